@@ -0,0 +1,35 @@
+"""
+Benchmark the batch analysis against calling ``_analyze`` for each sample.
+
+Usage: python benchmarks/analyze_batch.py [protocol] [samples] [workers]
+"""
+
+import copy
+from importlib import import_module
+import os
+import sys
+import time
+
+from jii_multispeq_protocols.analyze import analyze_batch, module_name
+from jii_multispeq_protocols.examples import load_example
+
+if __name__ == "__main__":
+  protocol = sys.argv[1] if len(sys.argv) > 1 else "phi2"
+  samples = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+  workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count()
+
+  sample = load_example(protocol)['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  data = [copy.deepcopy(sample) for _ in range(samples)]
+  analyze = import_module(module_name(protocol))._analyze
+
+  start = time.perf_counter()
+  for s in copy.deepcopy(data):
+    analyze(s)
+  print("%-12s %8.3f s" % ("loop", time.perf_counter() - start))
+
+  for w in sorted({1, workers}):
+    start = time.perf_counter()
+    for index, output, warns, error in analyze_batch(protocol, copy.deepcopy(data), workers=w, chunksize=64):
+      pass
+    print("%-12s %8.3f s" % ("workers=%d" % w, time.perf_counter() - start))
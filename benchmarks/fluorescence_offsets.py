@@ -0,0 +1,56 @@
+"""
+Benchmark the extraction of the detector offsets in the fluorescence
+detector offsets calibration.
+
+"loop" is the previous implementation slicing and averaging each measuring
+LED and trace in Python, "numpy" uses ``_bleed_offsets`` averaging all of
+them at once. Both are run on synthetic bleed traces generated from the
+calibration example and the results are compared value by value.
+
+Usage: python benchmarks/fluorescence_offsets.py [repeats]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.protocols.calibrations import fluorescence_detector_offsets_calibration as calibration
+
+N_LEDS = 4
+SUB_POINTS = 30
+
+def loop(traces):
+  offsets = []
+  for ledidx in range(N_LEDS):
+    offsets.append([])
+    for trace in traces:
+      t = trace["data_raw"][ledidx::N_LEDS]
+      tm = np.mean(t[0:SUB_POINTS])
+      t = np.array(t) - tm
+      offsets[ledidx].append(np.mean(t[int(SUB_POINTS)+3 : 2*SUB_POINTS]))
+  return offsets
+
+def vectorized(traces):
+  return calibration._bleed_offsets(traces, N_LEDS, SUB_POINTS)
+
+if __name__ == "__main__":
+  repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+  ## Synthetic runs: example bleed trace with added noise, one per intensity
+  sample = load_example('fluorescence_detector_offsets_calibration')['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  data_raw = np.array(next(s['data_raw'] for s in sample['set'] if len(s.get('data_raw', [])) == 90 * N_LEDS))
+  rng = np.random.default_rng(0)
+  runs = [[{"data_raw": [int(v) for v in data_raw + rng.normal(0, 20, data_raw.size).round()]} for _ in range(8)] for _ in range(repeats)]
+
+  for traces in runs:
+    assert all(list(a) == list(b) for a, b in zip(loop(traces), vectorized(traces))), "Results differ"
+
+  for label, fn in [("loop", loop), ("numpy", vectorized)]:
+    start = time.perf_counter()
+    for traces in runs:
+      fn(traces)
+    elapsed = time.perf_counter() - start
+    print("%-6s %8.1f µs/run (%d runs of 8 traces)" % (label, 1e6 * elapsed / repeats, repeats))
@@ -0,0 +1,45 @@
+"""
+Benchmark the cold start of the package.
+
+Compares the lazy protocol registry (default) with importing all protocols
+up front, the way the package used to do it. Every run uses a new
+interpreter, so nothing is cached between runs.
+
+Usage: python benchmarks/import_time.py [repeats]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = {
+  "lazy": "import jii_multispeq_protocols",
+  "lazy + phi2": "import jii_multispeq_protocols; jii_multispeq_protocols.phi2",
+  "eager": "import jii_multispeq_protocols as p; p.load_all()",
+}
+
+TIMER = """
+import time
+_start = time.perf_counter()
+%s
+print(time.perf_counter() - _start)
+"""
+
+def run(statement, repeats):
+  times = []
+  for _ in range(repeats):
+    out = subprocess.run([sys.executable, "-c", TIMER % statement], cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    times.append(float(out.stdout.strip().splitlines()[-1]))
+  return times
+
+if __name__ == "__main__":
+  repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+  for name, statement in STATEMENTS.items():
+    times = run(statement, repeats)
+    print("%-12s median %7.1f ms  (min %7.1f ms, n=%s)" % (
+      name, 1000 * statistics.median(times), 1000 * min(times), repeats))
@@ -0,0 +1,40 @@
+"""
+Benchmark the label lookups of the fluorescence detector offsets calibration,
+scanning the measurement for every lookup (``GetProtocolByLabel``) compared
+to the label index (``label_index``).
+
+Usage: python benchmarks/label_index.py [number]
+"""
+
+import sys
+import timeit
+
+from jii_multispeq.analysis import GetProtocolByLabel
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.labels import LabelIndex, label_index
+
+def scan(data, n):
+  for _ in range(n):
+    GetProtocolByLabel("bc0", data, True)
+    GetProtocolByLabel("bc1", data, True)
+
+def index(data, n):
+  labels = label_index(data)
+  for _ in range(n):
+    labels.get("bc0", True)
+    labels.get("bc1", True)
+
+if __name__ == "__main__":
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+  sample = load_example('fluorescence_detector_offsets_calibration')['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  n = len(sample['v_arrays'][2])
+  print("%d set entries, %d lookups per analysis" % (len(sample['set']), 2 * n))
+
+  assert all(a is b for a, b in zip(GetProtocolByLabel("bc0", sample, True), LabelIndex(sample).get("bc0", True)))
+
+  for label, fn in [("scan", scan), ("index", index)]:
+    t = min(timeit.repeat(lambda: fn(sample, n), number=number, repeat=3)) / number
+    print("%-12s %8.1f µs/analysis" % (label, 1e6 * t))
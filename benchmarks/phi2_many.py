@@ -0,0 +1,37 @@
+"""
+Benchmark the vectorized phi2 analysis (``analyze_many``) against calling
+``_analyze`` for each sample. Synthetic traces are generated from the phi2
+example and the results are compared value by value.
+
+Usage: python benchmarks/phi2_many.py [samples]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.protocols import phi2
+
+if __name__ == "__main__":
+  samples = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+  sample = load_example('phi2')['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  trace = np.asarray(sample['data_raw'])
+  rng = np.random.default_rng(0)
+  data_raw = trace + rng.integers(-200, 200, (samples, trace.size))
+  light_intensity = rng.integers(0, 2000, samples)
+
+  start = time.perf_counter()
+  outputs = [phi2._analyze({'data_raw': list(row), 'light_intensity': li})
+             for row, li in zip(data_raw.tolist(), light_intensity.tolist())]
+  print("%-13s %8.3f s" % ("_analyze", time.perf_counter() - start))
+
+  start = time.perf_counter()
+  columns = phi2.analyze_many(data_raw, light_intensity)
+  print("%-13s %8.3f s" % ("analyze_many", time.perf_counter() - start))
+
+  for key in ('Fs', 'Fmp', 'Phi2', 'LEF', 'PAR'):
+    assert np.array_equal([o[key] for o in outputs], columns[key]), "Results differ for %s" % key
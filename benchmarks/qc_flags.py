@@ -0,0 +1,61 @@
+"""
+Benchmark collecting QC flags for a batch of samples.
+
+"warnings" is the previous way to report a problem with ``warnings.warn``
+and the default filter, which only shows a warning once per call site,
+"record" records every warning with ``warnings.catch_warnings`` for each
+sample and "collect" uses ``qc.collect`` with ``qc.flag``. The number of
+flags that reached the caller is printed for each.
+
+Usage: python benchmarks/qc_flags.py [samples]
+"""
+
+import sys
+import time
+import warnings
+
+from jii_multispeq_protocols.qc import collect, flag, summarize
+
+def analyze_warn(value):
+  if value > 0.85:
+    warnings.warn("Phi2 is outside of expected range, please consider discarding the measurement")
+
+def analyze_flag(value):
+  if value > 0.85:
+    flag("phi2_range", "Phi2 is outside of expected range, please consider discarding the measurement", value)
+
+def run_warnings(values):
+  with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter('default')
+    for value in values:
+      analyze_warn(value)
+  return len(caught)
+
+def run_record(values):
+  count = 0
+  for value in values:
+    with warnings.catch_warnings(record=True) as caught:
+      warnings.simplefilter('always')
+      analyze_warn(value)
+    count += len(caught)
+  return count
+
+def run_collect(values):
+  results = []
+  for value in values:
+    with collect() as flags:
+      analyze_flag(value)
+    results.append(flags)
+  return sum(summarize(results).values())
+
+if __name__ == "__main__":
+  samples = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+  ## Every other sample is flagged
+  values = [0.9 if i % 2 else 0.5 for i in range(samples)]
+
+  for label, fn in [("warnings", run_warnings), ("record", run_record), ("collect", run_collect)]:
+    start = time.perf_counter()
+    count = fn(values)
+    elapsed = time.perf_counter() - start
+    print("%-8s %8.2f µs/sample, %d of %d flags kept" % (label, 1e6 * elapsed / samples, count, samples // 2))
@@ -0,0 +1,50 @@
+"""
+Benchmark the cached flowcharts and validation results.
+
+All protocols of the package are rendered and validated repeatedly, the
+way a catalog service would. "direct" calls ``generate`` and ``validate``
+every time, "cached" uses ``cached_generate`` and ``cached_validate`` with an
+in-memory cache. The results are compared and the cache counters printed.
+
+Usage: python benchmarks/result_cache.py [repeats]
+"""
+
+from importlib import import_module
+import sys
+import time
+
+from jii_multispeq_protocols import discover_protocols
+from jii_multispeq_protocols.cache import ResultCache, cached_generate, cached_validate
+from jii_multispeq_protocols.validate import validate
+from jii_multispeq_protocols.visualize import generate
+
+if __name__ == "__main__":
+  repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+  protocols = []
+  for name in discover_protocols().values():
+    protocol = getattr(import_module(name), '_protocol', None)
+    if protocol is not None:
+      protocols.append(protocol)
+
+  generate_cache = ResultCache()
+  validate_cache = ResultCache()
+
+  for protocol in protocols:
+    assert cached_generate(protocol, cache=generate_cache) == generate(protocol), "Results differ"
+    assert cached_validate(protocol, cache=validate_cache) == validate(protocol), "Results differ"
+
+  for label, render, test in [
+    ("direct", generate, validate),
+    ("cached", lambda p: cached_generate(p, cache=generate_cache), lambda p: cached_validate(p, cache=validate_cache))
+  ]:
+    start = time.perf_counter()
+    for _ in range(repeats):
+      for protocol in protocols:
+        render(protocol)
+        test(protocol)
+    elapsed = time.perf_counter() - start
+    print("%-6s %8.1f µs/protocol (%d protocols)" % (label, 1e6 * elapsed / (repeats * len(protocols)), len(protocols)))
+
+  print("generate", generate_cache.stats())
+  print("validate", validate_cache.stats())
@@ -0,0 +1,72 @@
+"""
+Benchmark the averaging of the DIRK subtraces in the RIDES analysis.
+
+"loop" is the previous implementation summing the subtraces point by point
+in Python, "numpy" uses ``rides._sum_subtraces`` and array operations for
+the baseline correction. Both are run on synthetic DIRK_ECS traces generated
+from the RIDES example and the results are compared value by value.
+
+Usage: python benchmarks/rides_dirk.py [samples]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.protocols import rides
+
+BEGINNING = 100
+LENGTH = 220
+NUMBER = 6
+
+def loop(data_raw):
+  trace = data_raw[BEGINNING:BEGINNING + LENGTH]
+  for i in range(1, NUMBER):
+    temp = data_raw[i*LENGTH+BEGINNING:(i+1)*LENGTH+BEGINNING]
+    for j in range(LENGTH):
+      trace[j] = trace[j] + temp[j]
+
+  fake_time_axis = list(range(1, LENGTH + 1))
+  m, b = np.polyfit(fake_time_axis[75:145], trace[75:145], 1)
+  baseline_offset = [np.round(j * np.round(m, 3) + round(b)) for j in range(LENGTH)]
+
+  for j in range(LENGTH):
+    trace[j] = -1 * np.log(trace[j]/baseline_offset[j])
+
+  trace[120] = trace[119]
+  return trace[80:150]
+
+def vectorized(data_raw):
+  trace = rides._sum_subtraces(data_raw, BEGINNING, LENGTH, NUMBER)
+
+  fake_time_axis = np.arange(1, LENGTH + 1)
+  m, b = np.polyfit(fake_time_axis[75:145], trace[75:145], 1)
+  baseline_offset = np.round(np.arange(LENGTH) * np.round(m, 3) + round(b))
+
+  trace = -1 * np.log(trace / baseline_offset)
+
+  trace[120] = trace[119]
+  return list(trace[80:150])
+
+if __name__ == "__main__":
+  samples = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+  ## Synthetic samples: example trace with added noise
+  sample = load_example('rides')['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  data_raw = np.array(next(s['data_raw'] for s in sample['set'] if s.get('label') == 'DIRK_ECS'))
+  rng = np.random.default_rng(0)
+  traces = [[int(v) for v in data_raw + rng.normal(0, 20, data_raw.size).round()] for _ in range(samples)]
+
+  for a, b in zip(map(loop, [list(t) for t in traces]), map(vectorized, traces)):
+    assert a == b, "Results differ"
+
+  for label, fn in [("loop", loop), ("numpy", vectorized)]:
+    inputs = [list(t) for t in traces]
+    start = time.perf_counter()
+    for t in inputs:
+      fn(t)
+    elapsed = time.perf_counter() - start
+    print("%-6s %8.1f µs/sample (%d samples)" % (label, 1e6 * elapsed / samples, samples))
@@ -0,0 +1,107 @@
+"""
+Compare the exponential fits used in the RIDES analysis (``fit_exponential``
+for single samples and ``fit_exponential_lm`` for batches) with
+``scipy.optimize.curve_fit`` (starting at ``p0=[1, 1, 1]``).
+
+The ECS and P700 DIRK decays of the RIDES example are fitted with both
+methods, followed by synthetic decays with noise. For each trace the
+parameters and the residual sum of squares (RSS) are compared and the
+time per fit is reported.
+
+Usage: python benchmarks/rides_fit.py [samples]
+"""
+
+import sys
+import time
+import warnings
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.fitting import fit_exponential, fit_exponential_lm
+from jii_multispeq_protocols.protocols import rides
+
+def exp_func(x, a, b, c):
+  return b + a * np.exp(-x / c)
+
+def scipy_fit(t, y):
+  with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    try:
+      return tuple(curve_fit(exp_func, t, y, p0=[1, 1, 1])[0]) + (True,)
+    except Exception:
+      return np.nan, np.nan, np.nan, False
+
+def rss(t, y, a, b, c):
+  return np.sum((exp_func(t, a, b, c) - y) ** 2)
+
+def example_traces():
+  sample = load_example('rides')['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  traces = {}
+  for s in sample['set']:
+    if s.get('label') in ('DIRK_ECS', 'DIRK_P700'):
+      traces[s['label']] = s['data_raw']
+  ecs = rides._sum_subtraces(traces['DIRK_ECS'], 100, 220, 6)
+  p700 = np.asarray(traces['DIRK_ECS'][100:320]) + rides._sum_subtraces(traces['DIRK_P700'], 320, 220, 5)
+  out = {}
+  for label, trace, fit in (("ECS", ecs, slice(75, 145)), ("P700", p700, slice(None))):
+    axis = np.arange(1, 221)
+    m, b = np.polyfit(axis[fit], trace[fit], 1)
+    baseline = np.arange(220) * np.round(m, 3) + (round(b) if label == "ECS" else np.round(b))
+    if label == "ECS":
+      baseline = np.round(baseline)
+    trace = -1 * np.log(trace / baseline)
+    trace[120] = trace[119]
+    out[label] = trace[100:120]
+  return out
+
+if __name__ == "__main__":
+  samples = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+  t = np.arange(20) * 1.5
+
+  print("RIDES example")
+  for label, y in example_traces().items():
+    for name, fn in (("curve_fit", scipy_fit), ("fit_exponential", fit_exponential), ("fit_exponential_lm", fit_exponential_lm)):
+      a, b, c, ok = fn(t, y)
+      print("  %-5s %-18s a=%+.5e b=%+.5e c=%10.4f converged=%-5s rss=%.4e" % (label, name, a, b, c, bool(ok), rss(t, y, a, b, c)))
+
+  ## Synthetic decays similar to the ECS trace
+  rng = np.random.default_rng(0)
+  a = rng.normal(0, 1e-3, samples)
+  b = rng.normal(0, 1e-3, samples)
+  c = rng.uniform(1, 40, samples)
+  y = b[:, None] + a[:, None] * np.exp(-t / c[:, None]) + rng.normal(0, 1e-4, (samples, t.size))
+
+  start = time.perf_counter()
+  reference = [scipy_fit(t, row) for row in y]
+  t_scipy = time.perf_counter() - start
+
+  start = time.perf_counter()
+  single = [fit_exponential(t, row) for row in y]
+  t_single = time.perf_counter() - start
+
+  start = time.perf_counter()
+  batch = fit_exponential(t, y)
+  t_batch = time.perf_counter() - start
+
+  start = time.perf_counter()
+  batch_lm = fit_exponential_lm(t, y)
+  t_batch_lm = time.perf_counter() - start
+
+  rss_scipy = np.array([rss(t, row, *p[:3]) if p[3] else np.inf for row, p in zip(y, reference)])
+  rss_fast = np.array([rss(t, row, *p) for row, p in zip(y, zip(*batch[:3]))])
+  rss_lm = np.array([rss(t, row, *p) for row, p in zip(y, zip(*batch_lm[:3]))])
+  converged = batch[3]
+  converged_lm = batch_lm[3]
+
+  print("\nSynthetic decays (%d samples)" % samples)
+  print("  curve_fit failed:            %d" % sum(not p[3] for p in reference))
+  print("  fit_exponential converged:   %d" % converged.sum())
+  print("  fit_exponential_lm converged: %d" % converged_lm.sum())
+  print("  max relative RSS difference: %.2e (converged fits)" % np.max((rss_fast - rss_scipy)[converged] / rss_scipy[converged]))
+  print("  max relative RSS difference: %.2e (converged fits, LM)" % np.max((rss_lm - rss_scipy)[converged_lm] / rss_scipy[converged_lm]))
+  for label, elapsed in (("curve_fit", t_scipy), ("fit_exponential", t_single),
+                         ("fit_exponential (batch)", t_batch), ("fit_exponential_lm (batch)", t_batch_lm)):
+    print("  %-27s %8.1f µs/fit" % (label, 1e6 * elapsed / samples))
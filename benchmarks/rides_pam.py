@@ -0,0 +1,81 @@
+"""
+Benchmark the PAM fluorescence parameters of the RIDES analysis.
+
+"loop" is the previous implementation for a single sample, de-interleaving
+the trace in Python, sorting the Fm' windows and fitting the multi-phase
+flash (MPF) steps with ``np.polyfit``. "batch" uses ``rides.analyze_pam``
+for all samples at once (partial sort and closed form regression). Both are
+run on synthetic PAM traces generated from the RIDES example and the
+rounded outputs are compared value by value.
+
+Usage: python benchmarks/rides_pam.py [samples]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.protocols import rides
+
+NAMES = ['Phi2', 'NPQt', 'PhiNO', 'PhiNPQ', 'qL']
+
+def loop(data_raw):
+  temp1 = []
+  for i in range(0, len(data_raw), 2):
+    temp1.append(data_raw[i])
+  for i in range(1, len(data_raw)+1, 2):
+    temp1.append(data_raw[i])
+  data = temp1[0:310]
+
+  Fs = np.mean(data[1:4])
+  sat_vals = np.sort(data[101:130])
+  AFmP = np.mean(sat_vals[2:20])
+  sat_vals = np.sort(data[131:145])
+  FmP_step1 = np.mean(sat_vals[2:6])
+  sat_vals = np.sort(data[146:160])
+  FmP_step2 = np.mean(sat_vals[2:6])
+  sat_vals = np.sort(data[161:175])
+  FmP_step3 = np.mean(sat_vals[2:6])
+  FoPrime = np.min(np.sort(data[206:220]))
+
+  m, b = np.polyfit([1/8000,1/7000,1/6000,1/5000], [AFmP,FmP_step1,FmP_step2,FmP_step3], 1)
+
+  FmPrime = AFmP if m > 0 else b
+  fvfm = (FmPrime-Fs)/FmPrime
+  npqt = (4.88 / ((FmPrime / FoPrime) -1) )-1
+  qL = ((FmPrime - Fs)*FoPrime)/((FmPrime-FoPrime)*Fs)
+  PhiNO = 1/(npqt + 1 + qL*4.88)
+  PhiNPQ = 1-fvfm-PhiNO
+
+  return [np.round(v, 3) for v in (fvfm, npqt, PhiNO, PhiNPQ, qL)]
+
+def batch(data_raw):
+  output = rides.analyze_pam(data_raw)
+  return np.round(np.stack([output[name] for name in NAMES], axis=1), 3)
+
+if __name__ == "__main__":
+  samples = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+  ## Synthetic samples: example trace with added noise
+  sample = load_example('rides')['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  data_raw = np.array(next(s['data_raw'] for s in sample['set'] if s.get('label') == 'PAM'))
+  rng = np.random.default_rng(0)
+  traces = [[int(v) for v in data_raw + rng.normal(0, 50, data_raw.size).round()] for _ in range(samples)]
+
+  matrix = np.array(traces)
+  expected = np.array([loop(t) for t in traces])
+  assert np.array_equal(expected, batch(matrix), equal_nan=True), "Results differ"
+
+  start = time.perf_counter()
+  for t in traces:
+    loop(t)
+  elapsed = time.perf_counter() - start
+  print("%-6s %8.2f µs/sample (%d samples)" % ("loop", 1e6 * elapsed / samples, samples))
+
+  start = time.perf_counter()
+  batch(matrix)
+  elapsed = time.perf_counter() - start
+  print("%-6s %8.2f µs/sample (%d samples)" % ("batch", 1e6 * elapsed / samples, samples))
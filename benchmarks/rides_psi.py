@@ -0,0 +1,70 @@
+"""
+Benchmark the PSI (P700) saturation pulse parameters of the RIDES analysis.
+
+"loop" is the previous implementation for a single sample, calculating the
+absorbance point by point and sorting the saturation pulse windows for the
+top 20% means. "batch" uses ``rides.analyze_psi`` for all samples at once
+(one ``np.log`` for all traces and a partial sort). Both are run on
+synthetic PAM traces generated from the RIDES example and the outputs are
+compared value by value.
+
+Usage: python benchmarks/rides_psi.py [samples]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.protocols import rides
+
+NAMES = ["PS1 Active Centers", "PS1 Open Centers", "PS1 Over Reduced Centers", "PS1 Oxidized Centers"]
+
+def loop(data_raw):
+  data = list(data_raw[0::2]) + list(data_raw[1::2])
+
+  PSI_data = data[310:615]
+  PSI_dark_raw = np.mean(PSI_data[195:200])
+  PSI_data_absorbance = []
+  for i in range(0, 305):
+    PSI_data_absorbance.append(np.log(PSI_dark_raw/PSI_data[i]))
+
+  PSI_ss = 1000*np.mean(PSI_data_absorbance[1:18])
+  PSI_sat1_vals = np.sort(PSI_data_absorbance[25:170])
+  PSI_sat1 = 1000*np.mean(PSI_sat1_vals[int(145*0.8):145])
+  PSI_sat2_vals = np.sort(PSI_data_absorbance[220:270])
+  PSI_sat2 = 1000*np.mean(PSI_sat2_vals[int(50*0.8):50])
+
+  return [PSI_sat2, (PSI_sat1-PSI_ss)/PSI_sat2, 1-PSI_sat1/PSI_sat2, PSI_ss/PSI_sat2], PSI_data_absorbance
+
+def batch(data_raw):
+  output = rides.analyze_psi(data_raw)
+  return np.stack([output[name] for name in NAMES], axis=1), output['PSI_data_absorbance']
+
+if __name__ == "__main__":
+  samples = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+  ## Synthetic samples: example trace with added noise
+  sample = load_example('rides')['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  data_raw = np.array(next(s['data_raw'] for s in sample['set'] if s.get('label') == 'PAM'))
+  rng = np.random.default_rng(0)
+  traces = [[int(v) for v in data_raw + rng.normal(0, 50, data_raw.size).round()] for _ in range(samples)]
+
+  matrix = np.array(traces)
+  expected = [loop(t) for t in traces]
+  parameters, absorbance = batch(matrix)
+  assert np.array_equal(np.array([e[0] for e in expected]), parameters), "Results differ"
+  assert np.array_equal(np.array([e[1] for e in expected]), absorbance), "Absorbance differs"
+
+  start = time.perf_counter()
+  for t in traces:
+    loop(t)
+  elapsed = time.perf_counter() - start
+  print("%-6s %8.2f µs/sample (%d samples)" % ("loop", 1e6 * elapsed / samples, samples))
+
+  start = time.perf_counter()
+  batch(matrix)
+  elapsed = time.perf_counter() - start
+  print("%-6s %8.2f µs/sample (%d samples)" % ("batch", 1e6 * elapsed / samples, samples))
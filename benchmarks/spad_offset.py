@@ -0,0 +1,59 @@
+"""
+Benchmark the offset search of the relative chlorophyll (SPAD) calibration.
+
+"loop" is the previous implementation, calling ``stats.linregress`` for each
+offset on a 10 unit grid, "numpy" calculates the regressions for all offsets
+on a 1 unit grid at once.
+
+Usage: python benchmarks/spad_offset.py [number]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+from scipy import stats
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.protocols.calibrations import relative_chlorophyll_spad_calibration as spad
+
+def loop(r655, v655, r950, v950, s):
+  maxR2 = 0
+  bestOffset = -2000
+  for offset in np.arange(-200, 200, 10):
+    da = []
+    for i in range(len(r655)):
+      DA655 = np.round(r655[i] - offset) - np.round(v655[i] - offset)
+      DA950 = np.round(r950[i]) - np.round(v950[i])
+      da.append(DA655 - DA950)
+    slope, intercept, r_value, p_value, std_err = stats.linregress(da, s)
+    if r_value**2 > maxR2:
+      maxR2 = r_value**2
+      bestOffset = offset
+  return bestOffset, maxR2
+
+def vectorized(r655, v655, r950, v950, s):
+  offsets = np.arange(-200, 200, 1)
+  DA655 = np.round(np.array(r655) - offsets[:, None]) - np.round(np.array(v655) - offsets[:, None])
+  DA950 = np.round(np.array(r950)) - np.round(np.array(v950))
+  slope, intercept, r2 = spad._linregress_rows(DA655 - DA950, s)
+  r2 = np.where(np.isfinite(r2), r2, -np.inf)
+  best = np.argmax(r2)
+  return offsets[best], r2[best]
+
+if __name__ == "__main__":
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+  sample = load_example('relative_chlorophyll_spad_calibration')['sample'][0]
+  sample = sample[0] if isinstance(sample, list) else sample
+  t = [e for e in sample['set'] if e.get('label') == 'spad']
+  args = ([e['absorbance'][0][0] for e in t], [e['absorbance'][0][1] for e in t],
+          [e['absorbance'][1][0] for e in t], [e['absorbance'][1][1] for e in t],
+          [7.8, 16.7, 34.3, 26.5, 39.9, 44, 24, 40, 51])
+
+  print("loop  (40 offsets):  best offset %s, r² %.6f" % loop(*args))
+  print("numpy (400 offsets): best offset %s, r² %.6f" % vectorized(*args))
+
+  for label, fn in [("loop", loop), ("numpy", vectorized)]:
+    elapsed = min(timeit.repeat(lambda: fn(*args), number=number, repeat=3)) / number
+    print("%-6s %8.1f µs/call" % (label, 1e6 * elapsed))
@@ -0,0 +1,57 @@
+"""
+Benchmark reading a large measurement export.
+
+"load" parses the whole file with ``json.load`` before iterating over the
+samples, "stream" uses ``stream.read_samples`` reading one sample at a time.
+The export is a synthetic JSON array of phi2 measurements generated from the
+example. Both read the same samples, the peak memory is measured with
+``tracemalloc``.
+
+Usage: python benchmarks/stream_reader.py [measurements]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.protocols import phi2
+from jii_multispeq_protocols.stream import read_samples
+from jii_multispeq_protocols.traces import iter_samples
+
+def load(path):
+  with open(path, 'r', encoding='utf-8') as fp:
+    yield from iter_samples(json.load(fp))
+
+def stream(path):
+  yield from read_samples(path)
+
+if __name__ == "__main__":
+  measurements = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+  example = load_example('phi2')
+
+  with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, 'export.json')
+    with open(path, 'w', encoding='utf-8') as fp:
+      fp.write('[')
+      for i in range(measurements):
+        fp.write((',' if i > 0 else '') + json.dumps(example))
+      fp.write(']')
+
+    print("export %.1f MB (%d measurements)" % (os.path.getsize(path) / 1e6, measurements))
+
+    assert all(a == b for a, b in zip(load(path), stream(path))), "Results differ"
+
+    for label, fn in [("load", load), ("stream", stream)]:
+      tracemalloc.start()
+      start = time.perf_counter()
+      for sample in fn(path):
+        phi2._analyze(sample)
+      elapsed = time.perf_counter() - start
+      peak = tracemalloc.get_traced_memory()[1]
+      tracemalloc.stop()
+      print("%-6s %8.1f ms, peak memory %8.1f MB" % (label, 1e3 * elapsed, peak / 1e6))
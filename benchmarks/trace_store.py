@@ -0,0 +1,75 @@
+"""
+Benchmark the memory used by the traces of many samples.
+
+"lists" are the traces as parsed from JSON (Python lists of ints), "store"
+is a ``TraceStore`` with int32 arrays, loaded memory-mapped from disk. The
+samples are synthetic RIDES and phi2 samples generated from the examples.
+The phi2 analysis is run on the stored traces as a single 2-D view and
+compared to the analysis of the lists.
+
+Usage: python benchmarks/trace_store.py [samples]
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.protocols import phi2
+from jii_multispeq_protocols.traces import TraceStore, iter_samples
+
+def list_size(samples):
+  """
+  Size of the traces as Python lists (list and int objects)
+  """
+  size = 0
+  for sample in samples:
+    for protocol in sample.get('set', [sample]):
+      trace = protocol.get('data_raw')
+      if isinstance(trace, list):
+        size += sys.getsizeof(trace) + sum(sys.getsizeof(v) for v in trace)
+  return size
+
+def synthetic(name, samples, rng):
+  template = next(iter_samples([load_example(name)]))
+  out = []
+  for _ in range(samples):
+    sample = dict(template)
+    if 'set' in sample:
+      sample['set'] = [dict(p, data_raw=[int(v) + int(rng.integers(0, 50)) for v in p['data_raw']]) if p.get('data_raw') else p for p in sample['set']]
+    else:
+      sample['data_raw'] = [int(v) + int(rng.integers(0, 50)) for v in sample['data_raw']]
+    out.append(sample)
+  return out
+
+if __name__ == "__main__":
+  samples = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+  rng = np.random.default_rng(0)
+
+  for name in ['rides', 'phi2']:
+    corpus = synthetic(name, samples, rng)
+
+    with tempfile.TemporaryDirectory() as directory:
+      TraceStore.from_samples(corpus).save(directory)
+      store = TraceStore.load(directory)
+
+      print("%-6s lists %8.1f kB, store %8.1f kB (%d samples)" % (name, list_size(corpus) / 1e3, store.nbytes() / 1e3, samples))
+
+      if name == 'phi2':
+        start = time.perf_counter()
+        expected = [phi2._analyze(sample) for sample in corpus]
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        traces, owners = store.matrix('data_raw')
+        light = np.array([store.samples[i]['light_intensity'] for i in owners])
+        result = phi2.analyze_many(traces, light)
+        batch = time.perf_counter() - start
+
+        assert np.array_equal(result["Phi2"], [e["Phi2"] for e in expected]), "Results differ"
+        print("phi2   _analyze %8.1f ms, analyze_many on the store %8.1f ms" % (1e3 * loop, 1e3 * batch))
+
+      del store
@@ -0,0 +1,29 @@
+"""
+Benchmark the per-call latency of the protocol validation.
+
+"uncached" loads the schema file and builds a new validator for every
+call (how ``validate`` used to work), "validate" uses the cached validator
+and "Validator" reuses a single validator object.
+
+Usage: python benchmarks/validate_cache.py [number]
+"""
+
+import sys
+import timeit
+
+from jii_multispeq_protocols.protocols import phi2, rides
+from jii_multispeq_protocols.validate import SchemaValidator, Validator, load_schema, validate
+
+def uncached(protocol):
+  return SchemaValidator(load_schema()).validate_with_all_errors(protocol)
+
+if __name__ == "__main__":
+  number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+  validator = Validator()
+
+  for name, protocol in [("phi2", phi2._protocol), ("rides", rides._protocol)]:
+    assert uncached(protocol) == validate(protocol) == validator.validate(protocol)
+
+    for label, fn in [("uncached", uncached), ("validate", validate), ("Validator", validator.validate)]:
+      t = min(timeit.repeat(lambda: fn(protocol), number=number, repeat=3)) / number
+      print("%-6s %-10s %8.1f µs/call" % (name, label, 1e6 * t))
@@ -0,0 +1,41 @@
+"""
+Benchmark of the quick structural validation.
+
+The protocols of this package are validated with the FastValidator and the
+full Draft202012Validator. That both give the same result is checked by
+``tests/test_validate.py``.
+
+Usage: python benchmarks/validate_fast.py
+"""
+
+import timeit
+
+import jii_multispeq_protocols as protocols
+from jii_multispeq_protocols.validate import SchemaValidator, load_schema
+
+def full_validation(validator, data):
+  try:
+    return list(validator.validator.iter_errors(data))
+  except AttributeError:
+    # jsonschema stops on the pre 2020-12 "items" lists in the schema
+    return None
+
+def load_protocols():
+  out = {}
+  for name, module in sorted(protocols.load_all().items()):
+    if hasattr(module, "_protocol"):
+      out[name] = module._protocol
+  return out
+
+if __name__ == "__main__":
+  validator = SchemaValidator(load_schema())
+  fast = validator.fast_validator
+
+  ## Benchmark on the valid protocols
+  for name, protocol in load_protocols().items():
+    if fast.is_valid(protocol) is not True:
+      continue
+    number = 20
+    t_full = min(timeit.repeat(lambda: full_validation(validator, protocol), number=number, repeat=3)) / number
+    t_fast = min(timeit.repeat(lambda: fast.is_valid(protocol), number=number, repeat=3)) / number
+    print("%-42s full %9.1f µs   quick %7.1f µs   (x%.0f)" % (name, 1e6 * t_full, 1e6 * t_fast, t_full / t_fast))
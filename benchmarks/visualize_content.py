@@ -0,0 +1,105 @@
+"""
+Benchmark the content summary of the protocol elements used for the
+flowcharts.
+
+"numpy" is the previous implementation calling the detector, LED and sensor
+helpers up to three times per element, each time using ``np.unique(np.hstack(...))``,
+"single" is ``visualize.content`` computing each summary once. Both are run
+on the sub-protocols of ``rides._protocol`` and the results are compared.
+
+Usage: python benchmarks/visualize_content.py [repeats]
+"""
+
+import gettext
+import sys
+import time
+
+import numpy as np
+
+from jii_multispeq_protocols import visualize
+from jii_multispeq_protocols.protocols import rides
+
+def _listing(element, key, names):
+  out = None
+  if key in element:
+    l = len(np.unique(np.hstack(element[key])))
+    out = np.unique(np.hstack(element[key]))
+    out = [names[str(x)] for x in out if str(x) in names]
+    out = ("\n".join(out) if l == 1 else ("\n" + "\n".join(["• %s" % o for o in out])))
+    out = out, l
+  return out
+
+def _environment(element):
+  out = None
+
+  def matchSensor(input):
+    for key,sensor in visualize.SENSORS.items():
+      if input in key:
+        return sensor
+    return str(input)
+
+  if "environmental" in element:
+    l = len(np.unique(np.hstack(element["environmental"])))
+    out = np.unique(np.hstack(element["environmental"]))
+    out = np.unique([matchSensor(x) for x in out])
+    out = ("\n".join(out) if l == 1 else ("\n" + "\n".join(["• %s" % o for o in out])))
+    out = out, l
+  return out
+
+def previous(element):
+  detectors = lambda el: _listing(el, "detectors", visualize.DETECTORS)
+  leds = lambda el, lights: _listing(el, lights, visualize.LEDS)
+
+  out = []
+  out.append("**%s**" % (visualize.label(element)))
+
+  if visualize.averages(element):
+    avg = visualize.averages(element)
+    if isinstance(avg, int):
+      if avg > 1:
+        avg = "*Averages*: %s" % (avg)
+        if visualize.averages_delay(element):
+          avg += " (delay between: %s)" % (visualize.averages_delay(element))
+        out.append(avg)
+
+  if visualize.protocols_repeats(element):
+    rep = visualize.protocols_repeats(element)
+    if isinstance(rep, int):
+      if rep > 1:
+        rep = "*Repeats*: %s" % (rep)
+        if visualize.protocols_delay(element):
+          rep += " (delay between: %s)" % (visualize.protocols_delay(element))
+        out.append(rep)
+
+  if detectors(element):
+    out.append("*%s:* %s" % ( gettext.ngettext( 'Detector', 'Detector', detectors(element)[1] ), detectors(element)[0]))
+
+  if leds(element, "pulsed_lights"):
+    out.append("*%s:* %s" % ( gettext.ngettext( 'Pulsed LED', 'Pulsed LEDs', leds(element,"pulsed_lights")[1] ), leds(element,"pulsed_lights")[0]))
+
+  if leds(element, "nonpulsed_lights"):
+    out.append("*%s:* %s" % ( gettext.ngettext( 'Non Pulsed LED', 'Non Pulsed LEDs', leds(element,"nonpulsed_lights")[1] ), leds(element,"nonpulsed_lights")[0]))
+
+  if _environment(element):
+    out.append("*%s:* %s" % ( gettext.ngettext( 'Sensor', 'Sensors', _environment(element)[1] ), _environment(element)[0]) )
+
+  if visualize.do_once(element):
+    out.append("%s" % visualize.do_once(element))
+
+  return "\n".join(out)
+
+if __name__ == "__main__":
+  repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+  elements = rides._protocol[0]["_protocol_set_"]
+
+  for element in elements:
+    assert previous(element) == visualize.content(element), "Results differ"
+
+  for label, fn in [("numpy", previous), ("single", visualize.content)]:
+    start = time.perf_counter()
+    for _ in range(repeats):
+      for element in elements:
+        fn(element)
+    elapsed = time.perf_counter() - start
+    print("%-6s %8.1f µs/protocol (%d sub-protocols)" % (label, 1e6 * elapsed / repeats, len(elements)))
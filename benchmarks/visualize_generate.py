@@ -0,0 +1,54 @@
+"""
+Benchmark generating flowcharts for protocols with many sub-protocols.
+
+"concat" is the previous implementation growing the chart with ``+=``,
+"join" is ``visualize.generate`` joining the pieces of ``generate_iter`` and
+"write" is ``visualize.generate_to`` writing the pieces to a file. The
+protocols are synthetic, repeating the sub-protocols of ``rides._protocol``.
+
+Usage: python benchmarks/visualize_generate.py [max sub-protocols]
+"""
+
+import sys
+import tempfile
+import time
+
+from jii_multispeq_protocols import visualize
+from jii_multispeq_protocols.protocols import rides
+
+def concat(protocol):
+  chart = ""
+  for piece in visualize.generate_iter(protocol):
+    chart += piece
+  return chart
+
+def join(protocol):
+  return visualize.generate(protocol)
+
+def write(protocol):
+  with tempfile.TemporaryFile('w') as fp:
+    visualize.generate_to(fp, protocol)
+
+def synthetic(size):
+  elements = rides._protocol[0]["_protocol_set_"]
+  return [{
+    "v_arrays": rides._protocol[0].get("v_arrays", []),
+    "_protocol_set_": [elements[i % len(elements)] for i in range(size)]
+  }]
+
+if __name__ == "__main__":
+  largest = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+  sizes = [size for size in [10, 100, 1000, 10000, 100000] if size <= largest]
+
+  for size in sizes:
+    protocol = synthetic(size)
+    assert concat(protocol) == join(protocol), "Results differ"
+
+    results = []
+    for fn in [concat, join, write]:
+      start = time.perf_counter()
+      fn(protocol)
+      results.append(1e3 * (time.perf_counter() - start))
+
+    print("%6d sub-protocols: concat %8.1f ms, join %8.1f ms, write %8.1f ms" % ((size,) + tuple(results)))
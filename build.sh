@@ -10,8 +10,12 @@ python3 docs/source/schema.py
 
 cd docs
 
-echo "Clean Build"
-make clean
+## Pages of unchanged protocols and their plots are reused, set CLEAN=1 to rebuild everything
+if [ "$CLEAN" = "1" ]; then
+  echo "Clean Build"
+  make clean
+  rm -rf source/protocols
+fi
 
 echo "Start new Build"
 make html
@@ -1,5 +1,8 @@
 from jii_multispeq import measurement as _measurement
 import gettext
+import glob
+import hashlib
+import importlib.util
 import json
 import matplotlib.pyplot as plt
 import numpy as np
@@ -13,11 +16,19 @@ import textwrap
 import traceback
 from importlib import import_module
 
+import jii_multispeq_protocols
 import jii_multispeq_protocols.protocols
 import jii_multispeq_protocols.validate as validate
 import jii_multispeq_protocols.visualize as visualize
+from jii_multispeq_protocols.examples import example_path
 from jii_multispeq_protocols.visualize import JII_STYLES
 
+## Directory of the individual protocol pages
+PROTOCOLS_DIR = os.path.join( os.path.dirname(__file__), '..', 'protocols' )
+
+## Hashes of the sources and generated pages of the last build
+MANIFEST_FILE = os.path.join( PROTOCOLS_DIR, '.manifest.json' )
+
 PROTOCOL = """$header
 
 .. automodule:: $package_name.$module_name
@@ -161,19 +172,81 @@ PROTOCOL_GRAPH = """
    plt.show()
 """
 
+def hash_files( paths ):
+  """
+  Hash of the content of files, missing files are skipped
+  """
+  h = hashlib.sha256()
+  for path in paths:
+    if os.path.isfile(path):
+      h.update(os.path.basename(path).encode('utf-8'))
+      with open(path, 'rb') as f:
+        h.update(f.read())
+  return h.hexdigest()
+
+def shared_hash():
+  """
+  Hash of everything used to build all pages (package modules, schema and this script).
+  If any of it changes, all pages are rebuilt.
+  """
+  package_dir = os.path.dirname(jii_multispeq_protocols.__file__)
+  paths = sorted(glob.glob(os.path.join(package_dir, '*.py')))
+  paths += [os.path.join(package_dir, 'schema.json'), os.path.abspath(__file__)]
+  return hash_files(paths)
+
+def source_hash( full_module_name ):
+  """
+  Hash of the protocol's source and example measurement
+  """
+  spec = importlib.util.find_spec(full_module_name)
+  return hash_files([spec.origin, example_path(full_module_name)])
+
+def load_manifest():
+  try:
+    with open( MANIFEST_FILE, 'r', encoding='utf-8' ) as f:
+      return json.load(f)
+  except (OSError, ValueError):
+    return {}
+
 def generate_individual_module_rst():
   package = jii_multispeq_protocols.protocols
   package_name = package.__name__
-  
-  ## Clean up the individual protocol files
-  dir_path = os.path.join( os.path.dirname(__file__), '..', 'protocols' )
-  shutil.rmtree( dir_path, ignore_errors=True )
-  os.makedirs( dir_path, exist_ok=True )
 
-  import_package_recursive(package_name, package)
+  manifest = load_manifest()
+  shared = shared_hash()
+
+  ## Clean up the individual protocol files, if the pages of the last build can't be reused
+  if manifest.get('shared') != shared:
+    shutil.rmtree( PROTOCOLS_DIR, ignore_errors=True )
+    manifest = {'shared': shared, 'modules': {}}
+
+  os.makedirs( PROTOCOLS_DIR, exist_ok=True )
+
+  seen = set()
+  import_package_recursive(package_name, package, manifest['modules'], seen)
+
+  ## Remove pages of protocols that no longer exist
+  for full_module_name in list(manifest['modules']):
+    if full_module_name not in seen:
+      page = os.path.join( PROTOCOLS_DIR, manifest['modules'][full_module_name]['page'] )
+      if os.path.isfile(page):
+        os.remove(page)
+      del manifest['modules'][full_module_name]
+
+  with open( MANIFEST_FILE, 'w', encoding='utf-8' ) as f:
+    json.dump(manifest, f, indent=2, sort_keys=True)
 
 
-def import_package_recursive(base_module_name, target_namespace):
+def import_package_recursive(base_module_name, target_namespace, manifest=None, seen=None):
+  """
+  Build the pages for all protocols of a package. If a manifest is provided,
+  protocols with unchanged sources and pages are skipped.
+  """
+  if manifest is None:
+    manifest = {}
+
+  if seen is None:
+    seen = set()
   
   try:
     protocol_pkg = import_module(base_module_name)
@@ -191,9 +264,25 @@ def import_package_recursive(base_module_name, target_namespace):
           os.makedirs( pkg_dir )
         except:
           pass
-        import_package_recursive(module_name, target_namespace)
+        import_package_recursive(module_name, target_namespace, manifest, seen)
       else:
+        seen.add(module_name)
+        page = os.path.join( *protocol_pkg.__name__.split(".")[2:], name+'.rst' )
+        source = source_hash(module_name)
+
+        ## Reuse the page of the last build
+        entry = manifest.get(module_name)
+        if entry is not None and entry['source'] == source and entry['output'] == hash_files([os.path.join( PROTOCOLS_DIR, page )]):
+          continue
+
+        import_module(module_name) # protocols are loaded lazily, make sure it is available
         module_rst(name, protocol_pkg.__name__, protocol_pkg) # package name
+
+        manifest[module_name] = {
+          'page': page,
+          'source': source,
+          'output': hash_files([os.path.join( PROTOCOLS_DIR, page )])
+        }
             
   except ImportError as e:
     print(f"Could not import {base_module_name}: {e}")
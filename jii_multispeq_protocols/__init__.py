@@ -5,7 +5,6 @@ JII-MultispeQ-Protocols
 from pkgutil import iter_modules
 from importlib import import_module, invalidate_caches
 from importlib.metadata import version, PackageNotFoundError
-import sys
 
 import jii_multispeq_protocols
 from jii_multispeq_protocols.validate import validate
@@ -23,32 +22,64 @@ __all__ = ['__version__']
 # Not sure if this needs to be here...
 invalidate_caches()
 
-def import_package_recursive(base_module_name, target_namespace):
-    try:
-        protocol_pkg = import_module(base_module_name)
-        
-        # Iterate through all modules in protocol package
-        for _, name, is_pkg in iter_modules(protocol_pkg.__path__):
-            
-            # Import each module/subpackage
-            module_name = f'{base_module_name}.{name}'
-            
-            if module_name not in sys.modules:
-                try:
-                    module = import_module(module_name)
-                except ImportError:
-                    continue
-            else:
-                module = sys.modules[module_name]
-            
-            # Add the module to namespace
-            setattr(target_namespace, name, module)
-            
-            # If it's a subpackage, recurse into it
-            if is_pkg:
-                import_package_recursive(module_name, target_namespace)
-                
-    except ImportError as e:
-        print(f"Could not import {base_module_name}: {e}")
-
-import_package_recursive('jii_multispeq_protocols.protocols', jii_multispeq_protocols)
+PROTOCOLS_PACKAGE = 'jii_multispeq_protocols.protocols'
+
+def discover_protocols(base_module_name=PROTOCOLS_PACKAGE, registry=None):
+    """
+    Find all protocol modules without importing them.
+
+    Only the (lightweight) packages are imported to get their search path,
+    the protocol modules themselves are just listed.
+
+    :param base_module_name: Package to search for protocols
+    :type base_module_name: str
+    :param registry: Dictionary to add the found modules to
+    :type registry: dict
+
+    :return: Short module name mapped to the full module name
+    :rtype: dict
+    """
+    if registry is None:
+        registry = {}
+
+    protocol_pkg = import_module(base_module_name)
+
+    for _, name, is_pkg in iter_modules(protocol_pkg.__path__):
+        module_name = f'{base_module_name}.{name}'
+        registry.setdefault(name, module_name)
+
+        if is_pkg:
+            discover_protocols(module_name, registry)
+
+    return registry
+
+# Protocols are only imported when accessed for the first time
+_protocols = discover_protocols()
+
+def __getattr__(name):
+    if name in _protocols:
+        module = import_module(_protocols[name])
+        # Cache the module, so __getattr__ is only called once per protocol
+        setattr(jii_multispeq_protocols, name, module)
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def load_all():
+    """
+    Import all protocols at once, e.g. to check all of them or before
+    starting worker processes. Protocols that can't be imported (missing
+    dependencies) are skipped.
+
+    :return: Short module name mapped to the imported module
+    :rtype: dict
+    """
+    modules = {}
+    for name in _protocols:
+        try:
+            modules[name] = getattr(jii_multispeq_protocols, name)
+        except ImportError:
+            continue
+    return modules
+
+def __dir__():
+    return sorted(set(globals()) | set(_protocols))
@@ -0,0 +1,146 @@
+"""
+Run the analysis of a protocol for many measurements, e.g. to
+reprocess the data of a whole project after the analysis changed.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from importlib import import_module
+from itertools import islice
+import warnings
+
+from jii_multispeq_protocols import PROTOCOLS_PACKAGE, discover_protocols
+from jii_multispeq_protocols.qc import QCFlag, WARNING, WARNING_CODE, collect
+
+def module_name ( protocol_module ):
+  """
+  Get the full module name of a protocol
+
+  :param protocol_module: Protocol module or its name (e.g. ``phi2``, ``calibrations.relative_chlorophyll_spad_calibration`` or the full module name)
+  :type protocol_module: module or str
+
+  :return: Full module name
+  :rtype: str
+
+  :raises ValueError: if the protocol is not a module or a module name
+  """
+  name = getattr(protocol_module, '__name__', protocol_module)
+
+  if not isinstance(name, str):
+    raise ValueError("Provided protocol needs to be a module or a module name")
+
+  if name.startswith(PROTOCOLS_PACKAGE + '.'):
+    return name
+
+  ## Short names are resolved using the protocol registry
+  protocols = discover_protocols()
+  if name in protocols:
+    return protocols[name]
+
+  return PROTOCOLS_PACKAGE + '.' + name
+
+def analysis_module ( protocol_module ):
+  """
+  Get the full module name of a protocol and make sure it can be imported
+  and has an analysis (``_analyze``)
+
+  :param protocol_module: Protocol module or its name (see :func:`module_name`)
+  :type protocol_module: module or str
+
+  :return: Full module name
+  :rtype: str
+
+  :raises ValueError: if the protocol doesn't exist or has no analysis
+  """
+  name = module_name(protocol_module)
+
+  try:
+    module = import_module(name)
+  except ModuleNotFoundError as e:
+    ## Only the protocol itself is unknown, missing dependencies are raised as they are
+    if e.name is None or not (name == e.name or name.startswith(e.name + '.')):
+      raise
+    raise ValueError("Protocol \"%s\" not found" % name) from None
+
+  if not hasattr(module, '_analyze'):
+    raise ValueError("Protocol \"%s\" has no analysis" % name)
+
+  return name
+
+def _analyze_one ( name, sample, flags=False ):
+  """
+  Analyze a single sample and collect the QC flags and warnings raised during the analysis
+  """
+  output = None
+  error = None
+
+  with warnings.catch_warnings(), collect() as collected:
+    warnings.simplefilter('always')
+
+    ## Other warnings are added as flags without a specific code, in the order they are raised
+    def showwarning ( message, *args, **kwargs ):
+      collected.append(QCFlag(WARNING_CODE, str(message), WARNING, None))
+
+    warnings.showwarning = showwarning
+
+    try:
+      output = import_module(name)._analyze(sample)
+    except Exception as e:
+      error = "%s: %s" % (type(e).__name__, e)
+
+  if flags:
+    return output, collected, error
+
+  return output, [f.message for f in collected], error
+
+def analyze_batch ( protocol_module=None, samples=None, workers=None, chunksize=16, flags=False ):
+  """
+  Analyze multiple samples with a protocol's ``_analyze`` function. Results
+  are returned in the same order as the samples are provided, as soon as they
+  are available. Warnings are collected for each sample and a failing sample
+  does not stop the batch.
+
+  :param protocol_module: Protocol module or its name (e.g. ``phi2`` or ``calibrations.relative_chlorophyll_spad_calibration``)
+  :type protocol_module: module or str
+  :param samples: Samples as passed to ``_analyze``
+  :type samples: iterable of dict
+  :param workers: Number of processes to use, if not set (or 1) samples are analyzed in the current process
+  :type workers: int
+  :param chunksize: Number of samples sent to a process at once
+  :type chunksize: int
+  :param flags: Return the QC flags (code, message, severity and value) instead of only the warning messages
+  :type flags: bool
+
+  :return: Generator of index, output (None if the analysis failed), list of warnings (or QC flags) and the error message (or None) for each sample
+  :rtype: generator of (int, dict, list, str)
+
+  :raises ValueError: if no protocol or samples are provided, or the protocol doesn't exist or has no analysis
+  """
+  if protocol_module is None:
+    raise ValueError("No protocol provided to analyze")
+
+  if samples is None:
+    raise ValueError("No samples provided to analyze")
+
+  ## Make sure the protocol can be imported before any sample is analyzed
+  name = analysis_module(protocol_module)
+
+  if workers is None or workers <= 1:
+    for index, sample in enumerate(samples):
+      yield (index,) + _analyze_one(name, sample, flags)
+    return
+
+  ## Samples are submitted in windows, so large projects are not held in memory at once
+  window_size = workers * chunksize * 4
+  samples = iter(samples)
+  index = 0
+
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    while True:
+      window = list(islice(samples, window_size))
+      if len(window) == 0:
+        break
+
+      for result in executor.map(partial(_analyze_one, name, flags=flags), window, chunksize=chunksize):
+        yield (index,) + result
+        index += 1
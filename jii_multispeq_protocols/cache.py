@@ -0,0 +1,259 @@
+"""
+Cache the flowcharts and validation results of protocols, e.g. for a
+service rendering the same protocols over and over. Flowcharts are stored
+by a hash of the protocol content, so the same protocol is found
+independent of its formatting or the order of its keys. Validation
+results are stored for the exact protocol, as the errors quote it.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import tempfile
+
+import jii_multispeq_protocols
+from jii_multispeq_protocols.validate import SCHEMA_FILE, validate
+from jii_multispeq_protocols.visualize import generate
+
+def protocol_key ( protocol, **arguments ):
+  """
+  Content hash of a protocol and the arguments used to process it. The
+  protocol is serialized with sorted keys, so the key does not depend on the
+  formatting of a JSON string or the order of the keys.
+
+  :param protocol: Protocol code
+  :type protocol: str, dict or list
+  :param arguments: Additional arguments the result depends on (e.g. ``direction``)
+
+  :return: Hash (hex) or None if the protocol can't be serialized
+  :rtype: str
+  """
+  if isinstance(protocol, str):
+    try:
+      protocol = json.loads(protocol)
+    except json.JSONDecodeError:
+      return None
+
+  return _content_hash([protocol, arguments])
+
+def _content_hash ( value, sort_keys=True ):
+  """
+  Hash of a JSON serializable value, None if it can't be serialized
+  """
+  try:
+    content = json.dumps(value, sort_keys=sort_keys, separators=(',', ':'), allow_nan=False)
+  except (TypeError, ValueError):
+    return None
+
+  return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class ResultCache:
+    """
+    Cache with a bounded number of results kept in memory (least recently
+    used results are dropped first) and an optional directory, so results
+    are kept across restarts. Results need to be JSON serializable to be
+    stored on disk.
+
+    :param maxsize: Maximum number of results kept in memory
+    :type maxsize: int
+    :param directory: Directory to store the results in (not stored on disk if None)
+    :type directory: str
+    """
+    def __init__(self, maxsize: int = 256, directory: str = None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.results = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, "%s.json" % key)
+
+    def _remember(self, key, value):
+        self.results[key] = value
+        self.results.move_to_end(key)
+        if len(self.results) > self.maxsize:
+            self.results.popitem(last=False)
+
+    def get(self, key, default=None):
+        """
+        Get a result from memory or disk and count the hit or miss
+
+        Args:
+            key: Key of the result
+            default: Returned if there is no result for the key
+
+        Returns:
+            Result or the default
+        """
+        if key in self.results:
+            self.hits += 1
+            self.results.move_to_end(key)
+            return self.results[key]
+
+        if self.directory is not None:
+            try:
+                with open(self._path(key), 'r', encoding='utf-8') as fp:
+                    value = json.load(fp)
+            except (OSError, ValueError):
+                pass
+            else:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """
+        Add a result to the cache
+
+        Args:
+            key: Key of the result
+            value: Result
+        """
+        self._remember(key, value)
+
+        if self.directory is not None:
+            ## Write to a temporary file first, so other processes never read a partial result
+            fd, path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+                    json.dump(value, fp)
+                os.replace(path, self._path(key))
+            except (OSError, TypeError, ValueError):
+                os.remove(path)
+
+    def clear(self, disk=False):
+        """
+        Remove all results from memory and reset the counters
+
+        Args:
+            disk: Also remove the results stored on disk
+        """
+        self.results.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def stats(self):
+        """
+        Counters to size the cache
+
+        Returns:
+            Dictionary with hits (memory and disk), misses and the number of results in memory
+        """
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "size": len(self.results),
+            "maxsize": self.maxsize
+        }
+
+    def __len__(self):
+        return len(self.results)
+
+## Default caches, kept in memory only
+generate_cache = ResultCache()
+validate_cache = ResultCache()
+
+def _version ():
+  """
+  Package version, so results of a different version are not reused
+  """
+  return getattr(jii_multispeq_protocols, '__version__', None)
+
+def _schema_version ( file_path=SCHEMA_FILE ):
+  """
+  Schema file modification, so results are not reused when the schema changes
+  """
+  stat = os.stat( file_path )
+  return [stat.st_mtime_ns, stat.st_size]
+
+def cached_generate ( protocol = None, direction = 'TD', styles=None, cache=None ):
+  """
+  Same as :func:`jii_multispeq_protocols.visualize.generate`, but the
+  flowchart is taken from the cache if the protocol was rendered before
+  with the same arguments.
+
+  :param protocol: Protocol code to visualize
+  :type protocol: str, dict or list
+  :param direction: Flow-chart direction flow (TB, TD, BT, RL, LR)
+  :type direction: str
+  :param styles: Flow-chart styles
+  :type styles: dict
+  :param cache: Cache to use (default: ``generate_cache``)
+  :type cache: ResultCache
+
+  :return: Flow chart code for Mermaid
+  :rtype: str
+
+  :raises ValueError: same as :func:`jii_multispeq_protocols.visualize.generate`
+  """
+  if cache is None:
+    cache = generate_cache
+
+  key = protocol_key( protocol, function="generate", version=_version(), direction=direction, styles=styles )
+
+  if key is not None:
+    chart = cache.get(key)
+    if chart is not None:
+      return chart
+
+  chart = generate( protocol, direction, styles )
+
+  if key is not None:
+    cache.put(key, chart)
+
+  return chart
+
+def cached_validate ( protocol=None, verbose=False, cache=None ):
+  """
+  Same as :func:`jii_multispeq_protocols.validate.validate`, but the result
+  is taken from the cache if the protocol was tested before with the same
+  schema. Results are kept for the exact protocol (text of strings and the
+  order of the keys), as the errors quote it.
+
+  :param protocol: Protocol code to test
+  :type protocol: dict or str
+  :param verbose: Print errors
+  :type verbose: bool
+  :param cache: Cache to use (default: ``validate_cache``)
+  :type cache: ResultCache
+
+  :return: True if tests are passed with an empty list, otherwise False with a list of errors
+  :rtype: bool, list
+  """
+  if cache is None:
+    cache = validate_cache
+
+  arguments = {"function": "validate", "version": _version(), "schema": _schema_version()}
+
+  ## Errors quote the protocol as it is (raw string or keys in their original order),
+  ## so strings are not parsed and the keys are not sorted for the key
+  key = _content_hash([protocol, arguments], sort_keys=False)
+
+  result = cache.get(key) if key is not None else None
+
+  if result is None:
+    result = validate( protocol )
+    if key is not None:
+      cache.put(key, [result[0], result[1]])
+
+  is_valid, errors = result[0], list(result[1])
+
+  if not is_valid and verbose:
+    for error in errors:
+      print(error)
+
+  return is_valid, errors
@@ -0,0 +1,179 @@
+"""
+Build and parse the commands sent to the MultispeQ (``toDevice``).
+
+A command string is a sequence of ``+`` terminated tokens, each command
+name followed by its numeric arguments, e.g. ``par_tweak+1.02+setCalTime+0+``.
+"""
+
+from collections import namedtuple
+
+DeviceCommand = namedtuple('DeviceCommand', ['name', 'args'])
+DeviceCommand.__doc__ = "Single device command with its name and a tuple of (numeric) arguments"
+
+def _format_arg ( value ):
+  """
+  Format a command argument, numbers are formatted the same way
+  independent of being a Python or numpy type
+  """
+  if isinstance(value, bool):
+    return str(int(value))
+  return "%s" % value
+
+def _parse_arg ( token ):
+  """
+  Convert a token into a number, or None if it is not a number
+  """
+  try:
+    return int(token)
+  except ValueError:
+    pass
+  try:
+    return float(token)
+  except ValueError:
+    return None
+
+def parse_commands ( string ):
+  """
+  Parse a command string (``toDevice``) into commands. Every token that
+  is not a number starts a new command, the numbers following it are its
+  arguments.
+
+  :param string: Command string
+  :type string: str
+
+  :return: Commands
+  :rtype: list of DeviceCommand
+
+  :raises ValueError: if the string does not start with a command name
+  """
+  commands = []
+  name = None
+  args = []
+
+  for token in string.split('+'):
+    if token == '':
+      continue
+
+    value = _parse_arg(token)
+    if value is not None:
+      if name is None:
+        raise ValueError("Argument \"%s\" is not preceded by a command" % token)
+      args.append(value)
+      continue
+
+    if name is not None:
+      commands.append(DeviceCommand(name, tuple(args)))
+    name = token
+    args = []
+
+  if name is not None:
+    commands.append(DeviceCommand(name, tuple(args)))
+
+  return commands
+
+class DeviceCommandBuilder:
+    """
+    Collect commands for the device and serialize them into a single
+    command string (``toDevice``) once all commands are added.
+
+    :param commands: Commands to start with, either a command string or a list of commands
+    :type commands: str or list
+    """
+    def __init__(self, commands=None):
+        self.commands = []
+
+        if isinstance(commands, str):
+            commands = parse_commands(commands)
+
+        if commands is not None:
+            self.extend(commands)
+
+    def add(self, name, *args):
+        """
+        Add a command
+
+        Args:
+            name: Command name
+            *args: Command arguments
+
+        Returns:
+            The builder, so calls can be chained
+        """
+        self.commands.append(DeviceCommand(str(name), tuple(args)))
+        return self
+
+    def add_args(self, *args):
+        """
+        Add arguments to the last command, e.g. when they are computed in a loop
+
+        Args:
+            *args: Command arguments
+
+        Returns:
+            The builder, so calls can be chained
+
+        Raises:
+            ValueError: If no command was added yet
+        """
+        if len(self.commands) == 0:
+            raise ValueError("No command to add the arguments to")
+
+        name, previous = self.commands[-1]
+        self.commands[-1] = DeviceCommand(name, previous + tuple(args))
+        return self
+
+    def extend(self, commands):
+        """
+        Add multiple commands, e.g. from another builder
+
+        Args:
+            commands: Builder or list of commands (name and arguments)
+
+        Returns:
+            The builder, so calls can be chained
+        """
+        for name, args in commands:
+            self.add(name, *args)
+        return self
+
+    def serialize(self):
+        """
+        Serialize the commands into a command string
+
+        Returns:
+            Command string (``toDevice``)
+        """
+        return "".join(
+            "+".join([name] + [_format_arg(arg) for arg in args]) + "+"
+            for name, args in self.commands
+        )
+
+    @classmethod
+    def parse(cls, string):
+        """
+        Create a builder from an existing command string
+
+        Args:
+            string: Command string (``toDevice``)
+
+        Returns:
+            Builder with the parsed commands
+        """
+        return cls(parse_commands(string))
+
+    def __iter__(self):
+        return iter(self.commands)
+
+    def __len__(self):
+        return len(self.commands)
+
+    def __eq__(self, other):
+        if isinstance(other, DeviceCommandBuilder):
+            return self.commands == other.commands
+        return NotImplemented
+
+    def __str__(self):
+        return self.serialize()
+
+    def __repr__(self):
+        return "DeviceCommandBuilder(%r)" % self.serialize()
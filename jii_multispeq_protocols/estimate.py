@@ -0,0 +1,220 @@
+"""
+Estimate the duration of a protocol and the amount of data it produces,
+before running it on the MultispeQ.
+"""
+
+import json
+
+from jii_multispeq_protocols.visualize import get_variable
+
+## Average number of characters per data_raw point in the returned JSON (e.g. "12345,")
+BYTES_PER_POINT = 6
+
+def resolve(variable, v_arr=None, set_idx=0, repeat_idx=0):
+  """
+  Get the numeric value of a protocol setting. Variables are resolved
+  like for the flow chart, where ``@s`` variables are selected by the set
+  repeat and ``@p`` variables by the protocol repeat.
+
+  :param variable: Setting value or variable
+  :type variable: int, float or str
+  :param v_arr: Variable arrays (``v_arrays``)
+  :type v_arr: list
+  :param set_idx: Index of the set repeat
+  :type set_idx: int
+  :param repeat_idx: Index of the protocol repeat
+  :type repeat_idx: int
+
+  :return: Value or None if it can't be resolved
+  :rtype: float or None
+  """
+  value = get_variable(variable, v_arr)
+
+  if isinstance(variable, str) and variable[:2] in ('@s', '@p') and value is not variable:
+    values = value.split(', ')
+    value = values[ (set_idx if variable[:2] == '@s' else repeat_idx) % len(values) ]
+
+  if isinstance(value, bool):
+    return None
+
+  try:
+    return float(value)
+  except (TypeError, ValueError):
+    return None
+
+## Settings used for the estimate
+SETTINGS = ["pulses", "pulse_distance", "averages", "averages_delay", "protocol_averages",
+            "pre_illumination", "protocols_delay", "protocol_repeats"]
+
+def _uses(element, prefix):
+  """
+  Check if the settings of an element use a type of variable
+  """
+  def walk(value):
+    if isinstance(value, str):
+      return value.startswith(prefix)
+    if isinstance(value, list):
+      return any(walk(v) for v in value)
+    return False
+
+  return any(walk(element[key]) for key in SETTINGS if key in element)
+
+def _recorded(element, idx):
+  """
+  Data points recorded per pulse, one for each detector. Nothing is
+  recorded if the pulse set only uses light 0 or detector 0 (e.g. dark pulses).
+  """
+  def active(values):
+    if not isinstance(values, list):
+      return [values]
+    return [v for v in values if v != 0]
+
+  lights = element.get("pulsed_lights", [])
+  if idx < len(lights) and len(active(lights[idx])) == 0:
+    return 0
+
+  detectors = element.get("detectors")
+  if isinstance(detectors, list):
+    return len(active(detectors[idx])) if idx < len(detectors) else 0
+
+  ## Without detectors, one point per light
+  return len(active(lights[idx])) if idx < len(lights) else 1
+
+def _run(element, v_arr, set_idx, repeat_idx, unresolved):
+  """
+  Duration (µs) and data points for a single execution of a protocol
+  """
+  def value(variable, default=0):
+    if type(variable) in (int, float):
+      return variable
+    out = resolve(variable, v_arr, set_idx, repeat_idx)
+    if out is None:
+      unresolved.add(str(variable))
+      return default
+    return out
+
+  duration = 0
+  points = 0
+
+  pulses = element.get("pulses", [])
+  distances = element.get("pulse_distance", [])
+
+  for idx, pulse in enumerate(pulses):
+    n = value(pulse)
+    if idx < len(distances):
+      duration += n * value(distances[idx])
+    points += n * _recorded(element, idx)
+
+  averages = value(element.get("averages", 1), 1)
+  averages *= value(element.get("protocol_averages", 1), 1)
+  duration = duration * averages + max(averages - 1, 0) * value(element.get("averages_delay", 0)) * 1000
+
+  ## Pre-illumination duration is set in ms
+  illumination = element.get("pre_illumination")
+  if isinstance(illumination, list) and len(illumination) > 0:
+    for arr in (illumination if isinstance(illumination[0], list) else [illumination]):
+      if len(arr) > 1:
+        duration += value(arr[1]) * 1000
+
+  duration += value(element.get("protocols_delay", 0)) * 1000
+
+  return duration, points
+
+def _element(element, v_arr, set_idx, unresolved):
+  """
+  Duration (µs) and data points for a protocol including its repeats
+  """
+  repeats = resolve(element.get("protocol_repeats", 1), v_arr, set_idx)
+  if repeats is None:
+    unresolved.add(str(element.get("protocol_repeats")))
+    repeats = 1
+  repeats = int(repeats)
+
+  ## Each repeat only needs to be calculated if it uses different settings
+  if not _uses(element, '@p'):
+    duration, points = _run(element, v_arr, set_idx, 0, unresolved)
+    return duration * repeats, points * repeats
+
+  duration = 0
+  points = 0
+  for repeat_idx in range(repeats):
+    d, p = _run(element, v_arr, set_idx, repeat_idx, unresolved)
+    duration += d
+    points += p
+  return duration, points
+
+def estimate(protocol=None, bytes_per_point=BYTES_PER_POINT):
+  """
+  Estimate the duration of a protocol and the number of ``data_raw`` points
+  returned. The duration is based on the pulses, pulse distances, averages,
+  repeats, pre-illuminations and delays. Time for environmental sensors,
+  prompts or waiting for the clamp is not included.
+
+  :param protocol: Protocol code
+  :type protocol: str, dict or list
+  :param bytes_per_point: Characters used per data_raw point in the returned JSON
+  :type bytes_per_point: int
+
+  :return: Duration in ms (``duration``), number of data points (``data_raw``), estimated size of the data points in bytes (``bytes``) and values that couldn't be resolved (``unresolved``)
+  :rtype: dict
+
+  :raises ValueError: if no protocol data is provided or the protocol data has the wrong format
+  """
+  if protocol is None:
+    raise ValueError("No protocol provided to estimate")
+
+  if not isinstance(protocol, (str,dict,list)):
+    raise ValueError("Provided protocol needs to be a dictionary, list or string")
+
+  ## Parse protocol string as json
+  if isinstance(protocol, str):
+    protocol = json.loads(protocol)
+
+  ## In case protocol is a dict, turn it into a list
+  if isinstance(protocol, dict):
+    protocol = [protocol]
+
+  duration = 0
+  points = 0
+  unresolved = set()
+
+  for element in protocol:
+    v_arr = element.get("v_arrays")
+
+    if "_protocol_set_" not in element:
+      d, p = _element(element, v_arr, 0, unresolved)
+      duration += d
+      points += p
+      continue
+
+    set_repeats = resolve(element.get("set_repeats", 1), v_arr)
+    if set_repeats is None:
+      unresolved.add(str(element.get("set_repeats")))
+      set_repeats = 1
+    set_repeats = int(set_repeats)
+
+    for el in element["_protocol_set_"]:
+      el_v_arr = el.get("v_arrays", v_arr)
+
+      ## Protocols with do_once only run during the first or last set repeat
+      if el.get("do_once") in (1, -1):
+        d, p = _element(el, el_v_arr, 0 if el["do_once"] == 1 else set_repeats - 1, unresolved)
+      elif not _uses(el, '@s'):
+        d, p = _element(el, el_v_arr, 0, unresolved)
+        d, p = d * set_repeats, p * set_repeats
+      else:
+        d, p = 0, 0
+        for set_idx in range(set_repeats):
+          dd, pp = _element(el, el_v_arr, set_idx, unresolved)
+          d += dd
+          p += pp
+
+      duration += d
+      points += p
+
+  return {
+    "duration": duration / 1000,
+    "data_raw": int(points),
+    "bytes": int(points) * bytes_per_point,
+    "unresolved": sorted(unresolved)
+  }
@@ -0,0 +1,74 @@
+"""
+Example measurements for the protocols.
+
+The examples are stored as compressed JSON files within the package
+and are only read when requested.
+"""
+
+import gzip
+import json
+import os
+
+from jii_multispeq_protocols import PROTOCOLS_PACKAGE, discover_protocols
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+def example_path ( protocol_name ):
+  """
+  Get the file path of a protocol's example measurement
+
+  :param protocol_name: Protocol name (e.g. ``rides``, ``calibrations.ir_led_calibration`` or the full module name)
+  :type protocol_name: str
+
+  :return: Path to the compressed JSON file
+  :rtype: str
+  """
+  if protocol_name.startswith(PROTOCOLS_PACKAGE + '.'):
+    protocol_name = protocol_name[len(PROTOCOLS_PACKAGE) + 1:]
+
+  ## Short names are resolved using the protocol registry
+  if '.' not in protocol_name:
+    protocols = discover_protocols()
+    if protocol_name in protocols:
+      protocol_name = protocols[protocol_name][len(PROTOCOLS_PACKAGE) + 1:]
+
+  return os.path.join(EXAMPLES_DIR, *protocol_name.split('.')) + '.json.gz'
+
+def load_example ( protocol_name ):
+  """
+  Load the example measurement of a protocol. A new copy is returned
+  every time, so it is safe to modify it during the analysis.
+
+  :param protocol_name: Protocol name (e.g. ``rides``, ``calibrations.ir_led_calibration`` or the full module name)
+  :type protocol_name: str
+
+  :return: Example measurement
+  :rtype: dict
+
+  :raises ValueError: if the protocol has no example measurement
+  """
+  file_path = example_path(protocol_name)
+
+  if not os.path.isfile(file_path):
+    raise ValueError("No example found for protocol \"%s\"" % protocol_name)
+
+  with gzip.open( file_path, 'rt', encoding='utf-8') as fp:
+    return json.load( fp )
+
+def lazy_example ( module_name ):
+  """
+  Create a module level ``__getattr__`` function that loads the
+  protocol's ``_example`` when it is accessed.
+
+  :param module_name: Name of the protocol module (``__name__``)
+  :type module_name: str
+
+  :return: Function to be used as ``__getattr__`` in the protocol module
+  :rtype: function
+  """
+  def __getattr__ ( name ):
+    if name == '_example' and os.path.isfile(example_path(module_name)):
+      return load_example(module_name)
+    raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+  return __getattr__
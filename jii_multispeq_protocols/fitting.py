@@ -0,0 +1,239 @@
+"""
+Curve fitting used by the protocol analyses, working on a single
+trace or on many traces (one per row) at once.
+"""
+
+import numpy as np
+
+def _linear ( t, y_c, y_mean, c ):
+  """
+  Least squares amplitude and offset for fixed time constants and the
+  resulting score (explained sum of squares, larger is better). The trace
+  is passed centered (y_c) with its mean (y_mean).
+  """
+  e = np.exp(-t / c[..., None])
+  e_mean = e.sum(axis=-1) / t.size
+  e_c = e - e_mean[..., None]
+  var = np.einsum('...i,...i->...', e_c, e_c)
+  cov = np.einsum('...i,...i->...', e_c, y_c)
+
+  with np.errstate(divide='ignore', invalid='ignore'):
+    a = cov / var
+    score = np.where(var > 0, cov * a, -np.inf)
+
+  return a, y_mean - a * e_mean, score
+
+def tau_grid ( t, grid_size=64 ):
+  """
+  Time constants used for the initial search, log-spaced from a tenth of
+  the smallest time step to a hundred times the length of the trace.
+
+  :param t: Time points
+  :type t: array
+  :param grid_size: Number of time constants
+  :type grid_size: int
+
+  :return: Time constants
+  :rtype: array
+  """
+  t = np.asarray(t, dtype=float)
+  span = t[-1] - t[0]
+  step = np.min(t[1:] - t[:-1])
+  return np.exp(np.linspace(np.log(step / 10), np.log(span * 100), grid_size))
+
+def fit_exponential ( t, y, grid_size=64, refine_size=32, levels=3 ):
+  """
+  Fit an exponential decay :math:`y = b + a \\cdot e^{-t/c}`.
+
+  For a given time constant :math:`c` the amplitude :math:`a` and offset :math:`b`
+  follow from linear least squares. The best time constant is searched on a
+  log-spaced grid, which is refined around the best value a few times,
+  followed by a parabolic interpolation. All traces are fitted at the same
+  time.
+
+  The fit is considered not converged when the data can't be fitted, or when
+  the best time constant is at the edge of the grid (e.g. the trace is flat
+  or linear).
+
+  :param t: Time points (the same for all traces)
+  :type t: array of shape (n_points,)
+  :param y: Trace or traces (one per row)
+  :type y: array of shape (n_points,) or (n_samples, n_points)
+  :param grid_size: Number of time constants for the initial search
+  :type grid_size: int
+  :param refine_size: Number of time constants for each refinement
+  :type refine_size: int
+  :param levels: Number of refinements
+  :type levels: int
+
+  :return: Amplitude a, offset b, time constant c and if the fit converged
+  :rtype: tuple of (float, float, float, bool) or arrays for multiple traces
+
+  :raises ValueError: if the trace and time points don't match
+  """
+  t = np.asarray(t, dtype=float)
+  y = np.asarray(y, dtype=float)
+
+  if t.ndim != 1 or t.size < 3 or y.shape[-1] != t.size:
+    raise ValueError("Trace needs to have the same number of points as the time points (at least 3)")
+
+  y_mean = y.sum(axis=-1) / t.size
+  y_c = (y - y_mean[..., None])[..., None, :]
+
+  ## Initial search on the grid for all traces (in log space)
+  grid = np.log(tau_grid(t, grid_size))
+  scores = _linear(t, y_c, y_mean[..., None], np.exp(grid))[2]
+  idx = np.argmax(scores, axis=-1)
+  converged = (idx > 0) & (idx < grid_size - 1)
+  step = grid[1] - grid[0]
+  idx = np.clip(idx, 1, grid_size - 2)[..., None]
+  best = np.take_along_axis(np.broadcast_to(grid, scores.shape), idx, axis=-1)[..., 0]
+
+  ## Refine the grid around the best time constant, each time
+  ## covering the range between its neighbours
+  offsets = np.linspace(-1, 1, refine_size)
+  for _ in range(levels):
+    grid = best[..., None] + step * offsets
+    scores = _linear(t, y_c, y_mean[..., None], np.exp(grid))[2]
+    idx = np.clip(np.argmax(scores, axis=-1), 1, refine_size - 2)[..., None]
+    best = np.take_along_axis(grid, idx, axis=-1)[..., 0]
+    step = step * 2 / (refine_size - 1)
+
+  ## Parabolic interpolation through the best point and its neighbours
+  s0, s1, s2 = (np.take_along_axis(scores, idx + i, axis=-1)[..., 0] for i in (-1, 0, 1))
+  with np.errstate(divide='ignore', invalid='ignore'):
+    shift = 0.5 * step * (s0 - s2) / (s0 - 2 * s1 + s2)
+  best = best + np.where(np.isfinite(shift), np.clip(shift, -step, step), 0)
+
+  c = np.exp(best)
+  a, b, score = _linear(t, y_c[..., 0, :], y_mean, c)
+
+  converged = converged & np.isfinite(score) & np.isfinite(a) & np.isfinite(b)
+
+  ## Return scalars for a single trace
+  return a[()], b[()], c[()], converged[()]
+
+def _projected ( t, y_c, u ):
+  """
+  Amplitude, centered residuals and their (Kaufman) derivative with respect
+  to the log time constant u, with the linear parameters projected out
+  """
+  k = np.exp(-u)[:, None]
+  e = np.exp(-t * k)
+  e_c = e - e.mean(axis=-1, keepdims=True)
+  var = np.einsum('ij,ij->i', e_c, e_c)
+
+  with np.errstate(divide='ignore', invalid='ignore'):
+    a = np.einsum('ij,ij->i', e_c, y_c) / var
+    residual = y_c - a[:, None] * e_c
+
+    ## Derivative of the model, projected onto the residual space
+    v = t * e * k
+    v_c = v - v.mean(axis=-1, keepdims=True)
+    v_c = v_c - (np.einsum('ij,ij->i', v_c, e_c) / var)[:, None] * e_c
+
+  return a, e.mean(axis=-1), residual, -a[:, None] * v_c
+
+def fit_exponential_lm ( t, y, p0=None, iterations=50, tolerance=1e-10 ):
+  """
+  Fit an exponential decay :math:`y = b + a \\cdot e^{-t/c}` using
+  Levenberg-Marquardt iterations. Like for :func:`fit_exponential`, the
+  amplitude :math:`a` and offset :math:`b` are solved by linear least squares,
+  so the iterations only need to find the time constant (variable projection).
+  The Gauss-Newton curvature is replaced by a secant estimate once available.
+  All traces are fitted at the same time, each with its own damping, and only
+  traces that haven't converged yet are updated in each iteration.
+
+  The initial time constant is taken from the grid search of
+  :func:`fit_exponential` (without refinements) if not provided.
+
+  The fit is considered not converged when the iterations didn't converge,
+  or the time constant is outside the range searched by :func:`fit_exponential`.
+
+  :param t: Time points (the same for all traces)
+  :type t: array of shape (n_points,)
+  :param y: Trace or traces (one per row)
+  :type y: array of shape (n_points,) or (n_samples, n_points)
+  :param p0: Initial time constant (for all or each trace)
+  :type p0: float or array
+  :param iterations: Maximum number of iterations
+  :type iterations: int
+  :param tolerance: Change of the log time constant at which the fit is converged
+  :type tolerance: float
+
+  :return: Amplitude a, offset b, time constant c and if the fit converged
+  :rtype: tuple of (float, float, float, bool) or arrays for multiple traces
+
+  :raises ValueError: if the trace and time points don't match
+  """
+  t = np.asarray(t, dtype=float)
+  y = np.asarray(y, dtype=float)
+
+  if t.ndim != 1 or t.size < 3 or y.shape[-1] != t.size:
+    raise ValueError("Trace needs to have the same number of points as the time points (at least 3)")
+
+  if p0 is None:
+    p0 = fit_exponential(t, y, levels=0)[2]
+
+  shape = y.shape[:-1]
+  y = y.reshape(-1, t.size)
+  y_mean = y.mean(axis=-1)
+  y_c = y - y_mean[:, None]
+
+  ## Log of the time constant, one per trace, limited to the range of the grid search
+  lower, upper = np.log(tau_grid(t, 2))
+  with np.errstate(divide='ignore', invalid='ignore'):
+    u = np.clip(np.log(np.broadcast_to(np.asarray(p0, dtype=float), shape)).ravel(), lower, upper)
+
+  a, e_mean, residual, jac = _projected(t, y_c, u)
+  cost = np.einsum('ij,ij->i', residual, residual)
+  grad = np.einsum('ij,ij->i', jac, residual)
+  curvature = np.einsum('ij,ij->i', jac, jac)
+  damping = np.full(u.shape, 1e-3)
+  converged = np.zeros(u.shape, dtype=bool)
+  active = np.flatnonzero(np.isfinite(cost))
+
+  for _ in range(iterations):
+    if active.size == 0:
+      break
+
+    ## Damped Newton step for the active traces
+    with np.errstate(divide='ignore', invalid='ignore'):
+      step = -grad[active] / (curvature[active] * (1 + damping[active]))
+
+    u_new = np.clip(u[active] + step, lower, upper)
+    a_new, e_mean_new, residual_new, jac_new = _projected(t, y_c[active], u_new)
+    cost_new = np.einsum('ij,ij->i', residual_new, residual_new)
+    grad_new = np.einsum('ij,ij->i', jac_new, residual_new)
+
+    ## The curvature is estimated from the change of the gradient (secant), as the
+    ## Gauss-Newton approximation converges slowly for noisy traces
+    with np.errstate(divide='ignore', invalid='ignore'):
+      secant = (grad_new - grad[active]) / (u_new - u[active])
+    curvature_new = np.where(np.isfinite(secant) & (secant > 0), secant, np.einsum('ij,ij->i', jac_new, jac_new))
+
+    better = cost_new <= cost[active]
+    edge = better & ((u_new == lower) | (u_new == upper))
+    small = ~np.isfinite(step) | (np.abs(step) <= tolerance) | edge
+
+    keep = active[better]
+    u[keep] = u_new[better]
+    a[keep] = a_new[better]
+    e_mean[keep] = e_mean_new[better]
+    residual[keep] = residual_new[better]
+    jac[keep] = jac_new[better]
+    cost[keep] = cost_new[better]
+    grad[keep] = grad_new[better]
+    curvature[keep] = curvature_new[better]
+    damping[active] = np.where(better, damping[active] / 10, np.minimum(damping[active] * 10, 1e16))
+
+    converged[active] = small & np.isfinite(step) & ~edge
+    active = active[~small]
+
+  c = np.exp(u)
+  b = y_mean - a * e_mean
+
+  converged = converged & np.isfinite(cost) & np.isfinite(a) & (u > lower) & (u < upper)
+
+  ## Return scalars for a single trace
+  return tuple(v.reshape(shape)[()] for v in (a, b, c, converged))
@@ -0,0 +1,59 @@
+"""
+Find the protocols within a measurement by their label.
+"""
+
+class LabelIndex:
+    """
+    Protocols (``set`` entries) of a measurement grouped by label. The
+    measurement is only scanned once, when the index is created.
+
+    :param data: Measurement
+    :type data: dict
+    """
+    def __init__(self, data: dict):
+        self.set = data.get("set", []) if isinstance(data, dict) else []
+        self.size = len(self.set)
+        self.labels = {}
+
+        for protocol in self.set:
+            if isinstance(protocol, dict) and "label" in protocol:
+                self.labels.setdefault(protocol["label"], []).append(protocol)
+
+    def get(self, label=None, array=False):
+        """
+        Get the protocol(s) with the given label, same as ``GetProtocolByLabel``
+
+        Args:
+            label: Protocol label
+            array: Always return a list
+
+        Returns:
+            Single protocol, list of protocols or None if the label is not found
+        """
+        out = self.labels.get(label)
+
+        if not out:
+            return None
+
+        if len(out) == 1 and not array:
+            return out[0]
+
+        return list(out)
+
+    def __contains__(self, label):
+        return label in self.labels
+
+def label_index ( data ):
+  """
+  Get the label index of a measurement. Create it once at the start of
+  the analysis and use it for all lookups, so the measurement is only
+  scanned once. The index is not cached, so changes to the measurement
+  afterwards are not included.
+
+  :param data: Measurement
+  :type data: dict
+
+  :return: Label index
+  :rtype: LabelIndex
+  """
+  return LabelIndex(data)
@@ -15,7 +15,9 @@ These calibration steps require the chlorophyll calibration and the pink fluores
 import numpy as np
 from scipy import stats
 import warnings
-from jii_multispeq.analysis import GetProtocolByLabel
+from jii_multispeq_protocols.examples import lazy_example
+from jii_multispeq_protocols.labels import label_index
+from jii_multispeq_protocols.device import DeviceCommandBuilder
 
 _protocol = [
   {
@@ -334,6 +336,41 @@ _protocol = [
   }
 ]
 
+def _bleed_offsets( traces, nMeasuringLEDS, subPoints ):
+  """
+  Average offset of the baseline corrected traces for each measuring LED
+  (rows) and trace (columns). The measuring LEDs are interleaved in ``data_raw``.
+
+  :param traces: Protocols with the interleaved traces (``data_raw``)
+  :type traces: list
+  :param nMeasuringLEDS: Number of measuring LEDs
+  :type nMeasuringLEDS: int
+  :param subPoints: Number of points for the baseline
+  :type subPoints: int
+
+  :return: Offsets
+  :rtype: array of shape (nMeasuringLEDS, number of traces)
+  """
+  lengths = set( len(trace["data_raw"]) for trace in traces )
+
+  ## Traces that can't be stacked are handled one by one
+  if len(lengths) != 1 or lengths.pop() % nMeasuringLEDS != 0:
+    offsets = []
+    for ledidx in range(nMeasuringLEDS):
+      offsets.append([])
+      for trace in traces:
+        t = trace["data_raw"][ledidx::nMeasuringLEDS]
+        t = np.array(t) - np.mean(t[0:subPoints])
+        offsets[ledidx].append(np.mean(t[int(subPoints)+3 : 2*subPoints]))
+    return np.array(offsets)
+
+  ## (traces, points, LEDs) -> (LEDs, traces, points), so the averages are taken along the last axis
+  data = np.array([trace["data_raw"] for trace in traces], dtype=float)
+  data = np.ascontiguousarray(data.reshape(len(traces), -1, nMeasuringLEDS).transpose(2, 0, 1))
+
+  baseline = data[..., 0:subPoints].mean(axis=-1)
+  return (data - baseline[..., None])[..., int(subPoints)+3 : 2*subPoints].mean(axis=-1)
+
 def _analyze( _data ):
   """
   Macro for data evaluation artifacts on measurements caused by actinic light ground loops
@@ -446,32 +483,32 @@ def _analyze( _data ):
 
   nSettings = len(act_settings)
 
-  toDevice=""
+  toDevice = DeviceCommandBuilder()
 
   for i in range(15):
-    toDevice += "bleed3+%s+0+0+0+0+0+0+0+0+" % i
+    toDevice.add("bleed3", i, *[0] * 8)
 
 
   issues = 0
 
+  labels = label_index(_data)
+
   for aLEDindex in range(len(aLEDs)):
     actBleed = []
     
     b = nSettings * aLEDindex
     e = nSettings * (1 + aLEDindex)
       
-    t = GetProtocolByLabel( "bc0", _data, True )[b:e]
+    t = labels.get( "bc0", True )[b:e]
     actBleed.append(t)
     
     # output["trace_%s" % aLEDindex] = t["data_raw"] #TODO: This is not working, not sure why it is in the js code like this
 
-    t = GetProtocolByLabel( "bc1", _data, True )[b:e]
+    t = labels.get( "bc1", True )[b:e]
     actBleed.append(t)
 
     
 
-    actBleedTrace = {}
-      
     subPoints = _data["v_arrays"][1][1]
       
     LEDs = _data["v_arrays"][2] ## set up array for LEDs tested. Note: this does not include the baseline
@@ -483,23 +520,17 @@ def _analyze( _data ):
       for ledidx in range(len(mLEDs)):
         tn = "actBleed_%s_aLED_%s_det_%s_bleed_%s" % (mLedNames[mLEDs[ledidx]], aLEDs[aLEDindex],  mDetectors[ledidx], actBleed[abi][0]["bleed_correction"])
         tname.append(tn)
-        actBleedTrace[tn] = []
-        offset[tn] = []
 
       actbleed = actBleed[abi]  ## set actbleed to the array of traces in this run of the set
 
+      ## extract traces for each detector, subtract the baseline and average the offset for all intensities at once
+      offsets = _bleed_offsets(actbleed, nMeasuringLEDS, subPoints)
+
       for ledidx in range(len(mLEDs)):
-        numIntensities = len(actbleed)
-        for i in range(numIntensities):  ## extract traces for each detector, subtract the baseline
-          t = actbleed[i]["data_raw"][ledidx::nMeasuringLEDS]
-          tm = np.mean(t[0:subPoints])
-          t = np.array(t) - tm ## subtract off the baseline
-          actBleedTrace[tname[ledidx]].append(t)
-          averageOffset = np.mean(t[int(subPoints)+3 : 2*subPoints])
-          offset[tname[ledidx]].append(averageOffset)
-          # if actbleed[i]["bleed_correction"] == 1:  #TODO: Seems like it is not used
-          #   Xbounds = Extr[aLEDindex]
-          #   b = Xbounds[aLEDindex][mLEDs[ledidx]-1]
+        offset[tname[ledidx]] = list(offsets[ledidx])
+        # if actbleed[i]["bleed_correction"] == 1:  #TODO: Seems like it is not used
+        #   Xbounds = Extr[aLEDindex]
+        #   b = Xbounds[aLEDindex][mLEDs[ledidx]-1]
 
         if graphs == True:
           output["offset_%s" %tname[ledidx]] = offset[tname[ledidx]]
@@ -508,11860 +539,20 @@ def _analyze( _data ):
         detN = mDetectors[ledidx]
         bleedArray = bleedArrays[aLEDs[aLEDindex]]
         if actbleed[0]["bleed_correction"] == 0:
-            toDevice+="bleed3+%s+" % bleedArray[detN][ledN-1] ## MapLedToDet[mDetectors[ledidx]-1][mLEDs[ledidx]-1];
+            toDevice.add("bleed3", bleedArray[detN][ledN-1]) ## MapLedToDet[mDetectors[ledidx]-1][mLEDs[ledidx]-1];
             for j in range(8):
-              toDevice += "%s+" % np.round(10 * offset[tname[ledidx]][j], 0)
-
-
-  output["toDevice"] = toDevice
+              toDevice.add_args(np.round(10 * offset[tname[ledidx]][j], 0))
 
   if issues == 0:
     output["status"] = " Test OK"
   else:
     output["status"] = " WARNING: %s found! Try sending calibration data to instrument." % issues
-    output["toDevice"] = toDevice
 
-  output["toDevice"] += "setCalTime+2+setCalOK+2+0+"
-
-  return output
+  toDevice.add("setCalTime", 2).add("setCalOK", 2, 0)
 
+  output["toDevice"] = toDevice.serialize()
 
-_example = {
-  "time": 1600040142460,
-  "device_name": "MultispeQ",
-  "device_version": "2",
-  "device_id": "52:00:12:bc",
-  "device_battery": 98,
-  "device_firmware": 2.343,
-  "sample": [
-    [
-      {
-        "time": 1600040142460,
-        "v_arrays": [
-          [
-            0,
-            -200,
-            -400,
-            -750,
-            -1000,
-            -2000,
-            -3000,
-            -4000
-          ],
-          [
-            200,
-            30
-          ],
-          [
-            2,
-            9
-          ],
-          [
-            1,
-            0,
-            1,
-            0
-          ]
-        ],
-        "set_repeats": 2,
-        "protocol_id": 1,
-        "set": [
-          {
-            "time": 1600040142475,
-            "message": [
-              "alert",
-              "Clamp the Fluorescent Card (pink)",
-              "ok"
-            ],
-            "autogain": [
-              [
-                1,
-                1,
-                3,
-                15,
-                -4294,
-                29562
-              ],
-              [
-                6,
-                6,
-                1,
-                15,
-                -1342,
-                27708
-              ],
-              [
-                0,
-                10,
-                1,
-                15,
-                -1095,
-                45919
-              ]
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1600040150908,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29112,
-              27614,
-              45675,
-              977,
-              29112,
-              27615,
-              45669,
-              975,
-              29122,
-              27612,
-              45669,
-              974,
-              29112,
-              27611,
-              45667,
-              974,
-              29116,
-              27615,
-              45677,
-              974,
-              29114,
-              27613,
-              45675,
-              976,
-              29114,
-              27614,
-              45675,
-              975,
-              29116,
-              27613,
-              45674,
-              975,
-              29113,
-              27615,
-              45671,
-              975,
-              29114,
-              27613,
-              45674,
-              974,
-              29114,
-              27614,
-              45674,
-              976,
-              29112,
-              27611,
-              45677,
-              975,
-              29113,
-              27610,
-              45678,
-              975,
-              29110,
-              27615,
-              45671,
-              975,
-              29117,
-              27615,
-              45671,
-              975,
-              29110,
-              27611,
-              45673,
-              975,
-              29110,
-              27614,
-              45674,
-              974,
-              29116,
-              27611,
-              45673,
-              975,
-              29116,
-              27615,
-              45675,
-              975,
-              29109,
-              27613,
-              45678,
-              975,
-              29111,
-              27614,
-              45672,
-              974,
-              29110,
-              27614,
-              45673,
-              975,
-              29110,
-              27615,
-              45673,
-              974,
-              29114,
-              27613,
-              45673,
-              974,
-              29113,
-              27614,
-              45671,
-              975,
-              29107,
-              27614,
-              45673,
-              973,
-              29116,
-              27613,
-              45676,
-              974,
-              29113,
-              27611,
-              45675,
-              974,
-              29112,
-              27616,
-              45672,
-              975,
-              29111,
-              27611,
-              45671,
-              976,
-              29113,
-              27613,
-              45670,
-              974,
-              29108,
-              27615,
-              45677,
-              975,
-              29113,
-              27613,
-              45678,
-              973,
-              29108,
-              27614,
-              45675,
-              975,
-              29114,
-              27614,
-              45672,
-              974,
-              29111,
-              27614,
-              45676,
-              974,
-              29108,
-              27614,
-              45677,
-              975,
-              29112,
-              27611,
-              45670,
-              975,
-              29112,
-              27614,
-              45672,
-              975,
-              29114,
-              27611,
-              45673,
-              975,
-              29110,
-              27611,
-              45674,
-              974,
-              29108,
-              27614,
-              45672,
-              975,
-              29114,
-              27613,
-              45678,
-              975,
-              29112,
-              27613,
-              45676,
-              974,
-              29114,
-              27613,
-              45675,
-              975,
-              29110,
-              27612,
-              45679,
-              973,
-              29112,
-              27614,
-              45679,
-              975,
-              29112,
-              27612,
-              45678,
-              975,
-              29110,
-              27615,
-              45671,
-              975,
-              29114,
-              27614,
-              45675,
-              975,
-              29112,
-              27614,
-              45673,
-              974,
-              29106,
-              27611,
-              45671,
-              974,
-              29111,
-              27613,
-              45669,
-              974,
-              29113,
-              27611,
-              45673,
-              973,
-              29116,
-              27610,
-              45678,
-              975,
-              29109,
-              27613,
-              45676,
-              975,
-              29110,
-              27613,
-              45674,
-              975,
-              29110,
-              27615,
-              45670,
-              973,
-              29113,
-              27615,
-              45676,
-              975,
-              29115,
-              27614,
-              45680,
-              975,
-              29112,
-              27614,
-              45679,
-              975,
-              29110,
-              27608,
-              45670,
-              975,
-              29109,
-              27612,
-              45679,
-              975,
-              29111,
-              27611,
-              45674,
-              974,
-              29112,
-              27610,
-              45675,
-              974,
-              29113,
-              27615,
-              45679,
-              975,
-              29113,
-              27613,
-              45671,
-              973,
-              29112,
-              27612,
-              45676,
-              975,
-              29107,
-              27611,
-              45679,
-              973,
-              29107,
-              27612,
-              45671,
-              974,
-              29104,
-              27611,
-              45677,
-              975,
-              29106,
-              27610,
-              45674,
-              976,
-              29106,
-              27611,
-              45678,
-              976,
-              29111,
-              27615,
-              45673,
-              974,
-              29108,
-              27612,
-              45675,
-              974,
-              29108,
-              27612,
-              45675,
-              975,
-              29106,
-              27611,
-              45677,
-              975,
-              29107,
-              27615,
-              45674,
-              975,
-              29108,
-              27614,
-              45675,
-              974,
-              29111,
-              27615,
-              45675,
-              977,
-              29110,
-              27615,
-              45677,
-              975,
-              29104,
-              27615,
-              45675,
-              973,
-              29106,
-              27613,
-              45675,
-              974,
-              29104,
-              27613,
-              45675,
-              975,
-              29108,
-              27611,
-              45671,
-              975,
-              29103,
-              27613,
-              45675,
-              975,
-              29108,
-              27614,
-              45671,
-              974,
-              29106,
-              27614,
-              45679,
-              975,
-              29107,
-              27613,
-              45675,
-              973,
-              29106,
-              27616,
-              45675,
-              974
-            ]
-          },
-          {
-            "time": 1600040152037,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29094,
-              27616,
-              45679,
-              975,
-              29102,
-              27616,
-              45677,
-              975,
-              29102,
-              27615,
-              45679,
-              975,
-              29099,
-              27617,
-              45676,
-              974,
-              29104,
-              27611,
-              45676,
-              975,
-              29103,
-              27613,
-              45681,
-              975,
-              29099,
-              27609,
-              45674,
-              975,
-              29105,
-              27613,
-              45680,
-              974,
-              29103,
-              27611,
-              45671,
-              976,
-              29100,
-              27613,
-              45675,
-              975,
-              29099,
-              27614,
-              45675,
-              974,
-              29101,
-              27614,
-              45675,
-              977,
-              29102,
-              27615,
-              45675,
-              975,
-              29102,
-              27610,
-              45676,
-              974,
-              29100,
-              27612,
-              45675,
-              975,
-              29102,
-              27612,
-              45677,
-              974,
-              29101,
-              27613,
-              45676,
-              975,
-              29103,
-              27612,
-              45673,
-              975,
-              29101,
-              27615,
-              45675,
-              974,
-              29098,
-              27614,
-              45675,
-              976,
-              29101,
-              27610,
-              45675,
-              975,
-              29104,
-              27615,
-              45677,
-              975,
-              29097,
-              27615,
-              45681,
-              974,
-              29105,
-              27611,
-              45675,
-              975,
-              29098,
-              27614,
-              45673,
-              974,
-              29100,
-              27615,
-              45675,
-              975,
-              29100,
-              27611,
-              45675,
-              975,
-              29100,
-              27612,
-              45677,
-              974,
-              29106,
-              27610,
-              45681,
-              976,
-              29102,
-              27615,
-              45676,
-              975,
-              29098,
-              27611,
-              45674,
-              973,
-              29099,
-              27612,
-              45676,
-              974,
-              29099,
-              27615,
-              45682,
-              974,
-              29098,
-              27615,
-              45678,
-              974,
-              29099,
-              27613,
-              45677,
-              974,
-              29097,
-              27611,
-              45676,
-              974,
-              29097,
-              27614,
-              45681,
-              975,
-              29099,
-              27616,
-              45680,
-              975,
-              29095,
-              27617,
-              45678,
-              974,
-              29097,
-              27615,
-              45676,
-              975,
-              29095,
-              27615,
-              45670,
-              973,
-              29098,
-              27612,
-              45676,
-              975,
-              29095,
-              27617,
-              45678,
-              974,
-              29100,
-              27614,
-              45672,
-              975,
-              29097,
-              27613,
-              45672,
-              976,
-              29098,
-              27611,
-              45673,
-              975,
-              29095,
-              27612,
-              45676,
-              974,
-              29097,
-              27615,
-              45670,
-              975,
-              29096,
-              27616,
-              45677,
-              975,
-              29095,
-              27613,
-              45674,
-              974,
-              29099,
-              27613,
-              45678,
-              974,
-              29098,
-              27615,
-              45676,
-              975,
-              29099,
-              27615,
-              45676,
-              973,
-              29093,
-              27613,
-              45682,
-              975,
-              29096,
-              27615,
-              45674,
-              973,
-              29094,
-              27617,
-              45680,
-              975,
-              29095,
-              27614,
-              45676,
-              974,
-              29096,
-              27611,
-              45678,
-              974,
-              29095,
-              27613,
-              45674,
-              975,
-              29093,
-              27617,
-              45677,
-              974,
-              29095,
-              27615,
-              45676,
-              973,
-              29098,
-              27613,
-              45681,
-              974,
-              29101,
-              27614,
-              45679,
-              975,
-              29102,
-              27614,
-              45677,
-              975,
-              29098,
-              27611,
-              45674,
-              975,
-              29096,
-              27617,
-              45683,
-              974,
-              29094,
-              27613,
-              45675,
-              975,
-              29098,
-              27613,
-              45676,
-              973,
-              29098,
-              27612,
-              45684,
-              975,
-              29102,
-              27613,
-              45675,
-              976,
-              29100,
-              27615,
-              45681,
-              974,
-              29098,
-              27615,
-              45678,
-              975,
-              29106,
-              27612,
-              45675,
-              976,
-              29099,
-              27615,
-              45675,
-              975,
-              29096,
-              27613,
-              45674,
-              975,
-              29096,
-              27611,
-              45677,
-              972,
-              29096,
-              27615,
-              45677,
-              974,
-              29102,
-              27615,
-              45675,
-              974,
-              29099,
-              27614,
-              45674,
-              974,
-              29102,
-              27617,
-              45675,
-              975,
-              29101,
-              27614,
-              45678,
-              974,
-              29104,
-              27617,
-              45683,
-              974,
-              29098,
-              27612,
-              45681,
-              975,
-              29098,
-              27612,
-              45677,
-              974,
-              29101,
-              27612,
-              45676,
-              975,
-              29098,
-              27611,
-              45679,
-              973,
-              29098,
-              27616,
-              45675,
-              975,
-              29100,
-              27611,
-              45678,
-              975,
-              29104,
-              27614,
-              45681,
-              974,
-              29098,
-              27611,
-              45679,
-              974
-            ]
-          },
-          {
-            "time": 1600040153166,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29089,
-              27615,
-              45683,
-              975,
-              29092,
-              27614,
-              45673,
-              974,
-              29098,
-              27614,
-              45679,
-              974,
-              29098,
-              27613,
-              45677,
-              975,
-              29098,
-              27611,
-              45677,
-              974,
-              29098,
-              27611,
-              45681,
-              974,
-              29093,
-              27613,
-              45673,
-              974,
-              29094,
-              27613,
-              45678,
-              974,
-              29100,
-              27615,
-              45677,
-              975,
-              29102,
-              27614,
-              45679,
-              973,
-              29096,
-              27611,
-              45671,
-              973,
-              29100,
-              27611,
-              45671,
-              974,
-              29096,
-              27615,
-              45677,
-              973,
-              29096,
-              27617,
-              45673,
-              974,
-              29098,
-              27611,
-              45671,
-              973,
-              29090,
-              27619,
-              45675,
-              974,
-              29097,
-              27614,
-              45675,
-              975,
-              29097,
-              27613,
-              45671,
-              975,
-              29094,
-              27611,
-              45674,
-              974,
-              29096,
-              27615,
-              45671,
-              975,
-              29097,
-              27613,
-              45675,
-              975,
-              29096,
-              27616,
-              45675,
-              975,
-              29094,
-              27616,
-              45671,
-              974,
-              29092,
-              27615,
-              45671,
-              973,
-              29097,
-              27610,
-              45671,
-              975,
-              29096,
-              27613,
-              45677,
-              973,
-              29094,
-              27615,
-              45677,
-              974,
-              29097,
-              27615,
-              45674,
-              975,
-              29094,
-              27613,
-              45677,
-              974,
-              29090,
-              27614,
-              45673,
-              974,
-              29096,
-              27615,
-              45675,
-              974,
-              29092,
-              27615,
-              45678,
-              974,
-              29095,
-              27611,
-              45674,
-              974,
-              29096,
-              27615,
-              45678,
-              975,
-              29092,
-              27616,
-              45673,
-              974,
-              29088,
-              27613,
-              45676,
-              973,
-              29096,
-              27615,
-              45678,
-              975,
-              29092,
-              27616,
-              45673,
-              975,
-              29092,
-              27615,
-              45674,
-              973,
-              29091,
-              27615,
-              45676,
-              974,
-              29091,
-              27616,
-              45676,
-              975,
-              29091,
-              27615,
-              45682,
-              974,
-              29092,
-              27618,
-              45678,
-              974,
-              29092,
-              27616,
-              45677,
-              974,
-              29089,
-              27615,
-              45682,
-              973,
-              29093,
-              27614,
-              45682,
-              974,
-              29089,
-              27614,
-              45678,
-              974,
-              29091,
-              27616,
-              45675,
-              975,
-              29092,
-              27619,
-              45682,
-              973,
-              29089,
-              27615,
-              45676,
-              974,
-              29089,
-              27615,
-              45680,
-              973,
-              29088,
-              27617,
-              45675,
-              974,
-              29091,
-              27617,
-              45678,
-              975,
-              29092,
-              27615,
-              45677,
-              975,
-              29092,
-              27615,
-              45676,
-              975,
-              29095,
-              27614,
-              45674,
-              973,
-              29092,
-              27614,
-              45672,
-              974,
-              29092,
-              27617,
-              45678,
-              974,
-              29090,
-              27617,
-              45678,
-              974,
-              29092,
-              27614,
-              45677,
-              974,
-              29096,
-              27615,
-              45679,
-              975,
-              29094,
-              27615,
-              45679,
-              974,
-              29090,
-              27615,
-              45679,
-              975,
-              29094,
-              27614,
-              45671,
-              973,
-              29094,
-              27615,
-              45679,
-              974,
-              29093,
-              27614,
-              45678,
-              974,
-              29094,
-              27615,
-              45675,
-              973,
-              29091,
-              27614,
-              45671,
-              975,
-              29096,
-              27614,
-              45679,
-              975,
-              29096,
-              27612,
-              45675,
-              974,
-              29094,
-              27614,
-              45674,
-              975,
-              29095,
-              27612,
-              45674,
-              973,
-              29092,
-              27615,
-              45679,
-              973,
-              29097,
-              27615,
-              45677,
-              973,
-              29097,
-              27611,
-              45673,
-              974,
-              29093,
-              27613,
-              45675,
-              974,
-              29096,
-              27614,
-              45673,
-              974,
-              29094,
-              27617,
-              45673,
-              972,
-              29094,
-              27615,
-              45674,
-              974,
-              29098,
-              27611,
-              45676,
-              972,
-              29097,
-              27613,
-              45671,
-              974,
-              29097,
-              27611,
-              45675,
-              974,
-              29094,
-              27613,
-              45677,
-              975,
-              29094,
-              27613,
-              45677,
-              974,
-              29095,
-              27611,
-              45671,
-              974,
-              29097,
-              27616,
-              45671,
-              973,
-              29093,
-              27615,
-              45671,
-              973,
-              29096,
-              27612,
-              45674,
-              973,
-              29093,
-              27615,
-              45675,
-              975,
-              29092,
-              27614,
-              45678,
-              975
-            ]
-          },
-          {
-            "time": 1600040154295,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29086,
-              27613,
-              45673,
-              973,
-              29092,
-              27615,
-              45671,
-              975,
-              29089,
-              27614,
-              45673,
-              975,
-              29089,
-              27613,
-              45683,
-              974,
-              29087,
-              27611,
-              45679,
-              976,
-              29094,
-              27616,
-              45679,
-              975,
-              29090,
-              27611,
-              45677,
-              975,
-              29092,
-              27613,
-              45675,
-              974,
-              29090,
-              27614,
-              45678,
-              974,
-              29088,
-              27612,
-              45678,
-              975,
-              29092,
-              27613,
-              45675,
-              975,
-              29094,
-              27612,
-              45675,
-              974,
-              29092,
-              27611,
-              45674,
-              974,
-              29090,
-              27612,
-              45679,
-              976,
-              29093,
-              27613,
-              45678,
-              975,
-              29094,
-              27613,
-              45677,
-              974,
-              29090,
-              27614,
-              45678,
-              973,
-              29096,
-              27611,
-              45679,
-              973,
-              29094,
-              27613,
-              45671,
-              974,
-              29094,
-              27612,
-              45673,
-              975,
-              29093,
-              27612,
-              45675,
-              976,
-              29094,
-              27613,
-              45678,
-              974,
-              29094,
-              27614,
-              45681,
-              975,
-              29094,
-              27615,
-              45679,
-              975,
-              29096,
-              27611,
-              45671,
-              974,
-              29092,
-              27614,
-              45679,
-              975,
-              29093,
-              27613,
-              45675,
-              974,
-              29092,
-              27615,
-              45677,
-              975,
-              29093,
-              27613,
-              45679,
-              974,
-              29090,
-              27610,
-              45682,
-              973,
-              29096,
-              27609,
-              45682,
-              974,
-              29090,
-              27613,
-              45679,
-              974,
-              29092,
-              27612,
-              45679,
-              975,
-              29092,
-              27613,
-              45678,
-              974,
-              29096,
-              27613,
-              45678,
-              972,
-              29090,
-              27612,
-              45676,
-              973,
-              29088,
-              27615,
-              45682,
-              973,
-              29088,
-              27615,
-              45673,
-              973,
-              29088,
-              27613,
-              45675,
-              974,
-              29088,
-              27612,
-              45679,
-              973,
-              29090,
-              27614,
-              45675,
-              973,
-              29086,
-              27613,
-              45679,
-              972,
-              29090,
-              27613,
-              45680,
-              974,
-              29086,
-              27613,
-              45687,
-              972,
-              29090,
-              27617,
-              45677,
-              973,
-              29092,
-              27615,
-              45679,
-              972,
-              29088,
-              27611,
-              45679,
-              973,
-              29088,
-              27616,
-              45683,
-              972,
-              29090,
-              27613,
-              45675,
-              973,
-              29089,
-              27615,
-              45679,
-              972,
-              29089,
-              27613,
-              45685,
-              974,
-              29093,
-              27615,
-              45677,
-              971,
-              29090,
-              27615,
-              45680,
-              972,
-              29090,
-              27613,
-              45678,
-              974,
-              29086,
-              27616,
-              45679,
-              971,
-              29090,
-              27611,
-              45683,
-              973,
-              29088,
-              27611,
-              45677,
-              971,
-              29084,
-              27611,
-              45677,
-              974,
-              29090,
-              27613,
-              45679,
-              974,
-              29090,
-              27615,
-              45674,
-              973,
-              29084,
-              27612,
-              45679,
-              973,
-              29092,
-              27612,
-              45684,
-              972,
-              29086,
-              27617,
-              45678,
-              973,
-              29089,
-              27613,
-              45675,
-              973,
-              29092,
-              27613,
-              45675,
-              973,
-              29090,
-              27615,
-              45679,
-              974,
-              29093,
-              27614,
-              45679,
-              971,
-              29089,
-              27613,
-              45675,
-              973,
-              29096,
-              27614,
-              45673,
-              971,
-              29092,
-              27611,
-              45678,
-              973,
-              29090,
-              27613,
-              45679,
-              972,
-              29092,
-              27614,
-              45677,
-              974,
-              29094,
-              27613,
-              45679,
-              974,
-              29094,
-              27612,
-              45677,
-              972,
-              29094,
-              27614,
-              45671,
-              974,
-              29090,
-              27615,
-              45677,
-              973,
-              29093,
-              27613,
-              45669,
-              972,
-              29090,
-              27613,
-              45678,
-              974,
-              29094,
-              27611,
-              45677,
-              972,
-              29092,
-              27613,
-              45680,
-              974,
-              29097,
-              27611,
-              45671,
-              972,
-              29096,
-              27610,
-              45676,
-              973,
-              29096,
-              27611,
-              45679,
-              972,
-              29094,
-              27615,
-              45678,
-              974,
-              29096,
-              27613,
-              45675,
-              973,
-              29094,
-              27613,
-              45675,
-              974,
-              29094,
-              27614,
-              45675,
-              974,
-              29096,
-              27612,
-              45679,
-              972,
-              29095,
-              27609,
-              45681,
-              974,
-              29096,
-              27610,
-              45678,
-              972
-            ]
-          },
-          {
-            "time": 1600040155424,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29080,
-              27614,
-              45687,
-              973,
-              29090,
-              27612,
-              45675,
-              974,
-              29094,
-              27611,
-              45679,
-              974,
-              29091,
-              27614,
-              45680,
-              974,
-              29094,
-              27615,
-              45671,
-              974,
-              29096,
-              27613,
-              45675,
-              973,
-              29095,
-              27614,
-              45679,
-              972,
-              29092,
-              27615,
-              45676,
-              973,
-              29095,
-              27613,
-              45674,
-              974,
-              29090,
-              27610,
-              45677,
-              973,
-              29092,
-              27615,
-              45679,
-              975,
-              29093,
-              27613,
-              45678,
-              974,
-              29090,
-              27611,
-              45678,
-              972,
-              29096,
-              27611,
-              45679,
-              973,
-              29092,
-              27615,
-              45679,
-              973,
-              29086,
-              27610,
-              45681,
-              973,
-              29089,
-              27613,
-              45683,
-              974,
-              29094,
-              27612,
-              45676,
-              974,
-              29088,
-              27615,
-              45683,
-              973,
-              29090,
-              27614,
-              45676,
-              973,
-              29086,
-              27612,
-              45675,
-              973,
-              29091,
-              27611,
-              45675,
-              973,
-              29090,
-              27614,
-              45683,
-              973,
-              29087,
-              27614,
-              45678,
-              973,
-              29088,
-              27613,
-              45679,
-              974,
-              29092,
-              27610,
-              45679,
-              974,
-              29087,
-              27613,
-              45681,
-              973,
-              29090,
-              27613,
-              45677,
-              973,
-              29091,
-              27614,
-              45680,
-              973,
-              29090,
-              27611,
-              45683,
-              974,
-              29097,
-              27615,
-              45678,
-              973,
-              29089,
-              27616,
-              45686,
-              973,
-              29094,
-              27617,
-              45676,
-              974,
-              29085,
-              27615,
-              45677,
-              972,
-              29090,
-              27617,
-              45684,
-              972,
-              29090,
-              27615,
-              45686,
-              973,
-              29090,
-              27616,
-              45674,
-              972,
-              29086,
-              27615,
-              45676,
-              972,
-              29091,
-              27612,
-              45676,
-              974,
-              29089,
-              27613,
-              45678,
-              972,
-              29090,
-              27615,
-              45677,
-              971,
-              29090,
-              27615,
-              45676,
-              971,
-              29088,
-              27614,
-              45677,
-              973,
-              29088,
-              27615,
-              45680,
-              974,
-              29090,
-              27616,
-              45682,
-              973,
-              29089,
-              27613,
-              45682,
-              972,
-              29086,
-              27615,
-              45681,
-              972,
-              29089,
-              27615,
-              45684,
-              972,
-              29087,
-              27617,
-              45680,
-              974,
-              29089,
-              27613,
-              45677,
-              972,
-              29086,
-              27613,
-              45679,
-              971,
-              29089,
-              27615,
-              45676,
-              973,
-              29086,
-              27613,
-              45678,
-              973,
-              29087,
-              27615,
-              45678,
-              970,
-              29088,
-              27616,
-              45681,
-              974,
-              29089,
-              27613,
-              45678,
-              971,
-              29090,
-              27618,
-              45680,
-              972,
-              29088,
-              27616,
-              45676,
-              971,
-              29086,
-              27616,
-              45677,
-              972,
-              29088,
-              27613,
-              45675,
-              971,
-              29082,
-              27613,
-              45678,
-              970,
-              29092,
-              27613,
-              45679,
-              971,
-              29093,
-              27613,
-              45679,
-              971,
-              29093,
-              27616,
-              45678,
-              972,
-              29088,
-              27614,
-              45678,
-              973,
-              29091,
-              27617,
-              45681,
-              972,
-              29090,
-              27615,
-              45673,
-              972,
-              29089,
-              27614,
-              45677,
-              973,
-              29092,
-              27614,
-              45679,
-              970,
-              29094,
-              27612,
-              45674,
-              970,
-              29090,
-              27616,
-              45674,
-              971,
-              29094,
-              27615,
-              45675,
-              972,
-              29094,
-              27613,
-              45677,
-              973,
-              29090,
-              27612,
-              45682,
-              971,
-              29089,
-              27615,
-              45680,
-              973,
-              29092,
-              27615,
-              45676,
-              973,
-              29089,
-              27614,
-              45679,
-              973,
-              29094,
-              27613,
-              45679,
-              972,
-              29091,
-              27610,
-              45675,
-              972,
-              29096,
-              27613,
-              45677,
-              971,
-              29094,
-              27615,
-              45681,
-              972,
-              29094,
-              27615,
-              45679,
-              972,
-              29094,
-              27614,
-              45676,
-              971,
-              29094,
-              27613,
-              45681,
-              971,
-              29094,
-              27613,
-              45681,
-              971,
-              29090,
-              27611,
-              45679,
-              973,
-              29090,
-              27613,
-              45683,
-              971,
-              29095,
-              27611,
-              45682,
-              974,
-              29094,
-              27611,
-              45679,
-              973,
-              29093,
-              27613,
-              45676,
-              972
-            ]
-          },
-          {
-            "time": 1600040156553,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29082,
-              27615,
-              45682,
-              972,
-              29085,
-              27615,
-              45679,
-              973,
-              29090,
-              27613,
-              45683,
-              973,
-              29090,
-              27613,
-              45685,
-              971,
-              29090,
-              27615,
-              45677,
-              971,
-              29088,
-              27613,
-              45683,
-              973,
-              29088,
-              27614,
-              45682,
-              971,
-              29093,
-              27617,
-              45677,
-              971,
-              29087,
-              27614,
-              45679,
-              972,
-              29090,
-              27613,
-              45680,
-              973,
-              29086,
-              27615,
-              45678,
-              972,
-              29085,
-              27613,
-              45678,
-              972,
-              29085,
-              27617,
-              45683,
-              973,
-              29092,
-              27611,
-              45675,
-              972,
-              29089,
-              27615,
-              45683,
-              973,
-              29087,
-              27614,
-              45679,
-              971,
-              29088,
-              27615,
-              45679,
-              970,
-              29086,
-              27612,
-              45684,
-              973,
-              29089,
-              27615,
-              45679,
-              971,
-              29088,
-              27615,
-              45679,
-              971,
-              29090,
-              27614,
-              45675,
-              972,
-              29090,
-              27613,
-              45678,
-              974,
-              29088,
-              27613,
-              45683,
-              974,
-              29090,
-              27615,
-              45679,
-              973,
-              29093,
-              27613,
-              45679,
-              973,
-              29088,
-              27617,
-              45681,
-              971,
-              29092,
-              27613,
-              45683,
-              973,
-              29092,
-              27614,
-              45679,
-              972,
-              29092,
-              27615,
-              45676,
-              974,
-              29093,
-              27619,
-              45679,
-              973,
-              29104,
-              27618,
-              45683,
-              973,
-              29088,
-              27614,
-              45677,
-              974,
-              29084,
-              27617,
-              45681,
-              973,
-              29080,
-              27613,
-              45676,
-              972,
-              29081,
-              27615,
-              45679,
-              974,
-              29086,
-              27615,
-              45680,
-              972,
-              29083,
-              27615,
-              45675,
-              973,
-              29086,
-              27615,
-              45676,
-              973,
-              29078,
-              27613,
-              45670,
-              973,
-              29086,
-              27614,
-              45673,
-              972,
-              29079,
-              27613,
-              45672,
-              972,
-              29084,
-              27613,
-              45677,
-              972,
-              29086,
-              27616,
-              45678,
-              973,
-              29080,
-              27613,
-              45675,
-              971,
-              29086,
-              27615,
-              45673,
-              972,
-              29081,
-              27615,
-              45675,
-              972,
-              29086,
-              27613,
-              45676,
-              972,
-              29082,
-              27615,
-              45674,
-              972,
-              29086,
-              27613,
-              45673,
-              972,
-              29080,
-              27616,
-              45673,
-              972,
-              29088,
-              27614,
-              45673,
-              972,
-              29080,
-              27615,
-              45678,
-              971,
-              29081,
-              27613,
-              45676,
-              972,
-              29088,
-              27615,
-              45679,
-              971,
-              29082,
-              27617,
-              45677,
-              971,
-              29088,
-              27613,
-              45674,
-              970,
-              29088,
-              27616,
-              45679,
-              973,
-              29082,
-              27615,
-              45677,
-              972,
-              29085,
-              27615,
-              45676,
-              970,
-              29088,
-              27612,
-              45673,
-              970,
-              29081,
-              27613,
-              45682,
-              969,
-              29086,
-              27613,
-              45679,
-              970,
-              29083,
-              27612,
-              45679,
-              969,
-              29092,
-              27613,
-              45676,
-              970,
-              29087,
-              27613,
-              45679,
-              969,
-              29092,
-              27612,
-              45675,
-              969,
-              29093,
-              27611,
-              45680,
-              969,
-              29094,
-              27616,
-              45677,
-              967,
-              29098,
-              27613,
-              45682,
-              969,
-              29092,
-              27615,
-              45681,
-              968,
-              29094,
-              27613,
-              45676,
-              969,
-              29096,
-              27611,
-              45679,
-              970,
-              29093,
-              27613,
-              45681,
-              969,
-              29094,
-              27611,
-              45675,
-              968,
-              29095,
-              27612,
-              45680,
-              970,
-              29098,
-              27612,
-              45676,
-              969,
-              29094,
-              27609,
-              45676,
-              969,
-              29091,
-              27612,
-              45677,
-              968,
-              29098,
-              27610,
-              45679,
-              969,
-              29097,
-              27613,
-              45682,
-              970,
-              29097,
-              27611,
-              45678,
-              970,
-              29094,
-              27613,
-              45679,
-              968,
-              29095,
-              27612,
-              45682,
-              970,
-              29096,
-              27610,
-              45673,
-              969,
-              29101,
-              27614,
-              45682,
-              971,
-              29101,
-              27615,
-              45675,
-              970,
-              29099,
-              27615,
-              45680,
-              969,
-              29100,
-              27613,
-              45678,
-              969,
-              29102,
-              27615,
-              45678,
-              970,
-              29097,
-              27614,
-              45675,
-              969
-            ]
-          },
-          {
-            "time": 1600040157681,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29088,
-              27614,
-              45681,
-              970,
-              29088,
-              27617,
-              45675,
-              968,
-              29092,
-              27612,
-              45682,
-              968,
-              29092,
-              27615,
-              45675,
-              969,
-              29094,
-              27611,
-              45683,
-              969,
-              29092,
-              27611,
-              45678,
-              969,
-              29095,
-              27614,
-              45681,
-              968,
-              29094,
-              27615,
-              45677,
-              970,
-              29092,
-              27615,
-              45679,
-              969,
-              29093,
-              27610,
-              45682,
-              970,
-              29091,
-              27613,
-              45673,
-              968,
-              29092,
-              27614,
-              45681,
-              971,
-              29088,
-              27614,
-              45678,
-              968,
-              29090,
-              27610,
-              45676,
-              967,
-              29093,
-              27614,
-              45673,
-              970,
-              29094,
-              27613,
-              45671,
-              969,
-              29092,
-              27615,
-              45679,
-              968,
-              29094,
-              27613,
-              45679,
-              970,
-              29093,
-              27615,
-              45679,
-              969,
-              29089,
-              27615,
-              45683,
-              969,
-              29088,
-              27613,
-              45673,
-              969,
-              29092,
-              27611,
-              45677,
-              969,
-              29090,
-              27611,
-              45676,
-              968,
-              29086,
-              27611,
-              45675,
-              969,
-              29090,
-              27611,
-              45675,
-              969,
-              29089,
-              27613,
-              45673,
-              969,
-              29093,
-              27613,
-              45675,
-              968,
-              29093,
-              27615,
-              45679,
-              969,
-              29093,
-              27613,
-              45677,
-              970,
-              29086,
-              27613,
-              45674,
-              969,
-              29103,
-              27613,
-              45678,
-              972,
-              29095,
-              27615,
-              45676,
-              971,
-              29097,
-              27610,
-              45672,
-              969,
-              29094,
-              27615,
-              45674,
-              971,
-              29095,
-              27615,
-              45676,
-              970,
-              29091,
-              27616,
-              45676,
-              969,
-              29090,
-              27614,
-              45676,
-              971,
-              29094,
-              27614,
-              45670,
-              969,
-              29087,
-              27612,
-              45675,
-              968,
-              29091,
-              27612,
-              45672,
-              969,
-              29090,
-              27616,
-              45676,
-              969,
-              29089,
-              27618,
-              45674,
-              968,
-              29087,
-              27614,
-              45678,
-              969,
-              29091,
-              27612,
-              45676,
-              968,
-              29089,
-              27616,
-              45678,
-              968,
-              29087,
-              27613,
-              45680,
-              969,
-              29087,
-              27612,
-              45684,
-              967,
-              29089,
-              27614,
-              45675,
-              969,
-              29089,
-              27612,
-              45678,
-              967,
-              29090,
-              27614,
-              45675,
-              968,
-              29087,
-              27612,
-              45678,
-              969,
-              29084,
-              27616,
-              45684,
-              969,
-              29087,
-              27613,
-              45678,
-              969,
-              29083,
-              27614,
-              45681,
-              967,
-              29090,
-              27614,
-              45677,
-              967,
-              29087,
-              27611,
-              45678,
-              967,
-              29087,
-              27614,
-              45676,
-              966,
-              29087,
-              27612,
-              45678,
-              965,
-              29091,
-              27613,
-              45672,
-              965,
-              29091,
-              27615,
-              45685,
-              967,
-              29081,
-              27611,
-              45679,
-              964,
-              29087,
-              27610,
-              45675,
-              965,
-              29095,
-              27611,
-              45681,
-              966,
-              29090,
-              27611,
-              45679,
-              965,
-              29090,
-              27611,
-              45677,
-              964,
-              29090,
-              27609,
-              45681,
-              966,
-              29094,
-              27611,
-              45681,
-              967,
-              29097,
-              27612,
-              45685,
-              965,
-              29098,
-              27611,
-              45677,
-              963,
-              29098,
-              27611,
-              45679,
-              964,
-              29093,
-              27614,
-              45675,
-              964,
-              29094,
-              27610,
-              45685,
-              966,
-              29098,
-              27611,
-              45677,
-              965,
-              29100,
-              27613,
-              45679,
-              965,
-              29100,
-              27613,
-              45683,
-              965,
-              29098,
-              27613,
-              45679,
-              964,
-              29100,
-              27613,
-              45683,
-              964,
-              29097,
-              27613,
-              45675,
-              965,
-              29101,
-              27612,
-              45679,
-              965,
-              29100,
-              27610,
-              45678,
-              963,
-              29102,
-              27612,
-              45676,
-              966,
-              29102,
-              27610,
-              45679,
-              963,
-              29099,
-              27611,
-              45680,
-              963,
-              29105,
-              27615,
-              45679,
-              966,
-              29104,
-              27611,
-              45679,
-              965,
-              29103,
-              27613,
-              45681,
-              966,
-              29102,
-              27610,
-              45683,
-              964,
-              29106,
-              27612,
-              45682,
-              965,
-              29107,
-              27611,
-              45674,
-              963,
-              29106,
-              27614,
-              45678,
-              964
-            ]
-          },
-          {
-            "time": 1600040158810,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29088,
-              27613,
-              45681,
-              965,
-              29096,
-              27612,
-              45673,
-              963,
-              29100,
-              27614,
-              45673,
-              963,
-              29095,
-              27611,
-              45675,
-              964,
-              29095,
-              27611,
-              45678,
-              964,
-              29092,
-              27611,
-              45683,
-              965,
-              29092,
-              27610,
-              45681,
-              965,
-              29095,
-              27612,
-              45675,
-              963,
-              29091,
-              27611,
-              45673,
-              964,
-              29097,
-              27617,
-              45679,
-              964,
-              29094,
-              27605,
-              45675,
-              964,
-              29100,
-              27612,
-              45677,
-              965,
-              29098,
-              27611,
-              45678,
-              964,
-              29098,
-              27608,
-              45679,
-              966,
-              29093,
-              27614,
-              45679,
-              964,
-              29090,
-              27613,
-              45676,
-              965,
-              29092,
-              27612,
-              45682,
-              963,
-              29097,
-              27614,
-              45679,
-              964,
-              29096,
-              27612,
-              45677,
-              965,
-              29095,
-              27611,
-              45677,
-              966,
-              29092,
-              27611,
-              45679,
-              964,
-              29097,
-              27612,
-              45674,
-              964,
-              29096,
-              27613,
-              45677,
-              965,
-              29093,
-              27612,
-              45679,
-              965,
-              29091,
-              27612,
-              45679,
-              963,
-              29097,
-              27611,
-              45675,
-              965,
-              29094,
-              27611,
-              45681,
-              964,
-              29089,
-              27612,
-              45681,
-              966,
-              29093,
-              27611,
-              45679,
-              964,
-              29094,
-              27610,
-              45679,
-              964,
-              29106,
-              27613,
-              45682,
-              967,
-              29104,
-              27615,
-              45678,
-              967,
-              29101,
-              27615,
-              45681,
-              969,
-              29102,
-              27615,
-              45678,
-              968,
-              29102,
-              27617,
-              45677,
-              965,
-              29099,
-              27614,
-              45682,
-              967,
-              29098,
-              27614,
-              45680,
-              965,
-              29096,
-              27613,
-              45677,
-              965,
-              29098,
-              27614,
-              45681,
-              966,
-              29097,
-              27614,
-              45678,
-              966,
-              29094,
-              27613,
-              45682,
-              965,
-              29094,
-              27615,
-              45677,
-              965,
-              29094,
-              27613,
-              45674,
-              965,
-              29090,
-              27613,
-              45681,
-              965,
-              29094,
-              27611,
-              45682,
-              964,
-              29090,
-              27615,
-              45678,
-              963,
-              29096,
-              27611,
-              45677,
-              963,
-              29090,
-              27615,
-              45676,
-              963,
-              29092,
-              27615,
-              45676,
-              964,
-              29093,
-              27617,
-              45676,
-              963,
-              29091,
-              27614,
-              45677,
-              963,
-              29086,
-              27613,
-              45678,
-              964,
-              29093,
-              27615,
-              45675,
-              963,
-              29091,
-              27614,
-              45678,
-              963,
-              29089,
-              27613,
-              45678,
-              963,
-              29090,
-              27613,
-              45676,
-              963,
-              29092,
-              27613,
-              45676,
-              962,
-              29092,
-              27611,
-              45676,
-              962,
-              29092,
-              27613,
-              45677,
-              962,
-              29092,
-              27609,
-              45678,
-              961,
-              29076,
-              27608,
-              45679,
-              957,
-              29084,
-              27611,
-              45676,
-              959,
-              29088,
-              27609,
-              45678,
-              958,
-              29090,
-              27612,
-              45677,
-              959,
-              29098,
-              27608,
-              45683,
-              959,
-              29096,
-              27612,
-              45679,
-              957,
-              29098,
-              27607,
-              45678,
-              959,
-              29100,
-              27612,
-              45681,
-              959,
-              29102,
-              27611,
-              45678,
-              959,
-              29101,
-              27613,
-              45679,
-              958,
-              29102,
-              27610,
-              45683,
-              958,
-              29102,
-              27611,
-              45678,
-              959,
-              29104,
-              27613,
-              45683,
-              959,
-              29103,
-              27610,
-              45679,
-              959,
-              29106,
-              27611,
-              45682,
-              960,
-              29109,
-              27612,
-              45679,
-              959,
-              29104,
-              27613,
-              45678,
-              959,
-              29109,
-              27611,
-              45676,
-              959,
-              29108,
-              27611,
-              45683,
-              958,
-              29113,
-              27611,
-              45679,
-              959,
-              29110,
-              27613,
-              45679,
-              957,
-              29108,
-              27613,
-              45683,
-              958,
-              29112,
-              27614,
-              45678,
-              958,
-              29111,
-              27609,
-              45679,
-              958,
-              29110,
-              27610,
-              45683,
-              959,
-              29106,
-              27611,
-              45679,
-              958,
-              29114,
-              27612,
-              45683,
-              958,
-              29111,
-              27610,
-              45681,
-              958,
-              29109,
-              27613,
-              45675,
-              958,
-              29110,
-              27610,
-              45679,
-              957
-            ]
-          },
-          {
-            "time": 1600040159939,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29092,
-              27612,
-              45686,
-              959,
-              29101,
-              27613,
-              45679,
-              959,
-              29097,
-              27612,
-              45679,
-              958,
-              29101,
-              27615,
-              45683,
-              958,
-              29099,
-              27613,
-              45676,
-              959,
-              29098,
-              27611,
-              45679,
-              957,
-              29095,
-              27613,
-              45679,
-              957,
-              29097,
-              27613,
-              45677,
-              959,
-              29095,
-              27613,
-              45678,
-              958,
-              29099,
-              27616,
-              45681,
-              958,
-              29100,
-              27613,
-              45677,
-              957,
-              29102,
-              27613,
-              45681,
-              958,
-              29097,
-              27613,
-              45678,
-              957,
-              29098,
-              27612,
-              45679,
-              957,
-              29099,
-              27615,
-              45681,
-              958,
-              29097,
-              27611,
-              45682,
-              958,
-              29099,
-              27609,
-              45679,
-              960,
-              29102,
-              27611,
-              45679,
-              958,
-              29095,
-              27611,
-              45673,
-              959,
-              29095,
-              27614,
-              45679,
-              958,
-              29092,
-              27611,
-              45682,
-              958,
-              29097,
-              27614,
-              45679,
-              959,
-              29098,
-              27612,
-              45679,
-              958,
-              29093,
-              27613,
-              45683,
-              959,
-              29093,
-              27613,
-              45676,
-              959,
-              29094,
-              27611,
-              45678,
-              959,
-              29090,
-              27611,
-              45677,
-              958,
-              29094,
-              27612,
-              45679,
-              958,
-              29093,
-              27611,
-              45679,
-              958,
-              29093,
-              27612,
-              45685,
-              958,
-              29095,
-              27613,
-              45684,
-              959,
-              29098,
-              27614,
-              45683,
-              957,
-              29097,
-              27612,
-              45679,
-              957,
-              29095,
-              27614,
-              45677,
-              958,
-              29090,
-              27613,
-              45679,
-              959,
-              29093,
-              27613,
-              45677,
-              958,
-              29095,
-              27613,
-              45669,
-              957,
-              29091,
-              27611,
-              45675,
-              958,
-              29095,
-              27614,
-              45673,
-              958,
-              29091,
-              27612,
-              45673,
-              957,
-              29097,
-              27611,
-              45673,
-              958,
-              29094,
-              27615,
-              45678,
-              958,
-              29095,
-              27612,
-              45675,
-              959,
-              29093,
-              27609,
-              45677,
-              959,
-              29093,
-              27613,
-              45678,
-              959,
-              29095,
-              27612,
-              45675,
-              959,
-              29094,
-              27613,
-              45675,
-              959,
-              29096,
-              27611,
-              45678,
-              957,
-              29090,
-              27612,
-              45679,
-              959,
-              29094,
-              27612,
-              45675,
-              959,
-              29091,
-              27609,
-              45675,
-              957,
-              29091,
-              27611,
-              45675,
-              959,
-              29092,
-              27613,
-              45678,
-              958,
-              29092,
-              27613,
-              45676,
-              958,
-              29094,
-              27610,
-              45675,
-              958,
-              29095,
-              27610,
-              45677,
-              959,
-              29091,
-              27611,
-              45670,
-              958,
-              29090,
-              27611,
-              45677,
-              957,
-              29091,
-              27611,
-              45677,
-              959,
-              29089,
-              27611,
-              45675,
-              958,
-              29089,
-              27614,
-              45680,
-              958,
-              29087,
-              27611,
-              45678,
-              959,
-              29092,
-              27611,
-              45675,
-              958,
-              29091,
-              27615,
-              45679,
-              959,
-              29091,
-              27614,
-              45675,
-              959,
-              29093,
-              27613,
-              45674,
-              958,
-              29093,
-              27613,
-              45677,
-              957,
-              29089,
-              27614,
-              45681,
-              958,
-              29093,
-              27612,
-              45679,
-              958,
-              29087,
-              27615,
-              45675,
-              960,
-              29091,
-              27612,
-              45677,
-              958,
-              29091,
-              27614,
-              45676,
-              959,
-              29093,
-              27613,
-              45675,
-              959,
-              29093,
-              27613,
-              45677,
-              959,
-              29094,
-              27612,
-              45678,
-              959,
-              29091,
-              27611,
-              45677,
-              959,
-              29095,
-              27611,
-              45682,
-              959,
-              29089,
-              27615,
-              45676,
-              960,
-              29092,
-              27609,
-              45677,
-              958,
-              29094,
-              27617,
-              45679,
-              959,
-              29094,
-              27614,
-              45682,
-              959,
-              29097,
-              27615,
-              45676,
-              959,
-              29095,
-              27611,
-              45678,
-              960,
-              29093,
-              27613,
-              45683,
-              959,
-              29090,
-              27611,
-              45681,
-              960,
-              29093,
-              27609,
-              45681,
-              958,
-              29093,
-              27611,
-              45683,
-              958,
-              29095,
-              27612,
-              45681,
-              959,
-              29091,
-              27611,
-              45677,
-              959,
-              29090,
-              27610,
-              45677,
-              959
-            ]
-          },
-          {
-            "time": 1600040161067,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29086,
-              27616,
-              45679,
-              961,
-              29093,
-              27613,
-              45678,
-              959,
-              29089,
-              27615,
-              45679,
-              960,
-              29091,
-              27613,
-              45684,
-              960,
-              29092,
-              27612,
-              45683,
-              960,
-              29095,
-              27613,
-              45675,
-              961,
-              29094,
-              27611,
-              45677,
-              961,
-              29092,
-              27611,
-              45677,
-              961,
-              29098,
-              27613,
-              45681,
-              961,
-              29094,
-              27612,
-              45681,
-              961,
-              29092,
-              27611,
-              45679,
-              959,
-              29091,
-              27612,
-              45681,
-              959,
-              29095,
-              27612,
-              45679,
-              959,
-              29095,
-              27611,
-              45679,
-              961,
-              29093,
-              27612,
-              45683,
-              961,
-              29095,
-              27611,
-              45679,
-              959,
-              29091,
-              27614,
-              45682,
-              959,
-              29095,
-              27610,
-              45675,
-              959,
-              29097,
-              27611,
-              45680,
-              959,
-              29092,
-              27612,
-              45677,
-              960,
-              29097,
-              27613,
-              45673,
-              960,
-              29093,
-              27613,
-              45673,
-              961,
-              29089,
-              27613,
-              45678,
-              960,
-              29093,
-              27611,
-              45669,
-              961,
-              29095,
-              27612,
-              45677,
-              962,
-              29096,
-              27613,
-              45679,
-              960,
-              29093,
-              27614,
-              45675,
-              961,
-              29097,
-              27609,
-              45682,
-              961,
-              29095,
-              27615,
-              45681,
-              962,
-              29091,
-              27612,
-              45679,
-              959,
-              29119,
-              27613,
-              45677,
-              959,
-              29114,
-              27613,
-              45683,
-              960,
-              29114,
-              27617,
-              45679,
-              960,
-              29113,
-              27612,
-              45681,
-              959,
-              29113,
-              27611,
-              45679,
-              959,
-              29111,
-              27613,
-              45679,
-              961,
-              29111,
-              27613,
-              45684,
-              959,
-              29115,
-              27612,
-              45680,
-              959,
-              29115,
-              27614,
-              45683,
-              960,
-              29111,
-              27611,
-              45679,
-              960,
-              29117,
-              27615,
-              45679,
-              959,
-              29115,
-              27614,
-              45679,
-              960,
-              29111,
-              27613,
-              45683,
-              960,
-              29117,
-              27613,
-              45679,
-              960,
-              29112,
-              27613,
-              45677,
-              961,
-              29118,
-              27614,
-              45682,
-              960,
-              29111,
-              27611,
-              45679,
-              961,
-              29114,
-              27615,
-              45687,
-              961,
-              29111,
-              27614,
-              45682,
-              961,
-              29112,
-              27611,
-              45681,
-              959,
-              29111,
-              27611,
-              45681,
-              962,
-              29113,
-              27611,
-              45689,
-              962,
-              29114,
-              27614,
-              45675,
-              960,
-              29115,
-              27615,
-              45685,
-              961,
-              29111,
-              27616,
-              45682,
-              961,
-              29115,
-              27611,
-              45679,
-              961,
-              29111,
-              27613,
-              45679,
-              962,
-              29115,
-              27613,
-              45684,
-              960,
-              29115,
-              27609,
-              45679,
-              960,
-              29115,
-              27613,
-              45677,
-              963,
-              29091,
-              27614,
-              45679,
-              960,
-              29096,
-              27612,
-              45681,
-              961,
-              29094,
-              27612,
-              45678,
-              962,
-              29097,
-              27613,
-              45676,
-              961,
-              29090,
-              27613,
-              45675,
-              962,
-              29100,
-              27613,
-              45677,
-              961,
-              29100,
-              27617,
-              45683,
-              961,
-              29098,
-              27614,
-              45681,
-              961,
-              29098,
-              27611,
-              45675,
-              961,
-              29095,
-              27613,
-              45683,
-              962,
-              29096,
-              27611,
-              45678,
-              960,
-              29094,
-              27611,
-              45685,
-              961,
-              29100,
-              27613,
-              45678,
-              961,
-              29096,
-              27611,
-              45681,
-              961,
-              29095,
-              27613,
-              45679,
-              961,
-              29100,
-              27613,
-              45677,
-              961,
-              29093,
-              27615,
-              45682,
-              963,
-              29099,
-              27613,
-              45677,
-              960,
-              29095,
-              27611,
-              45677,
-              963,
-              29094,
-              27613,
-              45677,
-              961,
-              29102,
-              27614,
-              45681,
-              962,
-              29100,
-              27613,
-              45681,
-              962,
-              29099,
-              27613,
-              45683,
-              962,
-              29100,
-              27613,
-              45676,
-              959,
-              29097,
-              27613,
-              45681,
-              961,
-              29097,
-              27610,
-              45682,
-              961,
-              29103,
-              27613,
-              45682,
-              960,
-              29095,
-              27612,
-              45677,
-              961,
-              29095,
-              27614,
-              45679,
-              962,
-              29097,
-              27611,
-              45683,
-              961
-            ]
-          },
-          {
-            "time": 1600040162195,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29095,
-              27616,
-              45683,
-              963,
-              29095,
-              27615,
-              45682,
-              962,
-              29095,
-              27613,
-              45679,
-              962,
-              29099,
-              27612,
-              45676,
-              962,
-              29095,
-              27613,
-              45683,
-              962,
-              29093,
-              27611,
-              45684,
-              963,
-              29096,
-              27611,
-              45677,
-              964,
-              29099,
-              27617,
-              45679,
-              962,
-              29096,
-              27611,
-              45679,
-              962,
-              29095,
-              27615,
-              45679,
-              964,
-              29094,
-              27613,
-              45682,
-              961,
-              29095,
-              27615,
-              45679,
-              963,
-              29098,
-              27613,
-              45680,
-              962,
-              29094,
-              27611,
-              45679,
-              961,
-              29098,
-              27609,
-              45679,
-              963,
-              29095,
-              27612,
-              45679,
-              961,
-              29095,
-              27612,
-              45682,
-              963,
-              29099,
-              27610,
-              45677,
-              963,
-              29095,
-              27614,
-              45679,
-              962,
-              29095,
-              27613,
-              45677,
-              962,
-              29097,
-              27615,
-              45678,
-              961,
-              29099,
-              27614,
-              45681,
-              963,
-              29096,
-              27611,
-              45675,
-              962,
-              29097,
-              27614,
-              45676,
-              961,
-              29095,
-              27611,
-              45682,
-              962,
-              29099,
-              27611,
-              45675,
-              963,
-              29091,
-              27610,
-              45679,
-              964,
-              29097,
-              27611,
-              45684,
-              963,
-              29099,
-              27611,
-              45677,
-              961,
-              29092,
-              27613,
-              45679,
-              963,
-              29123,
-              27613,
-              45681,
-              963,
-              29125,
-              27615,
-              45681,
-              963,
-              29125,
-              27614,
-              45682,
-              963,
-              29127,
-              27615,
-              45682,
-              963,
-              29125,
-              27613,
-              45687,
-              963,
-              29123,
-              27612,
-              45679,
-              963,
-              29125,
-              27616,
-              45679,
-              961,
-              29124,
-              27615,
-              45681,
-              964,
-              29122,
-              27615,
-              45683,
-              962,
-              29123,
-              27611,
-              45675,
-              962,
-              29126,
-              27615,
-              45681,
-              963,
-              29122,
-              27614,
-              45682,
-              963,
-              29121,
-              27617,
-              45683,
-              962,
-              29120,
-              27617,
-              45678,
-              962,
-              29119,
-              27610,
-              45677,
-              963,
-              29125,
-              27615,
-              45678,
-              963,
-              29126,
-              27618,
-              45679,
-              963,
-              29124,
-              27613,
-              45679,
-              962,
-              29121,
-              27614,
-              45685,
-              962,
-              29126,
-              27612,
-              45681,
-              962,
-              29121,
-              27613,
-              45677,
-              964,
-              29126,
-              27616,
-              45679,
-              962,
-              29123,
-              27613,
-              45675,
-              962,
-              29122,
-              27610,
-              45678,
-              963,
-              29125,
-              27617,
-              45682,
-              961,
-              29122,
-              27618,
-              45680,
-              962,
-              29124,
-              27611,
-              45678,
-              963,
-              29122,
-              27615,
-              45679,
-              963,
-              29120,
-              27612,
-              45679,
-              962,
-              29121,
-              27615,
-              45679,
-              962,
-              29097,
-              27611,
-              45677,
-              962,
-              29099,
-              27611,
-              45678,
-              963,
-              29097,
-              27612,
-              45679,
-              963,
-              29099,
-              27611,
-              45679,
-              961,
-              29099,
-              27613,
-              45679,
-              961,
-              29095,
-              27613,
-              45675,
-              963,
-              29095,
-              27613,
-              45677,
-              965,
-              29097,
-              27613,
-              45682,
-              963,
-              29100,
-              27611,
-              45683,
-              961,
-              29103,
-              27615,
-              45679,
-              960,
-              29101,
-              27611,
-              45675,
-              963,
-              29101,
-              27615,
-              45679,
-              962,
-              29101,
-              27614,
-              45677,
-              962,
-              29099,
-              27611,
-              45679,
-              965,
-              29103,
-              27614,
-              45676,
-              963,
-              29100,
-              27611,
-              45681,
-              962,
-              29099,
-              27611,
-              45681,
-              964,
-              29098,
-              27613,
-              45679,
-              963,
-              29100,
-              27613,
-              45681,
-              964,
-              29105,
-              27615,
-              45682,
-              963,
-              29099,
-              27611,
-              45684,
-              963,
-              29101,
-              27611,
-              45679,
-              962,
-              29100,
-              27611,
-              45678,
-              964,
-              29100,
-              27616,
-              45676,
-              962,
-              29102,
-              27615,
-              45682,
-              963,
-              29103,
-              27611,
-              45681,
-              961,
-              29099,
-              27611,
-              45679,
-              963,
-              29100,
-              27611,
-              45675,
-              962,
-              29099,
-              27613,
-              45681,
-              964,
-              29101,
-              27612,
-              45683,
-              963
-            ]
-          },
-          {
-            "time": 1600040163323,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29091,
-              27612,
-              45678,
-              964,
-              29097,
-              27611,
-              45681,
-              965,
-              29095,
-              27613,
-              45679,
-              964,
-              29098,
-              27614,
-              45683,
-              964,
-              29096,
-              27610,
-              45683,
-              963,
-              29099,
-              27612,
-              45683,
-              964,
-              29097,
-              27612,
-              45683,
-              963,
-              29097,
-              27613,
-              45679,
-              963,
-              29096,
-              27613,
-              45678,
-              963,
-              29100,
-              27611,
-              45681,
-              963,
-              29099,
-              27611,
-              45681,
-              965,
-              29093,
-              27608,
-              45677,
-              963,
-              29097,
-              27610,
-              45679,
-              963,
-              29101,
-              27611,
-              45679,
-              963,
-              29095,
-              27611,
-              45681,
-              963,
-              29097,
-              27612,
-              45679,
-              963,
-              29098,
-              27607,
-              45678,
-              963,
-              29101,
-              27610,
-              45681,
-              963,
-              29095,
-              27612,
-              45678,
-              964,
-              29097,
-              27612,
-              45683,
-              965,
-              29101,
-              27612,
-              45677,
-              964,
-              29099,
-              27613,
-              45679,
-              963,
-              29101,
-              27615,
-              45681,
-              964,
-              29097,
-              27610,
-              45685,
-              964,
-              29095,
-              27611,
-              45682,
-              964,
-              29099,
-              27611,
-              45683,
-              963,
-              29094,
-              27611,
-              45681,
-              965,
-              29098,
-              27613,
-              45679,
-              962,
-              29095,
-              27611,
-              45679,
-              964,
-              29094,
-              27613,
-              45683,
-              964,
-              29137,
-              27614,
-              45683,
-              963,
-              29133,
-              27613,
-              45679,
-              963,
-              29138,
-              27615,
-              45679,
-              964,
-              29133,
-              27612,
-              45687,
-              963,
-              29132,
-              27614,
-              45683,
-              963,
-              29131,
-              27614,
-              45677,
-              963,
-              29135,
-              27615,
-              45683,
-              962,
-              29130,
-              27617,
-              45681,
-              963,
-              29130,
-              27612,
-              45681,
-              963,
-              29135,
-              27612,
-              45682,
-              963,
-              29133,
-              27616,
-              45684,
-              963,
-              29134,
-              27613,
-              45681,
-              964,
-              29133,
-              27614,
-              45678,
-              963,
-              29131,
-              27617,
-              45675,
-              964,
-              29133,
-              27613,
-              45681,
-              962,
-              29133,
-              27614,
-              45682,
-              964,
-              29134,
-              27614,
-              45679,
-              963,
-              29133,
-              27615,
-              45683,
-              963,
-              29135,
-              27612,
-              45677,
-              963,
-              29137,
-              27614,
-              45681,
-              963,
-              29134,
-              27614,
-              45682,
-              963,
-              29132,
-              27615,
-              45681,
-              962,
-              29133,
-              27615,
-              45683,
-              964,
-              29135,
-              27613,
-              45683,
-              963,
-              29131,
-              27615,
-              45675,
-              963,
-              29131,
-              27617,
-              45683,
-              963,
-              29131,
-              27615,
-              45681,
-              965,
-              29135,
-              27613,
-              45679,
-              962,
-              29132,
-              27617,
-              45679,
-              963,
-              29135,
-              27613,
-              45680,
-              963,
-              29095,
-              27610,
-              45681,
-              963,
-              29101,
-              27611,
-              45677,
-              962,
-              29099,
-              27614,
-              45677,
-              963,
-              29097,
-              27612,
-              45679,
-              961,
-              29097,
-              27613,
-              45678,
-              962,
-              29100,
-              27611,
-              45679,
-              965,
-              29095,
-              27613,
-              45683,
-              964,
-              29097,
-              27611,
-              45682,
-              964,
-              29099,
-              27610,
-              45683,
-              962,
-              29102,
-              27613,
-              45677,
-              964,
-              29099,
-              27611,
-              45680,
-              964,
-              29098,
-              27611,
-              45675,
-              964,
-              29099,
-              27611,
-              45676,
-              963,
-              29101,
-              27614,
-              45679,
-              962,
-              29096,
-              27613,
-              45681,
-              963,
-              29095,
-              27615,
-              45679,
-              964,
-              29100,
-              27611,
-              45679,
-              962,
-              29097,
-              27613,
-              45678,
-              963,
-              29102,
-              27610,
-              45678,
-              963,
-              29099,
-              27611,
-              45681,
-              963,
-              29095,
-              27610,
-              45676,
-              963,
-              29107,
-              27612,
-              45680,
-              965,
-              29104,
-              27611,
-              45675,
-              964,
-              29101,
-              27606,
-              45675,
-              963,
-              29099,
-              27611,
-              45679,
-              963,
-              29099,
-              27612,
-              45679,
-              963,
-              29102,
-              27612,
-              45679,
-              964,
-              29099,
-              27613,
-              45681,
-              964,
-              29100,
-              27614,
-              45680,
-              963,
-              29101,
-              27611,
-              45679,
-              964
-            ]
-          },
-          {
-            "time": 1600040164451,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29090,
-              27614,
-              45683,
-              963,
-              29095,
-              27611,
-              45679,
-              964,
-              29102,
-              27611,
-              45679,
-              964,
-              29093,
-              27613,
-              45677,
-              963,
-              29097,
-              27613,
-              45683,
-              963,
-              29101,
-              27612,
-              45679,
-              965,
-              29097,
-              27610,
-              45679,
-              964,
-              29095,
-              27610,
-              45681,
-              965,
-              29099,
-              27611,
-              45681,
-              963,
-              29101,
-              27613,
-              45679,
-              964,
-              29095,
-              27615,
-              45679,
-              966,
-              29095,
-              27609,
-              45682,
-              963,
-              29095,
-              27613,
-              45676,
-              967,
-              29093,
-              27611,
-              45682,
-              964,
-              29101,
-              27611,
-              45683,
-              965,
-              29100,
-              27613,
-              45675,
-              965,
-              29099,
-              27608,
-              45681,
-              964,
-              29098,
-              27612,
-              45683,
-              963,
-              29095,
-              27611,
-              45679,
-              963,
-              29099,
-              27611,
-              45677,
-              965,
-              29091,
-              27611,
-              45678,
-              964,
-              29095,
-              27611,
-              45681,
-              963,
-              29097,
-              27612,
-              45677,
-              966,
-              29095,
-              27610,
-              45679,
-              965,
-              29099,
-              27615,
-              45679,
-              965,
-              29099,
-              27611,
-              45679,
-              964,
-              29098,
-              27611,
-              45679,
-              963,
-              29101,
-              27613,
-              45679,
-              965,
-              29094,
-              27613,
-              45678,
-              963,
-              29093,
-              27612,
-              45679,
-              965,
-              29142,
-              27617,
-              45687,
-              961,
-              29143,
-              27617,
-              45685,
-              962,
-              29140,
-              27617,
-              45687,
-              963,
-              29139,
-              27617,
-              45683,
-              963,
-              29138,
-              27615,
-              45684,
-              963,
-              29138,
-              27615,
-              45683,
-              963,
-              29139,
-              27611,
-              45685,
-              963,
-              29141,
-              27615,
-              45681,
-              962,
-              29139,
-              27617,
-              45686,
-              963,
-              29142,
-              27617,
-              45682,
-              964,
-              29143,
-              27614,
-              45683,
-              963,
-              29139,
-              27615,
-              45683,
-              963,
-              29138,
-              27615,
-              45685,
-              962,
-              29138,
-              27615,
-              45679,
-              963,
-              29139,
-              27615,
-              45683,
-              963,
-              29139,
-              27615,
-              45685,
-              963,
-              29138,
-              27615,
-              45681,
-              962,
-              29137,
-              27616,
-              45683,
-              961,
-              29139,
-              27615,
-              45683,
-              962,
-              29139,
-              27615,
-              45675,
-              962,
-              29139,
-              27617,
-              45680,
-              962,
-              29139,
-              27619,
-              45689,
-              963,
-              29137,
-              27615,
-              45680,
-              962,
-              29139,
-              27615,
-              45681,
-              961,
-              29135,
-              27617,
-              45684,
-              963,
-              29137,
-              27615,
-              45683,
-              963,
-              29138,
-              27617,
-              45679,
-              963,
-              29137,
-              27616,
-              45687,
-              963,
-              29135,
-              27615,
-              45681,
-              963,
-              29140,
-              27615,
-              45684,
-              961,
-              29092,
-              27613,
-              45677,
-              963,
-              29093,
-              27613,
-              45683,
-              963,
-              29097,
-              27614,
-              45682,
-              963,
-              29100,
-              27611,
-              45679,
-              963,
-              29097,
-              27614,
-              45681,
-              964,
-              29094,
-              27614,
-              45683,
-              962,
-              29099,
-              27613,
-              45683,
-              964,
-              29095,
-              27610,
-              45675,
-              962,
-              29102,
-              27611,
-              45683,
-              961,
-              29097,
-              27613,
-              45676,
-              964,
-              29098,
-              27613,
-              45677,
-              964,
-              29094,
-              27611,
-              45680,
-              964,
-              29093,
-              27613,
-              45677,
-              964,
-              29097,
-              27613,
-              45675,
-              964,
-              29095,
-              27615,
-              45679,
-              965,
-              29095,
-              27614,
-              45680,
-              963,
-              29101,
-              27615,
-              45679,
-              963,
-              29099,
-              27615,
-              45679,
-              964,
-              29098,
-              27614,
-              45681,
-              963,
-              29099,
-              27613,
-              45679,
-              964,
-              29098,
-              27613,
-              45679,
-              962,
-              29099,
-              27614,
-              45679,
-              964,
-              29098,
-              27612,
-              45678,
-              963,
-              29101,
-              27613,
-              45683,
-              962,
-              29095,
-              27612,
-              45678,
-              962,
-              29102,
-              27611,
-              45682,
-              963,
-              29101,
-              27611,
-              45682,
-              964,
-              29099,
-              27615,
-              45679,
-              963,
-              29098,
-              27614,
-              45676,
-              963,
-              29099,
-              27611,
-              45677,
-              962
-            ]
-          },
-          {
-            "time": 1600040165578,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29091,
-              27611,
-              45684,
-              964,
-              29101,
-              27613,
-              45677,
-              964,
-              29098,
-              27615,
-              45679,
-              965,
-              29098,
-              27615,
-              45676,
-              963,
-              29099,
-              27613,
-              45677,
-              965,
-              29098,
-              27613,
-              45685,
-              964,
-              29094,
-              27615,
-              45679,
-              964,
-              29099,
-              27613,
-              45679,
-              962,
-              29098,
-              27611,
-              45675,
-              963,
-              29095,
-              27611,
-              45679,
-              963,
-              29097,
-              27613,
-              45681,
-              963,
-              29097,
-              27615,
-              45679,
-              963,
-              29099,
-              27613,
-              45675,
-              963,
-              29093,
-              27611,
-              45677,
-              963,
-              29093,
-              27610,
-              45676,
-              964,
-              29097,
-              27611,
-              45679,
-              964,
-              29097,
-              27613,
-              45675,
-              964,
-              29097,
-              27615,
-              45673,
-              963,
-              29099,
-              27615,
-              45675,
-              963,
-              29097,
-              27611,
-              45677,
-              963,
-              29099,
-              27610,
-              45681,
-              964,
-              29099,
-              27611,
-              45677,
-              965,
-              29097,
-              27610,
-              45681,
-              963,
-              29099,
-              27611,
-              45678,
-              964,
-              29099,
-              27614,
-              45678,
-              965,
-              29093,
-              27611,
-              45676,
-              964,
-              29093,
-              27613,
-              45678,
-              963,
-              29094,
-              27610,
-              45679,
-              964,
-              29095,
-              27615,
-              45678,
-              965,
-              29097,
-              27614,
-              45676,
-              964,
-              29167,
-              27619,
-              45683,
-              961,
-              29150,
-              27622,
-              45681,
-              962,
-              29145,
-              27620,
-              45682,
-              964,
-              29142,
-              27619,
-              45685,
-              963,
-              29143,
-              27619,
-              45680,
-              961,
-              29149,
-              27623,
-              45679,
-              962,
-              29142,
-              27622,
-              45683,
-              963,
-              29143,
-              27618,
-              45684,
-              963,
-              29143,
-              27620,
-              45687,
-              961,
-              29145,
-              27616,
-              45685,
-              961,
-              29151,
-              27618,
-              45685,
-              962,
-              29147,
-              27619,
-              45694,
-              959,
-              29141,
-              27621,
-              45689,
-              962,
-              29149,
-              27619,
-              45685,
-              963,
-              29141,
-              27620,
-              45686,
-              961,
-              29147,
-              27618,
-              45681,
-              961,
-              29137,
-              27620,
-              45683,
-              961,
-              29145,
-              27620,
-              45685,
-              960,
-              29149,
-              27621,
-              45681,
-              962,
-              29146,
-              27620,
-              45681,
-              961,
-              29143,
-              27619,
-              45685,
-              961,
-              29145,
-              27620,
-              45686,
-              961,
-              29142,
-              27621,
-              45682,
-              961,
-              29147,
-              27615,
-              45686,
-              960,
-              29143,
-              27619,
-              45680,
-              959,
-              29146,
-              27617,
-              45685,
-              961,
-              29142,
-              27622,
-              45685,
-              959,
-              29149,
-              27619,
-              45683,
-              959,
-              29147,
-              27619,
-              45681,
-              960,
-              29151,
-              27619,
-              45687,
-              960,
-              29085,
-              27611,
-              45681,
-              960,
-              29098,
-              27611,
-              45681,
-              960,
-              29095,
-              27611,
-              45681,
-              961,
-              29093,
-              27611,
-              45679,
-              961,
-              29094,
-              27613,
-              45678,
-              961,
-              29098,
-              27611,
-              45682,
-              961,
-              29098,
-              27613,
-              45683,
-              963,
-              29100,
-              27613,
-              45682,
-              961,
-              29096,
-              27611,
-              45680,
-              960,
-              29102,
-              27613,
-              45679,
-              961,
-              29101,
-              27608,
-              45677,
-              959,
-              29102,
-              27615,
-              45681,
-              961,
-              29102,
-              27609,
-              45673,
-              963,
-              29107,
-              27609,
-              45679,
-              962,
-              29107,
-              27613,
-              45679,
-              960,
-              29103,
-              27611,
-              45677,
-              960,
-              29103,
-              27612,
-              45677,
-              959,
-              29097,
-              27613,
-              45671,
-              961,
-              29107,
-              27613,
-              45679,
-              961,
-              29104,
-              27616,
-              45678,
-              961,
-              29102,
-              27611,
-              45677,
-              962,
-              29103,
-              27611,
-              45677,
-              963,
-              29105,
-              27615,
-              45678,
-              962,
-              29107,
-              27614,
-              45676,
-              961,
-              29103,
-              27611,
-              45679,
-              963,
-              29103,
-              27610,
-              45678,
-              960,
-              29107,
-              27613,
-              45682,
-              962,
-              29109,
-              27614,
-              45675,
-              962,
-              29106,
-              27613,
-              45680,
-              962,
-              29105,
-              27609,
-              45675,
-              959
-            ]
-          },
-          {
-            "time": 1600040166706,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29097,
-              27611,
-              45682,
-              962,
-              29103,
-              27614,
-              45675,
-              961,
-              29099,
-              27611,
-              45676,
-              961,
-              29101,
-              27611,
-              45676,
-              961,
-              29095,
-              27611,
-              45678,
-              961,
-              29103,
-              27611,
-              45673,
-              961,
-              29098,
-              27613,
-              45679,
-              961,
-              29099,
-              27614,
-              45679,
-              963,
-              29101,
-              27615,
-              45678,
-              962,
-              29099,
-              27614,
-              45682,
-              962,
-              29097,
-              27613,
-              45680,
-              963,
-              29102,
-              27616,
-              45685,
-              961,
-              29102,
-              27613,
-              45679,
-              961,
-              29104,
-              27609,
-              45680,
-              963,
-              29101,
-              27614,
-              45681,
-              961,
-              29095,
-              27615,
-              45682,
-              962,
-              29099,
-              27613,
-              45678,
-              963,
-              29101,
-              27613,
-              45679,
-              961,
-              29095,
-              27613,
-              45679,
-              961,
-              29102,
-              27611,
-              45679,
-              961,
-              29098,
-              27614,
-              45676,
-              961,
-              29103,
-              27611,
-              45679,
-              962,
-              29099,
-              27615,
-              45673,
-              962,
-              29099,
-              27611,
-              45677,
-              962,
-              29097,
-              27612,
-              45675,
-              960,
-              29099,
-              27613,
-              45683,
-              961,
-              29099,
-              27613,
-              45677,
-              962,
-              29099,
-              27614,
-              45679,
-              963,
-              29099,
-              27607,
-              45683,
-              961,
-              29097,
-              27614,
-              45679,
-              961,
-              29177,
-              27624,
-              45687,
-              960,
-              29173,
-              27626,
-              45683,
-              959,
-              29167,
-              27623,
-              45684,
-              960,
-              29166,
-              27625,
-              45682,
-              957,
-              29173,
-              27623,
-              45679,
-              959,
-              29166,
-              27626,
-              45685,
-              958,
-              29167,
-              27627,
-              45681,
-              959,
-              29167,
-              27624,
-              45683,
-              959,
-              29166,
-              27626,
-              45682,
-              958,
-              29163,
-              27622,
-              45683,
-              960,
-              29163,
-              27626,
-              45691,
-              958,
-              29163,
-              27623,
-              45679,
-              956,
-              29164,
-              27626,
-              45678,
-              957,
-              29159,
-              27625,
-              45681,
-              958,
-              29163,
-              27624,
-              45679,
-              958,
-              29163,
-              27626,
-              45688,
-              956,
-              29163,
-              27626,
-              45679,
-              957,
-              29159,
-              27625,
-              45679,
-              957,
-              29156,
-              27625,
-              45686,
-              957,
-              29163,
-              27625,
-              45687,
-              957,
-              29161,
-              27622,
-              45682,
-              957,
-              29160,
-              27623,
-              45679,
-              955,
-              29162,
-              27623,
-              45685,
-              955,
-              29163,
-              27624,
-              45681,
-              957,
-              29163,
-              27624,
-              45682,
-              955,
-              29164,
-              27623,
-              45683,
-              955,
-              29161,
-              27624,
-              45684,
-              954,
-              29163,
-              27621,
-              45687,
-              955,
-              29163,
-              27623,
-              45687,
-              957,
-              29163,
-              27623,
-              45685,
-              955,
-              29083,
-              27612,
-              45678,
-              956,
-              29091,
-              27613,
-              45677,
-              957,
-              29097,
-              27612,
-              45679,
-              958,
-              29095,
-              27612,
-              45678,
-              959,
-              29095,
-              27610,
-              45679,
-              956,
-              29099,
-              27611,
-              45678,
-              957,
-              29101,
-              27611,
-              45675,
-              957,
-              29098,
-              27611,
-              45676,
-              959,
-              29105,
-              27611,
-              45682,
-              959,
-              29099,
-              27613,
-              45679,
-              959,
-              29108,
-              27613,
-              45680,
-              956,
-              29105,
-              27611,
-              45675,
-              958,
-              29103,
-              27610,
-              45680,
-              956,
-              29103,
-              27609,
-              45679,
-              958,
-              29104,
-              27611,
-              45682,
-              957,
-              29111,
-              27611,
-              45683,
-              957,
-              29111,
-              27609,
-              45684,
-              957,
-              29109,
-              27611,
-              45680,
-              959,
-              29105,
-              27611,
-              45681,
-              959,
-              29110,
-              27613,
-              45681,
-              957,
-              29113,
-              27611,
-              45679,
-              957,
-              29110,
-              27614,
-              45685,
-              958,
-              29109,
-              27613,
-              45682,
-              959,
-              29113,
-              27614,
-              45677,
-              957,
-              29110,
-              27615,
-              45683,
-              957,
-              29107,
-              27611,
-              45679,
-              957,
-              29111,
-              27611,
-              45679,
-              958,
-              29110,
-              27611,
-              45677,
-              957,
-              29110,
-              27611,
-              45677,
-              958,
-              29109,
-              27613,
-              45683,
-              957
-            ]
-          },
-          {
-            "time": 1600040167834,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29095,
-              27612,
-              45682,
-              958,
-              29100,
-              27613,
-              45674,
-              956,
-              29102,
-              27610,
-              45678,
-              958,
-              29104,
-              27613,
-              45681,
-              957,
-              29103,
-              27615,
-              45671,
-              957,
-              29106,
-              27613,
-              45678,
-              957,
-              29105,
-              27615,
-              45673,
-              957,
-              29105,
-              27611,
-              45674,
-              957,
-              29103,
-              27615,
-              45681,
-              956,
-              29103,
-              27611,
-              45682,
-              958,
-              29101,
-              27611,
-              45679,
-              959,
-              29103,
-              27613,
-              45679,
-              956,
-              29101,
-              27613,
-              45673,
-              959,
-              29103,
-              27611,
-              45683,
-              957,
-              29103,
-              27611,
-              45677,
-              958,
-              29104,
-              27611,
-              45676,
-              958,
-              29103,
-              27611,
-              45677,
-              957,
-              29098,
-              27612,
-              45675,
-              958,
-              29099,
-              27614,
-              45673,
-              958,
-              29100,
-              27611,
-              45673,
-              957,
-              29099,
-              27611,
-              45674,
-              958,
-              29096,
-              27611,
-              45677,
-              959,
-              29097,
-              27611,
-              45676,
-              957,
-              29099,
-              27616,
-              45673,
-              957,
-              29099,
-              27610,
-              45677,
-              957,
-              29095,
-              27611,
-              45678,
-              958,
-              29099,
-              27613,
-              45673,
-              956,
-              29103,
-              27611,
-              45675,
-              956,
-              29097,
-              27609,
-              45677,
-              958,
-              29100,
-              27609,
-              45674,
-              957,
-              29189,
-              27631,
-              45686,
-              955,
-              29187,
-              27627,
-              45687,
-              955,
-              29183,
-              27627,
-              45687,
-              955,
-              29183,
-              27629,
-              45682,
-              955,
-              29183,
-              27629,
-              45689,
-              955,
-              29179,
-              27629,
-              45685,
-              954,
-              29175,
-              27631,
-              45685,
-              954,
-              29176,
-              27629,
-              45685,
-              954,
-              29179,
-              27627,
-              45683,
-              951,
-              29177,
-              27633,
-              45681,
-              953,
-              29173,
-              27631,
-              45683,
-              953,
-              29177,
-              27629,
-              45683,
-              953,
-              29173,
-              27629,
-              45686,
-              951,
-              29174,
-              27630,
-              45685,
-              953,
-              29173,
-              27634,
-              45687,
-              953,
-              29173,
-              27630,
-              45685,
-              951,
-              29175,
-              27628,
-              45691,
-              952,
-              29175,
-              27629,
-              45687,
-              951,
-              29171,
-              27631,
-              45687,
-              951,
-              29172,
-              27630,
-              45686,
-              951,
-              29175,
-              27630,
-              45682,
-              951,
-              29173,
-              27627,
-              45690,
-              950,
-              29173,
-              27631,
-              45685,
-              950,
-              29173,
-              27633,
-              45685,
-              950,
-              29177,
-              27630,
-              45689,
-              951,
-              29175,
-              27634,
-              45684,
-              950,
-              29174,
-              27629,
-              45687,
-              949,
-              29175,
-              27628,
-              45685,
-              950,
-              29178,
-              27631,
-              45686,
-              949,
-              29174,
-              27629,
-              45685,
-              951,
-              29083,
-              27611,
-              45677,
-              951,
-              29092,
-              27609,
-              45677,
-              953,
-              29096,
-              27609,
-              45675,
-              951,
-              29102,
-              27611,
-              45675,
-              953,
-              29101,
-              27611,
-              45677,
-              952,
-              29103,
-              27611,
-              45677,
-              951,
-              29106,
-              27611,
-              45672,
-              952,
-              29107,
-              27614,
-              45673,
-              952,
-              29106,
-              27611,
-              45679,
-              951,
-              29113,
-              27611,
-              45678,
-              953,
-              29110,
-              27613,
-              45681,
-              951,
-              29107,
-              27611,
-              45678,
-              951,
-              29105,
-              27614,
-              45678,
-              952,
-              29111,
-              27612,
-              45679,
-              951,
-              29110,
-              27615,
-              45679,
-              950,
-              29109,
-              27612,
-              45677,
-              954,
-              29115,
-              27612,
-              45681,
-              953,
-              29114,
-              27612,
-              45677,
-              953,
-              29115,
-              27613,
-              45685,
-              952,
-              29114,
-              27612,
-              45680,
-              952,
-              29113,
-              27612,
-              45674,
-              952,
-              29115,
-              27614,
-              45681,
-              953,
-              29117,
-              27613,
-              45675,
-              951,
-              29115,
-              27610,
-              45679,
-              952,
-              29118,
-              27609,
-              45674,
-              952,
-              29120,
-              27612,
-              45677,
-              951,
-              29119,
-              27613,
-              45675,
-              952,
-              29116,
-              27612,
-              45677,
-              951,
-              29114,
-              27611,
-              45679,
-              952,
-              29117,
-              27611,
-              45677,
-              951
-            ]
-          },
-          {
-            "time": 1600040168962,
-            "s": 1
-          },
-          {
-            "time": 1600040168962,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29105,
-              27616,
-              45679,
-              952,
-              29111,
-              27613,
-              45685,
-              952,
-              29111,
-              27610,
-              45683,
-              951,
-              29112,
-              27613,
-              45679,
-              953,
-              29107,
-              27610,
-              45676,
-              951,
-              29111,
-              27611,
-              45675,
-              952,
-              29114,
-              27613,
-              45679,
-              952,
-              29112,
-              27614,
-              45678,
-              951,
-              29113,
-              27613,
-              45681,
-              951,
-              29115,
-              27612,
-              45679,
-              951,
-              29107,
-              27612,
-              45676,
-              952,
-              29107,
-              27614,
-              45676,
-              952,
-              29107,
-              27612,
-              45679,
-              951,
-              29107,
-              27615,
-              45675,
-              951,
-              29115,
-              27614,
-              45675,
-              951,
-              29111,
-              27613,
-              45678,
-              952,
-              29113,
-              27611,
-              45677,
-              951,
-              29105,
-              27615,
-              45676,
-              952,
-              29110,
-              27615,
-              45680,
-              953,
-              29112,
-              27612,
-              45679,
-              951,
-              29113,
-              27611,
-              45679,
-              952,
-              29107,
-              27615,
-              45685,
-              951,
-              29107,
-              27614,
-              45678,
-              951,
-              29101,
-              27613,
-              45676,
-              951,
-              29110,
-              27612,
-              45675,
-              951,
-              29109,
-              27612,
-              45676,
-              951,
-              29105,
-              27614,
-              45679,
-              952,
-              29109,
-              27611,
-              45677,
-              951,
-              29107,
-              27614,
-              45675,
-              951,
-              29111,
-              27611,
-              45677,
-              953,
-              29110,
-              27612,
-              45678,
-              951,
-              29109,
-              27613,
-              45680,
-              952,
-              29106,
-              27612,
-              45679,
-              951,
-              29101,
-              27615,
-              45676,
-              952,
-              29108,
-              27613,
-              45677,
-              954,
-              29107,
-              27613,
-              45675,
-              951,
-              29105,
-              27610,
-              45677,
-              953,
-              29105,
-              27614,
-              45679,
-              954,
-              29103,
-              27615,
-              45679,
-              953,
-              29107,
-              27610,
-              45675,
-              951,
-              29107,
-              27613,
-              45678,
-              952,
-              29108,
-              27613,
-              45673,
-              951,
-              29109,
-              27613,
-              45675,
-              952,
-              29105,
-              27610,
-              45675,
-              953,
-              29105,
-              27614,
-              45676,
-              951,
-              29104,
-              27612,
-              45679,
-              952,
-              29105,
-              27615,
-              45679,
-              952,
-              29104,
-              27613,
-              45673,
-              953,
-              29105,
-              27615,
-              45669,
-              953,
-              29109,
-              27615,
-              45675,
-              952,
-              29103,
-              27610,
-              45678,
-              954,
-              29111,
-              27615,
-              45675,
-              953,
-              29108,
-              27609,
-              45676,
-              953,
-              29105,
-              27613,
-              45681,
-              951,
-              29107,
-              27613,
-              45678,
-              953,
-              29108,
-              27611,
-              45678,
-              951,
-              29107,
-              27611,
-              45681,
-              953,
-              29102,
-              27611,
-              45683,
-              951,
-              29099,
-              27613,
-              45676,
-              952,
-              29101,
-              27614,
-              45673,
-              954,
-              29106,
-              27613,
-              45678,
-              952,
-              29104,
-              27611,
-              45675,
-              953,
-              29105,
-              27613,
-              45680,
-              953,
-              29105,
-              27615,
-              45677,
-              952,
-              29108,
-              27612,
-              45677,
-              952,
-              29109,
-              27613,
-              45679,
-              953,
-              29107,
-              27617,
-              45674,
-              953,
-              29104,
-              27613,
-              45675,
-              951,
-              29108,
-              27614,
-              45675,
-              951,
-              29107,
-              27615,
-              45681,
-              953,
-              29105,
-              27615,
-              45674,
-              953,
-              29106,
-              27617,
-              45678,
-              953,
-              29104,
-              27612,
-              45679,
-              952,
-              29105,
-              27613,
-              45678,
-              953,
-              29102,
-              27613,
-              45675,
-              951,
-              29107,
-              27613,
-              45679,
-              952,
-              29107,
-              27614,
-              45676,
-              953,
-              29107,
-              27611,
-              45677,
-              954,
-              29105,
-              27615,
-              45677,
-              951,
-              29106,
-              27613,
-              45675,
-              953,
-              29105,
-              27614,
-              45677,
-              951,
-              29108,
-              27611,
-              45674,
-              955,
-              29109,
-              27615,
-              45671,
-              953,
-              29109,
-              27616,
-              45677,
-              952,
-              29108,
-              27612,
-              45676,
-              953,
-              29103,
-              27615,
-              45677,
-              951,
-              29108,
-              27613,
-              45673,
-              953,
-              29107,
-              27611,
-              45679,
-              954,
-              29107,
-              27611,
-              45681,
-              954,
-              29103,
-              27613,
-              45671,
-              954
-            ]
-          },
-          {
-            "time": 1600040170091,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29097,
-              27615,
-              45671,
-              955,
-              29105,
-              27615,
-              45673,
-              953,
-              29105,
-              27613,
-              45676,
-              953,
-              29105,
-              27612,
-              45679,
-              954,
-              29102,
-              27611,
-              45678,
-              953,
-              29108,
-              27616,
-              45673,
-              955,
-              29105,
-              27617,
-              45681,
-              954,
-              29103,
-              27611,
-              45677,
-              954,
-              29105,
-              27613,
-              45678,
-              955,
-              29101,
-              27611,
-              45679,
-              956,
-              29107,
-              27612,
-              45671,
-              954,
-              29109,
-              27611,
-              45679,
-              954,
-              29106,
-              27615,
-              45675,
-              954,
-              29107,
-              27615,
-              45674,
-              954,
-              29107,
-              27615,
-              45677,
-              955,
-              29103,
-              27615,
-              45671,
-              953,
-              29106,
-              27614,
-              45682,
-              954,
-              29108,
-              27617,
-              45678,
-              954,
-              29108,
-              27613,
-              45671,
-              954,
-              29109,
-              27614,
-              45677,
-              955,
-              29106,
-              27611,
-              45677,
-              953,
-              29109,
-              27616,
-              45677,
-              955,
-              29107,
-              27613,
-              45674,
-              955,
-              29109,
-              27615,
-              45673,
-              955,
-              29106,
-              27614,
-              45678,
-              955,
-              29108,
-              27611,
-              45675,
-              955,
-              29109,
-              27614,
-              45677,
-              956,
-              29107,
-              27615,
-              45681,
-              956,
-              29105,
-              27617,
-              45680,
-              955,
-              29108,
-              27614,
-              45672,
-              955,
-              29105,
-              27611,
-              45675,
-              957,
-              29103,
-              27616,
-              45679,
-              953,
-              29105,
-              27613,
-              45676,
-              955,
-              29105,
-              27616,
-              45679,
-              956,
-              29103,
-              27612,
-              45673,
-              956,
-              29105,
-              27611,
-              45673,
-              955,
-              29105,
-              27613,
-              45676,
-              954,
-              29105,
-              27612,
-              45676,
-              954,
-              29103,
-              27613,
-              45678,
-              955,
-              29111,
-              27617,
-              45675,
-              955,
-              29113,
-              27615,
-              45680,
-              954,
-              29099,
-              27610,
-              45673,
-              955,
-              29104,
-              27614,
-              45681,
-              957,
-              29103,
-              27613,
-              45677,
-              956,
-              29109,
-              27614,
-              45680,
-              956,
-              29107,
-              27612,
-              45684,
-              955,
-              29102,
-              27612,
-              45678,
-              955,
-              29112,
-              27613,
-              45673,
-              956,
-              29106,
-              27614,
-              45676,
-              955,
-              29105,
-              27613,
-              45679,
-              954,
-              29107,
-              27612,
-              45672,
-              954,
-              29107,
-              27616,
-              45679,
-              956,
-              29107,
-              27618,
-              45679,
-              954,
-              29105,
-              27612,
-              45677,
-              956,
-              29102,
-              27612,
-              45675,
-              956,
-              29109,
-              27616,
-              45681,
-              955,
-              29107,
-              27612,
-              45677,
-              955,
-              29106,
-              27612,
-              45675,
-              957,
-              29107,
-              27615,
-              45677,
-              956,
-              29101,
-              27612,
-              45679,
-              956,
-              29105,
-              27612,
-              45673,
-              955,
-              29105,
-              27614,
-              45679,
-              953,
-              29113,
-              27613,
-              45679,
-              955,
-              29105,
-              27611,
-              45674,
-              955,
-              29107,
-              27613,
-              45679,
-              955,
-              29105,
-              27614,
-              45677,
-              955,
-              29109,
-              27611,
-              45671,
-              954,
-              29107,
-              27613,
-              45675,
-              956,
-              29106,
-              27614,
-              45674,
-              955,
-              29107,
-              27612,
-              45676,
-              954,
-              29109,
-              27611,
-              45678,
-              955,
-              29110,
-              27615,
-              45675,
-              955,
-              29109,
-              27613,
-              45675,
-              957,
-              29111,
-              27617,
-              45671,
-              956,
-              29110,
-              27614,
-              45673,
-              956,
-              29107,
-              27614,
-              45677,
-              957,
-              29112,
-              27615,
-              45677,
-              956,
-              29110,
-              27614,
-              45679,
-              955,
-              29109,
-              27614,
-              45675,
-              955,
-              29112,
-              27611,
-              45675,
-              955,
-              29103,
-              27611,
-              45673,
-              957,
-              29107,
-              27615,
-              45675,
-              955,
-              29109,
-              27609,
-              45683,
-              955,
-              29110,
-              27611,
-              45671,
-              955,
-              29111,
-              27615,
-              45675,
-              956,
-              29112,
-              27614,
-              45679,
-              956,
-              29107,
-              27615,
-              45673,
-              955,
-              29106,
-              27613,
-              45677,
-              956,
-              29113,
-              27612,
-              45675,
-              956,
-              29111,
-              27614,
-              45673,
-              957
-            ]
-          },
-          {
-            "time": 1600040171219,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29097,
-              27615,
-              45674,
-              958,
-              29103,
-              27616,
-              45678,
-              958,
-              29107,
-              27614,
-              45681,
-              955,
-              29107,
-              27611,
-              45676,
-              956,
-              29105,
-              27613,
-              45682,
-              958,
-              29105,
-              27612,
-              45675,
-              958,
-              29108,
-              27615,
-              45678,
-              958,
-              29107,
-              27613,
-              45679,
-              958,
-              29106,
-              27607,
-              45674,
-              956,
-              29111,
-              27614,
-              45683,
-              958,
-              29105,
-              27615,
-              45675,
-              958,
-              29104,
-              27613,
-              45677,
-              957,
-              29108,
-              27615,
-              45683,
-              957,
-              29104,
-              27613,
-              45675,
-              958,
-              29108,
-              27611,
-              45675,
-              957,
-              29104,
-              27613,
-              45682,
-              958,
-              29103,
-              27613,
-              45678,
-              956,
-              29105,
-              27612,
-              45675,
-              957,
-              29108,
-              27612,
-              45674,
-              957,
-              29109,
-              27612,
-              45680,
-              957,
-              29109,
-              27614,
-              45679,
-              958,
-              29107,
-              27612,
-              45674,
-              958,
-              29108,
-              27609,
-              45678,
-              956,
-              29105,
-              27610,
-              45675,
-              957,
-              29111,
-              27614,
-              45681,
-              957,
-              29109,
-              27614,
-              45681,
-              957,
-              29106,
-              27615,
-              45679,
-              957,
-              29110,
-              27611,
-              45679,
-              957,
-              29109,
-              27612,
-              45678,
-              958,
-              29105,
-              27613,
-              45680,
-              957,
-              29102,
-              27620,
-              45677,
-              959,
-              29108,
-              27617,
-              45681,
-              957,
-              29110,
-              27619,
-              45682,
-              958,
-              29106,
-              27615,
-              45685,
-              959,
-              29105,
-              27618,
-              45677,
-              956,
-              29105,
-              27615,
-              45675,
-              957,
-              29107,
-              27617,
-              45678,
-              958,
-              29106,
-              27617,
-              45682,
-              959,
-              29102,
-              27614,
-              45687,
-              959,
-              29104,
-              27618,
-              45682,
-              959,
-              29105,
-              27614,
-              45681,
-              958,
-              29109,
-              27615,
-              45683,
-              957,
-              29106,
-              27614,
-              45682,
-              958,
-              29105,
-              27615,
-              45675,
-              958,
-              29106,
-              27613,
-              45678,
-              958,
-              29102,
-              27615,
-              45677,
-              958,
-              29105,
-              27619,
-              45679,
-              957,
-              29104,
-              27611,
-              45678,
-              958,
-              29108,
-              27615,
-              45680,
-              957,
-              29104,
-              27614,
-              45679,
-              960,
-              29108,
-              27615,
-              45679,
-              959,
-              29103,
-              27616,
-              45679,
-              959,
-              29108,
-              27614,
-              45681,
-              957,
-              29109,
-              27618,
-              45681,
-              959,
-              29108,
-              27615,
-              45678,
-              956,
-              29106,
-              27617,
-              45681,
-              959,
-              29102,
-              27615,
-              45678,
-              958,
-              29112,
-              27614,
-              45674,
-              958,
-              29106,
-              27616,
-              45678,
-              958,
-              29106,
-              27617,
-              45682,
-              957,
-              29107,
-              27611,
-              45679,
-              958,
-              29109,
-              27611,
-              45679,
-              957,
-              29105,
-              27613,
-              45677,
-              958,
-              29111,
-              27615,
-              45679,
-              957,
-              29109,
-              27610,
-              45683,
-              959,
-              29109,
-              27613,
-              45672,
-              959,
-              29107,
-              27611,
-              45675,
-              958,
-              29111,
-              27613,
-              45677,
-              958,
-              29108,
-              27610,
-              45677,
-              958,
-              29109,
-              27614,
-              45679,
-              957,
-              29107,
-              27609,
-              45677,
-              957,
-              29107,
-              27611,
-              45677,
-              957,
-              29109,
-              27613,
-              45676,
-              959,
-              29109,
-              27612,
-              45678,
-              959,
-              29109,
-              27614,
-              45679,
-              959,
-              29109,
-              27617,
-              45677,
-              957,
-              29109,
-              27614,
-              45683,
-              959,
-              29107,
-              27611,
-              45683,
-              957,
-              29111,
-              27615,
-              45679,
-              959,
-              29109,
-              27613,
-              45680,
-              959,
-              29109,
-              27613,
-              45673,
-              960,
-              29109,
-              27613,
-              45682,
-              959,
-              29108,
-              27616,
-              45674,
-              959,
-              29109,
-              27615,
-              45679,
-              959,
-              29112,
-              27615,
-              45681,
-              959,
-              29112,
-              27613,
-              45672,
-              957,
-              29108,
-              27613,
-              45677,
-              959,
-              29111,
-              27612,
-              45681,
-              959,
-              29108,
-              27612,
-              45677,
-              961,
-              29107,
-              27613,
-              45673,
-              960
-            ]
-          },
-          {
-            "time": 1600040172348,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29105,
-              27613,
-              45675,
-              961,
-              29105,
-              27611,
-              45673,
-              958,
-              29108,
-              27611,
-              45675,
-              958,
-              29106,
-              27613,
-              45675,
-              960,
-              29103,
-              27612,
-              45677,
-              960,
-              29103,
-              27612,
-              45676,
-              959,
-              29109,
-              27613,
-              45678,
-              959,
-              29109,
-              27613,
-              45677,
-              959,
-              29111,
-              27614,
-              45681,
-              959,
-              29109,
-              27611,
-              45675,
-              959,
-              29109,
-              27611,
-              45678,
-              960,
-              29105,
-              27613,
-              45673,
-              960,
-              29104,
-              27615,
-              45679,
-              959,
-              29109,
-              27614,
-              45675,
-              960,
-              29110,
-              27612,
-              45671,
-              959,
-              29107,
-              27613,
-              45673,
-              958,
-              29111,
-              27615,
-              45681,
-              959,
-              29104,
-              27614,
-              45676,
-              959,
-              29108,
-              27611,
-              45677,
-              961,
-              29109,
-              27609,
-              45679,
-              960,
-              29108,
-              27613,
-              45681,
-              959,
-              29108,
-              27613,
-              45679,
-              959,
-              29106,
-              27612,
-              45672,
-              961,
-              29109,
-              27614,
-              45682,
-              958,
-              29115,
-              27613,
-              45679,
-              959,
-              29105,
-              27611,
-              45677,
-              959,
-              29106,
-              27614,
-              45675,
-              960,
-              29103,
-              27616,
-              45677,
-              959,
-              29109,
-              27615,
-              45674,
-              960,
-              29110,
-              27615,
-              45670,
-              960,
-              29111,
-              27627,
-              45674,
-              961,
-              29105,
-              27623,
-              45677,
-              961,
-              29101,
-              27624,
-              45675,
-              959,
-              29105,
-              27620,
-              45671,
-              959,
-              29101,
-              27618,
-              45674,
-              961,
-              29104,
-              27620,
-              45675,
-              960,
-              29103,
-              27618,
-              45678,
-              961,
-              29102,
-              27619,
-              45667,
-              960,
-              29105,
-              27616,
-              45671,
-              961,
-              29106,
-              27619,
-              45674,
-              962,
-              29107,
-              27618,
-              45673,
-              960,
-              29105,
-              27615,
-              45671,
-              960,
-              29103,
-              27618,
-              45671,
-              959,
-              29104,
-              27617,
-              45674,
-              959,
-              29106,
-              27619,
-              45669,
-              962,
-              29106,
-              27615,
-              45671,
-              961,
-              29105,
-              27616,
-              45671,
-              958,
-              29101,
-              27616,
-              45669,
-              961,
-              29107,
-              27617,
-              45671,
-              960,
-              29101,
-              27617,
-              45670,
-              960,
-              29108,
-              27617,
-              45673,
-              961,
-              29103,
-              27619,
-              45667,
-              959,
-              29105,
-              27616,
-              45672,
-              959,
-              29105,
-              27616,
-              45669,
-              960,
-              29105,
-              27617,
-              45667,
-              961,
-              29105,
-              27620,
-              45671,
-              960,
-              29108,
-              27621,
-              45674,
-              960,
-              29109,
-              27620,
-              45667,
-              959,
-              29105,
-              27618,
-              45671,
-              961,
-              29104,
-              27615,
-              45670,
-              959,
-              29108,
-              27603,
-              45675,
-              959,
-              29106,
-              27609,
-              45673,
-              958,
-              29105,
-              27609,
-              45674,
-              959,
-              29106,
-              27613,
-              45672,
-              960,
-              29113,
-              27611,
-              45670,
-              962,
-              29107,
-              27611,
-              45677,
-              959,
-              29111,
-              27611,
-              45675,
-              961,
-              29110,
-              27612,
-              45673,
-              959,
-              29109,
-              27612,
-              45682,
-              961,
-              29110,
-              27611,
-              45677,
-              960,
-              29111,
-              27611,
-              45680,
-              959,
-              29105,
-              27612,
-              45675,
-              960,
-              29111,
-              27612,
-              45674,
-              958,
-              29116,
-              27611,
-              45675,
-              961,
-              29112,
-              27614,
-              45680,
-              960,
-              29109,
-              27611,
-              45677,
-              960,
-              29110,
-              27611,
-              45675,
-              959,
-              29111,
-              27613,
-              45675,
-              959,
-              29109,
-              27611,
-              45674,
-              961,
-              29111,
-              27611,
-              45678,
-              961,
-              29109,
-              27613,
-              45675,
-              961,
-              29109,
-              27613,
-              45678,
-              959,
-              29106,
-              27610,
-              45677,
-              959,
-              29109,
-              27611,
-              45677,
-              961,
-              29109,
-              27613,
-              45671,
-              961,
-              29109,
-              27615,
-              45673,
-              961,
-              29109,
-              27613,
-              45683,
-              959,
-              29109,
-              27611,
-              45682,
-              959,
-              29108,
-              27614,
-              45670,
-              960,
-              29111,
-              27612,
-              45679,
-              961
-            ]
-          },
-          {
-            "time": 1600040173478,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29098,
-              27615,
-              45679,
-              962,
-              29103,
-              27613,
-              45677,
-              960,
-              29106,
-              27613,
-              45679,
-              961,
-              29109,
-              27611,
-              45677,
-              961,
-              29108,
-              27611,
-              45681,
-              961,
-              29109,
-              27610,
-              45675,
-              961,
-              29108,
-              27611,
-              45676,
-              960,
-              29111,
-              27611,
-              45677,
-              961,
-              29107,
-              27610,
-              45675,
-              959,
-              29109,
-              27611,
-              45673,
-              960,
-              29111,
-              27609,
-              45683,
-              960,
-              29110,
-              27612,
-              45681,
-              960,
-              29109,
-              27613,
-              45671,
-              961,
-              29103,
-              27611,
-              45675,
-              961,
-              29109,
-              27611,
-              45675,
-              962,
-              29111,
-              27611,
-              45683,
-              961,
-              29107,
-              27611,
-              45671,
-              958,
-              29108,
-              27611,
-              45681,
-              961,
-              29107,
-              27615,
-              45670,
-              961,
-              29106,
-              27608,
-              45671,
-              961,
-              29108,
-              27611,
-              45673,
-              960,
-              29106,
-              27613,
-              45669,
-              960,
-              29110,
-              27613,
-              45673,
-              961,
-              29109,
-              27612,
-              45678,
-              961,
-              29102,
-              27613,
-              45671,
-              961,
-              29107,
-              27613,
-              45677,
-              961,
-              29106,
-              27610,
-              45671,
-              960,
-              29107,
-              27615,
-              45683,
-              959,
-              29107,
-              27613,
-              45673,
-              961,
-              29103,
-              27613,
-              45669,
-              961,
-              29111,
-              27629,
-              45679,
-              962,
-              29109,
-              27627,
-              45678,
-              962,
-              29104,
-              27620,
-              45671,
-              962,
-              29105,
-              27620,
-              45680,
-              961,
-              29105,
-              27624,
-              45674,
-              960,
-              29105,
-              27623,
-              45678,
-              962,
-              29106,
-              27621,
-              45676,
-              962,
-              29104,
-              27617,
-              45678,
-              961,
-              29107,
-              27620,
-              45672,
-              961,
-              29107,
-              27617,
-              45673,
-              961,
-              29105,
-              27619,
-              45672,
-              960,
-              29104,
-              27618,
-              45675,
-              958,
-              29099,
-              27618,
-              45674,
-              961,
-              29104,
-              27618,
-              45675,
-              962,
-              29104,
-              27617,
-              45676,
-              959,
-              29106,
-              27617,
-              45680,
-              962,
-              29108,
-              27615,
-              45676,
-              961,
-              29106,
-              27615,
-              45671,
-              962,
-              29102,
-              27614,
-              45675,
-              961,
-              29106,
-              27615,
-              45673,
-              962,
-              29104,
-              27617,
-              45671,
-              962,
-              29107,
-              27617,
-              45672,
-              962,
-              29107,
-              27619,
-              45671,
-              962,
-              29106,
-              27617,
-              45680,
-              960,
-              29106,
-              27616,
-              45674,
-              963,
-              29106,
-              27617,
-              45680,
-              959,
-              29102,
-              27615,
-              45672,
-              961,
-              29103,
-              27616,
-              45673,
-              963,
-              29106,
-              27620,
-              45676,
-              961,
-              29107,
-              27618,
-              45675,
-              962,
-              29105,
-              27601,
-              45671,
-              959,
-              29109,
-              27603,
-              45671,
-              960,
-              29111,
-              27601,
-              45675,
-              961,
-              29113,
-              27604,
-              45673,
-              961,
-              29110,
-              27608,
-              45675,
-              961,
-              29112,
-              27610,
-              45675,
-              962,
-              29106,
-              27611,
-              45671,
-              960,
-              29109,
-              27610,
-              45671,
-              962,
-              29105,
-              27609,
-              45673,
-              962,
-              29109,
-              27609,
-              45667,
-              961,
-              29111,
-              27609,
-              45671,
-              963,
-              29113,
-              27610,
-              45669,
-              963,
-              29112,
-              27609,
-              45673,
-              961,
-              29108,
-              27609,
-              45674,
-              962,
-              29104,
-              27610,
-              45675,
-              961,
-              29112,
-              27609,
-              45671,
-              962,
-              29108,
-              27611,
-              45673,
-              961,
-              29111,
-              27611,
-              45675,
-              961,
-              29108,
-              27612,
-              45673,
-              960,
-              29111,
-              27611,
-              45673,
-              961,
-              29109,
-              27611,
-              45671,
-              959,
-              29113,
-              27610,
-              45676,
-              963,
-              29111,
-              27612,
-              45673,
-              961,
-              29109,
-              27607,
-              45674,
-              961,
-              29104,
-              27611,
-              45671,
-              961,
-              29109,
-              27611,
-              45671,
-              963,
-              29113,
-              27610,
-              45670,
-              962,
-              29108,
-              27611,
-              45671,
-              960,
-              29108,
-              27607,
-              45671,
-              964,
-              29112,
-              27610,
-              45671,
-              961
-            ]
-          },
-          {
-            "time": 1600040174605,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29092,
-              27613,
-              45678,
-              963,
-              29109,
-              27613,
-              45671,
-              963,
-              29105,
-              27611,
-              45672,
-              961,
-              29105,
-              27611,
-              45675,
-              962,
-              29102,
-              27612,
-              45669,
-              963,
-              29105,
-              27611,
-              45669,
-              962,
-              29111,
-              27612,
-              45669,
-              962,
-              29103,
-              27611,
-              45676,
-              961,
-              29107,
-              27609,
-              45672,
-              963,
-              29107,
-              27611,
-              45675,
-              963,
-              29103,
-              27609,
-              45675,
-              962,
-              29107,
-              27611,
-              45671,
-              962,
-              29107,
-              27609,
-              45671,
-              962,
-              29109,
-              27607,
-              45671,
-              963,
-              29106,
-              27611,
-              45667,
-              963,
-              29105,
-              27613,
-              45669,
-              962,
-              29107,
-              27613,
-              45675,
-              961,
-              29107,
-              27607,
-              45675,
-              962,
-              29105,
-              27610,
-              45677,
-              961,
-              29107,
-              27610,
-              45677,
-              961,
-              29107,
-              27613,
-              45674,
-              963,
-              29108,
-              27608,
-              45676,
-              961,
-              29109,
-              27609,
-              45671,
-              963,
-              29110,
-              27611,
-              45675,
-              961,
-              29108,
-              27611,
-              45675,
-              963,
-              29109,
-              27610,
-              45677,
-              962,
-              29111,
-              27607,
-              45673,
-              962,
-              29107,
-              27611,
-              45673,
-              963,
-              29109,
-              27611,
-              45677,
-              963,
-              29105,
-              27610,
-              45675,
-              963,
-              29118,
-              27645,
-              45690,
-              965,
-              29106,
-              27639,
-              45681,
-              963,
-              29108,
-              27633,
-              45672,
-              965,
-              29108,
-              27629,
-              45670,
-              964,
-              29109,
-              27630,
-              45673,
-              965,
-              29108,
-              27625,
-              45667,
-              961,
-              29103,
-              27624,
-              45671,
-              963,
-              29105,
-              27625,
-              45670,
-              962,
-              29110,
-              27622,
-              45670,
-              962,
-              29106,
-              27621,
-              45670,
-              965,
-              29106,
-              27624,
-              45670,
-              961,
-              29102,
-              27621,
-              45670,
-              962,
-              29105,
-              27624,
-              45668,
-              961,
-              29103,
-              27620,
-              45668,
-              961,
-              29105,
-              27621,
-              45668,
-              965,
-              29106,
-              27621,
-              45670,
-              963,
-              29105,
-              27621,
-              45670,
-              963,
-              29103,
-              27620,
-              45669,
-              962,
-              29106,
-              27622,
-              45668,
-              961,
-              29106,
-              27620,
-              45668,
-              963,
-              29106,
-              27621,
-              45669,
-              963,
-              29105,
-              27619,
-              45672,
-              962,
-              29106,
-              27621,
-              45672,
-              962,
-              29104,
-              27621,
-              45672,
-              960,
-              29104,
-              27620,
-              45665,
-              962,
-              29104,
-              27618,
-              45670,
-              961,
-              29106,
-              27621,
-              45664,
-              961,
-              29105,
-              27620,
-              45666,
-              963,
-              29105,
-              27617,
-              45668,
-              964,
-              29105,
-              27623,
-              45671,
-              962,
-              29102,
-              27586,
-              45662,
-              959,
-              29103,
-              27591,
-              45667,
-              961,
-              29109,
-              27601,
-              45669,
-              962,
-              29108,
-              27602,
-              45673,
-              962,
-              29105,
-              27605,
-              45669,
-              963,
-              29106,
-              27605,
-              45678,
-              962,
-              29108,
-              27610,
-              45673,
-              962,
-              29114,
-              27607,
-              45673,
-              962,
-              29111,
-              27603,
-              45674,
-              961,
-              29112,
-              27607,
-              45679,
-              963,
-              29107,
-              27607,
-              45672,
-              964,
-              29113,
-              27609,
-              45675,
-              963,
-              29112,
-              27609,
-              45673,
-              963,
-              29112,
-              27611,
-              45671,
-              964,
-              29111,
-              27609,
-              45670,
-              963,
-              29112,
-              27609,
-              45669,
-              963,
-              29113,
-              27607,
-              45671,
-              963,
-              29109,
-              27607,
-              45671,
-              963,
-              29113,
-              27609,
-              45671,
-              964,
-              29112,
-              27608,
-              45671,
-              963,
-              29105,
-              27607,
-              45673,
-              962,
-              29113,
-              27607,
-              45670,
-              965,
-              29115,
-              27607,
-              45667,
-              963,
-              29113,
-              27607,
-              45669,
-              963,
-              29114,
-              27610,
-              45667,
-              962,
-              29110,
-              27609,
-              45667,
-              963,
-              29117,
-              27605,
-              45671,
-              963,
-              29112,
-              27607,
-              45670,
-              963,
-              29113,
-              27609,
-              45671,
-              964,
-              29113,
-              27610,
-              45675,
-              963
-            ]
-          },
-          {
-            "time": 1600040175734,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29100,
-              27607,
-              45677,
-              964,
-              29108,
-              27607,
-              45673,
-              963,
-              29112,
-              27610,
-              45674,
-              964,
-              29106,
-              27607,
-              45667,
-              963,
-              29109,
-              27611,
-              45665,
-              963,
-              29107,
-              27609,
-              45671,
-              963,
-              29109,
-              27607,
-              45665,
-              963,
-              29113,
-              27608,
-              45669,
-              963,
-              29108,
-              27607,
-              45671,
-              963,
-              29105,
-              27609,
-              45670,
-              963,
-              29107,
-              27609,
-              45675,
-              963,
-              29107,
-              27607,
-              45670,
-              963,
-              29105,
-              27608,
-              45667,
-              964,
-              29109,
-              27607,
-              45667,
-              963,
-              29106,
-              27606,
-              45665,
-              963,
-              29105,
-              27613,
-              45667,
-              963,
-              29105,
-              27606,
-              45668,
-              964,
-              29107,
-              27607,
-              45669,
-              963,
-              29105,
-              27606,
-              45669,
-              963,
-              29102,
-              27612,
-              45663,
-              963,
-              29109,
-              27607,
-              45669,
-              963,
-              29105,
-              27607,
-              45669,
-              962,
-              29105,
-              27608,
-              45669,
-              963,
-              29103,
-              27611,
-              45670,
-              963,
-              29107,
-              27608,
-              45665,
-              964,
-              29109,
-              27610,
-              45669,
-              963,
-              29105,
-              27607,
-              45666,
-              963,
-              29104,
-              27609,
-              45665,
-              965,
-              29110,
-              27607,
-              45674,
-              963,
-              29111,
-              27607,
-              45669,
-              965,
-              29116,
-              27658,
-              45681,
-              971,
-              29108,
-              27647,
-              45681,
-              968,
-              29110,
-              27640,
-              45675,
-              968,
-              29110,
-              27638,
-              45668,
-              965,
-              29110,
-              27634,
-              45667,
-              965,
-              29104,
-              27632,
-              45674,
-              967,
-              29106,
-              27628,
-              45668,
-              965,
-              29105,
-              27630,
-              45667,
-              966,
-              29112,
-              27624,
-              45663,
-              966,
-              29106,
-              27626,
-              45668,
-              966,
-              29108,
-              27626,
-              45666,
-              965,
-              29108,
-              27628,
-              45669,
-              964,
-              29104,
-              27624,
-              45667,
-              965,
-              29110,
-              27624,
-              45667,
-              965,
-              29106,
-              27621,
-              45670,
-              963,
-              29108,
-              27622,
-              45673,
-              965,
-              29103,
-              27623,
-              45665,
-              965,
-              29107,
-              27622,
-              45667,
-              965,
-              29108,
-              27626,
-              45667,
-              965,
-              29108,
-              27624,
-              45663,
-              967,
-              29107,
-              27622,
-              45667,
-              963,
-              29107,
-              27624,
-              45670,
-              966,
-              29108,
-              27620,
-              45670,
-              964,
-              29110,
-              27624,
-              45669,
-              965,
-              29109,
-              27626,
-              45666,
-              965,
-              29108,
-              27626,
-              45663,
-              962,
-              29108,
-              27622,
-              45665,
-              966,
-              29110,
-              27622,
-              45661,
-              964,
-              29111,
-              27622,
-              45665,
-              967,
-              29114,
-              27624,
-              45662,
-              963,
-              29103,
-              27573,
-              45657,
-              957,
-              29111,
-              27580,
-              45659,
-              961,
-              29115,
-              27591,
-              45666,
-              963,
-              29109,
-              27592,
-              45663,
-              964,
-              29107,
-              27596,
-              45665,
-              962,
-              29115,
-              27599,
-              45663,
-              963,
-              29116,
-              27599,
-              45663,
-              965,
-              29113,
-              27598,
-              45665,
-              964,
-              29116,
-              27605,
-              45667,
-              964,
-              29117,
-              27603,
-              45669,
-              964,
-              29110,
-              27605,
-              45662,
-              963,
-              29117,
-              27601,
-              45663,
-              963,
-              29115,
-              27602,
-              45665,
-              963,
-              29115,
-              27605,
-              45667,
-              964,
-              29115,
-              27605,
-              45667,
-              963,
-              29117,
-              27603,
-              45665,
-              964,
-              29113,
-              27605,
-              45668,
-              963,
-              29117,
-              27601,
-              45663,
-              965,
-              29113,
-              27603,
-              45666,
-              964,
-              29112,
-              27601,
-              45665,
-              964,
-              29115,
-              27605,
-              45667,
-              963,
-              29115,
-              27603,
-              45665,
-              965,
-              29117,
-              27604,
-              45667,
-              964,
-              29117,
-              27606,
-              45667,
-              964,
-              29113,
-              27606,
-              45664,
-              963,
-              29114,
-              27603,
-              45665,
-              964,
-              29117,
-              27603,
-              45663,
-              964,
-              29117,
-              27606,
-              45661,
-              964,
-              29113,
-              27604,
-              45663,
-              964,
-              29113,
-              27604,
-              45665,
-              963
-            ]
-          },
-          {
-            "time": 1600040176864,
-            "bleed_correction": 1,
-            "label": "bc1",
-            "data_raw": [
-              29101,
-              27606,
-              45661,
-              965,
-              29111,
-              27605,
-              45655,
-              966,
-              29113,
-              27603,
-              45662,
-              963,
-              29110,
-              27603,
-              45667,
-              963,
-              29109,
-              27606,
-              45661,
-              964,
-              29111,
-              27605,
-              45659,
-              965,
-              29111,
-              27605,
-              45664,
-              964,
-              29105,
-              27607,
-              45663,
-              963,
-              29105,
-              27599,
-              45659,
-              964,
-              29112,
-              27605,
-              45661,
-              965,
-              29105,
-              27601,
-              45661,
-              964,
-              29103,
-              27602,
-              45663,
-              964,
-              29109,
-              27601,
-              45659,
-              965,
-              29109,
-              27603,
-              45663,
-              964,
-              29109,
-              27605,
-              45667,
-              964,
-              29109,
-              27601,
-              45659,
-              965,
-              29106,
-              27602,
-              45663,
-              965,
-              29109,
-              27602,
-              45659,
-              965,
-              29105,
-              27604,
-              45665,
-              965,
-              29111,
-              27603,
-              45663,
-              963,
-              29111,
-              27603,
-              45660,
-              965,
-              29108,
-              27605,
-              45658,
-              966,
-              29110,
-              27604,
-              45661,
-              965,
-              29104,
-              27605,
-              45657,
-              964,
-              29111,
-              27603,
-              45660,
-              965,
-              29107,
-              27599,
-              45663,
-              963,
-              29106,
-              27604,
-              45661,
-              964,
-              29103,
-              27603,
-              45664,
-              964,
-              29104,
-              27603,
-              45663,
-              965,
-              29105,
-              27604,
-              45659,
-              965,
-              29126,
-              27674,
-              45683,
-              976,
-              29107,
-              27657,
-              45676,
-              973,
-              29108,
-              27650,
-              45668,
-              971,
-              29109,
-              27646,
-              45671,
-              966,
-              29113,
-              27639,
-              45668,
-              966,
-              29112,
-              27636,
-              45665,
-              964,
-              29109,
-              27635,
-              45667,
-              965,
-              29108,
-              27632,
-              45668,
-              965,
-              29115,
-              27633,
-              45657,
-              965,
-              29113,
-              27630,
-              45655,
-              964,
-              29111,
-              27630,
-              45669,
-              965,
-              29113,
-              27630,
-              45659,
-              967,
-              29113,
-              27630,
-              45663,
-              963,
-              29115,
-              27630,
-              45663,
-              963,
-              29115,
-              27630,
-              45665,
-              962,
-              29113,
-              27628,
-              45661,
-              963,
-              29111,
-              27624,
-              45659,
-              965,
-              29112,
-              27624,
-              45664,
-              964,
-              29115,
-              27626,
-              45663,
-              966,
-              29114,
-              27626,
-              45666,
-              963,
-              29113,
-              27625,
-              45657,
-              963,
-              29113,
-              27626,
-              45661,
-              964,
-              29116,
-              27625,
-              45661,
-              965,
-              29121,
-              27625,
-              45657,
-              965,
-              29113,
-              27624,
-              45657,
-              965,
-              29117,
-              27623,
-              45659,
-              963,
-              29113,
-              27626,
-              45661,
-              962,
-              29113,
-              27620,
-              45665,
-              962,
-              29116,
-              27621,
-              45657,
-              963,
-              29106,
-              27626,
-              45658,
-              965,
-              29101,
-              27555,
-              45645,
-              958,
-              29104,
-              27568,
-              45653,
-              961,
-              29113,
-              27576,
-              45655,
-              961,
-              29109,
-              27585,
-              45653,
-              961,
-              29113,
-              27586,
-              45656,
-              963,
-              29116,
-              27593,
-              45659,
-              963,
-              29119,
-              27595,
-              45656,
-              965,
-              29116,
-              27594,
-              45659,
-              965,
-              29114,
-              27595,
-              45655,
-              964,
-              29115,
-              27599,
-              45659,
-              965,
-              29116,
-              27597,
-              45651,
-              965,
-              29117,
-              27599,
-              45659,
-              964,
-              29120,
-              27595,
-              45658,
-              964,
-              29116,
-              27598,
-              45653,
-              963,
-              29117,
-              27599,
-              45659,
-              964,
-              29120,
-              27599,
-              45655,
-              963,
-              29117,
-              27596,
-              45653,
-              965,
-              29117,
-              27599,
-              45655,
-              965,
-              29113,
-              27599,
-              45658,
-              965,
-              29117,
-              27595,
-              45656,
-              966,
-              29117,
-              27599,
-              45660,
-              965,
-              29117,
-              27600,
-              45653,
-              964,
-              29118,
-              27599,
-              45658,
-              963,
-              29121,
-              27598,
-              45655,
-              964,
-              29121,
-              27598,
-              45655,
-              963,
-              29117,
-              27598,
-              45664,
-              965,
-              29123,
-              27597,
-              45657,
-              965,
-              29113,
-              27598,
-              45655,
-              964,
-              29121,
-              27599,
-              45657,
-              965,
-              29121,
-              27597,
-              45651,
-              965
-            ]
-          },
-          {
-            "time": 1600040177992,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29098,
-              27597,
-              45657,
-              965,
-              29110,
-              27601,
-              45651,
-              964,
-              29111,
-              27599,
-              45646,
-              965,
-              29109,
-              27597,
-              45651,
-              966,
-              29108,
-              27595,
-              45652,
-              965,
-              29109,
-              27599,
-              45647,
-              966,
-              29109,
-              27595,
-              45647,
-              963,
-              29111,
-              27597,
-              45649,
-              965,
-              29111,
-              27596,
-              45647,
-              966,
-              29105,
-              27599,
-              45647,
-              965,
-              29107,
-              27599,
-              45651,
-              965,
-              29110,
-              27595,
-              45644,
-              965,
-              29112,
-              27597,
-              45647,
-              966,
-              29106,
-              27597,
-              45652,
-              965,
-              29108,
-              27595,
-              45645,
-              965,
-              29111,
-              27595,
-              45646,
-              965,
-              29108,
-              27595,
-              45649,
-              966,
-              29106,
-              27596,
-              45651,
-              965,
-              29106,
-              27597,
-              45650,
-              965,
-              29109,
-              27598,
-              45651,
-              964,
-              29108,
-              27600,
-              45643,
-              965,
-              29105,
-              27598,
-              45647,
-              966,
-              29105,
-              27599,
-              45650,
-              965,
-              29101,
-              27595,
-              45647,
-              965,
-              29109,
-              27594,
-              45649,
-              965,
-              29103,
-              27599,
-              45646,
-              965,
-              29104,
-              27597,
-              45647,
-              965,
-              29107,
-              27595,
-              45647,
-              965,
-              29108,
-              27597,
-              45642,
-              966,
-              29109,
-              27594,
-              45647,
-              966,
-              29107,
-              27595,
-              45651,
-              967,
-              29108,
-              27596,
-              45649,
-              966,
-              29103,
-              27597,
-              45647,
-              965,
-              29109,
-              27597,
-              45650,
-              965,
-              29103,
-              27596,
-              45650,
-              965,
-              29103,
-              27597,
-              45645,
-              965,
-              29109,
-              27599,
-              45649,
-              965,
-              29105,
-              27599,
-              45650,
-              966,
-              29109,
-              27598,
-              45645,
-              966,
-              29111,
-              27595,
-              45647,
-              964,
-              29103,
-              27599,
-              45649,
-              966,
-              29105,
-              27591,
-              45646,
-              965,
-              29107,
-              27598,
-              45650,
-              965,
-              29109,
-              27597,
-              45648,
-              966,
-              29107,
-              27595,
-              45647,
-              964,
-              29108,
-              27597,
-              45643,
-              966,
-              29103,
-              27596,
-              45645,
-              966,
-              29099,
-              27599,
-              45641,
-              965,
-              29105,
-              27596,
-              45645,
-              965,
-              29105,
-              27594,
-              45645,
-              965,
-              29105,
-              27599,
-              45650,
-              965,
-              29107,
-              27597,
-              45645,
-              965,
-              29105,
-              27596,
-              45645,
-              965,
-              29106,
-              27595,
-              45651,
-              965,
-              29103,
-              27592,
-              45649,
-              963,
-              29109,
-              27595,
-              45643,
-              965,
-              29105,
-              27596,
-              45643,
-              965,
-              29103,
-              27594,
-              45643,
-              966,
-              29103,
-              27601,
-              45641,
-              966,
-              29105,
-              27598,
-              45645,
-              967,
-              29107,
-              27599,
-              45647,
-              965,
-              29103,
-              27597,
-              45645,
-              966,
-              29105,
-              27596,
-              45646,
-              965,
-              29105,
-              27597,
-              45645,
-              966,
-              29108,
-              27597,
-              45647,
-              966,
-              29103,
-              27596,
-              45647,
-              967,
-              29108,
-              27597,
-              45645,
-              965,
-              29105,
-              27596,
-              45649,
-              965,
-              29107,
-              27595,
-              45646,
-              966,
-              29106,
-              27599,
-              45643,
-              965,
-              29103,
-              27598,
-              45644,
-              966,
-              29101,
-              27595,
-              45641,
-              967,
-              29106,
-              27597,
-              45639,
-              966,
-              29105,
-              27597,
-              45647,
-              966,
-              29106,
-              27597,
-              45647,
-              965,
-              29103,
-              27596,
-              45647,
-              966,
-              29101,
-              27597,
-              45647,
-              966,
-              29107,
-              27595,
-              45645,
-              967,
-              29101,
-              27598,
-              45647,
-              965,
-              29107,
-              27597,
-              45642,
-              967,
-              29105,
-              27595,
-              45646,
-              965,
-              29103,
-              27597,
-              45645,
-              965,
-              29109,
-              27597,
-              45643,
-              966,
-              29104,
-              27599,
-              45652,
-              967,
-              29103,
-              27596,
-              45643,
-              966,
-              29103,
-              27598,
-              45643,
-              966,
-              29099,
-              27597,
-              45643,
-              966,
-              29106,
-              27598,
-              45646,
-              968,
-              29099,
-              27594,
-              45645,
-              967,
-              29106,
-              27598,
-              45646,
-              966
-            ]
-          },
-          {
-            "time": 1600040179121,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29100,
-              27597,
-              45645,
-              965,
-              29101,
-              27599,
-              45643,
-              965,
-              29105,
-              27597,
-              45644,
-              967,
-              29105,
-              27596,
-              45645,
-              967,
-              29107,
-              27594,
-              45651,
-              966,
-              29103,
-              27596,
-              45643,
-              966,
-              29103,
-              27595,
-              45647,
-              964,
-              29107,
-              27596,
-              45641,
-              966,
-              29103,
-              27595,
-              45641,
-              968,
-              29105,
-              27594,
-              45645,
-              967,
-              29109,
-              27596,
-              45647,
-              966,
-              29101,
-              27596,
-              45649,
-              966,
-              29102,
-              27597,
-              45643,
-              966,
-              29105,
-              27595,
-              45645,
-              965,
-              29107,
-              27594,
-              45642,
-              965,
-              29105,
-              27596,
-              45646,
-              967,
-              29106,
-              27595,
-              45645,
-              966,
-              29102,
-              27594,
-              45650,
-              966,
-              29105,
-              27596,
-              45646,
-              966,
-              29101,
-              27594,
-              45646,
-              965,
-              29107,
-              27596,
-              45644,
-              967,
-              29103,
-              27594,
-              45642,
-              965,
-              29103,
-              27593,
-              45648,
-              965,
-              29105,
-              27597,
-              45645,
-              965,
-              29107,
-              27596,
-              45649,
-              967,
-              29106,
-              27595,
-              45644,
-              965,
-              29103,
-              27595,
-              45649,
-              966,
-              29106,
-              27595,
-              45643,
-              966,
-              29108,
-              27593,
-              45647,
-              968,
-              29105,
-              27593,
-              45646,
-              967,
-              29114,
-              27606,
-              45645,
-              967,
-              29115,
-              27605,
-              45645,
-              967,
-              29113,
-              27605,
-              45647,
-              966,
-              29113,
-              27604,
-              45648,
-              966,
-              29114,
-              27609,
-              45640,
-              965,
-              29111,
-              27605,
-              45646,
-              967,
-              29110,
-              27604,
-              45650,
-              967,
-              29109,
-              27602,
-              45649,
-              965,
-              29114,
-              27607,
-              45647,
-              966,
-              29112,
-              27604,
-              45647,
-              966,
-              29112,
-              27605,
-              45649,
-              967,
-              29107,
-              27605,
-              45647,
-              967,
-              29110,
-              27603,
-              45645,
-              966,
-              29110,
-              27605,
-              45646,
-              966,
-              29111,
-              27603,
-              45649,
-              964,
-              29111,
-              27603,
-              45647,
-              967,
-              29107,
-              27605,
-              45647,
-              966,
-              29117,
-              27607,
-              45643,
-              966,
-              29112,
-              27603,
-              45646,
-              967,
-              29115,
-              27605,
-              45645,
-              967,
-              29109,
-              27601,
-              45646,
-              966,
-              29115,
-              27601,
-              45645,
-              965,
-              29109,
-              27609,
-              45647,
-              968,
-              29113,
-              27603,
-              45646,
-              968,
-              29110,
-              27604,
-              45643,
-              966,
-              29108,
-              27606,
-              45645,
-              966,
-              29114,
-              27607,
-              45645,
-              968,
-              29107,
-              27607,
-              45643,
-              967,
-              29113,
-              27607,
-              45650,
-              967,
-              29115,
-              27603,
-              45646,
-              967,
-              29102,
-              27592,
-              45647,
-              967,
-              29107,
-              27595,
-              45642,
-              965,
-              29105,
-              27595,
-              45639,
-              967,
-              29109,
-              27593,
-              45647,
-              967,
-              29108,
-              27601,
-              45659,
-              967,
-              29097,
-              27593,
-              45659,
-              964,
-              29105,
-              27598,
-              45650,
-              966,
-              29109,
-              27598,
-              45637,
-              967,
-              29102,
-              27599,
-              45651,
-              967,
-              29099,
-              27598,
-              45648,
-              966,
-              29109,
-              27593,
-              45648,
-              966,
-              29103,
-              27599,
-              45648,
-              967,
-              29101,
-              27597,
-              45646,
-              967,
-              29107,
-              27595,
-              45646,
-              965,
-              29109,
-              27599,
-              45645,
-              965,
-              29104,
-              27597,
-              45653,
-              966,
-              29102,
-              27598,
-              45649,
-              966,
-              29105,
-              27597,
-              45646,
-              966,
-              29102,
-              27597,
-              45649,
-              967,
-              29103,
-              27597,
-              45650,
-              966,
-              29106,
-              27595,
-              45652,
-              966,
-              29106,
-              27599,
-              45652,
-              965,
-              29101,
-              27595,
-              45648,
-              967,
-              29103,
-              27596,
-              45647,
-              966,
-              29106,
-              27597,
-              45647,
-              967,
-              29103,
-              27598,
-              45647,
-              966,
-              29101,
-              27596,
-              45651,
-              965,
-              29102,
-              27599,
-              45649,
-              966,
-              29107,
-              27597,
-              45653,
-              967,
-              29103,
-              27595,
-              45650,
-              965
-            ]
-          },
-          {
-            "time": 1600040180248,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29093,
-              27604,
-              45653,
-              967,
-              29097,
-              27596,
-              45647,
-              967,
-              29103,
-              27599,
-              45653,
-              967,
-              29105,
-              27598,
-              45653,
-              964,
-              29102,
-              27597,
-              45647,
-              966,
-              29105,
-              27595,
-              45654,
-              966,
-              29105,
-              27597,
-              45652,
-              967,
-              29107,
-              27599,
-              45655,
-              967,
-              29099,
-              27598,
-              45651,
-              967,
-              29099,
-              27599,
-              45647,
-              966,
-              29105,
-              27599,
-              45655,
-              965,
-              29105,
-              27597,
-              45652,
-              967,
-              29100,
-              27597,
-              45651,
-              968,
-              29107,
-              27596,
-              45651,
-              966,
-              29103,
-              27599,
-              45647,
-              966,
-              29097,
-              27599,
-              45647,
-              967,
-              29109,
-              27595,
-              45647,
-              967,
-              29102,
-              27598,
-              45653,
-              967,
-              29103,
-              27597,
-              45649,
-              966,
-              29103,
-              27595,
-              45651,
-              965,
-              29105,
-              27597,
-              45651,
-              966,
-              29104,
-              27599,
-              45647,
-              966,
-              29107,
-              27597,
-              45646,
-              966,
-              29105,
-              27598,
-              45651,
-              965,
-              29106,
-              27599,
-              45647,
-              967,
-              29105,
-              27595,
-              45653,
-              967,
-              29103,
-              27599,
-              45650,
-              965,
-              29103,
-              27599,
-              45651,
-              967,
-              29102,
-              27599,
-              45649,
-              967,
-              29101,
-              27599,
-              45646,
-              966,
-              29119,
-              27641,
-              45657,
-              967,
-              29119,
-              27639,
-              45650,
-              967,
-              29120,
-              27639,
-              45651,
-              968,
-              29123,
-              27639,
-              45654,
-              967,
-              29121,
-              27638,
-              45658,
-              966,
-              29121,
-              27639,
-              45655,
-              968,
-              29123,
-              27638,
-              45650,
-              967,
-              29119,
-              27635,
-              45659,
-              967,
-              29123,
-              27635,
-              45655,
-              967,
-              29117,
-              27639,
-              45654,
-              966,
-              29119,
-              27635,
-              45651,
-              967,
-              29122,
-              27636,
-              45649,
-              967,
-              29118,
-              27637,
-              45655,
-              968,
-              29123,
-              27635,
-              45660,
-              967,
-              29119,
-              27637,
-              45655,
-              967,
-              29119,
-              27639,
-              45655,
-              965,
-              29123,
-              27637,
-              45652,
-              969,
-              29123,
-              27637,
-              45652,
-              967,
-              29122,
-              27637,
-              45659,
-              968,
-              29124,
-              27634,
-              45654,
-              968,
-              29119,
-              27637,
-              45653,
-              967,
-              29124,
-              27635,
-              45657,
-              967,
-              29125,
-              27639,
-              45650,
-              967,
-              29121,
-              27637,
-              45653,
-              969,
-              29119,
-              27641,
-              45653,
-              967,
-              29119,
-              27643,
-              45653,
-              969,
-              29127,
-              27638,
-              45652,
-              968,
-              29119,
-              27643,
-              45658,
-              968,
-              29122,
-              27639,
-              45658,
-              966,
-              29118,
-              27636,
-              45653,
-              968,
-              29101,
-              27592,
-              45651,
-              966,
-              29101,
-              27594,
-              45655,
-              966,
-              29103,
-              27595,
-              45647,
-              967,
-              29099,
-              27597,
-              45654,
-              967,
-              29106,
-              27594,
-              45649,
-              967,
-              29103,
-              27597,
-              45653,
-              967,
-              29107,
-              27598,
-              45651,
-              967,
-              29105,
-              27595,
-              45649,
-              966,
-              29099,
-              27593,
-              45652,
-              969,
-              29103,
-              27595,
-              45651,
-              967,
-              29107,
-              27597,
-              45656,
-              967,
-              29108,
-              27599,
-              45649,
-              967,
-              29104,
-              27598,
-              45651,
-              966,
-              29111,
-              27600,
-              45648,
-              967,
-              29103,
-              27597,
-              45654,
-              966,
-              29110,
-              27597,
-              45647,
-              967,
-              29107,
-              27595,
-              45651,
-              967,
-              29104,
-              27597,
-              45654,
-              966,
-              29102,
-              27593,
-              45653,
-              967,
-              29110,
-              27597,
-              45649,
-              966,
-              29110,
-              27598,
-              45656,
-              967,
-              29107,
-              27592,
-              45651,
-              967,
-              29106,
-              27595,
-              45647,
-              967,
-              29111,
-              27596,
-              45653,
-              968,
-              29107,
-              27599,
-              45649,
-              967,
-              29107,
-              27599,
-              45655,
-              965,
-              29109,
-              27597,
-              45651,
-              968,
-              29105,
-              27597,
-              45654,
-              967,
-              29109,
-              27598,
-              45647,
-              967,
-              29102,
-              27593,
-              45650,
-              967
-            ]
-          },
-          {
-            "time": 1600040181375,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29097,
-              27595,
-              45655,
-              969,
-              29102,
-              27599,
-              45651,
-              968,
-              29103,
-              27597,
-              45647,
-              967,
-              29101,
-              27593,
-              45655,
-              966,
-              29099,
-              27595,
-              45650,
-              969,
-              29105,
-              27597,
-              45650,
-              968,
-              29097,
-              27593,
-              45654,
-              968,
-              29103,
-              27595,
-              45647,
-              968,
-              29103,
-              27596,
-              45651,
-              968,
-              29099,
-              27597,
-              45651,
-              967,
-              29103,
-              27597,
-              45651,
-              969,
-              29110,
-              27597,
-              45651,
-              971,
-              29104,
-              27597,
-              45646,
-              968,
-              29105,
-              27595,
-              45649,
-              967,
-              29105,
-              27596,
-              45651,
-              968,
-              29105,
-              27599,
-              45650,
-              967,
-              29105,
-              27593,
-              45647,
-              968,
-              29101,
-              27595,
-              45647,
-              967,
-              29103,
-              27595,
-              45652,
-              969,
-              29102,
-              27597,
-              45651,
-              967,
-              29101,
-              27595,
-              45647,
-              967,
-              29107,
-              27596,
-              45652,
-              970,
-              29108,
-              27599,
-              45652,
-              966,
-              29105,
-              27598,
-              45651,
-              967,
-              29102,
-              27597,
-              45652,
-              967,
-              29109,
-              27596,
-              45653,
-              966,
-              29101,
-              27595,
-              45652,
-              967,
-              29107,
-              27597,
-              45656,
-              967,
-              29105,
-              27597,
-              45651,
-              967,
-              29108,
-              27597,
-              45647,
-              969,
-              29134,
-              27706,
-              45667,
-              970,
-              29131,
-              27703,
-              45674,
-              969,
-              29131,
-              27699,
-              45663,
-              970,
-              29130,
-              27695,
-              45666,
-              970,
-              29133,
-              27703,
-              45661,
-              968,
-              29134,
-              27695,
-              45668,
-              968,
-              29129,
-              27694,
-              45662,
-              968,
-              29132,
-              27695,
-              45665,
-              968,
-              29132,
-              27694,
-              45665,
-              967,
-              29129,
-              27698,
-              45661,
-              968,
-              29129,
-              27696,
-              45661,
-              968,
-              29128,
-              27693,
-              45667,
-              967,
-              29127,
-              27697,
-              45663,
-              969,
-              29127,
-              27694,
-              45662,
-              967,
-              29130,
-              27697,
-              45663,
-              967,
-              29129,
-              27693,
-              45660,
-              969,
-              29131,
-              27695,
-              45663,
-              968,
-              29131,
-              27694,
-              45663,
-              967,
-              29131,
-              27694,
-              45663,
-              967,
-              29131,
-              27695,
-              45663,
-              968,
-              29130,
-              27695,
-              45669,
-              967,
-              29133,
-              27695,
-              45663,
-              967,
-              29129,
-              27693,
-              45663,
-              969,
-              29131,
-              27695,
-              45663,
-              968,
-              29130,
-              27695,
-              45663,
-              968,
-              29130,
-              27697,
-              45658,
-              968,
-              29132,
-              27695,
-              45663,
-              967,
-              29131,
-              27695,
-              45663,
-              967,
-              29130,
-              27699,
-              45665,
-              969,
-              29129,
-              27692,
-              45667,
-              966,
-              29105,
-              27586,
-              45651,
-              966,
-              29106,
-              27588,
-              45651,
-              967,
-              29111,
-              27591,
-              45651,
-              968,
-              29105,
-              27592,
-              45647,
-              967,
-              29103,
-              27594,
-              45654,
-              966,
-              29105,
-              27591,
-              45656,
-              968,
-              29106,
-              27591,
-              45653,
-              968,
-              29108,
-              27597,
-              45649,
-              968,
-              29109,
-              27591,
-              45652,
-              967,
-              29108,
-              27595,
-              45653,
-              967,
-              29103,
-              27593,
-              45651,
-              967,
-              29109,
-              27595,
-              45651,
-              968,
-              29108,
-              27595,
-              45659,
-              968,
-              29107,
-              27594,
-              45655,
-              966,
-              29103,
-              27596,
-              45647,
-              966,
-              29109,
-              27595,
-              45654,
-              969,
-              29109,
-              27597,
-              45653,
-              967,
-              29103,
-              27594,
-              45651,
-              967,
-              29103,
-              27595,
-              45649,
-              969,
-              29105,
-              27593,
-              45653,
-              969,
-              29105,
-              27595,
-              45655,
-              969,
-              29106,
-              27595,
-              45651,
-              969,
-              29107,
-              27595,
-              45655,
-              968,
-              29107,
-              27596,
-              45652,
-              967,
-              29110,
-              27595,
-              45652,
-              966,
-              29105,
-              27596,
-              45659,
-              966,
-              29105,
-              27595,
-              45654,
-              967,
-              29106,
-              27595,
-              45658,
-              967,
-              29107,
-              27593,
-              45654,
-              967,
-              29108,
-              27595,
-              45651,
-              967
-            ]
-          },
-          {
-            "time": 1600040182504,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29099,
-              27595,
-              45655,
-              968,
-              29102,
-              27595,
-              45649,
-              967,
-              29107,
-              27593,
-              45648,
-              968,
-              29107,
-              27597,
-              45647,
-              968,
-              29103,
-              27595,
-              45653,
-              967,
-              29106,
-              27594,
-              45654,
-              968,
-              29105,
-              27595,
-              45651,
-              968,
-              29109,
-              27595,
-              45651,
-              968,
-              29103,
-              27596,
-              45651,
-              967,
-              29102,
-              27595,
-              45655,
-              969,
-              29107,
-              27595,
-              45649,
-              969,
-              29108,
-              27597,
-              45652,
-              969,
-              29106,
-              27593,
-              45649,
-              967,
-              29108,
-              27595,
-              45653,
-              969,
-              29105,
-              27593,
-              45655,
-              967,
-              29107,
-              27599,
-              45649,
-              966,
-              29111,
-              27597,
-              45658,
-              969,
-              29109,
-              27598,
-              45653,
-              967,
-              29109,
-              27595,
-              45652,
-              967,
-              29106,
-              27595,
-              45655,
-              967,
-              29106,
-              27594,
-              45654,
-              968,
-              29105,
-              27596,
-              45651,
-              967,
-              29105,
-              27598,
-              45655,
-              968,
-              29111,
-              27597,
-              45647,
-              967,
-              29107,
-              27596,
-              45649,
-              967,
-              29099,
-              27599,
-              45654,
-              967,
-              29103,
-              27597,
-              45651,
-              969,
-              29107,
-              27596,
-              45651,
-              968,
-              29103,
-              27599,
-              45649,
-              968,
-              29105,
-              27595,
-              45649,
-              968,
-              29143,
-              27745,
-              45678,
-              971,
-              29138,
-              27741,
-              45672,
-              969,
-              29139,
-              27737,
-              45671,
-              970,
-              29139,
-              27739,
-              45669,
-              969,
-              29139,
-              27737,
-              45672,
-              970,
-              29137,
-              27737,
-              45671,
-              968,
-              29137,
-              27738,
-              45671,
-              968,
-              29136,
-              27737,
-              45675,
-              969,
-              29137,
-              27736,
-              45673,
-              968,
-              29138,
-              27737,
-              45669,
-              969,
-              29135,
-              27735,
-              45669,
-              969,
-              29134,
-              27737,
-              45669,
-              969,
-              29137,
-              27735,
-              45668,
-              969,
-              29137,
-              27735,
-              45669,
-              969,
-              29135,
-              27736,
-              45670,
-              969,
-              29137,
-              27735,
-              45671,
-              970,
-              29136,
-              27736,
-              45670,
-              970,
-              29134,
-              27738,
-              45671,
-              970,
-              29136,
-              27738,
-              45668,
-              969,
-              29133,
-              27737,
-              45674,
-              967,
-              29139,
-              27738,
-              45667,
-              967,
-              29134,
-              27734,
-              45669,
-              970,
-              29138,
-              27733,
-              45667,
-              969,
-              29138,
-              27736,
-              45669,
-              969,
-              29135,
-              27733,
-              45670,
-              970,
-              29138,
-              27733,
-              45669,
-              969,
-              29139,
-              27736,
-              45667,
-              970,
-              29136,
-              27736,
-              45669,
-              968,
-              29135,
-              27735,
-              45673,
-              969,
-              29138,
-              27735,
-              45669,
-              969,
-              29101,
-              27585,
-              45647,
-              966,
-              29109,
-              27587,
-              45652,
-              966,
-              29105,
-              27591,
-              45647,
-              967,
-              29099,
-              27594,
-              45647,
-              967,
-              29106,
-              27591,
-              45651,
-              967,
-              29105,
-              27591,
-              45647,
-              967,
-              29109,
-              27593,
-              45655,
-              968,
-              29109,
-              27596,
-              45651,
-              967,
-              29111,
-              27593,
-              45652,
-              966,
-              29109,
-              27593,
-              45651,
-              968,
-              29111,
-              27596,
-              45651,
-              967,
-              29111,
-              27595,
-              45651,
-              968,
-              29109,
-              27594,
-              45647,
-              969,
-              29103,
-              27594,
-              45656,
-              967,
-              29103,
-              27596,
-              45654,
-              969,
-              29107,
-              27595,
-              45657,
-              967,
-              29108,
-              27594,
-              45655,
-              967,
-              29111,
-              27595,
-              45646,
-              969,
-              29110,
-              27594,
-              45649,
-              968,
-              29108,
-              27594,
-              45651,
-              967,
-              29103,
-              27594,
-              45649,
-              968,
-              29111,
-              27595,
-              45651,
-              968,
-              29110,
-              27596,
-              45647,
-              969,
-              29110,
-              27595,
-              45655,
-              968,
-              29111,
-              27594,
-              45653,
-              968,
-              29107,
-              27594,
-              45651,
-              968,
-              29113,
-              27595,
-              45654,
-              967,
-              29111,
-              27594,
-              45653,
-              968,
-              29107,
-              27598,
-              45653,
-              967,
-              29111,
-              27595,
-              45658,
-              969
-            ]
-          },
-          {
-            "time": 1600040183632,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29092,
-              27595,
-              45651,
-              970,
-              29105,
-              27595,
-              45651,
-              970,
-              29099,
-              27595,
-              45649,
-              967,
-              29108,
-              27593,
-              45651,
-              969,
-              29107,
-              27597,
-              45655,
-              970,
-              29105,
-              27597,
-              45648,
-              967,
-              29109,
-              27599,
-              45649,
-              968,
-              29105,
-              27595,
-              45647,
-              968,
-              29111,
-              27595,
-              45651,
-              969,
-              29105,
-              27599,
-              45653,
-              968,
-              29108,
-              27598,
-              45648,
-              969,
-              29105,
-              27594,
-              45653,
-              968,
-              29107,
-              27598,
-              45655,
-              968,
-              29109,
-              27595,
-              45650,
-              968,
-              29104,
-              27594,
-              45654,
-              970,
-              29107,
-              27595,
-              45649,
-              968,
-              29103,
-              27597,
-              45652,
-              970,
-              29107,
-              27599,
-              45649,
-              967,
-              29107,
-              27595,
-              45651,
-              967,
-              29106,
-              27593,
-              45652,
-              968,
-              29105,
-              27595,
-              45652,
-              968,
-              29105,
-              27595,
-              45651,
-              967,
-              29106,
-              27595,
-              45653,
-              967,
-              29106,
-              27597,
-              45655,
-              969,
-              29109,
-              27591,
-              45653,
-              969,
-              29106,
-              27592,
-              45655,
-              968,
-              29108,
-              27597,
-              45655,
-              968,
-              29105,
-              27596,
-              45649,
-              968,
-              29107,
-              27594,
-              45655,
-              969,
-              29107,
-              27592,
-              45651,
-              969,
-              29171,
-              27918,
-              45705,
-              975,
-              29162,
-              27915,
-              45701,
-              973,
-              29158,
-              27909,
-              45698,
-              970,
-              29163,
-              27903,
-              45699,
-              971,
-              29160,
-              27905,
-              45699,
-              969,
-              29159,
-              27897,
-              45701,
-              970,
-              29161,
-              27901,
-              45699,
-              970,
-              29161,
-              27901,
-              45697,
-              971,
-              29159,
-              27900,
-              45698,
-              969,
-              29161,
-              27895,
-              45699,
-              971,
-              29159,
-              27899,
-              45697,
-              970,
-              29163,
-              27900,
-              45694,
-              971,
-              29158,
-              27898,
-              45698,
-              971,
-              29161,
-              27897,
-              45694,
-              970,
-              29162,
-              27895,
-              45694,
-              970,
-              29162,
-              27894,
-              45694,
-              971,
-              29160,
-              27897,
-              45698,
-              970,
-              29163,
-              27895,
-              45694,
-              973,
-              29159,
-              27895,
-              45695,
-              970,
-              29161,
-              27895,
-              45695,
-              967,
-              29161,
-              27894,
-              45693,
-              971,
-              29159,
-              27895,
-              45695,
-              971,
-              29163,
-              27896,
-              45695,
-              972,
-              29158,
-              27897,
-              45698,
-              970,
-              29161,
-              27894,
-              45695,
-              972,
-              29159,
-              27897,
-              45695,
-              969,
-              29163,
-              27894,
-              45699,
-              970,
-              29161,
-              27897,
-              45702,
-              969,
-              29159,
-              27894,
-              45699,
-              969,
-              29159,
-              27899,
-              45696,
-              971,
-              29101,
-              27572,
-              45647,
-              965,
-              29110,
-              27579,
-              45647,
-              967,
-              29111,
-              27587,
-              45649,
-              969,
-              29108,
-              27587,
-              45646,
-              967,
-              29111,
-              27589,
-              45647,
-              967,
-              29109,
-              27589,
-              45650,
-              968,
-              29113,
-              27591,
-              45653,
-              968,
-              29115,
-              27589,
-              45651,
-              968,
-              29114,
-              27591,
-              45649,
-              968,
-              29114,
-              27593,
-              45655,
-              967,
-              29110,
-              27593,
-              45654,
-              969,
-              29109,
-              27595,
-              45647,
-              968,
-              29111,
-              27592,
-              45653,
-              969,
-              29111,
-              27593,
-              45655,
-              968,
-              29112,
-              27593,
-              45656,
-              967,
-              29108,
-              27591,
-              45654,
-              969,
-              29110,
-              27591,
-              45647,
-              968,
-              29111,
-              27591,
-              45655,
-              969,
-              29113,
-              27590,
-              45646,
-              967,
-              29116,
-              27591,
-              45652,
-              970,
-              29115,
-              27594,
-              45650,
-              971,
-              29113,
-              27591,
-              45645,
-              967,
-              29111,
-              27591,
-              45652,
-              968,
-              29110,
-              27593,
-              45653,
-              967,
-              29111,
-              27594,
-              45651,
-              968,
-              29115,
-              27593,
-              45649,
-              969,
-              29114,
-              27593,
-              45649,
-              968,
-              29109,
-              27593,
-              45652,
-              968,
-              29113,
-              27590,
-              45651,
-              969,
-              29115,
-              27591,
-              45649,
-              968
-            ]
-          },
-          {
-            "time": 1600040184759,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29100,
-              27596,
-              45649,
-              970,
-              29110,
-              27594,
-              45650,
-              969,
-              29109,
-              27591,
-              45647,
-              970,
-              29113,
-              27592,
-              45653,
-              970,
-              29111,
-              27593,
-              45649,
-              968,
-              29110,
-              27597,
-              45647,
-              968,
-              29103,
-              27591,
-              45653,
-              970,
-              29111,
-              27591,
-              45652,
-              968,
-              29107,
-              27591,
-              45652,
-              969,
-              29111,
-              27593,
-              45654,
-              969,
-              29107,
-              27591,
-              45653,
-              969,
-              29110,
-              27593,
-              45653,
-              969,
-              29110,
-              27593,
-              45649,
-              969,
-              29110,
-              27592,
-              45647,
-              967,
-              29112,
-              27592,
-              45651,
-              969,
-              29109,
-              27591,
-              45651,
-              969,
-              29109,
-              27594,
-              45649,
-              969,
-              29111,
-              27593,
-              45648,
-              968,
-              29111,
-              27593,
-              45651,
-              968,
-              29107,
-              27593,
-              45651,
-              969,
-              29107,
-              27593,
-              45649,
-              970,
-              29103,
-              27595,
-              45651,
-              968,
-              29107,
-              27595,
-              45651,
-              968,
-              29101,
-              27590,
-              45647,
-              967,
-              29103,
-              27594,
-              45651,
-              967,
-              29102,
-              27591,
-              45647,
-              968,
-              29107,
-              27593,
-              45648,
-              970,
-              29109,
-              27591,
-              45649,
-              969,
-              29110,
-              27590,
-              45649,
-              969,
-              29110,
-              27593,
-              45647,
-              969,
-              29198,
-              28086,
-              45731,
-              981,
-              29189,
-              28073,
-              45725,
-              976,
-              29189,
-              28066,
-              45719,
-              973,
-              29189,
-              28063,
-              45721,
-              974,
-              29186,
-              28058,
-              45720,
-              973,
-              29188,
-              28055,
-              45721,
-              973,
-              29187,
-              28055,
-              45722,
-              973,
-              29186,
-              28053,
-              45709,
-              972,
-              29185,
-              28053,
-              45713,
-              973,
-              29186,
-              28055,
-              45713,
-              972,
-              29183,
-              28054,
-              45719,
-              971,
-              29181,
-              28048,
-              45713,
-              975,
-              29190,
-              28049,
-              45715,
-              971,
-              29183,
-              28052,
-              45715,
-              973,
-              29187,
-              28047,
-              45715,
-              971,
-              29183,
-              28051,
-              45716,
-              971,
-              29183,
-              28046,
-              45714,
-              972,
-              29183,
-              28047,
-              45711,
-              970,
-              29186,
-              28047,
-              45711,
-              970,
-              29187,
-              28047,
-              45715,
-              971,
-              29183,
-              28049,
-              45711,
-              973,
-              29186,
-              28050,
-              45715,
-              973,
-              29191,
-              28050,
-              45714,
-              971,
-              29187,
-              28049,
-              45711,
-              973,
-              29186,
-              28047,
-              45718,
-              972,
-              29188,
-              28049,
-              45708,
-              974,
-              29189,
-              28052,
-              45713,
-              971,
-              29187,
-              28048,
-              45709,
-              969,
-              29189,
-              28049,
-              45712,
-              972,
-              29188,
-              28047,
-              45712,
-              970,
-              29103,
-              27557,
-              45643,
-              963,
-              29109,
-              27573,
-              45643,
-              967,
-              29114,
-              27575,
-              45643,
-              968,
-              29111,
-              27577,
-              45645,
-              968,
-              29114,
-              27582,
-              45643,
-              968,
-              29114,
-              27585,
-              45649,
-              968,
-              29110,
-              27585,
-              45645,
-              969,
-              29114,
-              27590,
-              45645,
-              967,
-              29114,
-              27589,
-              45649,
-              967,
-              29113,
-              27589,
-              45647,
-              967,
-              29109,
-              27591,
-              45647,
-              968,
-              29112,
-              27591,
-              45648,
-              969,
-              29111,
-              27589,
-              45647,
-              969,
-              29115,
-              27587,
-              45647,
-              968,
-              29116,
-              27591,
-              45647,
-              969,
-              29111,
-              27591,
-              45647,
-              966,
-              29115,
-              27591,
-              45649,
-              969,
-              29118,
-              27586,
-              45645,
-              967,
-              29115,
-              27589,
-              45645,
-              970,
-              29114,
-              27589,
-              45647,
-              969,
-              29119,
-              27587,
-              45645,
-              969,
-              29118,
-              27588,
-              45647,
-              969,
-              29118,
-              27588,
-              45647,
-              967,
-              29113,
-              27593,
-              45643,
-              968,
-              29115,
-              27593,
-              45643,
-              970,
-              29116,
-              27589,
-              45639,
-              968,
-              29115,
-              27592,
-              45646,
-              969,
-              29121,
-              27595,
-              45647,
-              968,
-              29113,
-              27589,
-              45646,
-              967,
-              29114,
-              27588,
-              45649,
-              970
-            ]
-          },
-          {
-            "time": 1600040185888,
-            "bleed_correction": 0,
-            "label": "bc0",
-            "data_raw": [
-              29101,
-              27591,
-              45645,
-              970,
-              29115,
-              27591,
-              45646,
-              968,
-              29110,
-              27590,
-              45638,
-              969,
-              29115,
-              27590,
-              45643,
-              969,
-              29114,
-              27591,
-              45639,
-              968,
-              29111,
-              27588,
-              45647,
-              968,
-              29111,
-              27589,
-              45641,
-              969,
-              29113,
-              27591,
-              45644,
-              969,
-              29111,
-              27589,
-              45647,
-              968,
-              29106,
-              27589,
-              45646,
-              971,
-              29112,
-              27591,
-              45641,
-              969,
-              29111,
-              27590,
-              45641,
-              970,
-              29112,
-              27591,
-              45643,
-              969,
-              29111,
-              27590,
-              45643,
-              969,
-              29107,
-              27589,
-              45645,
-              971,
-              29112,
-              27588,
-              45642,
-              970,
-              29115,
-              27591,
-              45645,
-              969,
-              29113,
-              27590,
-              45646,
-              969,
-              29115,
-              27591,
-              45645,
-              969,
-              29110,
-              27589,
-              45641,
-              969,
-              29110,
-              27591,
-              45643,
-              968,
-              29108,
-              27592,
-              45646,
-              969,
-              29111,
-              27591,
-              45643,
-              968,
-              29111,
-              27589,
-              45647,
-              967,
-              29111,
-              27591,
-              45644,
-              969,
-              29111,
-              27584,
-              45643,
-              969,
-              29113,
-              27589,
-              45641,
-              969,
-              29106,
-              27590,
-              45643,
-              969,
-              29106,
-              27589,
-              45643,
-              969,
-              29110,
-              27590,
-              45643,
-              968,
-              29217,
-              28242,
-              45747,
-              983,
-              29199,
-              28222,
-              45741,
-              978,
-              29202,
-              28218,
-              45737,
-              976,
-              29202,
-              28213,
-              45729,
-              973,
-              29204,
-              28209,
-              45725,
-              972,
-              29201,
-              28205,
-              45730,
-              975,
-              29199,
-              28199,
-              45729,
-              977,
-              29199,
-              28198,
-              45721,
-              975,
-              29201,
-              28195,
-              45731,
-              975,
-              29203,
-              28199,
-              45729,
-              973,
-              29203,
-              28196,
-              45725,
-              976,
-              29202,
-              28197,
-              45723,
-              977,
-              29203,
-              28194,
-              45727,
-              971,
-              29203,
-              28197,
-              45725,
-              973,
-              29203,
-              28196,
-              45723,
-              974,
-              29207,
-              28196,
-              45722,
-              973,
-              29204,
-              28194,
-              45724,
-              971,
-              29201,
-              28194,
-              45725,
-              971,
-              29203,
-              28195,
-              45726,
-              973,
-              29203,
-              28195,
-              45718,
-              972,
-              29204,
-              28197,
-              45725,
-              974,
-              29206,
-              28192,
-              45727,
-              975,
-              29205,
-              28193,
-              45725,
-              973,
-              29205,
-              28195,
-              45729,
-              971,
-              29207,
-              28195,
-              45727,
-              973,
-              29205,
-              28191,
-              45725,
-              975,
-              29207,
-              28191,
-              45728,
-              972,
-              29207,
-              28193,
-              45721,
-              975,
-              29206,
-              28191,
-              45725,
-              975,
-              29197,
-              28189,
-              45724,
-              974,
-              29099,
-              27539,
-              45629,
-              963,
-              29114,
-              27553,
-              45635,
-              967,
-              29112,
-              27564,
-              45638,
-              967,
-              29111,
-              27569,
-              45642,
-              969,
-              29107,
-              27575,
-              45639,
-              968,
-              29117,
-              27577,
-              45641,
-              968,
-              29118,
-              27579,
-              45639,
-              969,
-              29119,
-              27581,
-              45639,
-              969,
-              29118,
-              27583,
-              45639,
-              969,
-              29120,
-              27583,
-              45639,
-              968,
-              29117,
-              27581,
-              45639,
-              970,
-              29118,
-              27583,
-              45639,
-              969,
-              29115,
-              27583,
-              45639,
-              969,
-              29119,
-              27583,
-              45639,
-              970,
-              29118,
-              27583,
-              45639,
-              970,
-              29125,
-              27586,
-              45642,
-              969,
-              29122,
-              27583,
-              45643,
-              968,
-              29118,
-              27585,
-              45637,
-              969,
-              29119,
-              27585,
-              45641,
-              968,
-              29123,
-              27583,
-              45635,
-              969,
-              29117,
-              27585,
-              45642,
-              970,
-              29117,
-              27583,
-              45636,
-              970,
-              29115,
-              27584,
-              45631,
-              969,
-              29121,
-              27583,
-              45641,
-              969,
-              29116,
-              27583,
-              45643,
-              969,
-              29121,
-              27583,
-              45635,
-              969,
-              29122,
-              27586,
-              45637,
-              968,
-              29119,
-              27584,
-              45643,
-              970,
-              29113,
-              27583,
-              45634,
-              970,
-              29116,
-              27586,
-              45643,
-              970
-            ]
-          }
-        ],
-        "data_raw": [
+  return output
 
-        ]
-      }
-    ]
-  ],
-  "app_os": "macOS 17.7.0",
-  "app_name": "PhotosynQ",
-  "app_version": "1.8.4",
-  "app_device": "x64",
-  "location": False,
-  "time_offset": "America/Detroit"
-}
+## Example data is stored in the package data and only loaded when accessed
+__getattr__ = lazy_example(__name__)
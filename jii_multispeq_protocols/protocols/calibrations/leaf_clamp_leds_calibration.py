@@ -15,7 +15,9 @@ testing CaliQ step 4 Calibrate LOWER PAR LEDs
 
 import numpy as np
 from scipy import stats
-from jii_multispeq.analysis import GetProtocolByLabel
+from jii_multispeq_protocols.examples import lazy_example
+from jii_multispeq_protocols.labels import label_index
+from jii_multispeq_protocols.device import DeviceCommandBuilder
 
 _protocol = [
   {
@@ -73,7 +75,6 @@ def _analyze( _data ):
 
   all_labels = []
   _set = _data["set"]
-  output["toDevice"] = ""
   
   for i in range(len(_set)):
     if "label" in _set[i]:
@@ -87,12 +88,14 @@ def _analyze( _data ):
 
   output["max_allowed_par"] = repr(max_allowed_par)
           
-  output["toDevice"] = ""
+  toDevice = DeviceCommandBuilder()
+
+  labels = label_index(_data)
 
   for led_index, _ in enumerate(unique_LEDs):
     led_label = unique_LEDs[led_index]
     set_number = 0
-    led2 = GetProtocolByLabel(led_label, _data, True)
+    led2 = labels.get(led_label, True)
     LED = led2[0]["led_to_qpar0"][0]
 
     all_settings = []
@@ -183,387 +186,15 @@ def _analyze( _data ):
           set_point_values.append(np.round(calibrated_setpoint,0))
           break
             
-    output["toDevice"] += "par_to_dac_lin+%s+" % LED
-    for cal_index in range(len(set_point_values)):
-      output["toDevice"] += "%s+" % set_point_values[cal_index]
-    
-    output["toDevice"] += "par_max_setting+%s+%s+" % (LED, max_calibrated_setpoint)
+    toDevice.add("par_to_dac_lin", LED, *set_point_values)
+    toDevice.add("par_max_setting", LED, max_calibrated_setpoint)
         
   ## end of led loop
 
+  output["toDevice"] = toDevice.serialize()
+
   ## Return data
   return output
 
-_example = {
-  "time": 1598118193361,
-  "device_name": "MultispeQ",
-  "device_version": "2",
-  "device_id": "41:00:08:6b",
-  "device_battery": 101,
-  "device_firmware": 2.3432,
-  "sample": [
-    [
-      {
-        "time": 1598118193361,
-        "v_arrays": [
-          [
-            6000
-          ],
-          [
-            25,
-            600,
-            3000
-          ],
-          [
-            600,
-            3000,
-            6000
-          ]
-        ],
-        "set_repeats": 1,
-        "protocol_id": 1,
-        "set": [
-          {
-            "time": 1598118193376,
-            "led_to_qpar0": [
-              7,
-              25,
-              0,
-              50
-            ],
-            "led_to_qpar1": [
-              7,
-              600,
-              964.81,
-              472
-            ],
-            "qpar_led_cal": [
-              [
-                50,
-                0
-              ],
-              [
-                71,
-                2
-              ],
-              [
-                92,
-                48
-              ],
-              [
-                113,
-                80
-              ],
-              [
-                134,
-                111
-              ],
-              [
-                155,
-                150
-              ],
-              [
-                176,
-                220
-              ],
-              [
-                197,
-                253
-              ],
-              [
-                218,
-                291
-              ],
-              [
-                239,
-                370
-              ],
-              [
-                260,
-                403
-              ],
-              [
-                281,
-                445
-              ],
-              [
-                302,
-                521
-              ],
-              [
-                323,
-                553
-              ],
-              [
-                344,
-                597
-              ],
-              [
-                365,
-                676
-              ],
-              [
-                386,
-                711
-              ],
-              [
-                407,
-                796
-              ],
-              [
-                428,
-                832
-              ],
-              [
-                449,
-                868
-              ],
-              [
-                470,
-                955
-              ],
-              [
-                491,
-                993
-              ]
-            ],
-            "label": "cal_led_7",
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1598118224113,
-            "led_to_qpar0": [
-              7,
-              600,
-              0,
-              50
-            ],
-            "led_to_qpar1": [
-              7,
-              3000,
-              3970.15,
-              1593
-            ],
-            "qpar_led_cal": [
-              [
-                50,
-                0
-              ],
-              [
-                127,
-                67
-              ],
-              [
-                204,
-                233
-              ],
-              [
-                281,
-                466
-              ],
-              [
-                358,
-                592
-              ],
-              [
-                435,
-                799
-              ],
-              [
-                512,
-                1050
-              ],
-              [
-                589,
-                1177
-              ],
-              [
-                666,
-                1389
-              ],
-              [
-                743,
-                1642
-              ],
-              [
-                820,
-                1774
-              ],
-              [
-                897,
-                1991
-              ],
-              [
-                974,
-                2246
-              ],
-              [
-                1051,
-                2390
-              ],
-              [
-                1128,
-                2605
-              ],
-              [
-                1205,
-                2861
-              ],
-              [
-                1282,
-                3003
-              ],
-              [
-                1359,
-                3222
-              ],
-              [
-                1436,
-                3485
-              ],
-              [
-                1513,
-                3626
-              ],
-              [
-                1590,
-                3864
-              ],
-              [
-                1667,
-                4141
-              ]
-            ],
-            "label": "cal_led_7",
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1598118256069,
-            "led_to_qpar0": [
-              7,
-              3000,
-              3995.94,
-              1593
-            ],
-            "led_to_qpar1": [
-              7,
-              6000,
-              7802.95,
-              2876
-            ],
-            "qpar_led_cal": [
-              [
-                1593,
-                1986
-              ],
-              [
-                1657,
-                4173
-              ],
-              [
-                1721,
-                4376
-              ],
-              [
-                1785,
-                4491
-              ],
-              [
-                1849,
-                4695
-              ],
-              [
-                1913,
-                4889
-              ],
-              [
-                1977,
-                4997
-              ],
-              [
-                2041,
-                5209
-              ],
-              [
-                2105,
-                5421
-              ],
-              [
-                2169,
-                5539
-              ],
-              [
-                2233,
-                5746
-              ],
-              [
-                2297,
-                5965
-              ],
-              [
-                2361,
-                6088
-              ],
-              [
-                2425,
-                6292
-              ],
-              [
-                2489,
-                6496
-              ],
-              [
-                2553,
-                6637
-              ],
-              [
-                2617,
-                6863
-              ],
-              [
-                2681,
-                7046
-              ],
-              [
-                2745,
-                7198
-              ],
-              [
-                2809,
-                7492
-              ],
-              [
-                2873,
-                7769
-              ],
-              [
-                2937,
-                7858
-              ]
-            ],
-            "label": "cal_led_7",
-            "data_raw": [
-
-            ]
-          }
-        ],
-        "data_raw": [
-
-        ]
-      }
-    ]
-  ],
-  "app_os": "macOS 17.7.0",
-  "app_name": "PhotosynQ",
-  "app_version": "1.8.4",
-  "app_device": "x64",
-  "location": [
-    "42.6912313",
-    "-84.4464580"
-  ],
-  "time_offset": "America/Detroit"
-}
\ No newline at end of file
+## Example data is stored in the package data and only loaded when accessed
+__getattr__ = lazy_example(__name__)
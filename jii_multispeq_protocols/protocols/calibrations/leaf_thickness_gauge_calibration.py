@@ -24,8 +24,10 @@ As with any values saved to the MultispeQ, you can see the saved calibration val
 
 import numpy as np
 from scipy import stats
-from jii_multispeq.analysis import GetProtocolByLabel
-import warnings
+from jii_multispeq_protocols.examples import lazy_example
+from jii_multispeq_protocols.qc import flag
+from jii_multispeq_protocols.labels import label_index
+from jii_multispeq_protocols.device import DeviceCommandBuilder
 
 _protocol = [
   {
@@ -121,8 +123,10 @@ def _analyze( _data ):
   calibrationStandards = [50,125,190,650,1000,2500,11300]
   calibrationStandards = [0, 80,170,220,650,930,2400,11300]
 
+  labels = label_index(_data)
+
   ## distances measured and replicates for each distance measured for this protocol
-  thickCal = GetProtocolByLabel("thick", _data, True)
+  thickCal = labels.get("thick", True)
   distancesMeasured = len(thickCal)
 
   measuredHallVals = []
@@ -142,7 +146,7 @@ def _analyze( _data ):
   thickness_b = np.round(coefficients[1],7)
   thickness_c = np.round(coefficients[0],4)
 
-  output["toDevice"] = "set_thickness+%s+%s+%s+%s+%s+" % ( (thickness_a*1000000000), thickness_b, thickness_c, measuredHallVals[0], measuredHallVals[distancesMeasured-1] )
+  toDevice = DeviceCommandBuilder().add("set_thickness", (thickness_a*1000000000), thickness_b, thickness_c, measuredHallVals[0], measuredHallVals[distancesMeasured-1])
 
   predictedThicknessVals = []
   residuals = []
@@ -164,150 +168,15 @@ def _analyze( _data ):
 
   if output["r2"] < .95:
     msg = "r² value  for linear regression low (r² = %s, expected: >0.95), or linear regression failed. If the issue presists, your thickness calibration cards might need to be cleaned. Also make sure the leaf clamp opens and closes smoothly." % np.round(output["r2"],2) if output["r2"] else "failed"
-    warnings.warn(msg)
+    flag("low_r2", msg, output["r2"])
   else:
     print("Leaf thickness calibration was successful")
-    output["toDevice"] += "setCalTime+4+hello+"
-
-
-  return output
-
-_example = {
-  "time": 1590074016885,
-  "device_name": "MultispeQ",
-  "device_version": "2",
-  "device_id": "32:21:3c:e5",
-  "device_battery": 106,
-  "device_firmware": 2.191,
-  "sample": [
-    [
-      {
-        "time": 1590074016885,
-        "protocol_id": 1,
-        "set": [
-          {
-            "time": 1590074022915,
-            "data_raw_size": "0",
-            "message": [
-              "alert",
-              "thickness fully closed",
-              "ok"
-            ],
-            "label": "thick",
-            "thickness_raw": 53199,
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1590074025535,
-            "data_raw_size": "0",
-            "message": [
-              "prompt",
-              "thickness Card 2 (red) or enter alternate value",
-              ""
-            ],
-            "label": "thick",
-            "thickness_raw": 52839,
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1590074032377,
-            "data_raw_size": "0",
-            "message": [
-              "prompt",
-              "thickness Card 3 (blue) or enter alternate value",
-              ""
-            ],
-            "label": "thick",
-            "thickness_raw": 52376,
-            "data_raw": [
+    toDevice.add("setCalTime", 4).add("hello")
 
-            ]
-          },
-          {
-            "time": 1590074036911,
-            "data_raw_size": "0",
-            "message": [
-              "prompt",
-              "thickness Card 4 (translucent) or enter alternate value",
-              ""
-            ],
-            "label": "thick",
-            "thickness_raw": 51730,
-            "data_raw": [
+  output["toDevice"] = toDevice.serialize()
 
-            ]
-          },
-          {
-            "time": 1590074041184,
-            "data_raw_size": "0",
-            "message": [
-              "prompt",
-              "thickness Card 5 (White) or enter alternate value",
-              ""
-            ],
-            "label": "thick",
-            "thickness_raw": 48480,
-            "data_raw": [
 
-            ]
-          },
-          {
-            "time": 1590074046184,
-            "data_raw_size": "0",
-            "message": [
-              "prompt",
-              "thickness Card 6 (Clear) or enter alternate value",
-              ""
-            ],
-            "label": "thick",
-            "thickness_raw": 47055,
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1590074051137,
-            "data_raw_size": "0",
-            "message": [
-              "prompt",
-              "thickness Card 7 (Black) or enter alternate value",
-              ""
-            ],
-            "label": "thick",
-            "thickness_raw": 42525,
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1590074055107,
-            "data_raw_size": "0",
-            "message": [
-              "alert",
-              "clamp fully open",
-              "ok"
-            ],
-            "label": "thick",
-            "thickness_raw": 38517,
-            "data_raw": [
-
-            ]
-          }
-        ],
-        "data_raw": [
+  return output
 
-        ]
-      }
-    ]
-  ],
-  "app_os": "macOS 17.7.0",
-  "app_name": "PhotosynQ",
-  "app_version": "1.8.4",
-  "app_device": "x64",
-  "location": False,
-  "time_offset": "America/Detroit"
-}
\ No newline at end of file
+## Example data is stored in the package data and only loaded when accessed
+__getattr__ = lazy_example(__name__)
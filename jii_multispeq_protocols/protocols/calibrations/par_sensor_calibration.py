@@ -14,8 +14,10 @@ ID: 2225
 """
 
 import numpy as np
-from jii_multispeq.analysis import GetProtocolByLabel
-import warnings
+from jii_multispeq_protocols.examples import lazy_example
+from jii_multispeq_protocols.qc import flag, ERROR
+from jii_multispeq_protocols.labels import label_index
+from jii_multispeq_protocols.device import DeviceCommandBuilder
 
 _protocol = [
   {
@@ -113,10 +115,12 @@ def _analyze( _data ):
 
   if ("error" in _data["set"][0]) and _data["set"][0]["error"] == "battery low":
     output["error"] = "Battery level too low for calibration! Please recharge until at least 50%!"
-    warnings.warn( output["error"] )
+    flag("battery_low", output["error"], severity=ERROR)
     return output
 
-  q = GetProtocolByLabel("qlight_to_qpar", _data, True)
+  labels = label_index(_data)
+
+  q = labels.get("qlight_to_qpar", True)
 
   qparV = []
 
@@ -128,7 +132,7 @@ def _analyze( _data ):
   qpar = np.mean(qparV)
   output["qpar"] = qpar
 
-  l = GetProtocolByLabel("light", _data)
+  l = labels.get("light")
 
   lightV = []
   output["lightV"] = lightV
@@ -140,7 +144,7 @@ def _analyze( _data ):
 
   output["measuredPAR_Light"] = light
 
-  d = GetProtocolByLabel("dark", _data)
+  d = labels.get("dark")
   dark = d[2]["light_intensity"]
 
   output["measuredPAR_dark"] = np.round( d[2]["light_intensity"], 3 ) 
@@ -153,50 +157,21 @@ def _analyze( _data ):
   output["tweak"] = tweak
 
   if dark > 1:
-    warnings.warn("The calibration value for the PAR sensor in the dark is too high (\"%s\"). Repeat the calibration."  % dark)
+    flag("par_dark_high", "The calibration value for the PAR sensor in the dark is too high (\"%s\"). Repeat the calibration."  % dark, dark)
 
   if tweak < 0.4 and tweak > 2.1:
-    warnings.warn("The PAR tweak value for the PAR sensor is out of range (\"%s\"). Repeat the calibration." % tweak)
-
-  output["toDevice"] = "s+set_par_dark+"
-  output["toDevice"] += "%s+" % (-1 * dark)
+    flag("par_tweak_range", "The PAR tweak value for the PAR sensor is out of range (\"%s\"). Repeat the calibration." % tweak, tweak)
 
-  output["toDevice"] += "par_tweak+"
-  output["toDevice"] += "%s+" % tweak
+  toDevice = DeviceCommandBuilder()
+  toDevice.add("s")
+  toDevice.add("set_par_dark", (-1 * dark))
+  toDevice.add("par_tweak", tweak)
+  toDevice.add("setCalTime", 0).add("setCalOK", 0, 0)
 
-  output["toDevice"] += "setCalTime+0+setCalOK+0+0+"
+  output["toDevice"] = toDevice.serialize()
 
 
   return output
 
-_example = {
-  "time": 1564325628718,
-  "device_name": "MultispeQ",
-  "device_version": "2",
-  "device_id": "ff:ff:ff:ff",
-  "device_battery": 8,
-  "device_firmware": 2.21,
-  "sample": [
-    [
-      {
-        "time": 1564325628723,
-        "protocol_id": 1,
-        "set": [
-          {
-            "time": 1564325628739,
-            "error": "battery low"
-          }
-        ],
-        "data_raw": [
-
-        ]
-      }
-    ]
-  ],
-  "app_os": "macOS 18.0.0",
-  "app_name": "PhotosynQ",
-  "app_version": "1.5.2",
-  "app_device": "x64",
-  "location": False,
-  "time_offset": "America/Detroit"
-}
\ No newline at end of file
+## Example data is stored in the package data and only loaded when accessed
+__getattr__ = lazy_example(__name__)
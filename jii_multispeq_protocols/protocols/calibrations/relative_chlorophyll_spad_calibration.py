@@ -10,9 +10,10 @@ ID: 1890
 """
 
 import numpy as np
-from scipy import stats
-from jii_multispeq.analysis import GetProtocolByLabel
-import warnings
+from jii_multispeq_protocols.examples import lazy_example
+from jii_multispeq_protocols.qc import flag
+from jii_multispeq_protocols.labels import label_index
+from jii_multispeq_protocols.device import DeviceCommandBuilder
 
 _protocol = [
   {
@@ -183,6 +184,38 @@ _protocol = [
   }
 ]
 
+def _linregress_rows( x, y ):
+  """
+  Linear regression of y against each row of x (same as ``stats.linregress``)
+
+  :param x: Independent values, one regression per row
+  :type x: array of shape (n_rows, n_points)
+  :param y: Dependent values
+  :type y: array of shape (n_points,)
+
+  :return: Slope, intercept and r² for each row
+  :rtype: tuple of arrays
+  """
+  x = np.asarray(x, dtype=float)
+  y = np.asarray(y, dtype=float)
+
+  x_mean = x.mean(axis=1)
+  y_mean = y.mean()
+  x_c = x - x_mean[:, None]
+  y_c = y - y_mean
+
+  ssxm = np.mean(x_c * x_c, axis=1)
+  ssym = np.mean(y_c * y_c)
+  ssxym = np.mean(x_c * y_c, axis=1)
+
+  with np.errstate(divide='ignore', invalid='ignore'):
+    r = np.clip(ssxym / np.sqrt(ssxm * ssym), -1, 1)
+    slope = ssxym / ssxm
+
+  intercept = y_mean - slope * x_mean
+
+  return slope, intercept, r**2
+
 def _analyze( _data ):
 
   """
@@ -216,8 +249,10 @@ def _analyze( _data ):
     ## Add key time and value to output
     output["time"] = _data["time"]
 
-  t = GetProtocolByLabel( "spad", _data, True )
-  ab = GetProtocolByLabel( "gain", _data, True )
+  labels = label_index(_data)
+
+  t = labels.get( "spad", True )
+  ab = labels.get( "gain", True )
 
 
   for i in range(len(t)):
@@ -239,31 +274,29 @@ def _analyze( _data ):
     v950.append(t[i]["absorbance"][1][0])  ## v is the value of the measurements
     r950.append(t[i]["absorbance"][1][1])  ## r is the reference
 
-  r2 = []
   maxR2 = 0
   bestOffset = -2000
   spadSlope = 0
   spadYInt = 0
 
-  for offset in np.arange(-200, 200, 10):
-    da = []
-    
-    for i in range(len(t)): ## cycle through the set of measurements
-      
-      DA655 = np.round(r655[i] - offset) - np.round(v655[i] - offset)
-      DA950 = np.round(r950[i]) - np.round(v950[i])
-      da.append(DA655 - DA950)
-    
-    slope, intercept, r_value, p_value, std_err = stats.linregress(da, s)
+  ## Calculate the ΔA for all offsets at once (one row per offset)
+  offsets = np.arange(-200, 200, 1)
+
+  DA655 = np.round(np.array(r655) - offsets[:, None]) - np.round(np.array(v655) - offsets[:, None])
+  DA950 = np.round(np.array(r950)) - np.round(np.array(v950))
+  da = DA655 - DA950
+
+  slope, intercept, r2 = _linregress_rows(da, s)
 
-    r2_value = r_value**2
+  ## The first offset with the highest r² is used
+  r2 = np.where(np.isfinite(r2), r2, -np.inf)
+  best = np.argmax(r2)
 
-    r2.append(r2_value)
-    if r2_value > maxR2:
-      maxR2 = r2_value
-      bestOffset = offset
-      spadSlope = slope
-      spadYInt = intercept
+  if r2[best] > maxR2:
+    maxR2 = r2[best]
+    bestOffset = offsets[best]
+    spadSlope = slope[best]
+    spadYInt = intercept[best]
 
 
   output["bestOffset"] = bestOffset
@@ -281,424 +314,19 @@ def _analyze( _data ):
 
   output["spad"] = repr(spad)
 
-  output["toDevice"] = ""
-
-  output["toDevice"] += "set_spad_offset+%s+" % np.round(bestOffset, 4)
-  output["toDevice"] += "set_spad_scale+%s+" % np.round(spadSlope, 4)
-  output["toDevice"] += "set_spad_yint+%s+" % np.round(spadYInt, 4)
+  toDevice = DeviceCommandBuilder()
+  toDevice.add("set_spad_offset", np.round(bestOffset, 4))
+  toDevice.add("set_spad_scale", np.round(spadSlope, 4))
+  toDevice.add("set_spad_yint", np.round(spadYInt, 4))
+  output["toDevice"] = toDevice.serialize()
 
   if maxR2 < .97:
     output["test"] = "R2 value low. Calibration card may be out of date"
-    warnings.warn( output["test"] )
+    flag("low_r2", output["test"], maxR2)
   else:
     output["test"] = "OK"
 
   return output
 
-_example = {
-  "time": 1553786924729,
-  "device_name": "MultispeQ",
-  "device_version": "2",
-  "device_id": "41:00:08:6b",
-  "device_battery": 100,
-  "device_firmware": 2.011,
-  "sample": [
-    [
-      {
-        "time": 1553786924729,
-        "protocol_id": 1,
-        "set": [
-          {
-            "time": 1553786924739,
-            "message": [
-              "prompt",
-              "Insert panel 9",
-              ""
-            ],
-            "label": "gain",
-            "auto_blank": [
-              [
-                2,
-                2,
-                3,
-                100,
-                -461,
-                9286
-              ],
-              [
-                6,
-                6,
-                1,
-                100,
-                -303,
-                9338
-              ],
-              [
-                3,
-                3,
-                3,
-                100,
-                -324,
-                9447
-              ]
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786933707,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                27992,
-                9286,
-                -90,
-                -0.47641,
-                2,
-                3,
-                655
-              ],
-              [
-                27837,
-                9338,
-                20,
-                -0.474988,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              7.863,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786941484,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                14921,
-                9286,
-                -90,
-                -0.204392,
-                2,
-                3,
-                655
-              ],
-              [
-                25923,
-                9338,
-                20,
-                -0.444027,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              16.653,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786946755,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                2081,
-                9286,
-                -90,
-                0.635358,
-                2,
-                3,
-                655
-              ],
-              [
-                11169,
-                9338,
-                20,
-                -0.077913,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              33.925,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786949693,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                3541,
-                9286,
-                -90,
-                0.411991,
-                2,
-                3,
-                655
-              ],
-              [
-                11675,
-                9338,
-                20,
-                -0.09719,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              26.483,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786954833,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                722,
-                9286,
-                -90,
-                1.062462,
-                2,
-                3,
-                655
-              ],
-              [
-                6145,
-                9338,
-                20,
-                0.182217,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              40.014,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786958252,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                467,
-                9286,
-                -90,
-                1.226162,
-                2,
-                3,
-                655
-              ],
-              [
-                5311,
-                9338,
-                20,
-                0.245785,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              43.666,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786961600,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                3130,
-                9286,
-                -90,
-                0.464162,
-                2,
-                3,
-                655
-              ],
-              [
-                8767,
-                9338,
-                20,
-                0.027464,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              23.84,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786969037,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                416,
-                9286,
-                -90,
-                1.267867,
-                2,
-                3,
-                655
-              ],
-              [
-                3779,
-                9338,
-                20,
-                0.39425,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              39.773,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1553786972223,
-            "message": [
-              "prompt",
-              "Insert spad sample",
-              ""
-            ],
-            "label": "spad",
-            "absorbance": [
-              [
-                283,
-                9286,
-                -90,
-                1.400309,
-                2,
-                3,
-                655
-              ],
-              [
-                5821,
-                9338,
-                20,
-                0.20582,
-                6,
-                1,
-                950
-              ]
-            ],
-            "spad": [
-              51.474,
-              36.467,
-              -90,
-              7.915
-            ],
-            "data_raw": [
-
-            ]
-          }
-        ],
-        "data_raw": [
-
-        ]
-      }
-    ]
-  ],
-  "app_os": "macOS 16.7.0",
-  "app_name": "PhotosynQ",
-  "app_version": "1.2.1",
-  "app_device": "x64",
-  "location": False,
-  "time_offset": "America/Detroit"
-}
\ No newline at end of file
+## Example data is stored in the package data and only loaded when accessed
+__getattr__ = lazy_example(__name__)
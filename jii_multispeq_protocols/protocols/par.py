@@ -11,6 +11,8 @@ the red, green, and blue channel of the sensor.
 
 """
 
+from jii_multispeq_protocols.examples import lazy_example
+
 _protocol = [
   {
     "averages": 1,
@@ -37,25 +39,5 @@ def _analyze ( _data ):
 
   return output
 
-_example = {
-  "device_name": "MultispeQ",
-  "device_version": "2",
-  "device_id": "01:12:53:20",
-  "device_battery": 82,
-  "device_firmware": 2.3465,
-  "sample": [
-    {
-      "ri": [
-        0,
-        415
-      ],
-      "protocol_id": "",
-      "light_intensity": 346.791,
-      "r": 2086.0,
-      "g": 575.4,
-      "b": 465.0,
-      "w": 2863.6,
-      "data_raw": []
-    }
-  ]
-}
+## Example data is stored in the package data and only loaded when accessed
+__getattr__ = lazy_example(__name__)
@@ -10,6 +10,7 @@ the linear electron flow, based on phi2 and the ambient light intensity.
 """
 
 import numpy as np
+from jii_multispeq_protocols.examples import lazy_example
 
 _protocol = [
     {
@@ -64,121 +65,50 @@ def _analyze ( _data ):
   output['Phi2'] = phi2
   output['LEF'] = lef
   output['PAR'] = _data['light_intensity']
-  output['Fluorescence Trace'] = _data['data_raw']
+  output['Fluorescence Trace'] = np.asarray(_data['data_raw']).tolist() # list, also for traces from a TraceStore
 
   # Return data
   return output
 
-_example = {
-  "time": 1501283341143,
-  "device_name": "MultispeQ",
-  "device_version": "1",
-  "device_id": "00:00:00:01",
-  "device_battery": 100,
-  "device_firmware": 1.2,
-  "sample": [
-    [
-      {
-        "time": 1501283341154,
-        "label": "",
-        "light_intensity": 17.95,
-        "r": 15,
-        "g": 7,
-        "b": 4,
-        "light_intensity_raw": 26,
-        "data_raw": [
-          15064,
-          15232,
-          15307,
-          15334,
-          15353,
-          15351,
-          15350,
-          15341,
-          15330,
-          15331,
-          15317,
-          15315,
-          15310,
-          15298,
-          15298,
-          15290,
-          15293,
-          15289,
-          15279,
-          15280,
-          20357,
-          20671,
-          20781,
-          20838,
-          20870,
-          20894,
-          20910,
-          20924,
-          20935,
-          20953,
-          20957,
-          20958,
-          20966,
-          20974,
-          20975,
-          20978,
-          20983,
-          20986,
-          20987,
-          20992,
-          20990,
-          20996,
-          20996,
-          20991,
-          20988,
-          20991,
-          20996,
-          20993,
-          20991,
-          20985,
-          20985,
-          20983,
-          20981,
-          20977,
-          20974,
-          20971,
-          20966,
-          20965,
-          20961,
-          20960,
-          20954,
-          20951,
-          20943,
-          20943,
-          20933,
-          20931,
-          20930,
-          20922,
-          20921,
-          20912,
-          19360,
-          18530,
-          18110,
-          17863,
-          17695,
-          17565,
-          17448,
-          17349,
-          17263,
-          17171,
-          17082,
-          17006,
-          16932,
-          16851,
-          16786,
-          16715,
-          16649,
-          16594,
-          16534,
-          16471
-        ]
-      }
-    ]
-  ]
-}
\ No newline at end of file
+def analyze_many ( data_raw, light_intensity ):
+  """
+  Same analysis as ``_analyze`` for many samples at once. Each output
+  is returned as an array with one value per sample.
+
+  :param data_raw: Fluorescence traces, one row per sample
+  :type data_raw: array of shape (n_samples, n_points)
+  :param light_intensity: Light intensity (PAR) for each sample
+  :type light_intensity: array of shape (n_samples,)
+
+  :return: Outputs of the analysis (columns)
+  :rtype: dict
+
+  :raises ValueError: if the traces are too short or the number of samples doesn't match
+  """
+  data_raw = np.asarray(data_raw)
+  light_intensity = np.asarray(light_intensity)
+
+  if data_raw.ndim != 2 or data_raw.shape[1] < 68:
+    raise ValueError("Traces need to be a 2-D array with at least 68 points per sample")
+
+  if light_intensity.shape != (data_raw.shape[0],):
+    raise ValueError("One light intensity is needed for each sample")
+
+  output = {}
+
+  fs = np.mean(data_raw[:, 1:5], axis=1)
+  fmp = np.mean(data_raw[:, 63:68], axis=1)
+  phi2 = (fmp-fs)/fmp
+  lef = phi2 * light_intensity * 0.45
+
+  output['Fs'] = fs
+  output['Fmp'] = fmp
+  output['Phi2'] = phi2
+  output['LEF'] = lef
+  output['PAR'] = light_intensity
+  output['Fluorescence Trace'] = data_raw
+
+  return output
+
+## Example data is stored in the package data and only loaded when accessed
+__getattr__ = lazy_example(__name__)
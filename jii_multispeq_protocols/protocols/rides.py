@@ -19,11 +19,13 @@ Important
 Supports MultispeQ V1 and V2 with Firmware 2.34 and higher
 """
 
-import warnings
+from itertools import islice
 
 import numpy as np
-from scipy.optimize import curve_fit
 import jii_multispeq.analysis as analysis
+from jii_multispeq_protocols.fitting import fit_exponential, fit_exponential_lm
+from jii_multispeq_protocols.examples import lazy_example
+from jii_multispeq_protocols.qc import flag
 
 _protocol = [{'_protocol_set_': [{'averages': 1,
                       'energy_min_wake_time': 7000,
@@ -230,64 +232,114 @@ _protocol = [{'_protocol_set_': [{'averages': 1,
                       'label': 'SPAD',
                       'spad': [1]}]}]
 
-def _analyze ( _data ):
+def _sum_subtraces ( data_raw, beginning, length, number ):
   """
-  Data evaluation of RIDES
-  
-  by: David M. Kramer
-  created: 2017-05-09 @ 18:15:27
+  Sum up consecutive subtraces of the same length (e.g. DIRK repeats)
   """
+  return np.asarray(data_raw[beginning:beginning + number * length]).reshape(number, length).sum(axis=0)
 
-  # Define the output dictionary here
-  output = {}
-  
-  DIRK_ECS = analysis.basic.GetProtocolByLabel("DIRK_ECS", _data)
-  P700_DIRK = analysis.basic.GetProtocolByLabel("DIRK_P700", _data)
-  PAM = analysis.basic.GetProtocolByLabel("PAM", _data)
-
-  output["leaf angle"] = P700_DIRK['angle']
-
-  if len(_data['set']) == 13:
-    _data['set'].insert(0, {})
-
+def _dirk_traces ( DIRK_ECS, P700_DIRK ):
+  """
+  Averaged and baseline corrected ECS and P700 DIRK traces (delta A)
+  """
   # ECS DIRK trace definitions
   beginning_of_ECS=100 # Note the 100 pulses 
   length_of_ECS_subtrace=220 # The length of each subtrace. 
   number_of_ECS_subtraces=6 # number of ECS subtraces. There are currently 6 of them.
-  length_of_ECS_baseline=100 # there are 100 points in the baseline before the DIRK
-  length_of_ECS_all_subtraces=beginning_of_ECS+(number_of_ECS_subtraces*length_of_ECS_subtrace)
-  ECS_averaged_trace=DIRK_ECS['data_raw'][beginning_of_ECS:320]
   begining_of_subtrace_for_linear_fit=75
   end_of_subtrace_for_linear_fit=145
 
-  P700_begining_of_subtrace_for_linear_fit=55
-  P700_end_of_subtrace_for_linear_fit=170
-  beginning_of_LEFD=1421 # Note the 100 pulses 
-  length_of_LEFd_subtrace=220 # The length of each subtrace. 
-  length_of_LEFd_baseline=100 # there are 100 points in the baseline before the DIRK
-  LEFd_trace=DIRK_ECS['data_raw'][beginning_of_LEFD:(beginning_of_LEFD+length_of_LEFd_subtrace)]
-
   # P700 DIRK trace definitions
   beginning_of_P700_DIRK=100 # Note the 100 pulses 
   length_of_P700_DIRK_subtrace=220 #The length of each subtrace. 
   number_of_P700_DIRK_subtraces=6 # number of ECS subtraces. There are currently 6 of them.
-  length_of_P700_DIRK_baseline=100 # there are 100 points in the baseline before the DIRK
-  length_of_P700_DIRK_all_subtraces=beginning_of_P700_DIRK+(number_of_P700_DIRK_subtraces*length_of_P700_DIRK_subtrace)
   P700_DIRK_averaged_trace=DIRK_ECS['data_raw'][beginning_of_P700_DIRK:320]
 
-  output['test_data_raw_PAM'] = len(PAM['data_raw'])
-  loPAM = len(PAM['data_raw'])
+  #ECS trace analysis:
+
+  # Average the traces
+  ECS_averaged_trace = _sum_subtraces(DIRK_ECS['data_raw'], beginning_of_ECS,
+                                      length_of_ECS_subtrace, number_of_ECS_subtraces)
+
+  # Create time axis
+  fake_time_axis = np.arange(1, length_of_ECS_subtrace + 1)
+
+  # Find best fit line for baseline
+  m,b = np.polyfit(fake_time_axis[begining_of_subtrace_for_linear_fit:end_of_subtrace_for_linear_fit],
+                  ECS_averaged_trace[begining_of_subtrace_for_linear_fit:end_of_subtrace_for_linear_fit], 1)
+
+  # Generate baseline offset
+  baseline_offset = np.round(np.arange(length_of_ECS_subtrace) * np.round(m, 3) + round(b))
+
+  # Calculate deltaI/I0 and convert to approximate delta_A
+  ECS_averaged_trace = -1 * np.log(ECS_averaged_trace / baseline_offset)  # ((rat-1)/-2.3)
+
+  # Eliminate spike artifact
+  ECS_averaged_trace[120] = ECS_averaged_trace[119]
+
+  # Calculaiton of the DIRK delta_P850 
+
+  # Get sum of all subtraces (the first subtrace is taken from the ECS trace)
+  P700_DIRK_averaged_trace = np.asarray(P700_DIRK_averaged_trace) + \
+    _sum_subtraces(P700_DIRK['data_raw'], beginning_of_P700_DIRK + length_of_P700_DIRK_subtrace,
+                   length_of_P700_DIRK_subtrace, number_of_P700_DIRK_subtraces - 1)
+
+  # Create time axis
+  fake_time_axis = np.arange(1, length_of_P700_DIRK_subtrace + 1)
 
-  temp1 = []
-  for i in range(0, loPAM, 2):
-    temp1.append(PAM['data_raw'][i])
+  # Find best fit line for baseline
+  m,b = np.polyfit(fake_time_axis, P700_DIRK_averaged_trace, 1)
+
+  # Generate baseline offset using linear regression
+  baseline_offset = np.arange(length_of_P700_DIRK_subtrace) * np.round(m, 3) + np.round(b)
+
+  # Calculate deltaI/I0 and convert to approximate delta_A
+  P700_DIRK_averaged_trace = -1 * np.log(P700_DIRK_averaged_trace / baseline_offset)  # ((rat-1)/-2.3)
+
+  # Replace artifactual data at position 120 with prior value
+  P700_DIRK_averaged_trace[120] = P700_DIRK_averaged_trace[119]
+
+  return ECS_averaged_trace, P700_DIRK_averaged_trace
+
+def _deinterleave ( data_raw ):
+  """
+  PAM traces alternate between the fluorescence and P700 points, the
+  fluorescence points (even) are followed by the P700 points (odd)
+  """
+  return np.concatenate((data_raw[..., 0::2], data_raw[..., 1::2]), axis=-1)
+
+def _sorted_mean ( values, start, stop ):
+  """
+  Mean of the sorted values from start to stop (last axis), using a partial
+  sort, as only the values within the range need to be found
+  """
+  stop = min(stop, values.shape[-1])
+  return np.mean(np.partition(values, (start, stop - 1), axis=-1)[..., start:stop], axis=-1)
+
+def analyze_pam ( data_raw ):
+  """
+  Fluorescence parameters of the PAM trace (Fs, FoPrime, multi-phase flash
+  FmPrime, Phi2, NPQt, PhiNO, PhiNPQ, qL, ...) for many samples at once.
+  The values are the same as calculated by ``_analyze``, but not rounded.
+  The multi-phase flash (MPF) values are used, unless the Fm' steps are
+  flat or increasing (``MPF`` is False).
 
-  for i in range(1, loPAM+1, 2):
-    temp1.append(PAM['data_raw'][i])
+  :param data_raw: PAM traces as measured (interleaved), one row per sample
+  :type data_raw: array of shape (n_samples, n_points)
 
-  PAM['data_raw']=temp1; # replace the old values wiht temp1
+  :return: Parameters (columns) with one value per sample
+  :rtype: dict
 
-  Fs_begin=1 #the first point to use for Fs 
+  :raises ValueError: if the traces are too short
+  """
+  data_raw = np.asarray(data_raw)
+
+  if data_raw.ndim != 2 or data_raw.shape[1] < 220:
+    raise ValueError("PAM traces need to be a 2-D array with at least 220 points per sample")
+
+  data = _deinterleave(data_raw)
+
+  Fs_begin=1 #the first point to use for Fs
   Fs_end =4 #the end point to use  for Fs
 
   #The first FM value (Fm_1) is obtained with the highest intensity
@@ -299,21 +351,98 @@ def _analyze ( _data ):
   Fm_3_end =160 #the end point to use  for the FIRST Fmp
   Fm_4_begin =161 #the first point to use for the FIRST Fmp
   Fm_4_end =175 #the end point to use  for the FIRST Fmp
-  Fm_5_begin =176 #the first point to use for the FIRST Fmp
-  Fm_5_end =190 #the end point to use  for the FIRST Fmp
 
   #START AND STOP FOR F0'
-  FoPrime_begin =206 #the first point to use for Fo 
+  FoPrime_begin =206 #the first point to use for Fo
   FoPrime_end =220 #the end point to use  for Fo
 
   #SET THE INVERSE INTENSITIES FOR THE AVENSON INTENSITY RAMP
-  inverse_intensity = [1/8000,1/7000,1/6000,1/5000]
+  inverse_intensity = np.array([1/8000,1/7000,1/6000,1/5000])
 
-  output['pump']="none"
+  output = {}
 
-  #PSI saturation pulse parameters:
-  #Calculation of the DIRK delta_A_ECS 
+  # GET THE VALUES FOR Fs
+  Fs = np.mean(data[:, Fs_begin:Fs_end], axis=1)
+  Fs_std = np.std(data[:, Fs_begin:Fs_end], axis=1) # standard deviation for error checking
+
+  # GET THE VALUES FOR THE Fm' ILLUMINATION CONDITIONS (sorted values 2 to 19, and 2 to 5 for the steps)
+  AFmP = _sorted_mean(data[:, Fm_1_begin:Fm_1_end], 2, 20)
+  FmP_steps = np.stack([
+    AFmP,
+    _sorted_mean(data[:, Fm_2_begin:Fm_2_end], 2, 6),
+    _sorted_mean(data[:, Fm_3_begin:Fm_3_end], 2, 6),
+    _sorted_mean(data[:, Fm_4_begin:Fm_4_end], 2, 6)
+  ], axis=1)
+
+  # Calculations for F0' (sorted, so the standard deviation is summed up in the same order as before)
+  FoPrime_values = np.sort(data[:, FoPrime_begin:FoPrime_end], axis=1)
+  FoPrime = FoPrime_values[:, 0]
+  FoPrime_std = np.std(FoPrime_values, axis=1)
+
+  # Corrected FmPrime using multi-phase flash, as a linear regression of the 4 steps
+  # against the inverse intensities (closed form, the intensities are the same for all samples)
+  x = inverse_intensity - np.mean(inverse_intensity)
+  m = (FmP_steps - np.mean(FmP_steps, axis=1, keepdims=True)) @ x / np.sum(x * x)
+  b = np.mean(FmP_steps, axis=1) - m * np.mean(inverse_intensity)
+
+  # Calculate Phi2, NPQt, PhiNPQ, PhiNO, qL w/ and w/out multi-phase flash
+  def parameters ( FmPrime ):
+    fvfm = (FmPrime-Fs)/FmPrime
+    npqt = (4.88 / ((FmPrime / FoPrime) -1) )-1
+    qL = ((FmPrime - Fs)*FoPrime)/((FmPrime-FoPrime)*Fs)
+    PhiNO = 1/(npqt + 1 + qL*4.88) # based on equation 52 in Kramer et al., 2004 PRES
+    PhiNPQ = 1-fvfm-PhiNO # based on equation 53 in Kramer et al., 2004 PRES
+    qP = (FmPrime - Fs)/(FmPrime - FoPrime)
+    FvP_FmP = (FmPrime-FoPrime)/FmPrime
+    return [fvfm, npqt, PhiNO, PhiNPQ, qL, FmPrime, qP, FvP_FmP]
+
+  # If multi-phase flash steps are flat or positive slope, then just use the normal values
+  MPF = ~(m > 0)
+  names = ['Phi2', 'NPQt', 'PhiNO', 'PhiNPQ', 'qL', 'FmPrime', 'qP', 'FvP_over_FmP']
+  for name, value_MPF, value_noMPF in zip(names, parameters(b), parameters(AFmP)):
+    output[name] = np.where(MPF, value_MPF, value_noMPF)
+
+  output['Fs'] = Fs
+  output['Fs_std'] = Fs_std
+  output['FoPrime'] = FoPrime
+  output['FoPrime_std'] = FoPrime_std
+  output['MPF'] = MPF
+
+  return output
+
+def _top_mean ( values, fraction ):
+  """
+  Mean of the largest values (last axis), e.g. the top 20%. The values are
+  found with a partial sort and then sorted, so they are summed up in the
+  same order as the sorted trace.
+  """
+  start = int(values.shape[-1] * fraction)
+  top = np.sort(np.partition(values, start, axis=-1)[..., start:], axis=-1)
+  return np.mean(top, axis=-1)
+
+def analyze_psi ( data_raw ):
+  """
+  PSI (P700) saturation pulse parameters of the PAM trace (PS1 active,
+  open, over-reduced and oxidized centers) for many samples at once.
+  The values are the same as calculated by ``_analyze``, but not rounded.
 
+  :param data_raw: PAM traces as measured (interleaved), one row per sample
+  :type data_raw: array of shape (n_samples, n_points)
+
+  :return: Parameters (columns) with one value per sample and the absorbance traces (``PSI_data_absorbance``)
+  :rtype: dict
+
+  :raises ValueError: if the traces are too short
+  """
+  data_raw = np.asarray(data_raw)
+
+  PSI_trace_beg=310
+  PSI_trace_end=615
+
+  if data_raw.ndim != 2 or data_raw.shape[1] < PSI_trace_end:
+    raise ValueError("PAM traces need to be a 2-D array with at least %s points per sample" % PSI_trace_end)
+
+  #PSI saturation pulse parameters:
   PSI_ss_beg=1 #beginning of the trace for P700 steady-state
   PSI_ss_end=18 #end of the trace for P700 steady-state
   PSI_sat1_beg=25 #beginning of the trace for P700 first saturation pulse
@@ -323,41 +452,82 @@ def _analyze ( _data ):
   PSI_sat2_beg=220 #beginning of the trace for P700 second saturation pulse
   PSI_sat2_end=270 #end of the trace for P700 second saturation pulse
 
-  # Start of analyses sections
+  # The P700 points follow the fluorescence points in the de-interleaved trace
+  PSI_data = _deinterleave(data_raw)[:, PSI_trace_beg:PSI_trace_end]
+  PSI_dark_raw = np.mean(PSI_data[:, PSI_dark_beg:PSI_dark_end], axis=1)
+  PSI_data_absorbance = np.log(PSI_dark_raw[:, np.newaxis] / PSI_data)
 
-  #ECS trace analysis:
+  PSI_ss = 1000*np.mean(PSI_data_absorbance[:, PSI_ss_beg:PSI_ss_end], axis=1)
+  PSI_sat1 = 1000*_top_mean(PSI_data_absorbance[:, PSI_sat1_beg:PSI_sat1_end], 0.8) # average of the top 20% largest values
+  PSI_sat2 = 1000*_top_mean(PSI_data_absorbance[:, PSI_sat2_beg:PSI_sat2_end], 0.8) # average of the top 20% largest values
 
-  # Average the traces
-  for i in range(1, number_of_ECS_subtraces):
-      temp = DIRK_ECS['data_raw'][i*length_of_ECS_subtrace+beginning_of_ECS:
-                                  (i+1)*length_of_ECS_subtrace+beginning_of_ECS]
-      for j in range(length_of_ECS_subtrace):
-          ECS_averaged_trace[j] = ECS_averaged_trace[j] + temp[j]
+  output = {}
+  output["PS1 Active Centers"] = PSI_sat2
+  output["PS1 Open Centers"] = (PSI_sat1-PSI_ss)/PSI_sat2
+  output["PS1 Over Reduced Centers"] = 1-PSI_sat1/PSI_sat2
+  output["PS1 Oxidized Centers"] = PSI_ss/PSI_sat2
+  output['PSI_data_absorbance'] = PSI_data_absorbance
 
-  # Create time axis
-  fake_time_axis = list(range(1, length_of_ECS_subtrace + 1))
+  return output
 
-  # Find best fit line for baseline
-  m,b = np.polyfit(fake_time_axis[begining_of_subtrace_for_linear_fit:end_of_subtrace_for_linear_fit],
-                  ECS_averaged_trace[begining_of_subtrace_for_linear_fit:end_of_subtrace_for_linear_fit], 1)
+def _analyze ( _data, _fits=None, _pam=None, _psi=None ):
+  """
+  Data evaluation of RIDES
+  
+  by: David M. Kramer
+  created: 2017-05-09 @ 18:15:27
 
-  # Generate baseline offset
-  baseline_offset = [np.round(j * np.round(m, 3) + round(b)) 
-                    for j in range(length_of_ECS_subtrace)]
+  The ECS and P700 DIRK decay fits (``_fits``), the PAM fluorescence
+  parameters (``_pam``) and the PSI parameters (``_psi``) can be provided,
+  when they are calculated for many samples at once (see ``analyze_many``).
+  """
 
-  # Calculate deltaI/I0 and convert to approximate delta_A
-  for j in range(length_of_ECS_subtrace):
-      rat = ECS_averaged_trace[j]/baseline_offset[j]
-      ECS_averaged_trace[j] = -1 * np.log(rat)  # ((rat-1)/-2.3)
+  # Define the output dictionary here
+  output = {}
+  
+  DIRK_ECS = analysis.basic.GetProtocolByLabel("DIRK_ECS", _data)
+  P700_DIRK = analysis.basic.GetProtocolByLabel("DIRK_P700", _data)
+  PAM = analysis.basic.GetProtocolByLabel("PAM", _data)
 
-  # Eliminate spike artifact
-  ECS_averaged_trace[120] = ECS_averaged_trace[119]
-  output['ECS_averaged_trace'] = ECS_averaged_trace[80:150]
+  output["leaf angle"] = P700_DIRK['angle']
+
+  if len(_data['set']) == 13:
+    _data['set'].insert(0, {})
+
+  P700_begining_of_subtrace_for_linear_fit=55
+  P700_end_of_subtrace_for_linear_fit=170
+  beginning_of_LEFD=1421 # Note the 100 pulses 
+  length_of_LEFd_subtrace=220 # The length of each subtrace. 
+  length_of_LEFd_baseline=100 # there are 100 points in the baseline before the DIRK
+  LEFd_trace=DIRK_ECS['data_raw'][beginning_of_LEFD:(beginning_of_LEFD+length_of_LEFd_subtrace)]
+
+  output['test_data_raw_PAM'] = len(PAM['data_raw'])
+
+  # Fluorescence parameters, calculated from the trace as measured
+  if _pam is None:
+    _pam = {key: value[0] for key, value in analyze_pam([PAM['data_raw']]).items()}
+
+  # PSI (P700) saturation pulse parameters
+  if _psi is None:
+    _psi = {key: value[0] for key, value in analyze_psi([PAM['data_raw']]).items()}
+
+  # The fluorescence points (even) are followed by the P700 points (odd)
+  PAM['data_raw']=list(PAM['data_raw'][0::2]) + list(PAM['data_raw'][1::2]); # replace the old values
+
+  output['pump']="none"
+
+  # Start of analyses sections
+
+  #ECS trace analysis:
+
+  # Averaged and baseline corrected ECS and P700 DIRK traces
+  ECS_averaged_trace, P700_DIRK_averaged_trace = _dirk_traces(DIRK_ECS, P700_DIRK)
+  output['ECS_averaged_trace'] = list(ECS_averaged_trace[80:150])
 
   begin_trace_index=100
   end_trace_index=120
   number_of_points_to_fit=end_trace_index-begin_trace_index
-  expData=ECS_averaged_trace[begin_trace_index:end_trace_index]
+  expData=list(ECS_averaged_trace[begin_trace_index:end_trace_index])
 
   # Here I assume that the time difference between points was 
 
@@ -370,11 +540,11 @@ def _analyze ( _data ):
   def exp_func(x, a, b, c):
       return b + a * np.exp(-x / c)
 
-  try:
-    # Fit the data
-    popt, pcov = curve_fit(exp_func, t, y, p0=[1, 1, 1])
-    a, b, c = popt
-    
+  # Fit the data
+  a, b, c, converged = fit_exponential(t, y) if _fits is None else _fits[0]
+  outdata = None
+
+  if converged:
     # Generate fitted curve
     outdata = exp_func(t, a, b, c)
     
@@ -387,45 +557,19 @@ def _analyze ( _data ):
     vHplus = output["ECSt mAU"] * output["gH+"]
     output["vH+"] = round(vHplus, 3)
 
-  except Exception as e:
-    pass  # Or handle the error as needed
+  else:
+    flag("ecs_fit", "ECS decay fit did not converge")
 
   # Calculaiton of the DIRK delta_P850 
 
-  # Get sum of all subtraces
-  for i in range(1, number_of_P700_DIRK_subtraces):
-      temp = P700_DIRK['data_raw'][i*length_of_P700_DIRK_subtrace+beginning_of_P700_DIRK:
-                                  (i+1)*length_of_P700_DIRK_subtrace+beginning_of_P700_DIRK]
-      
-      for j in range(length_of_P700_DIRK_subtrace):
-          P700_DIRK_averaged_trace[j] = P700_DIRK_averaged_trace[j] + temp[j]
-
-  # Create time axis
-  fake_time_axis = list(range(1, length_of_P700_DIRK_subtrace + 1))
-
-  # Find best fit line for baseline
-  m,b = np.polyfit(fake_time_axis, P700_DIRK_averaged_trace, 1)
-
-  # Generate baseline offset using linear regression
-  baseline_offset = [j * np.round(m, 3) + np.round(b) 
-                    for j in range(length_of_P700_DIRK_subtrace)]
-
-  # Calculate deltaI/I0 and convert to approximate delta_A
-  for j in range(length_of_P700_DIRK_subtrace):
-      rat = P700_DIRK_averaged_trace[j]/baseline_offset[j]
-      P700_DIRK_averaged_trace[j] = -1 * np.log(rat)  # ((rat-1)/-2.3)
-
-  # Replace artifactual data at position 120 with prior value
-  P700_DIRK_averaged_trace[120] = P700_DIRK_averaged_trace[119]
-
   # Slice the averaged trace for output
-  output['P700_DIRK_averaged_trace'] = P700_DIRK_averaged_trace[P700_begining_of_subtrace_for_linear_fit:
-                                                              P700_end_of_subtrace_for_linear_fit]
+  output['P700_DIRK_averaged_trace'] = list(P700_DIRK_averaged_trace[P700_begining_of_subtrace_for_linear_fit:
+                                                                   P700_end_of_subtrace_for_linear_fit])
 
   begin_trace_index=100
   end_trace_index=120
   number_of_points_to_fit=end_trace_index-begin_trace_index
-  P700expData=P700_DIRK_averaged_trace[begin_trace_index:end_trace_index]
+  P700expData=list(P700_DIRK_averaged_trace[begin_trace_index:end_trace_index])
   P700_time_per_point=1.5 #entger the delta time between points (only work with constant delta time) 
 
   # Create time series data points
@@ -433,38 +577,29 @@ def _analyze ( _data ):
   for i in range(len(expData)):  # assuming expData is defined
       P700tdata.append([i * time_per_point, P700expData[i]])
 
-  # Convert to numpy array for curve_fit
+  # Convert to numpy array for the fit
   P700tdata = np.array(P700tdata)
 
-  # Define the exponential decay function
-  def exp_decay(x, a, b, c):
-      return b + a * np.exp(-x / c)
+  # Perform non-linear least squares fitting
+  if _fits is None:
+    a, b, c, converged = fit_exponential(P700tdata[:, 0],  # x data
+                                         P700tdata[:, 1])  # y data
+  else:
+    a, b, c, converged = _fits[1]
 
-  # Initial parameter guesses
-  a = 1
-  b = 1
-  c = 1
-
-  try:
-    # Perform non-linear least squares fitting
-    # Note: curve_fit is scipy's equivalent to NonLinearRegression
-    popt, pcov = curve_fit(exp_decay, 
-                          P700tdata[:, 0],  # x data
-                          P700tdata[:, 1],  # y data
-                          p0=[a, b, c])     # initial guesses
-    
-    # Extract fitted parameters
-    a, b, c = popt
-    
+  if not converged:
+    flag("p700_fit", "P700 DIRK decay fit did not converge")
+
+  # The P700 results include the ECS fit, so they are only available if both fits converged
+  elif outdata is not None:
     # Generate fitted data points
     P700_outdata = []
     for i in range(len(expData)):
         P700_outdata.append(b + a * np.exp(-1 * i / c))
     
-    # Store results in output dictionary
-    output = {}
+    # Add the results to the output dictionary
     output['P700_fitinput'] = P700_outdata
-    output['P700_outdata'] = outdata  # assuming outdata is defined
+    output['P700_outdata'] = outdata
     
     # Round and store parameters
     output['P700_DIRK_ampl'] = round(a, 5)
@@ -475,108 +610,38 @@ def _analyze ( _data ):
     v_initial_P700 = output['P700_DIRK_ampl'] * output['kP700']
     output['v_initial_P700'] = round(v_initial_P700, 7)
 
-  except Exception as e:
-    print(f"An error occurred: {e}")
-
 
   # Display the DIRKf results and calculate LEFd
 
-  output['LEFd_trace'] = LEFd_trace
+  output['LEFd_trace'] = np.asarray(LEFd_trace).tolist() # list, also for traces from a TraceStore
 
   # Display of PAM result and calculation of the fluorescence parameters
   # ************************************************************************************************
   # Calculate the PAM fluorescence paramters
   
   output['data_raw_PAM'] = PAM['data_raw'][0:310]
-  data=PAM['data_raw'][0:310]
-    
-  # Set our Apparent FmPrime, 3 FmPrime steps, and Fs to calculate both traditional fv/fm and new Multi-phase flash fv/fm
-  # ----------------------------
 
-  # get the values for representative Fs 
-  baseline=0 # for the time being, do not use baseline
-
-  # GET THE VALUES FOR Fs
-  Fs = np.mean(data[Fs_begin:Fs_end]) - baseline # take only the first 4 values in the Fs range, excluding the very first
-  Fs_std = np.std(data[Fs_begin:Fs_end]) # create standard deviation for this value for error checking
+  # Fs, FoPrime and the multi-phase flash (MPF) FmPrime (see analyze_pam)
+  # ----------------------------
+  Fs = _pam['Fs']
+  Fs_std = _pam['Fs_std'] # standard deviation for error checking
   output['Fs']=np.round(Fs,2)
 
-  # GET THE VALUES FOR THE 5 Fm' ILLUMINATION CONDITIONS
-  sat_vals = np.sort(data[Fm_1_begin:Fm_1_end])  # sort the saturating light values from low to high
-  AFmP = np.mean(sat_vals[2:20]) - baseline # take the 18 largest values and average them
-  AFmP_std = np.std(sat_vals) # create standard deviation for this value for error checking
-  # output.AFmP=AFmP;
-    
-  sat_vals = np.sort(data[Fm_5_begin:Fm_5_end])  # sort the saturating light values from low to high
-  FmP_end = np.mean(sat_vals[2:23]) - baseline # take the 21 largest values and average them
-  FmP_end_std = np.std(sat_vals) # create standard deviation for this value for error checking
-  # output.FmP_end=FmP_end;
-    
-  sat_vals = np.sort(data[Fm_2_begin:Fm_2_end])  # sort the saturating light values from low to high
-  FmP_step1 = np.mean(sat_vals[2:6]) - baseline # take the 4 largest values and average them
-  FmP_step1_std = np.std(sat_vals) # create standard deviation for this value for error checking
-  # output.FmP_step1=FmP_step1;
-    
-  sat_vals = np.sort(data[Fm_3_begin:Fm_3_end])  # sort the saturating light values from low to high
-  FmP_step2 = np.mean(sat_vals[2:6]) - baseline # take the 4 largest values and average them
-  FmP_step2_std = np.std(sat_vals) # create standard deviation for this value for error checking
-  # output.FmP_step2=FmP_step2;
-    
-  sat_vals = np.sort(data[Fm_4_begin:Fm_4_end])  # sort the saturating light values from low to high
-  FmP_step3 = np.mean(sat_vals[2:6]) - baseline # take the 4 largest values and average them
-  FmP_step3_std = np.std(sat_vals) # create standard deviation for this value for error checking
-  # output.FmP_ste32=FmP_step3;
-    
-  # Calculations for F0'
-  # ----------------------------
-  FoPrime_values = np.sort(data[FoPrime_begin:FoPrime_end])
-    
-  # FoPrime = np.mean(FoPrime_values[5,10)) - baseline;
-  FoPrime = np.min(FoPrime_values)
-  FoPrime_std = np.std(FoPrime_values) # create standard deviation for this value for error checking
+  FoPrime = _pam['FoPrime']
+  FoPrime_std = _pam['FoPrime_std'] # standard deviation for error checking
   output['FoPrime']=np.round(FoPrime,2)
 
-  # output.FoPrime_values=FoPrime_values;
-    
-  # Calculations for corrected FmPrime using multi-phase flash
-  # ----------------------------
-  m,b = np.polyfit(inverse_intensity, [AFmP,FmP_step1,FmP_step2,FmP_step3], 1)
-
-  # Calculate Phi2 w/ and w/out multi-phase flash
+  # Phi2, NPQt, PhiNPQ, PhiNO, qL w/ or w/out multi-phase flash
   # ----------------------------
-  fvfm_noMPF = (AFmP-Fs)/AFmP
-  fvfm_MPF = (b-Fs)/b
-
+  fvfm = _pam['Phi2']
+  npqt = _pam['NPQt']
+  PhiNO = _pam['PhiNO']
+  PhiNPQ = _pam['PhiNPQ']
+  qL = _pam['qL']
+  FmPrime = _pam['FmPrime']
+  qP = _pam['qP']
+  FvP_FmP = _pam['FvP_over_FmP']
 
-  # Calculate NPQt, PhiNPQ, PhiNO, qL w/ and w/out multi-phase flash
-  # ----------------------------
-
-  #FIX: FmPrime does not exist at this point, but is called later
-  FmPrime = AFmP
-
-  npqt_MPF = (4.88 / ((b / FoPrime) -1) )-1
-  npqt_noMPF = (4.88 / ((AFmP / FoPrime) -1) )-1
-  qL_MPF = ((b - Fs)*FoPrime)/((b-FoPrime)*Fs)
-  qL_noMPF = ((AFmP - Fs)*FoPrime)/((AFmP-FoPrime)*Fs)
-  PhiNO_MPF = 1/(npqt_MPF + 1 + qL_MPF*4.88) # based on equation 52 in Kramer et al., 2004 PRES
-  PhiNO_noMPF = 1/(npqt_noMPF + 1 + qL_noMPF*4.88) # based on equation 52 in Kramer et al., 2004 PRES
-  PhiNPQ_MPF = 1-fvfm_MPF-PhiNO_MPF # based on equation 53 in Kramer et al., 2004 PRES 
-  PhiNPQ_noMPF = 1-fvfm_noMPF-PhiNO_noMPF # based on equation 53 in Kramer et al., 2004 PRES 
-  qP_MPF = (b - Fs)/(b - FoPrime)
-  qP_noMPF = (FmPrime - Fs)/(FmPrime - FoPrime) # FmPrime does not exist at this point!!!!
-  FvP_FmP_MPF = (b-FoPrime)/b
-  FvP_FmP_noMPF = (AFmP-FoPrime)/AFmP
-
-  # Create the variables to be printed (assume to use the MPF values unless there is a good reason not to)
-  # ----------------------------
-  fvfm = fvfm_MPF
-  npqt = npqt_MPF
-  PhiNO = PhiNO_MPF
-  PhiNPQ = PhiNPQ_MPF
-  qL = qL_MPF
-  FmPrime = b
-  qP = qP_MPF
-  FvP_FmP = FvP_FmP_MPF
   #****************OUTPUT VALUES FROM MACRO *******************
 
   # if any of the flag conditions are true, then create the 'flag' object.  Otherwise, do not create the flag object.
@@ -587,31 +652,22 @@ def _analyze ( _data ):
   # If Phi2 or NPQt is less than zero, make zero and give user warning.  If Phi2 is higher than .85, give user danger flag.
   # ----------------------------
 
-  if m > 0:
-    fvfm = fvfm_noMPF
-    npqt = npqt_noMPF
-    PhiNO = PhiNO_noMPF
-    PhiNPQ = PhiNPQ_noMPF
-    qL = qL_noMPF
-    FmPrime = AFmP
-    qP = qP_noMPF
-    FvP_FmP = FvP_FmP_noMPF
-    
+  if not _pam['MPF']:
     if fvfm <= -.10:
-      warnings.warn("Phi2 is outside of expected range, please consider discarding the measurement")
+      flag("phi2_range", "Phi2 is outside of expected range, please consider discarding the measurement", fvfm)
 
     if fvfm >=.85:
-      warnings.warn("Phi2 is outside of expected range, please consider discarding the measurement")
+      flag("phi2_range", "Phi2 is outside of expected range, please consider discarding the measurement", fvfm)
 
     else:
       output["Phi2"] = np.round(fvfm,3)
       
       
     if PhiNPQ <= -.10:
-      warnings.warn("PhiNPQ is outside of expected range, please consider discarding the measurement")
+      flag("phinpq_range", "PhiNPQ is outside of expected range, please consider discarding the measurement", PhiNPQ)
     
     if PhiNPQ >= 1.1:
-      warnings.warn("PhiNPQ is outside of expected range, please consider discarding the measurement")
+      flag("phinpq_range", "PhiNPQ is outside of expected range, please consider discarding the measurement", PhiNPQ)
     
     else:
       output['PhiNPQ']= np.round(PhiNPQ,3)
@@ -623,10 +679,10 @@ def _analyze ( _data ):
     outputqP = np.round(qP,3)
       
     if PhiNO <= -.10:
-      warnings.warn("PhiNO is outside of expected range, please consider discarding the measurement")
+      flag("phino_range", "PhiNO is outside of expected range, please consider discarding the measurement", PhiNO)
 
     if PhiNO >= 1.1:
-      warnings.warn("PhiNO is outside of expected range, please consider discarding the measurement")
+      flag("phino_range", "PhiNO is outside of expected range, please consider discarding the measurement", PhiNO)
     
     else:
       output['PhiNO']= np.round(PhiNO,3)
@@ -645,20 +701,20 @@ def _analyze ( _data ):
   else:
     
     if fvfm <= -.10:
-      warnings.warn("Phi2 is outside of expected range, please consider discarding the measurement")
+      flag("phi2_range", "Phi2 is outside of expected range, please consider discarding the measurement", fvfm)
     
     if fvfm >=.85:
-      warnings.warn("Phi2 is outside of expected range, please consider discarding the measurement")
+      flag("phi2_range", "Phi2 is outside of expected range, please consider discarding the measurement", fvfm)
     
     else:
       output["Phi2"] = np.round(fvfm,3)
     
     
     if PhiNPQ <= -.10:
-      warnings.warn("PhiNPQ is outside of expected range, please consider discarding the measurement")
+      flag("phinpq_range", "PhiNPQ is outside of expected range, please consider discarding the measurement", PhiNPQ)
     
     if PhiNPQ >= 1.1:
-      warnings.warn("PhiNPQ is outside of expected range, please consider discarding the measurement")
+      flag("phinpq_range", "PhiNPQ is outside of expected range, please consider discarding the measurement", PhiNPQ)
     
     else:
       output['PhiNPQ']= np.round(PhiNPQ,3)
@@ -670,10 +726,10 @@ def _analyze ( _data ):
     outputqP = np.round(qP,3)
   
     if PhiNO <= -.10:
-      warnings.warn("PhiNO is outside of expected range, please consider discarding the measurement")
+      flag("phino_range", "PhiNO is outside of expected range, please consider discarding the measurement", PhiNO)
     
     if PhiNO >= 1:
-      warnings.warn("PhiNO is outside of expected range, please consider discarding the measurement")
+      flag("phino_range", "PhiNO is outside of expected range, please consider discarding the measurement", PhiNO)
     
     else:
       output['PhiNO']= np.round(PhiNO,3)
@@ -710,7 +766,7 @@ def _analyze ( _data ):
   # ----------------------------
 
   if Fs_std > 100:
-    warnings.warn("noisy Fs")
+    flag("noisy_fs", "noisy Fs", Fs_std)
 
   # if (AFmP_std > 300) {
   #   warnings.warn("noisy FmPrime", output);
@@ -721,44 +777,17 @@ def _analyze ( _data ):
   # }
 
   if FoPrime_std > 150:
-    warnings.warn("noisy FoPrime")
+    flag("noisy_foprime", "noisy FoPrime", FoPrime_std)
     
   #ANALYZE THE PHI-PSI DATA  
 
-  ctrace=PAM['data_raw']
-  PSI_trace_beg=310
-  PSI_trace_end=615
-  PSI_trace_length=PSI_trace_end-PSI_trace_beg
-  PSI_data=PAM['data_raw'][PSI_trace_beg:PSI_trace_end]
-  PSI_dark_raw=np.mean(PSI_data[PSI_dark_beg:PSI_dark_end])
-  PSI_data_absorbance=[]
-  
-  for i in range(0, PSI_trace_length):
-    PSI_data_absorbance.append(np.log(PSI_dark_raw/PSI_data[i]))
-  
-  PSI_dark=np.mean(PSI_data_absorbance[PSI_dark_beg:PSI_dark_end])
-  PSI_ss=np.mean(PSI_data_absorbance[PSI_ss_beg:PSI_ss_end])
-  PSI_sat1=np.mean(PSI_data_absorbance[PSI_sat1_beg:PSI_sat1_end])
-  PSI_sat2=np.mean(PSI_data_absorbance[PSI_sat2_beg:PSI_sat2_end])
-  PSI_ss=1000*np.mean(PSI_data_absorbance[PSI_ss_beg:PSI_ss_end])
-  PSI_sat1_vals = np.sort(PSI_data_absorbance[PSI_sat1_beg:PSI_sat1_end])  # sort the saturating light values from low to high
-  length_of_sat1=PSI_sat1_end-PSI_sat1_beg
-  top_20_percent= int(length_of_sat1*0.8)
-  PSI_sat1 = 1000*np.mean(PSI_sat1_vals[top_20_percent:length_of_sat1]) # take the top 20% largest values and average them
-  PSI_sat2_vals = np.sort(PSI_data_absorbance[PSI_sat2_beg:PSI_sat2_end])  # sort the saturating light values from low to high
-  length_of_sat2=PSI_sat2_end-PSI_sat2_beg
-  top_20_percent=int(length_of_sat2*0.8)
-  PSI_sat2 = 1000*np.mean(PSI_sat2_vals[top_20_percent:length_of_sat2]) # take the top 20% largest values and average them
-  PSI_ox=PSI_ss/PSI_sat2
-  PSI_act=PSI_sat2
-  PSI_open=(PSI_sat1-PSI_ss)/PSI_sat2
-  PSI_or=1-PSI_sat1/PSI_sat2
-  output['PSI_data_absorbance']=PSI_data_absorbance
-
-  output["PS1 Active Centers"]=np.round(PSI_act, 3)
-  output["PS1 Open Centers"]=np.round(PSI_open, 3)
-  output["PS1 Over Reduced Centers"]=np.round(PSI_or, 3)
-  output["PS1 Oxidized Centers"]=np.round(PSI_ox, 3)
+  # Absorbance and PS1 centers (see analyze_psi)
+  output['PSI_data_absorbance']=list(_psi['PSI_data_absorbance'])
+
+  output["PS1 Active Centers"]=np.round(_psi["PS1 Active Centers"], 3)
+  output["PS1 Open Centers"]=np.round(_psi["PS1 Open Centers"], 3)
+  output["PS1 Over Reduced Centers"]=np.round(_psi["PS1 Over Reduced Centers"], 3)
+  output["PS1 Oxidized Centers"]=np.round(_psi["PS1 Oxidized Centers"], 3)
     #output.PSI_dark=PSI_dark;
   #output.PSI_ss = PSI_ss; #MathROUND(PSI_ss, 3);
   #output.PSI_sat1 =MathROUND(PSI_sat1, 3);
@@ -841,4009 +870,80 @@ def _analyze ( _data ):
 
   return output
 
-_example = {
-  "time": 1579894191905,
-  "device_name": "MultispeQ",
-  "device_version": "2",
-  "device_id": "00:00:04:32",
-  "device_battery": 93,
-  "device_firmware": 2.21,
-  "sample": [
-    [
-      {
-        "time": 1579894191905,
-        "protocol_id": "editor",
-        "set": [
-          {
-            "time": 1579894192135,
-            "label": "no_leaf_baseline",
-            "light_intensity": 15.603,
-            "r": 70,
-            "g": 35,
-            "b": 20,
-            "w": 119,
-            "temperature": 23.53,
-            "humidity": 35.832,
-            "pressure": 979.605,
-            "temperature2": 23.65,
-            "humidity2": 34.402,
-            "pressure2": 979.932,
-            "contactless_temp": 23.19,
-            "compass_direction": "??",
-            "compass": -1,
-            "angle": 2.334,
-            "pitch": 2.3,
-            "roll": 0.41,
-            "data_raw": [
-
-            ]
-          },
-          {
-            "time": 1579894193791,
-            "label": "DIRK_ECS",
-            "autogain": [
-              [
-                2,
-                1,
-                3,
-                12,
-                -493,
-                49615
-              ],
-              [
-                3,
-                8,
-                1,
-                80,
-                -216,
-                43519
-              ]
-            ],
-            "light_intensity": 14.403,
-            "r": 63.8,
-            "g": 32,
-            "b": 18.4,
-            "w": 109.2,
-            "temperature": 23.58,
-            "humidity": 35.781,
-            "pressure": 979.579,
-            "temperature2": 23.71,
-            "humidity2": 34.385,
-            "pressure2": 979.935,
-            "contactless_temp": 25.53,
-            "thickness": 0.3,
-            "data_raw": [
-              49509,
-              49487,
-              49491,
-              49495,
-              49503,
-              49495,
-              49495,
-              49487,
-              49502,
-              49490,
-              49495,
-              49485,
-              49484,
-              49501,
-              49491,
-              49489,
-              49487,
-              49491,
-              49494,
-              49487,
-              49487,
-              49485,
-              49491,
-              49484,
-              49491,
-              49491,
-              49493,
-              49486,
-              49493,
-              49479,
-              49481,
-              49483,
-              49487,
-              49485,
-              49498,
-              49483,
-              49481,
-              49485,
-              49487,
-              49496,
-              49492,
-              49495,
-              49489,
-              49477,
-              49487,
-              49494,
-              49481,
-              49482,
-              49481,
-              49491,
-              49485,
-              49491,
-              49469,
-              49477,
-              49487,
-              49491,
-              49486,
-              49481,
-              49485,
-              49487,
-              49487,
-              49483,
-              49477,
-              49484,
-              49486,
-              49493,
-              49486,
-              49471,
-              49485,
-              49479,
-              49476,
-              49481,
-              49477,
-              49478,
-              49484,
-              49471,
-              49482,
-              49482,
-              49483,
-              49485,
-              49467,
-              49487,
-              49482,
-              49487,
-              49485,
-              49487,
-              49478,
-              49476,
-              49478,
-              49483,
-              49487,
-              49471,
-              49471,
-              49479,
-              49477,
-              49475,
-              49482,
-              49483,
-              49479,
-              49471,
-              49483,
-              49471,
-              49482,
-              49479,
-              49487,
-              49477,
-              49483,
-              49479,
-              49485,
-              49497,
-              49471,
-              49471,
-              49479,
-              49492,
-              49487,
-              49481,
-              49471,
-              49475,
-              49479,
-              49479,
-              49481,
-              49471,
-              49484,
-              49483,
-              49471,
-              49479,
-              49480,
-              49479,
-              49471,
-              49483,
-              49487,
-              49479,
-              49475,
-              49485,
-              49487,
-              49475,
-              49471,
-              49486,
-              49487,
-              49481,
-              49471,
-              49478,
-              49485,
-              49486,
-              49486,
-              49479,
-              49471,
-              49481,
-              49485,
-              49483,
-              49476,
-              49484,
-              49477,
-              49485,
-              49477,
-              49478,
-              49483,
-              49479,
-              49479,
-              49476,
-              49477,
-              49478,
-              49477,
-              49477,
-              49485,
-              49477,
-              49479,
-              49471,
-              49476,
-              49477,
-              49483,
-              49470,
-              49481,
-              49471,
-              49471,
-              49493,
-              49481,
-              49487,
-              49487,
-              49469,
-              49482,
-              49483,
-              49486,
-              49479,
-              49471,
-              49469,
-              49481,
-              49477,
-              49486,
-              49468,
-              49481,
-              49484,
-              49480,
-              49478,
-              49479,
-              49478,
-              49482,
-              49477,
-              49479,
-              49478,
-              49482,
-              49487,
-              49495,
-              49490,
-              49493,
-              49480,
-              49491,
-              49483,
-              49481,
-              49488,
-              49497,
-              49495,
-              49498,
-              49489,
-              49501,
-              49509,
-              49499,
-              49504,
-              49503,
-              49502,
-              49498,
-              49487,
-              49482,
-              49487,
-              49487,
-              49487,
-              49483,
-              49497,
-              49487,
-              49494,
-              49478,
-              49471,
-              49487,
-              49485,
-              49479,
-              49479,
-              49480,
-              49477,
-              49471,
-              49477,
-              49477,
-              49480,
-              49477,
-              49475,
-              49471,
-              49477,
-              49479,
-              49471,
-              49471,
-              49482,
-              49471,
-              49481,
-              49471,
-              49477,
-              49482,
-              49476,
-              49471,
-              49471,
-              49484,
-              49486,
-              49465,
-              49483,
-              49479,
-              49477,
-              49479,
-              49476,
-              49471,
-              49482,
-              49479,
-              49471,
-              49477,
-              49483,
-              49471,
-              49466,
-              49471,
-              49479,
-              49471,
-              49471,
-              49471,
-              49471,
-              49469,
-              49471,
-              49471,
-              49469,
-              49463,
-              49479,
-              49479,
-              49471,
-              49477,
-              49464,
-              49469,
-              49471,
-              49471,
-              49471,
-              49481,
-              49467,
-              49467,
-              49471,
-              49469,
-              49465,
-              49467,
-              49477,
-              49471,
-              49471,
-              49471,
-              49479,
-              49479,
-              49478,
-              49471,
-              49471,
-              49471,
-              49479,
-              49480,
-              49465,
-              49466,
-              49471,
-              49466,
-              49486,
-              49468,
-              49471,
-              49471,
-              49477,
-              49483,
-              49479,
-              49459,
-              49471,
-              49482,
-              49467,
-              49471,
-              49467,
-              49481,
-              49479,
-              49469,
-              49465,
-              49471,
-              49467,
-              49471,
-              49467,
-              49467,
-              49471,
-              49467,
-              49463,
-              49466,
-              49471,
-              49471,
-              49468,
-              49467,
-              49461,
-              49478,
-              49481,
-              49465,
-              49465,
-              49477,
-              49471,
-              49471,
-              49469,
-              49467,
-              49481,
-              49471,
-              49471,
-              49471,
-              49461,
-              49471,
-              49471,
-              49471,
-              49471,
-              49475,
-              49479,
-              49479,
-              49471,
-              49463,
-              49478,
-              49468,
-              49470,
-              49463,
-              49471,
-              49470,
-              49477,
-              49470,
-              49479,
-              49471,
-              49467,
-              49467,
-              49481,
-              49471,
-              49465,
-              49478,
-              49481,
-              49467,
-              49467,
-              49471,
-              49478,
-              49471,
-              49471,
-              49471,
-              49475,
-              49471,
-              49471,
-              49463,
-              49479,
-              49479,
-              49471,
-              49471,
-              49479,
-              49471,
-              49474,
-              49471,
-              49470,
-              49475,
-              49479,
-              49465,
-              49465,
-              49471,
-              49478,
-              49471,
-              49481,
-              49471,
-              49469,
-              49480,
-              49469,
-              49471,
-              49474,
-              49483,
-              49482,
-              49483,
-              49474,
-              49488,
-              49475,
-              49475,
-              49482,
-              49486,
-              49484,
-              49495,
-              49481,
-              49487,
-              49481,
-              49490,
-              49487,
-              49487,
-              49489,
-              49485,
-              49487,
-              49471,
-              49487,
-              49483,
-              49483,
-              49477,
-              49471,
-              49476,
-              49477,
-              49471,
-              49471,
-              49483,
-              49477,
-              49468,
-              49477,
-              49477,
-              49464,
-              49465,
-              49469,
-              49471,
-              49462,
-              49464,
-              49471,
-              49463,
-              49460,
-              49467,
-              49475,
-              49470,
-              49467,
-              49463,
-              49471,
-              49462,
-              49463,
-              49463,
-              49463,
-              49471,
-              49463,
-              49463,
-              49471,
-              49471,
-              49467,
-              49465,
-              49465,
-              49461,
-              49463,
-              49471,
-              49463,
-              49468,
-              49465,
-              49469,
-              49463,
-              49467,
-              49465,
-              49465,
-              49463,
-              49459,
-              49471,
-              49455,
-              49457,
-              49460,
-              49471,
-              49468,
-              49469,
-              49469,
-              49465,
-              49464,
-              49467,
-              49455,
-              49470,
-              49463,
-              49463,
-              49464,
-              49459,
-              49465,
-              49471,
-              49476,
-              49467,
-              49467,
-              49471,
-              49469,
-              49467,
-              49461,
-              49461,
-              49471,
-              49460,
-              49461,
-              49455,
-              49479,
-              49459,
-              49461,
-              49463,
-              49455,
-              49461,
-              49455,
-              49467,
-              49461,
-              49468,
-              49471,
-              49471,
-              49459,
-              49462,
-              49466,
-              49466,
-              49469,
-              49467,
-              49455,
-              49464,
-              49469,
-              49451,
-              49460,
-              49458,
-              49463,
-              49462,
-              49461,
-              49449,
-              49455,
-              49466,
-              49471,
-              49455,
-              49461,
-              49468,
-              49460,
-              49451,
-              49465,
-              49467,
-              49453,
-              49462,
-              49471,
-              49460,
-              49463,
-              49467,
-              49471,
-              49463,
-              49455,
-              49449,
-              49470,
-              49471,
-              49470,
-              49470,
-              49464,
-              49460,
-              49463,
-              49463,
-              49455,
-              49461,
-              49462,
-              49457,
-              49467,
-              49463,
-              49463,
-              49455,
-              49466,
-              49466,
-              49463,
-              49463,
-              49459,
-              49459,
-              49464,
-              49455,
-              49463,
-              49471,
-              49463,
-              49453,
-              49460,
-              49471,
-              49458,
-              49460,
-              49455,
-              49464,
-              49463,
-              49451,
-              49471,
-              49465,
-              49459,
-              49463,
-              49467,
-              49471,
-              49455,
-              49465,
-              49471,
-              49465,
-              49462,
-              49459,
-              49467,
-              49461,
-              49451,
-              49464,
-              49460,
-              49445,
-              49452,
-              49455,
-              49464,
-              49454,
-              49455,
-              49462,
-              49460,
-              49461,
-              49455,
-              49463,
-              49457,
-              49457,
-              49470,
-              49475,
-              49475,
-              49467,
-              49473,
-              49475,
-              49474,
-              49474,
-              49482,
-              49475,
-              49481,
-              49485,
-              49491,
-              49489,
-              49481,
-              49481,
-              49497,
-              49491,
-              49471,
-              49487,
-              49478,
-              49470,
-              49484,
-              49489,
-              49471,
-              49479,
-              49471,
-              49466,
-              49465,
-              49463,
-              49463,
-              49471,
-              49469,
-              49471,
-              49463,
-              49468,
-              49471,
-              49470,
-              49466,
-              49466,
-              49467,
-              49469,
-              49467,
-              49466,
-              49455,
-              49462,
-              49462,
-              49459,
-              49471,
-              49461,
-              49459,
-              49463,
-              49463,
-              49467,
-              49462,
-              49460,
-              49463,
-              49467,
-              49471,
-              49463,
-              49455,
-              49455,
-              49462,
-              49464,
-              49455,
-              49478,
-              49455,
-              49455,
-              49463,
-              49459,
-              49463,
-              49459,
-              49465,
-              49466,
-              49463,
-              49466,
-              49455,
-              49459,
-              49462,
-              49455,
-              49463,
-              49455,
-              49470,
-              49471,
-              49460,
-              49471,
-              49471,
-              49467,
-              49471,
-              49467,
-              49454,
-              49469,
-              49463,
-              49459,
-              49465,
-              49467,
-              49463,
-              49455,
-              49467,
-              49463,
-              49455,
-              49462,
-              49471,
-              49463,
-              49466,
-              49461,
-              49471,
-              49455,
-              49459,
-              49471,
-              49465,
-              49455,
-              49467,
-              49471,
-              49459,
-              49449,
-              49462,
-              49449,
-              49462,
-              49455,
-              49469,
-              49451,
-              49455,
-              49454,
-              49463,
-              49455,
-              49461,
-              49465,
-              49454,
-              49459,
-              49467,
-              49458,
-              49459,
-              49458,
-              49449,
-              49455,
-              49460,
-              49459,
-              49455,
-              49471,
-              49461,
-              49455,
-              49462,
-              49463,
-              49461,
-              49462,
-              49453,
-              49467,
-              49461,
-              49455,
-              49462,
-              49455,
-              49458,
-              49467,
-              49466,
-              49455,
-              49460,
-              49463,
-              49455,
-              49461,
-              49454,
-              49461,
-              49463,
-              49467,
-              49463,
-              49471,
-              49463,
-              49463,
-              49462,
-              49455,
-              49448,
-              49469,
-              49459,
-              49465,
-              49465,
-              49454,
-              49455,
-              49455,
-              49454,
-              49455,
-              49455,
-              49453,
-              49463,
-              49463,
-              49447,
-              49469,
-              49455,
-              49455,
-              49452,
-              49455,
-              49459,
-              49465,
-              49460,
-              49455,
-              49465,
-              49461,
-              49455,
-              49463,
-              49461,
-              49455,
-              49457,
-              49463,
-              49455,
-              49454,
-              49466,
-              49450,
-              49459,
-              49455,
-              49451,
-              49451,
-              49459,
-              49450,
-              49459,
-              49454,
-              49451,
-              49459,
-              49454,
-              49459,
-              49456,
-              49459,
-              49459,
-              49463,
-              49458,
-              49459,
-              49471,
-              49473,
-              49459,
-              49472,
-              49466,
-              49483,
-              49483,
-              49467,
-              49475,
-              49473,
-              49470,
-              49475,
-              49475,
-              49459,
-              49471,
-              49468,
-              49482,
-              49465,
-              49471,
-              49462,
-              49470,
-              49458,
-              49466,
-              49470,
-              49463,
-              49471,
-              49461,
-              49444,
-              49465,
-              49471,
-              49461,
-              49471,
-              49465,
-              49455,
-              49462,
-              49449,
-              49463,
-              49463,
-              49451,
-              49459,
-              49461,
-              49455,
-              49453,
-              49455,
-              49460,
-              49450,
-              49450,
-              49463,
-              49455,
-              49463,
-              49461,
-              49462,
-              49447,
-              49450,
-              49461,
-              49454,
-              49453,
-              49453,
-              49447,
-              49451,
-              49455,
-              49455,
-              49461,
-              49461,
-              49445,
-              49460,
-              49454,
-              49455,
-              49461,
-              49461,
-              49452,
-              49462,
-              49447,
-              49457,
-              49452,
-              49445,
-              49443,
-              49452,
-              49445,
-              49451,
-              49451,
-              49447,
-              49454,
-              49462,
-              49457,
-              49454,
-              49451,
-              49447,
-              49455,
-              49454,
-              49447,
-              49453,
-              49453,
-              49447,
-              49451,
-              49443,
-              49460,
-              49455,
-              49454,
-              49462,
-              49452,
-              49451,
-              49455,
-              49451,
-              49459,
-              49460,
-              49459,
-              49458,
-              49459,
-              49449,
-              49455,
-              49459,
-              49458,
-              49452,
-              49450,
-              49459,
-              49447,
-              49449,
-              49459,
-              49454,
-              49455,
-              49455,
-              49447,
-              49454,
-              49453,
-              49451,
-              49455,
-              49449,
-              49455,
-              49466,
-              49447,
-              49449,
-              49447,
-              49455,
-              49455,
-              49449,
-              49454,
-              49454,
-              49451,
-              49455,
-              49443,
-              49455,
-              49462,
-              49453,
-              49447,
-              49453,
-              49445,
-              49454,
-              49459,
-              49451,
-              49455,
-              49447,
-              49453,
-              49449,
-              49444,
-              49447,
-              49447,
-              49454,
-              49459,
-              49448,
-              49462,
-              49448,
-              49446,
-              49455,
-              49450,
-              49453,
-              49463,
-              49447,
-              49453,
-              49454,
-              49449,
-              49450,
-              49445,
-              49454,
-              49462,
-              49447,
-              49455,
-              49455,
-              49443,
-              49447,
-              49447,
-              49445,
-              49455,
-              49447,
-              49450,
-              49455,
-              49455,
-              49449,
-              49455,
-              49447,
-              49447,
-              49451,
-              49447,
-              49453,
-              49455,
-              49443,
-              49453,
-              49448,
-              49447,
-              49455,
-              49445,
-              49454,
-              49447,
-              49447,
-              49454,
-              49447,
-              49458,
-              49450,
-              49446,
-              49460,
-              49450,
-              49454,
-              49460,
-              49445,
-              49454,
-              49456,
-              49457,
-              49459,
-              49463,
-              49470,
-              49470,
-              49459,
-              49471,
-              49465,
-              49472,
-              49475,
-              49473,
-              49483,
-              49471,
-              49459,
-              49475,
-              49474,
-              49466,
-              49469,
-              49471,
-              49463,
-              49460,
-              49469,
-              49466,
-              49462,
-              49467,
-              49455,
-              49465,
-              49465,
-              49455,
-              49463,
-              49449,
-              49452,
-              49453,
-              49453,
-              49462,
-              49450,
-              49439,
-              49453,
-              49455,
-              49455,
-              49455,
-              49445,
-              49455,
-              49449,
-              49455,
-              49448,
-              49465,
-              49457,
-              49446,
-              49443,
-              49445,
-              49454,
-              49451,
-              49459,
-              49461,
-              49447,
-              49441,
-              49455,
-              49449,
-              49455,
-              49459,
-              49449,
-              49446,
-              49442,
-              49449,
-              49449,
-              49450,
-              49453,
-              49441,
-              49453,
-              49450,
-              49455,
-              49445,
-              49459,
-              49451,
-              49447,
-              49459,
-              49451,
-              49449,
-              49451,
-              49453,
-              49438,
-              49455,
-              49446,
-              49443,
-              49445,
-              49443,
-              49447,
-              49455,
-              49459,
-              49457,
-              49435,
-              49439,
-              49441,
-              49441,
-              49449,
-              49450,
-              49443,
-              49453,
-              49453,
-              49444,
-              49447,
-              49449,
-              49439,
-              49453,
-              49459,
-              49449,
-              49438,
-              49452,
-              49443,
-              49449,
-              49455,
-              49455,
-              49445,
-              49454,
-              49441,
-              49446,
-              49452,
-              49445,
-              49453,
-              49455,
-              49447,
-              49445,
-              49443,
-              49444,
-              49443,
-              49449,
-              49439,
-              49439,
-              49441,
-              49450,
-              49443,
-              49446,
-              49445,
-              49446,
-              49450,
-              49450,
-              49451,
-              49443,
-              49443,
-              49451,
-              49451,
-              49451,
-              49449,
-              49441,
-              49453,
-              49446,
-              49447,
-              49446,
-              49443,
-              49449,
-              49443,
-              49461,
-              49446,
-              49452,
-              49447,
-              49443,
-              49449,
-              49439,
-              49442,
-              49437,
-              49454,
-              49439,
-              49439,
-              49447,
-              49442,
-              49447,
-              49437,
-              49439,
-              49447,
-              49454,
-              49444,
-              49439,
-              49454,
-              49443,
-              49455,
-              49439,
-              49439,
-              49447,
-              49444,
-              49434,
-              49451,
-              49441,
-              49442,
-              49451,
-              49450,
-              49444,
-              49447,
-              49439,
-              49447,
-              49443,
-              49451,
-              49447,
-              49445,
-              49443,
-              49439,
-              49439,
-              49433,
-              49444,
-              49445,
-              49441,
-              49445,
-              49439,
-              49455,
-              49447,
-              49447,
-              49454,
-              49448,
-              49447,
-              49451,
-              49444,
-              49443,
-              49451,
-              49437,
-              49447,
-              49443,
-              49447,
-              49449,
-              49451,
-              49445,
-              49459,
-              49453,
-              49455,
-              49457,
-              49454,
-              49459,
-              49450,
-              49469,
-              49455,
-              49451,
-              49463,
-              49455,
-              49471,
-              49469,
-              49459,
-              49469,
-              49471,
-              49467,
-              49465,
-              49455,
-              49467,
-              49455,
-              49466,
-              49453,
-              49469,
-              49461,
-              49463,
-              49450,
-              49450,
-              49463,
-              49459,
-              49443,
-              49459,
-              49449,
-              49453,
-              49443,
-              49455,
-              49449,
-              49446,
-              49445,
-              49451,
-              49451,
-              49451,
-              49451,
-              49444,
-              49446,
-              49447,
-              49443,
-              49455,
-              49450,
-              49451,
-              49447,
-              49443,
-              49447,
-              49445,
-              49453,
-              49450,
-              49451,
-              49445,
-              49445,
-              49455,
-              49441,
-              49450,
-              49440,
-              49444,
-              49442,
-              49444,
-              49452,
-              49441,
-              49438,
-              49439,
-              49455,
-              49449,
-              49439,
-              49445,
-              49445,
-              49442,
-              49439,
-              49449,
-              49441,
-              49447,
-              49439,
-              49451,
-              49447,
-              49449,
-              49451,
-              49445,
-              49443,
-              49446,
-              49454,
-              49440,
-              49455,
-              49437,
-              49450,
-              49441,
-              49445,
-              49447,
-              49447,
-              49453,
-              49446,
-              49447,
-              49443,
-              49451,
-              49441,
-              49445,
-              49439,
-              49447,
-              49449,
-              49435,
-              49447,
-              49439,
-              49444,
-              49431,
-              49446,
-              49439,
-              49445,
-              49430,
-              49455,
-              914,
-              914,
-              914,
-              913,
-              910,
-              916,
-              914,
-              911,
-              915,
-              910,
-              914,
-              912,
-              912,
-              915,
-              912,
-              914,
-              914,
-              916,
-              913,
-              910,
-              906,
-              906,
-              909,
-              902,
-              905,
-              901,
-              898,
-              902,
-              897,
-              900,
-              896,
-              899,
-              894,
-              900,
-              892,
-              896,
-              893,
-              892,
-              895,
-              894,
-              893,
-              899,
-              895,
-              902,
-              897,
-              904,
-              897,
-              905,
-              900,
-              905,
-              900,
-              906,
-              905,
-              903,
-              906,
-              902,
-              908,
-              906,
-              903,
-              909,
-              904,
-              909,
-              906,
-              908,
-              909,
-              906,
-              909,
-              904,
-              909,
-              908,
-              906,
-              904,
-              910,
-              905,
-              910,
-              904,
-              910,
-              904,
-              910,
-              905,
-              910,
-              905,
-              909,
-              906,
-              910,
-              904,
-              910,
-              906,
-              910,
-              910,
-              906,
-              910,
-              906,
-              911,
-              905,
-              910,
-              906,
-              909,
-              905,
-              909,
-              908,
-              908,
-              910,
-              905,
-              909,
-              907,
-              910,
-              905,
-              909,
-              906,
-              906,
-              910,
-              908,
-              909,
-              910,
-              905,
-              910,
-              909,
-              909,
-              906,
-              910,
-              910,
-              908,
-              910,
-              908,
-              910,
-              910,
-              906,
-              910,
-              905,
-              910,
-              908,
-              910,
-              910,
-              908,
-              910,
-              908,
-              910,
-              908,
-              910
-            ]
-          },
-          {
-            "time": 1579894201305,
-            "label": "DIRK_P700",
-            "light_intensity": 14.4,
-            "r": 63.8,
-            "g": 32,
-            "b": 18.4,
-            "w": 109.2,
-            "temperature": 23.64,
-            "humidity": 35.808,
-            "pressure": 979.576,
-            "temperature2": 23.75,
-            "humidity2": 34.302,
-            "pressure2": 979.895,
-            "contactless_temp": 24.71,
-            "compass_direction": "??",
-            "compass": -1,
-            "angle": 2.511,
-            "pitch": 2.51,
-            "roll": 0.18,
-            "data_raw": [
-              43613,
-              43625,
-              43593,
-              43595,
-              43611,
-              43599,
-              43608,
-              43589,
-              43589,
-              43580,
-              43588,
-              43582,
-              43613,
-              43564,
-              43597,
-              43580,
-              43602,
-              43601,
-              43573,
-              43579,
-              43585,
-              43585,
-              43585,
-              43597,
-              43587,
-              43584,
-              43589,
-              43575,
-              43579,
-              43565,
-              43590,
-              43612,
-              43560,
-              43585,
-              43593,
-              43576,
-              43609,
-              43607,
-              43605,
-              43585,
-              43608,
-              43584,
-              43582,
-              43577,
-              43566,
-              43596,
-              43579,
-              43553,
-              43593,
-              43577,
-              43573,
-              43568,
-              43592,
-              43565,
-              43582,
-              43601,
-              43599,
-              43573,
-              43581,
-              43575,
-              43590,
-              43603,
-              43583,
-              43591,
-              43585,
-              43583,
-              43605,
-              43597,
-              43583,
-              43589,
-              43565,
-              43561,
-              43563,
-              43581,
-              43589,
-              43567,
-              43578,
-              43592,
-              43578,
-              43601,
-              43595,
-              43550,
-              43565,
-              43573,
-              43597,
-              43613,
-              43583,
-              43540,
-              43571,
-              43585,
-              43593,
-              43572,
-              43577,
-              43559,
-              43595,
-              43585,
-              43601,
-              43565,
-              43585,
-              43581,
-              43589,
-              43593,
-              43579,
-              43585,
-              43550,
-              43559,
-              43575,
-              43569,
-              43573,
-              43577,
-              43565,
-              43604,
-              43599,
-              43571,
-              43593,
-              43584,
-              43581,
-              43577,
-              43603,
-              43585,
-              43593,
-              43611,
-              43570,
-              43571,
-              43579,
-              43563,
-              43555,
-              43581,
-              43579,
-              43566,
-              43541,
-              43557,
-              43539,
-              43557,
-              43584,
-              43565,
-              43560,
-              43549,
-              43562,
-              43575,
-              43582,
-              43553,
-              43593,
-              43589,
-              43557,
-              43580,
-              43582,
-              43569,
-              43569,
-              43577,
-              43561,
-              43579,
-              43573,
-              43551,
-              43568,
-              43544,
-              43577,
-              43549,
-              43568,
-              43567,
-              43576,
-              43581,
-              43559,
-              43561,
-              43561,
-              43559,
-              43582,
-              43581,
-              43589,
-              43569,
-              43575,
-              43585,
-              43568,
-              43589,
-              43568,
-              43569,
-              43559,
-              43567,
-              43598,
-              43584,
-              43601,
-              43568,
-              43571,
-              43577,
-              43553,
-              43581,
-              43601,
-              43562,
-              43569,
-              43573,
-              43545,
-              43565,
-              43547,
-              43576,
-              43585,
-              43550,
-              43577,
-              43611,
-              43582,
-              43597,
-              43567,
-              43569,
-              43572,
-              43590,
-              43591,
-              43577,
-              43574,
-              43571,
-              43564,
-              43583,
-              43551,
-              43597,
-              43584,
-              43577,
-              43551,
-              43571,
-              43576,
-              43565,
-              43602,
-              43585,
-              43571,
-              43581,
-              43584,
-              43581,
-              43617,
-              43575,
-              43550,
-              43585,
-              43566,
-              43600,
-              43596,
-              43601,
-              43593,
-              43585,
-              43593,
-              43581,
-              43585,
-              43617,
-              43582,
-              43599,
-              43589,
-              43601,
-              43605,
-              43622,
-              43605,
-              43576,
-              43565,
-              43576,
-              43585,
-              43589,
-              43574,
-              43557,
-              43579,
-              43615,
-              43579,
-              43583,
-              43565,
-              43584,
-              43589,
-              43585,
-              43603,
-              43563,
-              43562,
-              43583,
-              43581,
-              43521,
-              43578,
-              43568,
-              43575,
-              43581,
-              43575,
-              43573,
-              43545,
-              43573,
-              43570,
-              43601,
-              43527,
-              43536,
-              43601,
-              43570,
-              43547,
-              43583,
-              43589,
-              43569,
-              43582,
-              43560,
-              43591,
-              43591,
-              43573,
-              43569,
-              43577,
-              43601,
-              43580,
-              43583,
-              43577,
-              43558,
-              43553,
-              43610,
-              43569,
-              43580,
-              43540,
-              43581,
-              43581,
-              43596,
-              43603,
-              43595,
-              43603,
-              43589,
-              43551,
-              43577,
-              43585,
-              43584,
-              43553,
-              43589,
-              43587,
-              43609,
-              43605,
-              43578,
-              43599,
-              43601,
-              43593,
-              43600,
-              43605,
-              43593,
-              43583,
-              43601,
-              43600,
-              43594,
-              43577,
-              43553,
-              43585,
-              43592,
-              43561,
-              43574,
-              43573,
-              43575,
-              43551,
-              43547,
-              43573,
-              43585,
-              43538,
-              43571,
-              43583,
-              43593,
-              43567,
-              43598,
-              43585,
-              43569,
-              43591,
-              43601,
-              43573,
-              43564,
-              43551,
-              43568,
-              43559,
-              43537,
-              43545,
-              43533,
-              43537,
-              43529,
-              43533,
-              43558,
-              43511,
-              43523,
-              43545,
-              43569,
-              43549,
-              43549,
-              43565,
-              43567,
-              43539,
-              43537,
-              43547,
-              43539,
-              43549,
-              43594,
-              43577,
-              43549,
-              43543,
-              43567,
-              43576,
-              43555,
-              43567,
-              43547,
-              43597,
-              43543,
-              43545,
-              43553,
-              43553,
-              43545,
-              43575,
-              43547,
-              43573,
-              43553,
-              43567,
-              43567,
-              43526,
-              43553,
-              43557,
-              43557,
-              43567,
-              43596,
-              43565,
-              43581,
-              43561,
-              43544,
-              43575,
-              43531,
-              43537,
-              43571,
-              43573,
-              43580,
-              43569,
-              43580,
-              43608,
-              43563,
-              43584,
-              43560,
-              43575,
-              43601,
-              43571,
-              43583,
-              43545,
-              43570,
-              43589,
-              43552,
-              43589,
-              43593,
-              43581,
-              43583,
-              43583,
-              43567,
-              43630,
-              43617,
-              43552,
-              43568,
-              43580,
-              43593,
-              43584,
-              43569,
-              43592,
-              43595,
-              43587,
-              43585,
-              43571,
-              43593,
-              43584,
-              43598,
-              43581,
-              43597,
-              43613,
-              43592,
-              43595,
-              43567,
-              43568,
-              43574,
-              43577,
-              43601,
-              43600,
-              43591,
-              43578,
-              43605,
-              43593,
-              43555,
-              43604,
-              43593,
-              43599,
-              43585,
-              43581,
-              43598,
-              43551,
-              43579,
-              43565,
-              43569,
-              43566,
-              43585,
-              43601,
-              43559,
-              43589,
-              43585,
-              43545,
-              43591,
-              43567,
-              43575,
-              43579,
-              43565,
-              43541,
-              43612,
-              43591,
-              43573,
-              43593,
-              43559,
-              43593,
-              43613,
-              43579,
-              43611,
-              43577,
-              43585,
-              43574,
-              43587,
-              43585,
-              43601,
-              43573,
-              43557,
-              43585,
-              43565,
-              43593,
-              43568,
-              43581,
-              43590,
-              43601,
-              43585,
-              43611,
-              43572,
-              43590,
-              43545,
-              43583,
-              43596,
-              43596,
-              43585,
-              43564,
-              43599,
-              43606,
-              43601,
-              43589,
-              43606,
-              43581,
-              43591,
-              43591,
-              43583,
-              43575,
-              43595,
-              43596,
-              43616,
-              43583,
-              43615,
-              43598,
-              43581,
-              43579,
-              43592,
-              43591,
-              43568,
-              43585,
-              43616,
-              43579,
-              43601,
-              43601,
-              43577,
-              43601,
-              43579,
-              43590,
-              43617,
-              43599,
-              43567,
-              43596,
-              43595,
-              43601,
-              43607,
-              43581,
-              43611,
-              43599,
-              43593,
-              43605,
-              43617,
-              43601,
-              43620,
-              43627,
-              43588,
-              43569,
-              43624,
-              43605,
-              43608,
-              43604,
-              43607,
-              43595,
-              43580,
-              43604,
-              43603,
-              43593,
-              43604,
-              43609,
-              43596,
-              43575,
-              43601,
-              43609,
-              43571,
-              43591,
-              43617,
-              43560,
-              43577,
-              43563,
-              43573,
-              43565,
-              43576,
-              43592,
-              43583,
-              43603,
-              43577,
-              43593,
-              43592,
-              43628,
-              43617,
-              43570,
-              43557,
-              43588,
-              43591,
-              43575,
-              43588,
-              43581,
-              43589,
-              43597,
-              43601,
-              43589,
-              43617,
-              43588,
-              43592,
-              43569,
-              43576,
-              43575,
-              43592,
-              43561,
-              43581,
-              43594,
-              43580,
-              43582,
-              43585,
-              43568,
-              43583,
-              43601,
-              43605,
-              43582,
-              43581,
-              43599,
-              43611,
-              43585,
-              43585,
-              43581,
-              43579,
-              43594,
-              43600,
-              43577,
-              43612,
-              43620,
-              43597,
-              43591,
-              43569,
-              43582,
-              43590,
-              43585,
-              43583,
-              43580,
-              43585,
-              43592,
-              43561,
-              43569,
-              43585,
-              43583,
-              43604,
-              43593,
-              43597,
-              43553,
-              43583,
-              43557,
-              43582,
-              43588,
-              43609,
-              43581,
-              43617,
-              43580,
-              43594,
-              43599,
-              43589,
-              43608,
-              43582,
-              43601,
-              43588,
-              43595,
-              43588,
-              43601,
-              43595,
-              43608,
-              43590,
-              43605,
-              43601,
-              43560,
-              43588,
-              43576,
-              43581,
-              43593,
-              43578,
-              43564,
-              43568,
-              43544,
-              43566,
-              43550,
-              43569,
-              43552,
-              43579,
-              43553,
-              43557,
-              43537,
-              43571,
-              43557,
-              43566,
-              43605,
-              43552,
-              43565,
-              43569,
-              43585,
-              43583,
-              43583,
-              43602,
-              43581,
-              43567,
-              43574,
-              43589,
-              43594,
-              43589,
-              43545,
-              43581,
-              43568,
-              43539,
-              43585,
-              43605,
-              43577,
-              43599,
-              43595,
-              43597,
-              43601,
-              43617,
-              43633,
-              43605,
-              43553,
-              43547,
-              43598,
-              43559,
-              43597,
-              43584,
-              43571,
-              43567,
-              43589,
-              43581,
-              43596,
-              43581,
-              43553,
-              43603,
-              43579,
-              43584,
-              43601,
-              43583,
-              43623,
-              43579,
-              43599,
-              43583,
-              43617,
-              43600,
-              43609,
-              43569,
-              43597,
-              43628,
-              43583,
-              43589,
-              43589,
-              43573,
-              43578,
-              43565,
-              43564,
-              43607,
-              43627,
-              43590,
-              43607,
-              43601,
-              43606,
-              43605,
-              43575,
-              43575,
-              43588,
-              43583,
-              43587,
-              43576,
-              43585,
-              43597,
-              43593,
-              43571,
-              43557,
-              43573,
-              43572,
-              43573,
-              43579,
-              43589,
-              43560,
-              43601,
-              43578,
-              43577,
-              43605,
-              43607,
-              43649,
-              43612,
-              43578,
-              43577,
-              43577,
-              43569,
-              43601,
-              43571,
-              43579,
-              43593,
-              43569,
-              43551,
-              43585,
-              43557,
-              43593,
-              43578,
-              43561,
-              43549,
-              43557,
-              43571,
-              43598,
-              43567,
-              43561,
-              43573,
-              43582,
-              43601,
-              43616,
-              43574,
-              43601,
-              43590,
-              43617,
-              43585,
-              43603,
-              43543,
-              43577,
-              43599,
-              43571,
-              43549,
-              43589,
-              43569,
-              43583,
-              43587,
-              43601,
-              43583,
-              43596,
-              43603,
-              43606,
-              43574,
-              43605,
-              43594,
-              43621,
-              43601,
-              43585,
-              43576,
-              43607,
-              43583,
-              43593,
-              43559,
-              43581,
-              43591,
-              43591,
-              43584,
-              43579,
-              43553,
-              43577,
-              43606,
-              43623,
-              43615,
-              43563,
-              43589,
-              43569,
-              43575,
-              43584,
-              43582,
-              43577,
-              43588,
-              43563,
-              43585,
-              43603,
-              43605,
-              43592,
-              43601,
-              43602,
-              43616,
-              43583,
-              43573,
-              43617,
-              43615,
-              43582,
-              43584,
-              43581,
-              43583,
-              43591,
-              43593,
-              43625,
-              43608,
-              43573,
-              43579,
-              43593,
-              43591,
-              43600,
-              43609,
-              43585,
-              43593,
-              43575,
-              43600,
-              43598,
-              43601,
-              43569,
-              43580,
-              43589,
-              43583,
-              43597,
-              43595,
-              43601,
-              43593,
-              43601,
-              43589,
-              43585,
-              43585,
-              43606,
-              43591,
-              43581,
-              43572,
-              43576,
-              43573,
-              43572,
-              43552,
-              43505,
-              43553,
-              43583,
-              43573,
-              43590,
-              43601,
-              43604,
-              43565,
-              43569,
-              43577,
-              43591,
-              43630,
-              43609,
-              43576,
-              43567,
-              43593,
-              43584,
-              43622,
-              43572,
-              43579,
-              43596,
-              43621,
-              43581,
-              43565,
-              43603,
-              43563,
-              43569,
-              43565,
-              43594,
-              43558,
-              43548,
-              43567,
-              43583,
-              43540,
-              43577,
-              43571,
-              43581,
-              43563,
-              43561,
-              43561,
-              43600,
-              43585,
-              43579,
-              43603,
-              43624,
-              43588,
-              43580,
-              43597,
-              43609,
-              43585,
-              43605,
-              43597,
-              43596,
-              43581,
-              43601,
-              43597,
-              43603,
-              43575,
-              43560,
-              43547,
-              43576,
-              43579,
-              43584,
-              43612,
-              43579,
-              43595,
-              43566,
-              43556,
-              43567,
-              43551,
-              43585,
-              43584,
-              43575,
-              43611,
-              43581,
-              43592,
-              43576,
-              43616,
-              43576,
-              43575,
-              43592,
-              43587,
-              43593,
-              43558,
-              43592,
-              43572,
-              43589,
-              43569,
-              43599,
-              43577,
-              43600,
-              43597,
-              43565,
-              43566,
-              43568,
-              43591,
-              43565,
-              43549,
-              43569,
-              43568,
-              43584,
-              43561,
-              43585,
-              43557,
-              43594,
-              43585,
-              43585,
-              43575,
-              43571,
-              43575,
-              43629,
-              43559,
-              43585,
-              43569,
-              43577,
-              43615,
-              43573,
-              43574,
-              43579,
-              43569,
-              43563,
-              43577,
-              43558,
-              43565,
-              43585,
-              43595,
-              43580,
-              43575,
-              43600,
-              43569,
-              43591,
-              43569,
-              43582,
-              43575,
-              43609,
-              43551,
-              43589,
-              43589,
-              43569,
-              43585,
-              43590,
-              43601,
-              43567,
-              43613,
-              43585,
-              43572,
-              43572,
-              43605,
-              43583,
-              43617,
-              43597,
-              43617,
-              43569,
-              43580,
-              43593,
-              43585,
-              43561,
-              43597,
-              43581,
-              43593,
-              43604,
-              43583,
-              43603,
-              43588,
-              43612,
-              43613,
-              43587,
-              43569,
-              43561,
-              43573,
-              43600,
-              43589,
-              43593,
-              43577,
-              43581,
-              43577,
-              43577,
-              43603,
-              43591,
-              43573,
-              43585,
-              43583,
-              43563,
-              43561,
-              43579,
-              43607,
-              43587,
-              43585,
-              43576,
-              43585,
-              43595,
-              43591,
-              43603,
-              43592,
-              43615,
-              43588,
-              43591,
-              43610,
-              43593,
-              43585,
-              43597,
-              43589,
-              43598,
-              43604,
-              43603,
-              43601,
-              43583,
-              43574,
-              43595,
-              43597,
-              43592,
-              43585,
-              43592,
-              43567,
-              43553,
-              43569,
-              43553,
-              43593,
-              43564,
-              43570,
-              43578,
-              43587,
-              43566,
-              43592,
-              43573,
-              43585,
-              43593,
-              43585,
-              43573,
-              43569,
-              43545,
-              43567,
-              43566,
-              43585,
-              43574,
-              43577,
-              43585,
-              43571,
-              43601,
-              43552,
-              43557,
-              43581,
-              43577,
-              43584,
-              43576,
-              43574,
-              43571,
-              43577,
-              43544,
-              43577,
-              43601,
-              43581,
-              43593,
-              43587,
-              43580,
-              43566,
-              43585,
-              43549,
-              43577,
-              43581,
-              43571,
-              43553,
-              43557,
-              43567,
-              43577,
-              43561,
-              43525,
-              43557,
-              43575,
-              43557,
-              43553,
-              43558,
-              43535,
-              43593,
-              43550,
-              43567,
-              43551,
-              43581,
-              43575,
-              43550,
-              43577,
-              43574,
-              43583,
-              43588,
-              43563,
-              43571,
-              43597,
-              43575,
-              43596,
-              43569,
-              43577,
-              43605,
-              43561,
-              43591,
-              43545,
-              43557,
-              43587,
-              43537,
-              43564,
-              43555,
-              43577,
-              43611,
-              43573,
-              43577,
-              43579,
-              43570,
-              43559,
-              43577,
-              43569,
-              43560,
-              43595,
-              43593,
-              43585,
-              43580,
-              43585,
-              43595,
-              43573,
-              43605,
-              43560,
-              43599,
-              43576,
-              43585,
-              43588,
-              43574,
-              43551,
-              43579,
-              43577,
-              43565,
-              43585,
-              43583,
-              43571,
-              43557,
-              43568,
-              43552,
-              43583,
-              43599,
-              43572,
-              43575,
-              43571,
-              43588,
-              43536,
-              43561,
-              43593,
-              43580,
-              43547,
-              43569,
-              43589,
-              43590,
-              43579,
-              43585,
-              43617,
-              43571,
-              43598,
-              43594,
-              43605,
-              43561,
-              43593,
-              43582,
-              43601,
-              43576,
-              43569,
-              43584,
-              43569,
-              43577,
-              43563,
-              43553,
-              43580,
-              43582,
-              43559,
-              43567,
-              43563,
-              43605,
-              43560,
-              43568,
-              43587,
-              43596,
-              43579,
-              43575,
-              43610,
-              43561,
-              43585,
-              43585,
-              43571,
-              43561,
-              43596,
-              43609,
-              43601,
-              43601,
-              43607,
-              43581,
-              43560,
-              43585,
-              43577,
-              43593,
-              43577,
-              43564,
-              43564,
-              43571,
-              43576,
-              43597,
-              43569,
-              43583,
-              43555,
-              43537,
-              43577,
-              43572,
-              43577,
-              43574,
-              43581,
-              43565,
-              43571,
-              43583,
-              43565,
-              43591,
-              43573,
-              43585,
-              43613,
-              43583,
-              43583,
-              43601,
-              43609,
-              43611,
-              43597,
-              43569,
-              43589,
-              43572,
-              43597,
-              43592,
-              43584,
-              43577,
-              43584,
-              43583,
-              43579,
-              43592,
-              43568,
-              43584,
-              43603,
-              43593,
-              43589,
-              43579,
-              43572,
-              43611,
-              43628,
-              43592,
-              43581,
-              43591,
-              43573,
-              43604,
-              43574,
-              43571,
-              43573,
-              43593,
-              43563,
-              43605,
-              43598,
-              43603,
-              43561,
-              43585,
-              43580,
-              43545,
-              43553,
-              43591,
-              43601,
-              43605,
-              43592,
-              43596,
-              43612,
-              43545,
-              43611,
-              43577,
-              43567,
-              43627,
-              43601,
-              43611,
-              43601,
-              43619,
-              43588,
-              43625,
-              43585,
-              43606,
-              43593,
-              43617,
-              43627,
-              43593,
-              43592,
-              43617,
-              43617,
-              43588,
-              43585,
-              43628,
-              43591,
-              43621,
-              43601,
-              43599,
-              43627,
-              43633,
-              43597,
-              43601,
-              43611,
-              43585,
-              43602,
-              43582,
-              43585,
-              43594,
-              43601,
-              43597,
-              43591,
-              43593,
-              43614,
-              43611,
-              43609,
-              43573,
-              43615,
-              43573,
-              43601,
-              43637,
-              43632,
-              43601,
-              43603,
-              43589,
-              43615,
-              43631,
-              43597,
-              43585,
-              43573,
-              43579,
-              43581,
-              43583,
-              43561,
-              43569,
-              43617,
-              43591,
-              43573,
-              43584,
-              43596,
-              43592,
-              43607,
-              43585,
-              43591,
-              43588,
-              43595,
-              43593,
-              43569,
-              43580,
-              43597,
-              43585,
-              43585,
-              43593,
-              43596,
-              43583,
-              43577,
-              43611,
-              43602,
-              43596,
-              43573,
-              43597,
-              43603,
-              43585,
-              43587,
-              43600,
-              43592,
-              43581,
-              43591,
-              43595,
-              43600,
-              43581,
-              43581,
-              43585,
-              43583,
-              43569,
-              43582,
-              43591,
-              43585,
-              43593,
-              43572,
-              43607,
-              43590,
-              43604,
-              43588,
-              43567,
-              43611,
-              43603,
-              43590,
-              43633,
-              43606,
-              43604,
-              43582,
-              43584,
-              43605,
-              43595,
-              43563,
-              43607,
-              43601,
-              43605,
-              43595,
-              43603,
-              43593,
-              43592,
-              43611,
-              43557,
-              43565,
-              43573,
-              43600,
-              43584,
-              43595,
-              43585,
-              43600,
-              43575,
-              43583,
-              43580,
-              43565,
-              43581,
-              43569,
-              43601,
-              43585,
-              43584,
-              43597,
-              43572,
-              43591,
-              43593,
-              43563,
-              43593,
-              43607,
-              43541,
-              43603,
-              43578,
-              43617,
-              43573,
-              43596,
-              43596,
-              43625,
-              43595,
-              43527,
-              43608,
-              43585,
-              43603,
-              43577,
-              43585,
-              43571,
-              43595,
-              43601,
-              43571,
-              43592,
-              43573,
-              43585,
-              43593,
-              43607,
-              43603,
-              43565,
-              43596,
-              43540,
-              43597,
-              43583,
-              43580,
-              43589,
-              43580,
-              43561,
-              43553,
-              43585,
-              43590,
-              43557,
-              43598,
-              43585,
-              43569,
-              43608,
-              43595,
-              43607,
-              43578,
-              43585,
-              43583,
-              43565,
-              43576,
-              43557,
-              43564,
-              43557,
-              43569,
-              43577,
-              43565,
-              43571,
-              43593,
-              43585,
-              43573,
-              43611,
-              43601,
-              43577,
-              43601,
-              43573,
-              43553,
-              43571,
-              43559,
-              43585,
-              43576,
-              43590,
-              43585,
-              43564,
-              43585,
-              43559,
-              43581,
-              43576,
-              43585,
-              43575,
-              43583,
-              43593,
-              43584,
-              43581,
-              43601,
-              43600,
-              43601,
-              43580,
-              43590,
-              43581,
-              43584,
-              43573,
-              43579,
-              43553,
-              43593
-            ]
-          },
-          {
-            "time": 1579894204819,
-            "label": "PAM",
-            "light_intensity": 14.4,
-            "r": 63.8,
-            "g": 32,
-            "b": 18.4,
-            "w": 109.2,
-            "temperature": 23.7,
-            "humidity": 35.835,
-            "pressure": 979.568,
-            "temperature2": 23.81,
-            "humidity2": 34.436,
-            "pressure2": 979.867,
-            "contactless_temp": 24.33,
-            "thickness": 0.3,
-            "compass_direction": "??",
-            "compass": -1,
-            "angle": 2.324,
-            "pitch": 2.32,
-            "roll": 0.18,
-            "data_raw": [
-              1264,
-              43622,
-              1261,
-              43581,
-              1262,
-              43577,
-              1262,
-              43601,
-              1264,
-              43600,
-              1264,
-              43574,
-              1266,
-              43601,
-              1261,
-              43597,
-              1262,
-              43592,
-              1268,
-              43598,
-              1267,
-              43561,
-              1262,
-              43596,
-              1262,
-              43611,
-              1263,
-              43619,
-              1266,
-              43604,
-              1266,
-              43611,
-              1262,
-              43590,
-              1269,
-              43617,
-              1269,
-              43614,
-              1268,
-              43596,
-              1264,
-              43585,
-              1267,
-              43608,
-              1267,
-              43629,
-              1265,
-              43548,
-              1270,
-              43601,
-              1272,
-              43571,
-              1266,
-              43581,
-              1266,
-              43629,
-              1270,
-              43599,
-              1269,
-              43577,
-              1265,
-              43609,
-              1268,
-              43632,
-              1270,
-              43598,
-              1270,
-              43585,
-              1266,
-              43579,
-              1269,
-              43603,
-              1271,
-              43596,
-              1270,
-              43611,
-              1266,
-              43611,
-              1266,
-              43597,
-              1272,
-              43565,
-              1274,
-              43601,
-              1269,
-              43615,
-              1269,
-              43627,
-              1276,
-              43613,
-              1273,
-              43630,
-              1269,
-              43603,
-              1267,
-              43591,
-              1273,
-              43641,
-              1276,
-              43620,
-              1274,
-              43601,
-              1268,
-              43567,
-              1270,
-              43591,
-              1276,
-              43581,
-              1275,
-              43607,
-              1271,
-              43581,
-              1269,
-              43585,
-              1278,
-              43607,
-              1274,
-              43581,
-              1269,
-              43585,
-              1274,
-              43585,
-              1276,
-              43583,
-              1276,
-              43625,
-              1276,
-              43579,
-              1269,
-              43573,
-              1270,
-              43589,
-              1275,
-              43620,
-              1273,
-              43595,
-              1270,
-              43596,
-              1277,
-              43589,
-              1274,
-              43591,
-              1276,
-              43581,
-              1269,
-              43581,
-              1276,
-              43601,
-              1278,
-              43595,
-              1277,
-              43579,
-              1274,
-              43573,
-              1274,
-              43583,
-              1278,
-              43617,
-              1278,
-              43633,
-              1273,
-              43608,
-              1272,
-              43597,
-              1278,
-              43585,
-              1276,
-              43579,
-              1275,
-              43585,
-              1277,
-              43577,
-              1276,
-              43592,
-              1272,
-              43563,
-              1278,
-              43614,
-              1278,
-              43603,
-              1278,
-              43547,
-              1272,
-              43608,
-              1274,
-              43613,
-              1282,
-              43613,
-              1277,
-              43600,
-              1272,
-              43597,
-              1273,
-              43601,
-              1280,
-              43616,
-              1279,
-              43594,
-              1275,
-              43603,
-              3330,
-              43733,
-              3682,
-              43467,
-              3766,
-              43431,
-              3786,
-              43405,
-              3796,
-              43416,
-              3806,
-              43419,
-              3807,
-              43391,
-              3808,
-              43407,
-              3809,
-              43377,
-              3813,
-              43397,
-              3808,
-              43415,
-              3805,
-              43385,
-              3815,
-              43411,
-              3813,
-              43456,
-              3810,
-              43401,
-              3807,
-              43393,
-              3810,
-              43416,
-              3810,
-              43415,
-              3809,
-              43400,
-              3814,
-              43409,
-              3806,
-              43379,
-              3804,
-              43411,
-              3804,
-              43393,
-              3809,
-              43425,
-              3810,
-              43393,
-              3805,
-              43366,
-              3810,
-              43388,
-              3809,
-              43408,
-              3804,
-              43375,
-              3808,
-              43365,
-              3821,
-              43365,
-              3823,
-              43361,
-              3817,
-              43401,
-              3819,
-              43384,
-              3824,
-              43359,
-              3821,
-              43385,
-              3819,
-              43367,
-              3819,
-              43365,
-              3820,
-              43371,
-              3821,
-              43388,
-              3824,
-              43345,
-              3817,
-              43313,
-              3822,
-              43361,
-              3818,
-              43345,
-              3817,
-              43348,
-              3834,
-              43329,
-              3829,
-              43311,
-              3834,
-              43345,
-              3832,
-              43383,
-              3834,
-              43329,
-              3824,
-              43337,
-              3828,
-              43365,
-              3828,
-              43329,
-              3830,
-              43344,
-              3831,
-              43351,
-              3833,
-              43356,
-              3826,
-              43367,
-              3825,
-              43339,
-              3833,
-              43325,
-              3834,
-              43339,
-              3830,
-              43353,
-              3831,
-              43289,
-              3831,
-              43312,
-              3825,
-              43322,
-              3822,
-              43317,
-              3830,
-              43292,
-              3829,
-              43319,
-              3830,
-              43313,
-              3830,
-              43300,
-              3829,
-              43282,
-              3824,
-              43345,
-              3825,
-              43303,
-              3832,
-              43281,
-              3826,
-              43311,
-              3825,
-              43313,
-              3818,
-              43297,
-              3816,
-              43309,
-              3818,
-              43288,
-              3818,
-              43277,
-              3818,
-              43303,
-              3818,
-              43281,
-              3818,
-              43325,
-              3813,
-              43258,
-              3815,
-              43291,
-              3814,
-              43333,
-              3816,
-              43318,
-              3817,
-              43313,
-              3818,
-              43317,
-              3818,
-              43289,
-              3816,
-              43281,
-              3520,
-              43325,
-              3046,
-              43397,
-              2662,
-              43473,
-              2356,
-              43524,
-              2122,
-              43533,
-              1941,
-              43539,
-              1809,
-              43590,
-              1722,
-              43531,
-              1649,
-              43583,
-              1596,
-              43583,
-              1556,
-              43578,
-              1526,
-              43591,
-              1504,
-              43605,
-              1486,
-              43603,
-              1472,
-              43592,
-              1697,
-              43283,
-              1597,
-              43337,
-              1549,
-              43345,
-              1498,
-              43361,
-              1455,
-              43357,
-              1416,
-              43409,
-              1390,
-              43423,
-              1367,
-              43456,
-              1346,
-              43455,
-              1321,
-              43472,
-              1304,
-              43461,
-              1293,
-              43457,
-              1279,
-              43462,
-              1271,
-              43464,
-              1265,
-              43489,
-              1249,
-              43951,
-              3371,
-              43595,
-              3641,
-              43409,
-              3739,
-              43323,
-              3776,
-              43341,
-              3787,
-              43355,
-              3794,
-              43321,
-              3800,
-              43319,
-              3798,
-              43318,
-              3799,
-              43346,
-              3796,
-              43321,
-              3801,
-              43294,
-              3801,
-              43335,
-              3790,
-              43341,
-              3797,
-              43311,
-              3798,
-              43337,
-              3791,
-              43319,
-              3793,
-              43318,
-              3793,
-              43333,
-              3785,
-              43329,
-              3786,
-              43309,
-              3791,
-              43297,
-              3789,
-              43295,
-              3790,
-              43331,
-              3785,
-              43347,
-              3785,
-              43313,
-              3792,
-              43301,
-              3783,
-              43329,
-              3786,
-              43297,
-              3788,
-              43304,
-              3818,
-              43288,
-              3817,
-              43300,
-              3819,
-              43287,
-              3817,
-              43277,
-              3817,
-              43285,
-              3814,
-              43301,
-              3820,
-              43311,
-              3816,
-              43265,
-              3819,
-              43267,
-              3814,
-              43257,
-              3819,
-              43287,
-              3817,
-              43285,
-              3817,
-              43297,
-              3817,
-              43284,
-              3817,
-              43309,
-              3817,
-              43281,
-              3814,
-              43328,
-              3810,
-              43291,
-              3809,
-              43281,
-              3806,
-              43333,
-              3809,
-              43297,
-              3809,
-              43271,
-              3805,
-              43321,
-              3809,
-              43351,
-              3810,
-              43297,
-              3810,
-              43308,
-              3810,
-              43297,
-              3805,
-              43317,
-              3803,
-              43281,
-              3806,
-              43297,
-              3795,
-              43281,
-              3785,
-              43297,
-              3787,
-              43289,
-              3781,
-              43295,
-              3783,
-              43311,
-              3784,
-              43329,
-              3780,
-              43305,
-              3778,
-              43334,
-              3788,
-              43313,
-              3781,
-              43319,
-              3776,
-              43317,
-              3785,
-              43340,
-              3776,
-              43341,
-              3784,
-              43321,
-              3782,
-              43337,
-              1585,
-              43265,
-              3640,
-              43372,
-              3548,
-              43437,
-              3469,
-              43401,
-              3406,
-              43449,
-              3336,
-              43477,
-              3273,
-              43477,
-              3219,
-              43467,
-              3161,
-              43512,
-              3099,
-              43500,
-              3040,
-              43481,
-              2986,
-              43487,
-              2936,
-              43485,
-              2891,
-              43496,
-              2838,
-              43541
-            ]
-          },
-          {
-            "time": 1579894211290,
-            "label": "SPAD",
-            "absorbance": [
-              [
-                7411,
-                9435,
-                -40,
-                0.104365,
-                2,
-                3,
-                0
-              ],
-              [
-                65535,
-                9067,
-                0,
-                -0.85901,
-                6,
-                1,
-                0
-              ]
-            ],
-            "spad": [
-              42.726,
-              37.157,
-              -40,
-              6.93
-            ],
-            "light_intensity": 11.415,
-            "r": 53,
-            "g": 25,
-            "b": 15,
-            "w": 88,
-            "temperature": 23.81,
-            "humidity": 35.854,
-            "pressure": 979.581,
-            "temperature2": 23.94,
-            "humidity2": 34.358,
-            "pressure2": 979.884,
-            "contactless_temp": 23.81,
-            "thickness": 0.29,
-            "compass_direction": "??",
-            "compass": -1,
-            "angle": 2.407,
-            "pitch": 2.32,
-            "roll": 0.65,
-            "data_raw": [
-
-            ]
-          }
-        ],
-        "data_raw": [
-
-        ]
-      }
-    ]
-  ],
-  "app_os": "macOS 18.7.0",
-  "app_name": "PhotosynQ",
-  "app_version": "1.6.11",
-  "app_device": "x64",
-  "location": False,
-  "time_offset": "America/Detroit"
-}
\ No newline at end of file
+def analyze_many ( samples, chunksize=1024 ):
+  """
+  Analyze many RIDES samples. The ECS and P700 DIRK decays of the
+  samples are fitted together (in chunks), using vectorized
+  Levenberg-Marquardt iterations instead of one fit per sample, and the
+  PAM fluorescence and PSI parameters are calculated for the chunk at
+  once (see ``analyze_pam`` and ``analyze_psi``).
+
+  The decays are fitted with ``fit_exponential_lm`` instead of the grid
+  search of ``fit_exponential`` used by ``_analyze``. The fitted values
+  agree to about 1e-6 (relative), so the rounded ECS and P700 results are
+  usually the same, but can differ in the last digit. A fit at the limit
+  of convergence can converge with one fitter and not the other, in which
+  case the ECS or P700 results are only returned by one of them.
+  All other calculations are the same as for ``_analyze``, including
+  errors being raised. Use ``analyze_batch`` to keep errors and warnings
+  per sample.
+
+  :param samples: Samples as passed to ``_analyze``
+  :type samples: iterable of dict
+  :param chunksize: Number of samples fitted at once
+  :type chunksize: int
+
+  :return: Generator of the outputs, in the same order as the samples
+  :rtype: generator of dict
+  """
+  t = np.arange(20) * 1.5
+  samples = iter(samples)
+
+  while True:
+    chunk = list(islice(samples, chunksize))
+    if len(chunk) == 0:
+      break
+
+    ## Samples where the traces can't be calculated are analyzed on their own
+    traces = {}
+    for idx, sample in enumerate(chunk):
+      try:
+        ECS_trace, P700_trace = _dirk_traces(analysis.basic.GetProtocolByLabel("DIRK_ECS", sample),
+                                             analysis.basic.GetProtocolByLabel("DIRK_P700", sample))
+        traces[idx] = (ECS_trace[100:120], P700_trace[100:120])
+      except Exception:
+        continue
+
+    fits = {}
+    if len(traces) > 0:
+      ECS_fits = fit_exponential_lm(t, np.array([ecs for ecs, _ in traces.values()]))
+      P700_fits = fit_exponential_lm(t, np.array([p700 for _, p700 in traces.values()]))
+      for i, idx in enumerate(traces):
+        fits[idx] = (tuple(v[i] for v in ECS_fits), tuple(v[i] for v in P700_fits))
+
+    ## PAM traces with the same length are analyzed together
+    pam_traces = {}
+    for idx, sample in enumerate(chunk):
+      try:
+        data_raw = analysis.basic.GetProtocolByLabel("PAM", sample)['data_raw']
+      except Exception:
+        continue
+      pam_traces.setdefault(len(data_raw), {})[idx] = data_raw
+
+    pam = {}
+    psi = {}
+    for group in pam_traces.values():
+      data_raw = np.array(list(group.values()))
+      for results, analyze in ((pam, analyze_pam), (psi, analyze_psi)):
+        try:
+          parameters = analyze(data_raw)
+        except ValueError:
+          continue
+        for i, idx in enumerate(group):
+          results[idx] = {key: value[i] for key, value in parameters.items()}
+
+    for idx, sample in enumerate(chunk):
+      yield _analyze(sample, fits.get(idx), pam.get(idx), psi.get(idx))
+
+## Example data is stored in the package data and only loaded when accessed
+__getattr__ = lazy_example(__name__)
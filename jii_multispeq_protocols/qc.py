@@ -0,0 +1,100 @@
+"""
+Quality control (QC) flags raised by the analysis of a sample, e.g. when
+a value is outside of the expected range.
+
+Flags are collected per sample when a collector is active (see
+:func:`collect`), which is cheap enough for large batches and keeps every
+flag. Without a collector, e.g. when analyzing a single measurement
+interactively, flags are shown as warnings like before.
+"""
+
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+import threading
+import warnings
+
+## Severity of a flag
+INFO = 'info'
+WARNING = 'warning'
+ERROR = 'error'
+
+QCFlag = namedtuple('QCFlag', ['code', 'message', 'severity', 'value'])
+QCFlag.__doc__ = "Quality control flag with a code, message, severity and the value that was flagged (if any)"
+
+## Code for warnings that were not raised as flags
+WARNING_CODE = 'warning'
+
+_local = threading.local()
+
+def _collectors ():
+  if not hasattr(_local, 'collectors'):
+    _local.collectors = []
+  return _local.collectors
+
+def flag ( code, message, value=None, severity=WARNING ):
+  """
+  Raise a QC flag for the sample that is analyzed. The flag is added to the
+  active collector, or shown as a warning if there is none.
+
+  :param code: Short code to identify the flag (e.g. ``phi2_range``)
+  :type code: str
+  :param message: Message for the user
+  :type message: str
+  :param value: Value that was flagged
+  :type value: float
+  :param severity: Severity (``info``, ``warning`` or ``error``)
+  :type severity: str
+  """
+  collectors = _collectors()
+
+  if collectors:
+    collectors[-1].append(QCFlag(code, message, severity, value))
+  else:
+    warnings.warn(message, stacklevel=2)
+
+@contextmanager
+def collect ():
+  """
+  Collect the QC flags raised within the context instead of showing them
+  as warnings. Collectors can be nested, flags go to the innermost one.
+
+  .. code-block:: python
+
+     with collect() as flags:
+       output = _analyze( sample )
+
+  :return: List that the flags (QCFlag) are added to
+  :rtype: list
+  """
+  flags = []
+  collectors = _collectors()
+  collectors.append(flags)
+
+  try:
+    yield flags
+  finally:
+    ## Removed by identity, as other (empty) collectors compare equal
+    for i in range(len(collectors) - 1, -1, -1):
+      if collectors[i] is flags:
+        del collectors[i]
+        break
+
+def summarize ( flags ):
+  """
+  Count the flags by code, e.g. for all samples of a batch
+
+  :param flags: Flags (QCFlag or codes), or lists of flags (one per sample)
+  :type flags: iterable
+
+  :return: Number of flags for each code
+  :rtype: collections.Counter
+  """
+  counts = Counter()
+
+  for item in flags:
+    if isinstance(item, list):
+      counts.update(f.code if isinstance(f, QCFlag) else f for f in item)
+    else:
+      counts[item.code if isinstance(item, QCFlag) else item] += 1
+
+  return counts
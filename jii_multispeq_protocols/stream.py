@@ -0,0 +1,264 @@
+"""
+Read samples from large measurement exports one at a time and write the
+analysis results as they are produced, so exports don't need to fit into
+memory.
+
+Exports can be a JSON array of measurements, newline delimited JSON (one
+measurement per line) or a single measurement, optionally gzip compressed.
+"""
+
+import gzip
+from itertools import chain
+import json
+
+import numpy as np
+
+from jii_multispeq_protocols.analyze import analysis_module, analyze_batch
+from jii_multispeq_protocols.traces import iter_samples
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER = '0123456789.eE+-'
+
+def _open ( source, mode ):
+  """
+  Open a file path (gzip compressed if it ends with ``.gz``), file objects are used as they are
+  """
+  if not isinstance(source, str):
+    return None
+
+  if source.endswith('.gz'):
+    return gzip.open(source, mode + 't', encoding='utf-8')
+
+  return open(source, mode, encoding='utf-8')
+
+def read_values ( fp, chunk_size=65536 ):
+  """
+  Read JSON values one at a time. If the file contains an array, its
+  elements are returned, otherwise all values in the file (e.g. one per line).
+
+  :param fp: File opened in text mode
+  :type fp: file
+  :param chunk_size: Number of characters read at once
+  :type chunk_size: int
+
+  :return: Generator of values
+  :rtype: generator
+
+  :raises ValueError: if the file is not valid JSON
+  """
+  decoder = json.JSONDecoder()
+  buffer = ''
+  position = 0
+  eof = False
+
+  def more ( size ):
+    nonlocal buffer, position, eof
+    chunk = fp.read(size)
+    if not chunk:
+      eof = True
+    buffer = buffer[position:] + chunk
+    position = 0
+
+  def next_char ():
+    """
+    Skip the whitespace and return the next character (None at the end of the file)
+    """
+    nonlocal position
+    while True:
+      while position < len(buffer) and buffer[position] in _WHITESPACE:
+        position += 1
+      if position < len(buffer):
+        return buffer[position]
+      if eof:
+        return None
+      more(chunk_size)
+
+  def decode ():
+    """
+    Decode the next value, reading more if it is not complete yet
+    """
+    nonlocal position
+    size = chunk_size
+    while True:
+      try:
+        value, end = decoder.raw_decode(buffer, position)
+      except json.JSONDecodeError as e:
+        if eof:
+          raise ValueError("Invalid JSON (%s)" % e) from None
+        more(max(size, len(buffer)))
+        size *= 2
+        continue
+
+      ## A number at the end of the buffer might continue in the next chunk
+      if not eof and not isinstance(value, (dict, list, str)) and (end == len(buffer) or buffer[end] in _NUMBER):
+        more(size)
+        continue
+
+      position = end
+      return value
+
+  char = next_char()
+
+  ## Values one after the other (e.g. one per line)
+  if char != '[':
+    while char is not None:
+      yield decode()
+      char = next_char()
+    return
+
+  ## Elements of an array, separated by exactly one comma
+  position += 1
+  char = next_char()
+
+  if char != ']':
+    while True:
+      if char is None:
+        raise ValueError("Invalid JSON (array is not closed)")
+      yield decode()
+
+      char = next_char()
+      if char == ']':
+        break
+      if char != ',':
+        raise ValueError("Invalid JSON (expected ',' or ']' in array, got %s)" % ('end of file' if char is None else repr(char)))
+
+      position += 1
+      char = next_char()
+      if char == ']':
+        raise ValueError("Invalid JSON (expected a value after ',')")
+
+  ## Only whitespace is allowed after the array
+  position += 1
+  char = next_char()
+  if char is not None:
+    raise ValueError("Invalid JSON (extra data after the array: %s)" % repr(char))
+
+def read_samples ( source, chunk_size=65536 ):
+  """
+  Read the samples of a measurement export one at a time, unpacking the
+  measurements and the nested lists the samples are stored in.
+
+  :param source: File path (gzip compressed if it ends with ``.gz``) or file opened in text mode
+  :type source: str or file
+  :param chunk_size: Number of characters read at once
+  :type chunk_size: int
+
+  :return: Generator of samples, as passed to ``_analyze``
+  :rtype: generator of dict
+
+  :raises ValueError: if the file is not valid JSON
+  """
+  fp = _open(source, 'r')
+
+  if fp is None:
+    yield from iter_samples(read_values(source, chunk_size))
+    return
+
+  with fp:
+    yield from iter_samples(read_values(fp, chunk_size))
+
+def _to_json ( value ):
+  """
+  Convert numpy values when writing results
+  """
+  if isinstance(value, np.ndarray):
+    return value.tolist()
+  if isinstance(value, np.generic):
+    return value.item()
+  raise TypeError("Object of type %s is not JSON serializable" % type(value).__name__)
+
+class ResultWriter:
+    """
+    Write results one at a time, either as newline delimited JSON or as a
+    JSON array. Use as a context manager, so the file is completed when done.
+
+    :param destination: File path (gzip compressed if it ends with ``.gz``) or file opened in text mode
+    :type destination: str or file
+    :param array: Write a JSON array instead of one result per line
+    :type array: bool
+    """
+    def __init__(self, destination, array: bool = False):
+        self.own = isinstance(destination, str)
+        self.fp = _open(destination, 'w') if self.own else destination
+        self.array = array
+        self.count = 0
+
+    def write(self, result):
+        """
+        Write a single result
+
+        Args:
+            result: JSON serializable result (numpy values are converted)
+        """
+        line = json.dumps(result, default=_to_json)
+
+        if self.array:
+            self.fp.write(('[\n' if self.count == 0 else ',\n') + line)
+        else:
+            self.fp.write(line + '\n')
+
+        self.count += 1
+
+    def close(self, complete=True):
+        """
+        Complete the file and close it, if it was opened by the writer
+
+        Args:
+            complete: Close the JSON array, otherwise it is left open (e.g. after an error), so the file isn't valid JSON
+        """
+        if self.array and complete:
+            self.fp.write('[]\n' if self.count == 0 else '\n]\n')
+        self.array = False
+
+        if self.own:
+            self.fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        ## An array is only completed if all results were written
+        self.close(complete=exc_type is None)
+
+def analyze_file ( protocol_module=None, source=None, destination=None, workers=None, array=False ):
+  """
+  Analyze all samples of a measurement export and write the results, one
+  sample at a time. Each result contains the sample's index, the analysis
+  output, warnings and error (see :func:`jii_multispeq_protocols.analyze.analyze_batch`).
+
+  :param protocol_module: Protocol module or its name (e.g. ``phi2``)
+  :type protocol_module: module or str
+  :param source: Export file path or file
+  :type source: str or file
+  :param destination: Results file path or file
+  :type destination: str or file
+  :param workers: Number of processes to use
+  :type workers: int
+  :param array: Write a JSON array instead of one result per line
+  :type array: bool
+
+  :return: Number of samples analyzed
+  :rtype: int
+
+  :raises ValueError: if no protocol, source or destination is provided, the protocol has no analysis or the source is not valid JSON
+  """
+  if protocol_module is None:
+    raise ValueError("No protocol provided to analyze")
+
+  if source is None:
+    raise ValueError("No measurement export provided to analyze")
+
+  if destination is None:
+    raise ValueError("No destination provided for the results")
+
+  ## The protocol and source are checked before the destination is created (or overwritten)
+  name = analysis_module(protocol_module)
+  results = analyze_batch(name, read_samples(source), workers)
+  first = next(results, None)
+
+  with ResultWriter(destination, array) as writer:
+    if first is not None:
+      for index, output, warnings, error in chain([first], results):
+        writer.write({"index": index, "output": output, "warnings": warnings, "error": error})
+
+  return writer.count
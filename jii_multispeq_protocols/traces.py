@@ -0,0 +1,262 @@
+"""
+Store the traces (``data_raw``) of many samples in contiguous arrays,
+one per label, instead of Python lists. The store can be saved to a
+directory and loaded as memory-mapped files, so the traces are read as
+views without loading or copying them.
+"""
+
+import json
+import os
+
+import numpy as np
+
+## Key for the traces of samples without a set of protocols
+DATA_RAW = 'data_raw'
+
+INDEX_FILE = 'index.json'
+SAMPLES_FILE = 'samples.json'
+
+def iter_samples ( items ):
+  """
+  Iterate over samples, unpacking measurements (dict with ``sample``)
+  and the nested lists the samples can be stored in.
+
+  :param items: Measurements or samples
+  :type items: iterable of dict
+
+  :return: Generator of samples
+  :rtype: generator of dict
+  """
+  for item in items:
+    if isinstance(item, list):
+      yield from iter_samples(item)
+    elif isinstance(item, dict) and 'sample' in item:
+      yield from iter_samples(item['sample'] if isinstance(item['sample'], list) else [item['sample']])
+    else:
+      yield item
+
+def _trace_key ( protocol, position ):
+  """
+  Key for a trace within a set, the label or the position if there is no label
+  """
+  if 'label' in protocol:
+    return str(protocol['label'])
+  return 'set[%s]' % position
+
+def _as_array ( trace ):
+  """
+  Trace as int32 array, or float64 if the values don't fit
+  """
+  trace = np.asarray(trace)
+
+  if trace.size == 0:
+    return trace.astype(np.int32)
+
+  if trace.dtype.kind in 'iub' and trace.min() >= np.iinfo(np.int32).min and trace.max() <= np.iinfo(np.int32).max:
+    return trace.astype(np.int32)
+
+  return trace.astype(np.float64)
+
+class TraceStore:
+    """
+    Traces of many samples, stored per label as one contiguous array with
+    the start of each trace (offsets) and the sample it belongs to. The
+    remaining content of the samples is kept with references to the traces.
+
+    Use :meth:`from_samples` to create a store and :meth:`load` to open a
+    saved one.
+
+    :param columns: Data, offsets and sample indexes for each label
+    :type columns: dict
+    :param samples: Samples with references instead of the traces
+    :type samples: list
+    """
+    def __init__(self, columns: dict, samples: list):
+        self.columns = columns
+        self.samples = samples
+
+    @classmethod
+    def from_samples(cls, samples):
+        """
+        Create a store from samples
+
+        Args:
+            samples: Samples or measurements (see :func:`iter_samples`)
+
+        Returns:
+            TraceStore
+        """
+        traces = {}
+        stripped = []
+
+        def add(key, trace, index):
+            arrays, owners = traces.setdefault(key, ([], []))
+            arrays.append(_as_array(trace))
+            owners.append(index)
+            return [key, len(arrays) - 1]
+
+        for index, sample in enumerate(iter_samples(samples)):
+            sample = dict(sample)
+
+            if isinstance(sample.get('set'), list):
+                sample['set'] = [dict(protocol) for protocol in sample['set']]
+                for position, protocol in enumerate(sample['set']):
+                    if isinstance(protocol.get('data_raw'), list):
+                        protocol['data_raw'] = {'$trace': add(_trace_key(protocol, position), protocol['data_raw'], index)}
+
+            if isinstance(sample.get('data_raw'), list) and not isinstance(sample.get('set'), list):
+                sample['data_raw'] = {'$trace': add(DATA_RAW, sample['data_raw'], index)}
+
+            stripped.append(sample)
+
+        columns = {}
+        for key, (arrays, owners) in traces.items():
+            dtype = np.result_type(*arrays) if len(arrays) > 0 else np.int32
+            lengths = np.array([array.size for array in arrays], dtype=np.int64)
+            columns[key] = {
+                'data': np.concatenate(arrays).astype(dtype, copy=False),
+                'offsets': np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+                'samples': np.array(owners, dtype=np.int64)
+            }
+
+        return cls(columns, stripped)
+
+    def save(self, directory):
+        """
+        Save the store to a directory (``.npy`` files for the traces and JSON for the rest)
+
+        Args:
+            directory: Directory to save the store to
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        index = {}
+        for number, (key, column) in enumerate(self.columns.items()):
+            name = 'trace_%s' % number
+            index[key] = name
+            for part, array in column.items():
+                np.save(os.path.join(directory, '%s.%s.npy' % (name, part)), array)
+
+        with open(os.path.join(directory, SAMPLES_FILE), 'w', encoding='utf-8') as fp:
+            json.dump(self.samples, fp)
+
+        ## Index is written last, so an incomplete store can't be loaded
+        with open(os.path.join(directory, INDEX_FILE), 'w', encoding='utf-8') as fp:
+            json.dump(index, fp)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """
+        Load a saved store
+
+        Args:
+            directory: Directory the store was saved to
+            mmap: Memory-map the traces (read-only) instead of reading them
+
+        Returns:
+            TraceStore
+        """
+        with open(os.path.join(directory, INDEX_FILE), 'r', encoding='utf-8') as fp:
+            index = json.load(fp)
+
+        with open(os.path.join(directory, SAMPLES_FILE), 'r', encoding='utf-8') as fp:
+            samples = json.load(fp)
+
+        columns = {}
+        for key, name in index.items():
+            columns[key] = {
+                part: np.load(os.path.join(directory, '%s.%s.npy' % (name, part)), mmap_mode='r' if mmap else None)
+                for part in ('data', 'offsets', 'samples')
+            }
+
+        return cls(columns, samples)
+
+    def keys(self):
+        """
+        Labels with traces
+
+        Returns:
+            List of labels
+        """
+        return list(self.columns.keys())
+
+    def trace(self, key, number):
+        """
+        Single trace as a view
+
+        Args:
+            key: Label
+            number: Number of the trace for the label (across all samples)
+
+        Returns:
+            Trace (array)
+        """
+        column = self.columns[key]
+        return column['data'][column['offsets'][number]:column['offsets'][number + 1]]
+
+    def matrix(self, key):
+        """
+        All traces of a label as a 2-D view (one row per trace), e.g. to be
+        used with ``phi2.analyze_many``
+
+        Args:
+            key: Label
+
+        Returns:
+            Traces (array of shape (number of traces, points)) and the sample index for each row
+
+        Raises:
+            ValueError: If the traces don't have the same length
+        """
+        column = self.columns[key]
+        lengths = np.diff(column['offsets'])
+
+        if lengths.size == 0 or np.any(lengths != lengths[0]):
+            raise ValueError("Traces for \"%s\" don't have the same length" % key)
+
+        return column['data'].reshape(lengths.size, int(lengths[0])), column['samples']
+
+    def _resolve(self, value):
+        if isinstance(value, dict) and '$trace' in value:
+            return self.trace(*value['$trace'])
+        return value
+
+    def sample(self, index):
+        """
+        Sample with the traces as (read-only when memory-mapped) views,
+        to be passed to a protocol's ``_analyze`` function
+
+        Args:
+            index: Sample index
+
+        Returns:
+            Sample
+        """
+        sample = dict(self.samples[index])
+
+        if isinstance(sample.get('set'), list):
+            sample['set'] = [dict(protocol) for protocol in sample['set']]
+            for protocol in sample['set']:
+                if 'data_raw' in protocol:
+                    protocol['data_raw'] = self._resolve(protocol['data_raw'])
+
+        if 'data_raw' in sample:
+            sample['data_raw'] = self._resolve(sample['data_raw'])
+
+        return sample
+
+    def __len__(self):
+        return len(self.samples)
+
+    def __iter__(self):
+        for index in range(len(self.samples)):
+            yield self.sample(index)
+
+    def nbytes(self):
+        """
+        Size of the traces in bytes
+
+        Returns:
+            Number of bytes
+        """
+        return sum(array.nbytes for column in self.columns.values() for array in column.values())
@@ -3,27 +3,32 @@ Test your protocol for issues before you continue
 to work with it or you publish it.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 import json
 import jsonschema
 import os
+import re
 import warnings
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-def validate ( protocol=None, verbose=False ):
-  """
-  Test protocol
+from jii_multispeq_protocols.visualize import get_variable
 
-  :param protocol: Protocol code to test
-  :type protocol: dict or str
-  :param verbose: Print errors
-  :type verbose: bool
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), 'schema.json' )
 
-  :return: True if tests are passed with an empty list, otherwise False with a list of errors
-  :rtype: bool, list
+## Compiled validators, keyed by schema file path
+_validators = {}
+
+def load_schema ( file_path=SCHEMA_FILE ):
   """
+  Load the schema used for validation
 
-  file_path = os.path.join(os.path.dirname(__file__), 'schema.json' )
+  :param file_path: Path to the schema file
+  :type file_path: str
 
+  :return: Schema (empty if the file is not valid JSON)
+  :rtype: dict
+  """
   try:
     with open( file_path, 'r', encoding='utf-8') as fp:
       schema = json.load( fp )
@@ -32,7 +37,43 @@ def validate ( protocol=None, verbose=False ):
     schema = {}
     pass
 
-  validator = SchemaValidator(schema)
+  return schema
+
+def get_validator ( file_path=SCHEMA_FILE ):
+  """
+  Get the compiled validator for a schema file. The validator is
+  cached and only rebuilt when the schema file is modified.
+
+  :param file_path: Path to the schema file
+  :type file_path: str
+
+  :return: Validator for the schema
+  :rtype: SchemaValidator
+  """
+  stat = os.stat( file_path )
+  key = (stat.st_mtime_ns, stat.st_size)
+
+  cached = _validators.get(file_path)
+  if cached is None or cached[0] != key:
+    cached = (key, SchemaValidator(load_schema(file_path)))
+    _validators[file_path] = cached
+
+  return cached[1]
+
+def validate ( protocol=None, verbose=False ):
+  """
+  Test protocol
+
+  :param protocol: Protocol code to test
+  :type protocol: dict or str
+  :param verbose: Print errors
+  :type verbose: bool
+
+  :return: True if tests are passed with an empty list, otherwise False with a list of errors
+  :rtype: bool, list
+  """
+
+  validator = get_validator()
   
   is_valid, errors = validator.validate_with_all_errors(protocol)
   if not is_valid and verbose:
@@ -41,11 +82,216 @@ def validate ( protocol=None, verbose=False ):
 
   return is_valid, errors
 
+## Arrays with one entry per pulse set
+PULSE_SET_ARRAYS = ["pulse_distance", "pulse_length", "pulsed_lights", "pulsed_lights_brightness",
+                    "detectors", "nonpulsed_lights", "nonpulsed_lights_brightness"]
+
+## Arrays with one entry per light within a pulse set
+PULSED_LIGHT_ARRAYS = {
+  "pulsed_lights": ["pulse_length", "pulsed_lights_brightness", "detectors"],
+  "nonpulsed_lights": ["nonpulsed_lights_brightness"]
+}
+
+def _format_path ( path ):
+  return ' -> '.join(str(p) for p in path) if path else 'root'
+
+def _check_variables ( value, v_arr, repeats, path, errors ):
+  """
+  Check all variables within a value resolve using the v_arrays
+  """
+  if isinstance(value, list):
+    for idx, item in enumerate(value):
+      _check_variables(item, v_arr, repeats, path + [idx], errors)
+    return
+
+  if not isinstance(value, str) or not value.startswith(('@s', '@p', '@n', '#l')):
+    return
+
+  try:
+    resolved = get_variable(value, v_arr if v_arr is not None else [])
+  except (ValueError, IndexError):
+    errors.append("Path '%s': '%s' is not a valid variable" % (_format_path(path), value))
+    return
+
+  ## The variable is returned unchanged if it can't be resolved
+  if resolved is value:
+    if v_arr is None:
+      errors.append("Path '%s': '%s' is used, but no v_arrays are defined" % (_format_path(path), value))
+    else:
+      errors.append("Path '%s': '%s' points outside of the v_arrays (%s arrays defined)" % (_format_path(path), value, len(v_arr)) )
+    return
+
+  ## Values for @s and @p are selected by the set and protocol repeat
+  if value[:2] in repeats and isinstance(repeats[value[:2]], int):
+    length = len(v_arr[int(value[2:])])
+    if length < repeats[value[:2]]:
+      errors.append("Path '%s': '%s' has %s values, but is used for %s repeats" % (_format_path(path), value, length, repeats[value[:2]]) )
+
+def _check_element ( element, v_arr, set_repeats, path, errors ):
+  """
+  Check a single protocol from a protocol (set)
+  """
+  repeats = {
+    '@s': get_variable(set_repeats, v_arr),
+    '@p': get_variable(element.get("protocol_repeats", 1), v_arr)
+  }
+
+  for key, value in element.items():
+    if key not in ("v_arrays", "_protocol_set_"):
+      _check_variables(value, v_arr, repeats, path + [key], errors)
+
+  ## All pulse set arrays need one entry per pulse set
+  if isinstance(element.get("pulses"), list):
+    pulses = len(element["pulses"])
+    for key in PULSE_SET_ARRAYS:
+      if isinstance(element.get(key), list) and len(element[key]) != pulses:
+        errors.append("Path '%s': has %s entries, but there are %s pulse sets" % (_format_path(path + [key]), len(element[key]), pulses) )
+
+  ## Each light needs its own settings
+  for lights, keys in PULSED_LIGHT_ARRAYS.items():
+    if not isinstance(element.get(lights), list):
+      continue
+    for idx, light in enumerate(element[lights]):
+      for key in keys:
+        if isinstance(element.get(key), list) and idx < len(element[key]) and isinstance(light, list) \
+          and isinstance(element[key][idx], list) and len(element[key][idx]) != len(light):
+          errors.append("Path '%s': has %s entries, but there are %s %s" % (_format_path(path + [key, idx]), len(element[key][idx]), len(light), lights) )
+
+def check_semantics ( protocol=None, verbose=False ):
+  """
+  Test protocol for issues the schema can't detect, like arrays with a
+  different number of pulse sets or variables pointing outside of the ``v_arrays``.
+  Variables are resolved the same way as for the flow chart.
+
+  :param protocol: Protocol code to test
+  :type protocol: dict, list or str
+  :param verbose: Print errors
+  :type verbose: bool
+
+  :return: True if tests are passed with an empty list, otherwise False with a list of errors
+  :rtype: bool, list
+  """
+  errors = []
+
+  if isinstance(protocol, str):
+    protocol = json.loads(protocol)
+
+  if isinstance(protocol, dict):
+    protocol = [protocol]
+
+  for idx, element in enumerate(protocol or []):
+    if not isinstance(element, dict):
+      continue
+
+    v_arr = element.get("v_arrays")
+    set_repeats = element.get("set_repeats", 1)
+
+    if isinstance(element.get("_protocol_set_"), list):
+      _check_element({k: v for k, v in element.items() if k != "_protocol_set_"}, v_arr, set_repeats, [idx], errors)
+      for sub_idx, el in enumerate(element["_protocol_set_"]):
+        if isinstance(el, dict):
+          _check_element(el, el.get("v_arrays", v_arr), set_repeats, [idx, "_protocol_set_", sub_idx], errors)
+    else:
+      _check_element(element, v_arr, set_repeats, [idx], errors)
+
+  if len(errors) > 0 and verbose:
+    for error in errors:
+      print(error)
+
+  return len(errors) == 0, errors
+
+def _validate_one ( protocol ):
+  """
+  Test a single protocol (dict or JSON string) with the cached validator
+  """
+  if isinstance(protocol, str):
+    try:
+      protocol = json.loads(protocol)
+    except json.JSONDecodeError as e:
+      return False, ["Path 'root': Invalid JSON (%s)" % e]
+
+  return get_validator().validate_with_all_errors(protocol)
+
+def validate_many ( protocols=None, workers=None, chunksize=16 ):
+  """
+  Test multiple protocols. Results are returned in the same order as
+  the protocols are provided, as soon as they are available.
+
+  :param protocols: Protocols to test
+  :type protocols: iterable of dict or str
+  :param workers: Number of processes to use, if not set (or 1) protocols are tested in the current process
+  :type workers: int
+  :param chunksize: Number of protocols sent to a process at once
+  :type chunksize: int
+
+  :return: Generator of index, True/False and list of errors for each protocol
+  :rtype: generator of (int, bool, list)
+
+  :raises ValueError: if no protocols are provided
+  """
+  if protocols is None:
+    raise ValueError("No protocols provided to validate")
+
+  if workers is None or workers <= 1:
+    for index, protocol in enumerate(protocols):
+      is_valid, errors = _validate_one(protocol)
+      yield index, is_valid, errors
+    return
+
+  ## Protocols are submitted in windows, so large uploads are not held in memory at once
+  window_size = workers * chunksize * 4
+  protocols = iter(protocols)
+  index = 0
+
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    while True:
+      window = list(islice(protocols, window_size))
+      if len(window) == 0:
+        break
+
+      for is_valid, errors in executor.map(_validate_one, window, chunksize=chunksize):
+        yield index, is_valid, errors
+        index += 1
+
+
+class Validator:
+    """
+    Reusable protocol validator. The schema is loaded and compiled once,
+    when the validator is created.
+
+    :param file_path: Path to the schema file
+    :type file_path: str
+    """
+    def __init__(self, file_path: str = SCHEMA_FILE):
+        self.file_path = file_path
+        self.schema_validator = SchemaValidator(load_schema(file_path))
+
+    def validate(self, protocol=None, verbose=False) -> Tuple[bool, List[str]]:
+        """
+        Test protocol
+
+        Args:
+            protocol: Protocol code to test
+            verbose: Print errors
+
+        Returns:
+            Tuple of (is_valid, list_of_error_messages)
+        """
+        is_valid, errors = self.schema_validator.validate_with_all_errors(protocol)
+        if not is_valid and verbose:
+            for error in errors:
+                print(error)
+
+        return is_valid, errors
+
+    __call__ = validate
+
 
 class SchemaValidator:
     def __init__(self, schema: Dict):
         self.schema = schema
         self.validator = jsonschema.Draft202012Validator(schema)
+        self.fast_validator = FastValidator(schema)
 
     def validate_with_all_errors(self, data: Dict) -> Tuple[bool, List[str]]:
         """
@@ -57,6 +303,10 @@ class SchemaValidator:
         Returns:
             Tuple of (is_valid, list_of_error_messages)
         """
+        # Most protocols are valid, only run the full validation if the quick check fails
+        if self.fast_validator.is_valid(data) is True:
+            return True, []
+
         errors = []
         try:
             for error in self.validator.iter_errors(data):
@@ -68,4 +318,267 @@ class SchemaValidator:
         except AttributeError:
            pass
         
-        return len(errors) == 0, errors
\ No newline at end of file
+        return len(errors) == 0, errors
+
+
+## Python types of JSON values (subclasses are not considered)
+_JSON_TYPES = {
+    "array": list,
+    "object": dict,
+    "string": str,
+    "boolean": bool,
+    "null": type(None),
+}
+
+_KNOWN_TYPES = (list, dict, str, int, float, bool, type(None))
+
+## Keywords without influence on the validation result
+_ANNOTATIONS = {"$schema", "$id", "$comment", "$defs", "title", "description", "examples", "default", "format"}
+
+
+def _check_all(checks: List[Callable], instance) -> Optional[bool]:
+    for check in checks:
+        result = check(instance)
+        if result is not True:
+            return result
+    return True
+
+
+class FastValidator:
+    """
+    Quick structural check of a protocol, compiled from the schema.
+
+    Only the keywords used by the protocol schema are supported. The result is
+    True if the protocol is valid, False if it is not and None if it can't be
+    decided (unsupported keyword or value type). In the latter two cases
+    the full validation is needed to get the error messages.
+
+    Args:
+        schema: The schema to compile
+    """
+    def __init__(self, schema: Dict):
+        self.defs = schema.get("$defs", {}) if isinstance(schema, dict) else {}
+        self.compiled_defs = {}
+        self.check = self._compile(schema)
+
+    def is_valid(self, data) -> Optional[bool]:
+        """
+        Checks if the data is valid.
+
+        Args:
+            data: The data to check against the schema
+
+        Returns:
+            True, False or None if unknown
+        """
+        return self.check(data)
+
+    def _compile(self, schema) -> Callable:
+        if schema is True:
+            return lambda instance: True
+        if schema is False:
+            return lambda instance: False
+        if not isinstance(schema, dict):
+            return lambda instance: None
+
+        checks = []
+        for keyword, value in schema.items():
+            if keyword in _ANNOTATIONS or keyword not in jsonschema.Draft202012Validator.VALIDATORS:
+                continue
+            compiler = getattr(self, "_keyword_%s" % keyword.lstrip("$"), None)
+            if compiler is None:
+                return lambda instance: None
+            checks.append(compiler(value, schema))
+
+        if len(checks) == 0:
+            return lambda instance: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda instance: _check_all(checks, instance)
+
+    def _keyword_ref(self, ref, schema):
+        name = ref[len("#/$defs/"):]
+        if not ref.startswith("#/$defs/") or name not in self.defs:
+            return lambda instance: None
+
+        # Definitions are compiled once and might reference themselves
+        if name not in self.compiled_defs:
+            self.compiled_defs[name] = None
+            self.compiled_defs[name] = self._compile(self.defs[name])
+
+        return lambda instance: self.compiled_defs[name](instance)
+
+    def _keyword_type(self, types, schema):
+        types = [types] if isinstance(types, str) else list(types)
+        accepted = tuple(_JSON_TYPES[name] for name in types if name in _JSON_TYPES)
+        if "number" in types:
+            accepted += (int, float)
+        elif "integer" in types:
+            accepted += (int,)
+        integer = "integer" in types and "number" not in types
+
+        def check(instance):
+            t = type(instance)
+            if t in accepted:
+                return True
+            if integer and t is float:
+                return instance.is_integer()
+            return False if t in _KNOWN_TYPES else None
+        return check
+
+    def _keyword_enum(self, values, schema):
+        if any(type(value) not in (int, float, str) for value in values):
+            return lambda instance: None
+
+        def check(instance):
+            t = type(instance)
+            if t is int or t is float or t is str:
+                return instance in values
+            return False if t in _KNOWN_TYPES else None
+        return check
+
+    def _keyword_minimum(self, minimum, schema):
+        def check(instance):
+            t = type(instance)
+            if t is int or t is float:
+                return instance >= minimum
+            return True if t in _KNOWN_TYPES else None
+        return check
+
+    def _keyword_maximum(self, maximum, schema):
+        def check(instance):
+            t = type(instance)
+            if t is int or t is float:
+                return instance <= maximum
+            return True if t in _KNOWN_TYPES else None
+        return check
+
+    def _keyword_pattern(self, pattern, schema):
+        search = re.compile(pattern).search
+        # Protocols use the same strings over and over again
+        matches = {}
+
+        def check(instance):
+            t = type(instance)
+            if t is str:
+                match = matches.get(instance)
+                if match is None:
+                    match = search(instance) is not None
+                    if len(matches) < 1024:
+                        matches[instance] = match
+                return match
+            return True if t in _KNOWN_TYPES else None
+        return check
+
+    def _keyword_minItems(self, min_items, schema):
+        def check(instance):
+            t = type(instance)
+            if t is list:
+                return len(instance) >= min_items
+            return True if t in _KNOWN_TYPES else None
+        return check
+
+    def _keyword_maxItems(self, max_items, schema):
+        def check(instance):
+            t = type(instance)
+            if t is list:
+                return len(instance) <= max_items
+            return True if t in _KNOWN_TYPES else None
+        return check
+
+    def _keyword_prefixItems(self, prefix_items, schema):
+        checks = [self._compile(item) for item in prefix_items]
+
+        def check(instance):
+            t = type(instance)
+            if t is not list:
+                return True if t in _KNOWN_TYPES else None
+            for item_check, item in zip(checks, instance):
+                result = item_check(item)
+                if result is not True:
+                    return result
+            return True
+        return check
+
+    def _keyword_items(self, items, schema):
+        prefix = len(schema.get("prefixItems", []))
+
+        # A list of schemas (pre 2020-12 syntax) is not supported by the full validation either
+        item_check = self._compile(items) if not isinstance(items, list) else (lambda instance: None)
+
+        def check(instance):
+            t = type(instance)
+            if t is not list:
+                return True if t in _KNOWN_TYPES else None
+            for index in range(prefix, len(instance)):
+                result = item_check(instance[index])
+                if result is not True:
+                    return result
+            return True
+        return check
+
+    def _keyword_properties(self, properties, schema):
+        checks = {key: self._compile(value) for key, value in properties.items()}
+
+        def check(instance):
+            t = type(instance)
+            if t is not dict:
+                return True if t in _KNOWN_TYPES else None
+            for key, value in instance.items():
+                if key in checks:
+                    result = checks[key](value)
+                    if result is not True:
+                        return result
+            return True
+        return check
+
+    def _keyword_required(self, required, schema):
+        def check(instance):
+            t = type(instance)
+            if t is not dict:
+                return True if t in _KNOWN_TYPES else None
+            return all(key in instance for key in required)
+        return check
+
+    def _keyword_dependentRequired(self, dependencies, schema):
+        def check(instance):
+            t = type(instance)
+            if t is not dict:
+                return True if t in _KNOWN_TYPES else None
+            for key, required in dependencies.items():
+                if key in instance and not all(dependency in instance for dependency in required):
+                    return False
+            return True
+        return check
+
+    def _keyword_allOf(self, subschemas, schema):
+        checks = [self._compile(subschema) for subschema in subschemas]
+        return lambda instance: _check_all(checks, instance)
+
+    def _keyword_anyOf(self, subschemas, schema):
+        checks = [self._compile(subschema) for subschema in subschemas]
+
+        def check(instance):
+            result = False
+            for subschema_check in checks:
+                match = subschema_check(instance)
+                if match:
+                    return True
+                if match is None:
+                    result = None
+            return result
+        return check
+
+    def _keyword_oneOf(self, subschemas, schema):
+        checks = [self._compile(subschema) for subschema in subschemas]
+
+        def check(instance):
+            matches = 0
+            for subschema_check in checks:
+                match = subschema_check(instance)
+                if match is None:
+                    return None
+                if match:
+                    matches += 1
+            return matches == 1
+        return check
@@ -3,8 +3,8 @@ Visualize the content of a protocol as a flowchart
 """
 
 import json
-import numpy as np
 import gettext
+from functools import lru_cache
 
 DETECTORS = {
   "1": "700nm - 1150nm",
@@ -84,6 +84,51 @@ def label(element, idx = -1):
     
   return out
 
+def _flatten(values):
+  """
+  Flatten nested lists of values into a tuple
+  """
+  if not isinstance(values, (list, tuple)):
+    return (values,)
+
+  out = []
+  for value in values:
+    if isinstance(value, (list, tuple)):
+      out.extend(_flatten(value))
+    else:
+      out.append(value)
+
+  return tuple(out)
+
+def _unique(values):
+  """
+  Sorted unique values. Like with numpy, values are converted to
+  strings if any of them is a string, or to floats if any is a float.
+  """
+  ## Cached by type and value, as e.g. 1 and 1.0 are equal but give different results
+  return _unique_typed(tuple((type(x), x) for x in values))
+
+@lru_cache(maxsize=1024)
+def _unique_typed(typed):
+  """
+  Sorted unique values for (type, value) pairs (see _unique)
+  """
+  values = [x for _, x in typed]
+  types = set(t for t, _ in typed)
+
+  if any(issubclass(t, str) for t in types):
+    values = [str(x) for x in values]
+  elif any(issubclass(t, float) for t in types):
+    values = [float(x) for x in values]
+
+  return tuple(sorted(set(values)))
+
+def _listing(items, count):
+  """
+  Single item or bullet list
+  """
+  return "\n".join(items) if count == 1 else ("\n" + "\n".join(["• %s" % o for o in items]))
+
 def detectors(element):
   """
   Get Detectors
@@ -91,12 +136,9 @@ def detectors(element):
   out = None
 
   if "detectors" in element:
-    l = len(np.unique(np.hstack(element["detectors"])))
-    out = np.unique(np.hstack(element["detectors"]))
-    out = [DETECTORS[str(x)] for x in out if str(x) in DETECTORS]
-    out = ("\n".join(out) if l == 1 else ("\n" + "\n".join(["• %s" % o for o in out])))
-
-    out = out, len(np.unique(np.hstack(element["detectors"])))
+    values = _unique(_flatten(element["detectors"]))
+    out = [DETECTORS[str(x)] for x in values if str(x) in DETECTORS]
+    out = _listing(out, len(values)), len(values)
     
   return out
 
@@ -107,12 +149,9 @@ def leds(element, lights="nonpulsed_lights"):
   out = None
 
   if lights in element:
-    l = len(np.unique(np.hstack(element[lights])))
-    out = np.unique(np.hstack(element[lights]))
-    out = [LEDS[str(x)] for x in out if str(x) in LEDS]
-    out = ("\n".join(out) if l == 1 else ("\n" + "\n".join(["• %s" % o for o in out])))
-
-    out = out, l
+    values = _unique(_flatten(element[lights]))
+    out = [LEDS[str(x)] for x in values if str(x) in LEDS]
+    out = _listing(out, len(values)), len(values)
     
   return out
 
@@ -129,12 +168,9 @@ def environment(element):
     return str(input)
 
   if "environmental" in element:
-    l = len(np.unique(np.hstack(element["environmental"])))
-    out = np.unique(np.hstack(element["environmental"]))
-    out = np.unique([matchSensor(x) for x in out])
-    out = ("\n".join(out) if l == 1 else ("\n" + "\n".join(["• %s" % o for o in out])))
-
-    out = out, l
+    values = _unique(_flatten(element["environmental"]))
+    out = sorted(set(matchSensor(x) for x in values))
+    out = _listing(out, len(values)), len(values)
     
   return out
 
@@ -292,74 +328,49 @@ def content(element):
   out.append("**%s**" % (label(element)))
 
   ## Averages
-  if averages(element):
-    avg = averages(element)
-    if isinstance(avg, int):
-      if avg > 1:
-        avg = "*Averages*: %s" % (avg)
-        if averages_delay(element):
-          avg += " (delay between: %s)" % (averages_delay(element))
-        out.append(avg)
+  avg = averages(element)
+  if avg and isinstance(avg, int):
+    if avg > 1:
+      avg = "*Averages*: %s" % (avg)
+      delay = averages_delay(element)
+      if delay:
+        avg += " (delay between: %s)" % (delay)
+      out.append(avg)
 
   ## Repeats
-  if protocols_repeats(element):
-    rep = protocols_repeats(element)
-    if isinstance(rep, int):
-      if rep > 1:
-        rep = "*Repeats*: %s" % (rep)
-        if protocols_delay(element):
-          rep += " (delay between: %s)" % (protocols_delay(element))
-        out.append(rep)
-
-  ## Detectors
-  if detectors(element):
-    out.append("*%s:* %s" % ( gettext.ngettext( 'Detector', 'Detector', detectors(element)[1] ), detectors(element)[0]))
-
-  ## LEDs
-  if leds(element, "pulsed_lights"):
-    out.append("*%s:* %s" % ( gettext.ngettext( 'Pulsed LED', 'Pulsed LEDs', leds(element,"pulsed_lights")[1] ), leds(element,"pulsed_lights")[0]))
-
-  ## LEDs
-  if leds(element, "nonpulsed_lights"):
-    out.append("*%s:* %s" % ( gettext.ngettext( 'Non Pulsed LED', 'Non Pulsed LEDs', leds(element,"nonpulsed_lights")[1] ), leds(element,"nonpulsed_lights")[0]))
-
-  ## Other Sensors
-  if environment(element):
-    out.append("*%s:* %s" % ( gettext.ngettext( 'Sensor', 'Sensors', environment(element)[1] ), environment(element)[0]) )
+  rep = protocols_repeats(element)
+  if rep and isinstance(rep, int):
+    if rep > 1:
+      rep = "*Repeats*: %s" % (rep)
+      delay = protocols_delay(element)
+      if delay:
+        rep += " (delay between: %s)" % (delay)
+      out.append(rep)
+
+  ## Each summary is computed once
+  summaries = (
+    ('Detector', 'Detector', detectors(element)),
+    ('Pulsed LED', 'Pulsed LEDs', leds(element, "pulsed_lights")),
+    ('Non Pulsed LED', 'Non Pulsed LEDs', leds(element, "nonpulsed_lights")),
+    ('Sensor', 'Sensors', environment(element))
+  )
+
+  ## Detectors, LEDs and other Sensors
+  for singular, plural, summary in summaries:
+    if summary:
+      out.append("*%s:* %s" % ( gettext.ngettext( singular, plural, summary[1] ), summary[0]))
 
   ## Execution
-  if do_once(element):
-    out.append("%s" % do_once(element))
+  once = do_once(element)
+  if once:
+    out.append("%s" % once)
 
   return "\n".join(out)
 
-def generate ( protocol = None, direction = 'TD', styles=None ):
+def _check_arguments ( protocol, direction, styles ):
   """
-  Generate a flow chart for a given protocol using the Mermaid library.
-
-  :param protocol: Protocol code to visualize
-  :type protocol: str, dict or list
-
-  :param direction: Flow-chart direction flow (TB, TD, BT, RL, LR)
-  :type protocol: str
-
-  :param style: Flow-chart styles (see: `Mermaid Theme Variables <https://mermaid.js.org/config/theming.html#customizing-themes-with-themevariables>`_ )
-  :type protocol: dict
-
-  :return: Flow chart code for Mermaid
-  :rtype: str
-
-  :raises ValueError: if no protocol data is provided or the protocol data has the wrong format
-  :raises ValueError: if direction has incorrect value
-  :raises ValueError: if style is not a dictinary
+  Check the arguments for generating a flow chart
   """
-
-  # TB - Top to bottom
-  # TD - Top-down/ same as top to bottom
-  # BT - Bottom to top
-  # RL - Right to left
-  # LR - Left to right
-
   if protocol is None:
     raise ValueError("No protocol provided to generate a flow-chart")
   
@@ -372,10 +383,19 @@ def generate ( protocol = None, direction = 'TD', styles=None ):
   if styles is not None and not isinstance(styles, (dict)):
     raise ValueError("Styles must be provided as a dictionary")
 
-  chart = ""
-    
+def _chart ( protocol, direction, styles ):
+  """
+  Generate the flow chart code piece by piece
+  """
+
+  # TB - Top to bottom
+  # TD - Top-down/ same as top to bottom
+  # BT - Bottom to top
+  # RL - Right to left
+  # LR - Left to right
+
   if styles is not None:
-    chart += f"""%%{{
+    yield f"""%%{{
 init: {{
   "theme": "base",
   "themeVariables": {json.dumps(styles)}
@@ -394,17 +414,17 @@ init: {{
   ## Loop through protocols in list
   for element in protocol:
 
-    chart += "flowchart %s\n" % direction
+    yield "flowchart %s\n" % direction
     
     ## Protocol Start
-    chart += "\tSTART((Start))\n"
+    yield "\tSTART((Start))\n"
     
     if "_protocol_set_" in element:
 
       for idx, el in enumerate(element["_protocol_set_"]):
         
         ## Add Protocol Container
-        chart += "\tA%s[\"`%s`\"]:::protocol\n" % (idx, content(el))
+        yield "\tA%s[\"`%s`\"]:::protocol\n" % (idx, content(el))
 
         ## Add connection between Sub-Protocols. Connection between previous and current is added.
         node = []
@@ -418,26 +438,26 @@ init: {{
           node.append( preillumination( el, v_arrays(element) ) )
 
         ## Add node connection
-        chart += "\t%s ==>%s A%s\n" % ( ("A%s" % (idx-1) if idx > 0 else "START" ), ( "|\"`%s`\"|" % "\n\n".join(node) if len(node) > 0 else "" ), idx)
+        yield "\t%s ==>%s A%s\n" % ( ("A%s" % (idx-1) if idx > 0 else "START" ), ( "|\"`%s`\"|" % "\n\n".join(node) if len(node) > 0 else "" ), idx)
 
         ## Add End Point
         if idx == len(element["_protocol_set_"]) -1:
           if protocols_delay(el):
-            chart += "\tA%s ==> |%sms| END\n" % (idx, protocols_delay(el))
+            yield "\tA%s ==> |%sms| END\n" % (idx, protocols_delay(el))
           else:
-            chart += "\tA%s ==> END\n" % idx
+            yield "\tA%s ==> END\n" % idx
 
 
       ## Add set repeats
       if set_repeats(element):
-        chart += "\tA%s -.-> |%sx| A0\n" % (idx, get_variable( set_repeats(element), v_arrays(element) ))
+        yield "\tA%s -.-> |%sx| A0\n" % (idx, get_variable( set_repeats(element), v_arrays(element) ))
         
         ## change thickness of dotted line
-        chart += "\tlinkStyle %s stroke-width:3px\n" % (idx+2)
+        yield "\tlinkStyle %s stroke-width:3px\n" % (idx+2)
     
     else:
       ## Protocol
-      chart += "\tA0[\"`%s`\"]:::protocol\n" % content(element)
+      yield "\tA0[\"`%s`\"]:::protocol\n" % content(element)
 
       node = []
 
@@ -449,13 +469,92 @@ init: {{
       if preillumination( element ):
         node.append( preillumination( element ) )
 
-      chart += "\tSTART ==>%s A0\n" % ( ( "|\"`%s`\"|" % "\n\n".join(node) if len(node) > 0 else "" ))
+      yield "\tSTART ==>%s A0\n" % ( ( "|\"`%s`\"|" % "\n\n".join(node) if len(node) > 0 else "" ))
 
-      chart += "\tA0 ==> END\n"
+      yield "\tA0 ==> END\n"
 
     ## Protocol End
-    chart += "\tEND((&nbsp;End&nbsp;))\n"
+    yield "\tEND((&nbsp;End&nbsp;))\n"
+
+    yield "\tclassDef protocol text-align:left,white-space:pre;"
 
-    chart += "\tclassDef protocol text-align:left,white-space:pre;"
+def generate_iter ( protocol = None, direction = 'TD', styles=None ):
+  """
+  Generate a flow chart for a given protocol using the Mermaid library, one
+  piece (line) at a time. Large protocols don't need to be held in memory
+  as a single string.
+
+  :param protocol: Protocol code to visualize
+  :type protocol: str, dict or list
+
+  :param direction: Flow-chart direction flow (TB, TD, BT, RL, LR)
+  :type protocol: str
+
+  :param style: Flow-chart styles (see: `Mermaid Theme Variables <https://mermaid.js.org/config/theming.html#customizing-themes-with-themevariables>`_ )
+  :type protocol: dict
+
+  :return: Pieces of the flow chart code for Mermaid
+  :rtype: generator of str
+
+  :raises ValueError: if no protocol data is provided or the protocol data has the wrong format
+  :raises ValueError: if direction has incorrect value
+  :raises ValueError: if style is not a dictinary
+  """
+  ## Arguments are checked right away, not when the chart is consumed
+  _check_arguments( protocol, direction, styles )
+
+  return _chart( protocol, direction, styles )
+
+def generate_to ( fp, protocol = None, direction = 'TD', styles=None ):
+  """
+  Generate a flow chart for a given protocol using the Mermaid library and
+  write it to a file as it is generated.
+
+  :param fp: File (or any object with a ``write`` method) to write the chart to
+  :type fp: file
+
+  :param protocol: Protocol code to visualize
+  :type protocol: str, dict or list
+
+  :param direction: Flow-chart direction flow (TB, TD, BT, RL, LR)
+  :type protocol: str
+
+  :param style: Flow-chart styles (see: `Mermaid Theme Variables <https://mermaid.js.org/config/theming.html#customizing-themes-with-themevariables>`_ )
+  :type protocol: dict
 
-  return chart
+  :return: Number of characters written
+  :rtype: int
+
+  :raises ValueError: if no protocol data is provided or the protocol data has the wrong format
+  :raises ValueError: if direction has incorrect value
+  :raises ValueError: if style is not a dictinary
+  """
+  size = 0
+
+  for piece in generate_iter( protocol, direction, styles ):
+    fp.write(piece)
+    size += len(piece)
+
+  return size
+
+def generate ( protocol = None, direction = 'TD', styles=None ):
+  """
+  Generate a flow chart for a given protocol using the Mermaid library.
+
+  :param protocol: Protocol code to visualize
+  :type protocol: str, dict or list
+
+  :param direction: Flow-chart direction flow (TB, TD, BT, RL, LR)
+  :type protocol: str
+
+  :param style: Flow-chart styles (see: `Mermaid Theme Variables <https://mermaid.js.org/config/theming.html#customizing-themes-with-themevariables>`_ )
+  :type protocol: dict
+
+  :return: Flow chart code for Mermaid
+  :rtype: str
+
+  :raises ValueError: if no protocol data is provided or the protocol data has the wrong format
+  :raises ValueError: if direction has incorrect value
+  :raises ValueError: if style is not a dictinary
+  """
+  return "".join( generate_iter( protocol, direction, styles ) )
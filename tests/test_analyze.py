@@ -0,0 +1,51 @@
+import sys
+import types
+import warnings
+
+from jii_multispeq_protocols import PROTOCOLS_PACKAGE
+from jii_multispeq_protocols.analyze import analyze_batch
+from jii_multispeq_protocols.qc import WARNING_CODE, flag
+
+def _protocol(monkeypatch):
+  """
+  Protocol raising warnings and QC flags alternately
+  """
+  module = types.ModuleType(PROTOCOLS_PACKAGE + '._test_messages')
+
+  def _analyze(_data):
+    warnings.warn("first")
+    flag("second_code", "second", 2)
+    warnings.warn("third")
+    flag("fourth_code", "fourth")
+    return {"value": _data["value"]}
+
+  module._analyze = _analyze
+  monkeypatch.setitem(sys.modules, module.__name__, module)
+  return module
+
+def test_messages_in_order(monkeypatch):
+  module = _protocol(monkeypatch)
+
+  results = list(analyze_batch(module, [{"value": 1}, {"value": 2}]))
+
+  assert [r[0] for r in results] == [0, 1]
+  for index, output, messages, error in results:
+    assert messages == ["first", "second", "third", "fourth"]
+    assert error is None
+
+def test_flags_in_order(monkeypatch):
+  module = _protocol(monkeypatch)
+
+  index, output, flags, error = next(analyze_batch(module, [{"value": 1}], flags=True))
+
+  assert [f.code for f in flags] == [WARNING_CODE, "second_code", WARNING_CODE, "fourth_code"]
+  assert flags[1].value == 2
+
+def test_errors_kept_per_sample(monkeypatch):
+  module = _protocol(monkeypatch)
+
+  results = list(analyze_batch(module, [{"value": 1}, {}]))
+
+  assert results[0][3] is None
+  assert results[1][1] is None
+  assert results[1][3].startswith("KeyError")
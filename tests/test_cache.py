@@ -0,0 +1,26 @@
+from jii_multispeq_protocols.cache import ResultCache, cached_generate, cached_validate
+from jii_multispeq_protocols.validate import validate
+
+def test_validate_key_order():
+  cache = ResultCache()
+  first = [[{'label': 'x', 'averages': 1}]]
+  second = [[{'averages': 1, 'label': 'x'}]]
+
+  assert cached_validate(first, cache=cache) == validate(first)
+  assert cached_validate(second, cache=cache) == validate(second)
+  assert cached_validate(first, cache=cache) == validate(first)
+  assert cache.stats()['hits'] == 1
+
+def test_validate_string_formatting():
+  cache = ResultCache()
+  first = '[{"pulses":[20], "bogus": 1}]'
+  second = '[ {"bogus":1,"pulses":[20]} ]'
+
+  assert cached_validate(first, cache=cache) == validate(first)
+  assert cached_validate(second, cache=cache) == validate(second)
+
+def test_generate_key_order():
+  cache = ResultCache()
+  cached_generate([{'pulses': [20], 'detectors': [[1]]}], cache=cache)
+  cached_generate([{'detectors': [[1]], 'pulses': [20]}], cache=cache)
+  assert cache.stats()['hits'] == 1
@@ -0,0 +1,35 @@
+import gc
+import weakref
+
+from jii_multispeq_protocols.labels import label_index
+
+class Measurement(dict):
+  """
+  Measurement that can be referenced weakly
+  """
+
+def test_label_index_lookup():
+  data = {"set": [{"label": "a", "n": 1}, {"label": "b"}, {"label": "a", "n": 2}, {"n": 3}]}
+  labels = label_index(data)
+
+  assert labels.get("b") is data["set"][1]
+  assert labels.get("a") == [data["set"][0], data["set"][2]]
+  assert labels.get("b", True) == [data["set"][1]]
+  assert labels.get("missing") is None
+  assert "a" in labels
+
+def test_label_index_changed_measurement():
+  data = {"set": [{"label": "a"}]}
+  assert label_index(data).get("b") is None
+
+  data["set"][0]["label"] = "b"
+  assert label_index(data).get("b") is data["set"][0]
+
+def test_label_index_keeps_no_reference():
+  data = Measurement({"set": [{"label": "a", "data_raw": list(range(1000))}]})
+  label_index(data)
+  ref = weakref.ref(data)
+
+  del data
+  gc.collect()
+  assert ref() is None
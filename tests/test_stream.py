@@ -0,0 +1,37 @@
+import io
+import json
+
+import pytest
+
+from jii_multispeq_protocols.stream import ResultWriter, read_values
+
+def test_writer_array():
+  fp = io.StringIO()
+  with ResultWriter(fp, array=True) as writer:
+    writer.write({"index": 0})
+    writer.write({"index": 1})
+  assert json.loads(fp.getvalue()) == [{"index": 0}, {"index": 1}]
+
+def test_writer_array_not_completed_after_error():
+  fp = io.StringIO()
+  with pytest.raises(RuntimeError):
+    with ResultWriter(fp, array=True) as writer:
+      writer.write({"index": 0})
+      raise RuntimeError("batch failed")
+
+  with pytest.raises(ValueError):
+    json.loads(fp.getvalue())
+
+@pytest.mark.parametrize("text", ['[1,2', '[', '[1,,2]', '[1 2]', '[1,2,]', '[1,2]]]', '[1,2] 3'])
+def test_read_values_invalid(text):
+  with pytest.raises(ValueError):
+    list(read_values(io.StringIO(text), 2))
+
+@pytest.mark.parametrize("text, values", [
+  ('[]', []),
+  ('[1, 2.5e3, "x"]', [1, 2500.0, "x"]),
+  ('{"a": 1}\n{"a": 2}\n', [{"a": 1}, {"a": 2}])
+])
+def test_read_values(text, values):
+  for chunk_size in (1, 3, 65536):
+    assert list(read_values(io.StringIO(text), chunk_size)) == values
@@ -0,0 +1,49 @@
+import copy
+
+import numpy as np
+import pytest
+
+from jii_multispeq_protocols.examples import load_example
+from jii_multispeq_protocols.traces import TraceStore, iter_samples
+
+def _arrays(value):
+  """
+  Paths of numpy arrays within an output
+  """
+  if isinstance(value, np.ndarray):
+    return ['']
+  if isinstance(value, dict):
+    return ['%s.%s' % (key, path) for key, item in value.items() for path in _arrays(item)]
+  if isinstance(value, (list, tuple)):
+    return ['[%s]%s' % (i, path) for i, item in enumerate(value) for path in _arrays(item)]
+  return []
+
+@pytest.fixture
+def store(tmp_path):
+  def load(name):
+    samples = list(iter_samples([load_example(name)]))
+    TraceStore.from_samples(copy.deepcopy(samples)).save(str(tmp_path / name))
+    return samples, TraceStore.load(str(tmp_path / name))
+  return load
+
+def test_phi2_trace_store(store):
+  from jii_multispeq_protocols.protocols import phi2
+
+  samples, traces = store('phi2')
+  output = phi2._analyze(traces.sample(0))
+
+  assert _arrays(output) == []
+  assert output == phi2._analyze(copy.deepcopy(samples[0]))
+
+def test_rides_trace_store(store):
+  pytest.importorskip('jii_multispeq')
+  from jii_multispeq_protocols.protocols import rides
+
+  samples, traces = store('rides')
+  output = rides._analyze(traces.sample(0))
+  expected = rides._analyze(copy.deepcopy(samples[0]))
+
+  assert _arrays(output) == []
+  assert isinstance(output['LEFd_trace'], list)
+  assert output['LEFd_trace'] == expected['LEFd_trace']
+  assert output.keys() == expected.keys()
@@ -0,0 +1,112 @@
+"""
+Differential check of the quick structural validation (FastValidator)
+against the full Draft202012Validator. A protocol accepted by the quick
+check has to be valid, a rejected one invalid, and the errors of
+SchemaValidator have to be the same with and without the quick check.
+"""
+
+import copy
+import random
+
+import pytest
+
+import jii_multispeq_protocols as protocols
+from jii_multispeq_protocols.validate import FastValidator, SchemaValidator, load_schema
+
+VALUES = [-1, 0, 1, 2, 1.5, 1.0, 10 ** 9, True, False, None, "", "x", "@s0", "@n0:1", "#l0",
+          "light_intensity", "auto_bright3", [], [1], ["@p1"], [[1]], {}, {"a": 1}]
+
+MUTATIONS = 500
+
+@pytest.fixture(scope="module")
+def validator():
+  return SchemaValidator(load_schema())
+
+def full_validation(validator, data):
+  """
+  Errors of the full validation and if jsonschema stopped early
+  """
+  errors = []
+  aborted = False
+  try:
+    for error in validator.validator.iter_errors(data):
+      path = ' -> '.join(str(p) for p in error.path) if error.path else 'root'
+      errors.append(f"Path '{path}': {error.message}")
+  except AttributeError:
+    # jsonschema stops on the pre 2020-12 "items" lists in the schema
+    aborted = True
+  return (len(errors) == 0, errors), aborted
+
+def check_same(validator, data):
+  expected, aborted = full_validation(validator, data)
+  quick = validator.fast_validator.is_valid(data)
+
+  if quick is True:
+    assert expected == (True, [])
+  if quick is False and not aborted:
+    assert expected[0] is False
+  assert validator.validate_with_all_errors(data) == expected
+
+  return quick
+
+def containers(data, path=()):
+  yield path, data
+  items = data.items() if isinstance(data, dict) else enumerate(data) if isinstance(data, list) else []
+  for key, value in items:
+    if isinstance(value, (dict, list)):
+      yield from containers(value, path + (key,))
+
+def mutate(protocol, rng):
+  protocol = copy.deepcopy(protocol)
+  path, target = rng.choice(list(containers(protocol)))
+  if isinstance(target, dict):
+    keys = list(target.keys())
+    action = rng.random()
+    if keys and action < 0.2:
+      del target[rng.choice(keys)]
+    elif keys and action < 0.9:
+      target[rng.choice(keys)] = copy.deepcopy(rng.choice(VALUES))
+    else:
+      target[rng.choice(["pulses", "averages", "label", "detectors", "unknown"])] = copy.deepcopy(rng.choice(VALUES))
+  elif isinstance(target, list):
+    if target and rng.random() < 0.7:
+      target[rng.randrange(len(target))] = copy.deepcopy(rng.choice(VALUES))
+    elif target and rng.random() < 0.5:
+      del target[rng.randrange(len(target))]
+    else:
+      target.append(copy.deepcopy(rng.choice(VALUES)))
+  return protocol
+
+## Protocols that can be imported (e.g. rides needs jii_multispeq)
+PROTOCOLS = {name: module._protocol for name, module in protocols.load_all().items() if hasattr(module, "_protocol")}
+
+@pytest.mark.parametrize("name", sorted(PROTOCOLS))
+def test_bundled_protocol(validator, name):
+  check_same(validator, PROTOCOLS[name])
+
+@pytest.mark.parametrize("name", sorted(PROTOCOLS))
+def test_mutated_protocol(validator, name):
+  protocol = PROTOCOLS[name]
+  rng = random.Random(name)
+
+  for _ in range(MUTATIONS // len(PROTOCOLS) + 1):
+    check_same(validator, mutate(protocol, rng))
+
+@pytest.mark.parametrize("schema, data", [
+  ({"not": {"type": "string"}}, 1),
+  ({"type": "object", "properties": {"a": {"not": {"type": "string"}}}}, {"a": "x"}),
+  ({"properties": {"a": {"type": "string"}, "b": {"$ref": "#/properties/a"}}}, {"b": 1}),
+  ({"contains": {"type": "integer"}}, [1])
+])
+def test_unsupported_keyword(schema, data):
+  ## Undecided by the quick check, the full validation is used
+  assert FastValidator(schema).is_valid(data) is None
+
+  validator = SchemaValidator(schema)
+  expected, _ = full_validation(validator, data)
+  assert validator.validate_with_all_errors(data) == expected
+
+def test_unsupported_value_type(validator):
+  ## Values that are not JSON types are left to jsonschema
+  assert FastValidator({"type": "array"}).is_valid((1, 2)) is None
+  check_same(validator, [{"pulses": (20,)}])
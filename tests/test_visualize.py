@@ -0,0 +1,13 @@
+from jii_multispeq_protocols.visualize import detectors, generate
+
+def test_detectors_float_then_int():
+  ## Values that compare equal (1.0 and 1) must not share cached results
+  assert detectors({'detectors': [[1.0]]}) == ('', 1)
+  assert detectors({'detectors': [[1]]}) == ('700nm - 1150nm', 1)
+
+def test_generate_independent_of_previous_protocols():
+  protocol = [{'pulses': [20], 'detectors': [[1]], 'pulsed_lights': [[3]]}]
+  before = generate(protocol)
+  generate([{'pulses': [20], 'detectors': [[1.0]], 'pulsed_lights': [[3.0]]}])
+  assert generate(protocol) == before
+  assert '700nm - 1150nm' in before